@@ -35,7 +35,7 @@
 #
 ##########################################################################
 
-import os, sys, traceback
+import os, sys, json, resource, traceback
 
 import IECore
 
@@ -106,6 +106,33 @@ class execute( Gaffer.Application ) :
 					},
 				),
 
+				IECore.StringParameter(
+					name = "diskCacheDirectory",
+					description = "A directory in which computed values are stored, "
+						"so that they can be reused by subsequent executions, including "
+						"those in other processes. Disabled if empty.",
+					defaultValue = "",
+				),
+
+				IECore.IntParameter(
+					name = "diskCacheSizeLimit",
+					description = "The maximum size of the disk cache, in megabytes.",
+					defaultValue = Gaffer.ValuePlug.getDiskCacheSizeLimit() / ( 1024 * 1024 ),
+					minValue = 0,
+				),
+
+				IECore.BoolParameter(
+					name = "worker",
+					description = "Runs as a long-lived worker process, as used by the "
+						"LocalDispatcher. The script is loaded once, and then requests "
+						"to execute nodes are read from stdin, one JSON object per line, "
+						"each containing \"nodes\", \"frames\" and \"context\" entries "
+						"with the same meaning as the equivalent parameters. A JSON "
+						"response containing the result and the memory usage of the "
+						"worker is written to stdout for each request.",
+					defaultValue = False,
+				),
+
 			]
 
 		)
@@ -118,6 +145,10 @@ class execute( Gaffer.Application ) :
 
 	def _run( self, args ) :
 
+		if args["diskCacheDirectory"].value :
+			Gaffer.ValuePlug.setDiskCacheSizeLimit( args["diskCacheSizeLimit"].value * 1024 * 1024 )
+			Gaffer.ValuePlug.setDiskCacheDirectory( args["diskCacheDirectory"].value )
+
 		scriptNode = Gaffer.ScriptNode()
 		scriptNode["fileName"].setValue( os.path.abspath( args["script"].value ) )
 		try :
@@ -128,9 +159,55 @@ class execute( Gaffer.Application ) :
 
 		self.root()["scripts"].addChild( scriptNode )
 
+		if args["worker"].value :
+			return self.__runWorker( scriptNode )
+
+		return self.__execute(
+			scriptNode,
+			args["nodes"],
+			self.parameters()["frames"].getFrameListValue().asList(),
+			args["context"],
+		)
+
+	def __runWorker( self, scriptNode ) :
+
+		# Responses are written to the original stdout, and stdout itself
+		# is redirected to stderr, so that output from the tasks being executed
+		# can't be confused with the responses.
+		sys.stdout.flush()
+		responses = os.fdopen( os.dup( sys.stdout.fileno() ), "w" )
+		os.dup2( sys.stderr.fileno(), sys.stdout.fileno() )
+
+		for line in iter( sys.stdin.readline, "" ) :
+
+			request = json.loads( line )
+			contextArgs = []
+			for key, value in request["context"].items() :
+				contextArgs.extend( [ "-" + str( key ), str( value ) ] )
+
+			result = self.__execute(
+				scriptNode,
+				[ str( n ) for n in request["nodes"] ],
+				IECore.FrameList.parse( str( request["frames"] ) ).asList(),
+				contextArgs,
+			)
+
+			responses.write(
+				json.dumps( {
+					"result" : result,
+					# Peak resident set size, in kilobytes.
+					"rss" : resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss,
+				} ) + "\n"
+			)
+			responses.flush()
+
+		return 0
+
+	def __execute( self, scriptNode, nodeNames, frames, contextArgs ) :
+
 		nodes = []
-		if len( args["nodes"] ) :
-			for nodeName in args["nodes"] :
+		if len( nodeNames ) :
+			for nodeName in nodeNames :
 				node = scriptNode.descendant( nodeName )
 				if node is None :
 					IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Node \"%s\" does not exist" % nodeName )
@@ -147,16 +224,14 @@ class execute( Gaffer.Application ) :
 				IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Script has no executable nodes" )
 				return 1
 
-		if len(args["context"]) % 2 :
+		if len( contextArgs ) % 2 :
 			IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Context parameter must have matching entry/value pairs" )
 			return 1
 
 		context = Gaffer.Context( scriptNode.context() )
-		for i in range( 0, len(args["context"]), 2 ) :
-			entry = args["context"][i].lstrip( "-" )
-			context[entry] = eval( args["context"][i+1] )
-
-		frames = self.parameters()["frames"].getFrameListValue().asList()
+		for i in range( 0, len( contextArgs ), 2 ) :
+			entry = contextArgs[i].lstrip( "-" )
+			context[entry] = eval( contextArgs[i+1] )
 
 		with context :
 			for node in nodes :
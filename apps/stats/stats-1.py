@@ -37,7 +37,9 @@
 import os
 import gc
 import sys
+import ast
 import time
+import bisect
 import resource
 import collections
 
@@ -64,6 +66,12 @@ class stats( Gaffer.Application ) :
 			gaffer stats fileName.gfr
 			```
 
+			To find out which nodes and references take the longest to load :
+
+			```
+			gaffer stats fileName.gfr -loadingStatistics
+			```
+
 			To run a scene processing node using the performance monitor :
 
 			```
@@ -115,6 +123,15 @@ class stats( Gaffer.Application ) :
 					defaultValue = False,
 				),
 
+				IECore.BoolParameter(
+					name = "loadingStatistics",
+					description = "Measures the time taken to load each type of node "
+						"and each Reference. This requires the script to be loaded one "
+						"statement at a time, so the overall loading time will be slower "
+						"than usual.",
+					defaultValue = False,
+				),
+
 				IECore.IntParameter(
 					name = "maxLinesPerMetric",
 					description = "The maximum number of plugs to list for each metric "
@@ -147,8 +164,12 @@ class stats( Gaffer.Application ) :
 		script = Gaffer.ScriptNode()
 		script["fileName"].setValue( os.path.abspath( args["script"].value ) )
 
+		self.__loadingStatistics = None
 		with _Timer() as loadingTimer :
-			script.load( continueOnError = True )
+			if args["loadingStatistics"].value :
+				self.__loadingStatistics = self.__loadWithStatistics( script )
+			else :
+				script.load( continueOnError = True )
 		self.__timers["Loading"] = loadingTimer
 
 		self.__memory["Script"] = _Memory.maxRSS() - self.__memory["Application"]
@@ -171,6 +192,12 @@ class stats( Gaffer.Application ) :
 
 			self.__printNodes( script )
 
+			if self.__loadingStatistics is not None :
+
+				print ""
+
+				self.__printLoadingStatistics( args )
+
 			if args["scene"].value :
 
 				self.__printScene( script, args )
@@ -266,6 +293,117 @@ class stats( Gaffer.Application ) :
 		print "Nodes :\n"
 		self.__printItems( items )
 
+	def __loadWithStatistics( self, script ) :
+
+		# We load the script as normal, but trace the execution of its
+		# top level statements, attributing the time taken by each to
+		# the node it operates on. The serialiser refers to nodes via the
+		# "__children" dictionary, so we use that to identify them.
+
+		fileName = script["fileName"].getValue()
+		with open( fileName ) as f :
+			statements = ast.parse( f.read(), fileName ).body
+
+		lineNumbers = [ s.lineno for s in statements ]
+		statementTimes = collections.defaultdict( float )
+
+		# The index of the statement currently being executed,
+		# and the time at which it started.
+		current = [ None, 0.0 ]
+
+		def finishStatement() :
+
+			if current[0] is not None :
+				statementTimes[current[0]] += time.time() - current[1]
+				current[0] = None
+
+		def localTrace( frame, event, arg ) :
+
+			if event == "line" :
+				index = bisect.bisect_right( lineNumbers, frame.f_lineno ) - 1
+				if index != current[0] :
+					finishStatement()
+					current[:] = [ index, time.time() ]
+			elif event == "return" :
+				finishStatement()
+
+			return localTrace
+
+		def globalTrace( frame, event, arg ) :
+
+			# We only trace the module level code of the script itself,
+			# and not that of any files it loads in turn (for References
+			# for instance), since they are executed from within one of
+			# the script's own statements.
+			if (
+				current[0] is None and
+				frame.f_code.co_name == "<module>" and
+				frame.f_code.co_filename == "<string>"
+			) :
+				return localTrace
+
+			return None
+
+		sys.settrace( globalTrace )
+		try :
+			script.load( continueOnError = True )
+		finally :
+			sys.settrace( None )
+
+		nodeTypeTimes = collections.defaultdict( float )
+		referenceTimes = collections.defaultdict( float )
+
+		for index, duration in statementTimes.items() :
+
+			node = None
+			nodeName = self.__childrenKey( statements[index] )
+			if nodeName is not None :
+				node = script.getChild( nodeName )
+
+			if node is None :
+				nodeTypeTimes["Other"] += duration
+				continue
+
+			nodeTypeTimes[node.typeName().rpartition( ":" )[2]] += duration
+			if isinstance( node, Gaffer.Reference ) :
+				referenceTimes[node.relativeName( script )] += duration
+
+		return nodeTypeTimes, referenceTimes
+
+	# Returns the key used in the first `__children[key]` expression
+	# found in a depth first search of the statement, or None.
+	def __childrenKey( self, node ) :
+
+		if (
+			isinstance( node, ast.Subscript ) and
+			isinstance( node.value, ast.Name ) and node.value.id == "__children" and
+			isinstance( node.slice, ast.Index ) and isinstance( node.slice.value, ast.Str )
+		) :
+			return node.slice.value.s
+
+		for child in ast.iter_child_nodes( node ) :
+			key = self.__childrenKey( child )
+			if key is not None :
+				return key
+
+		return None
+
+	def __printLoadingStatistics( self, args ) :
+
+		nodeTypeTimes, referenceTimes = self.__loadingStatistics
+		n = args["maxLinesPerMetric"].value
+
+		def items( times ) :
+			times = sorted( times.items(), key = lambda x : x[1], reverse = True )[:n]
+			return [ ( name, "%.3fs" % t ) for name, t in times ]
+
+		print "Loading (by node type) :\n"
+		self.__printItems( items( nodeTypeTimes ) )
+
+		if referenceTimes :
+			print "\nLoading (by reference) :\n"
+			self.__printItems( items( referenceTimes ) )
+
 	def __printScene( self, script, args ) :
 
 		import GafferScene
@@ -39,6 +39,8 @@
 #define GAFFER_ACTION_H
 
 #include "boost/function.hpp"
+#include "boost/signals.hpp"
+#include "boost/noncopyable.hpp"
 
 #include "IECore/RunTimeTyped.h"
 
@@ -98,6 +100,20 @@ class Action : public IECore::RunTimeTyped
 		/// system, so it is sufficient to bind only raw pointers to the subject.
 		static void enact( GraphComponentPtr subject, const Function &doFn, const Function &undoFn );
 
+		typedef boost::signal<void ( GraphComponent *subject, Stage stage )> EditSignal;
+		/// A signal emitted on the editing thread immediately before an
+		/// action is done, undone or redone. Clients performing computations
+		/// on background threads may connect to it to stop them before the
+		/// graph is modified. Because slots may wait for those computations,
+		/// which may themselves need the GIL, edits made from Python must
+		/// release the GIL first.
+		static EditSignal &preActionSignal();
+		/// A signal emitted after an action has been done, undone or redone,
+		/// even if it failed. It is always paired with a preceding emission
+		/// of preActionSignal(), and emissions nest if an action is performed
+		/// while another is in progress.
+		static EditSignal &postActionSignal();
+
 	protected :
 
 		Action();
@@ -136,6 +152,23 @@ class Action : public IECore::RunTimeTyped
 
 		friend class ScriptNode;
 
+		// Emits preActionSignal() on construction and postActionSignal()
+		// on destruction.
+		class EditScope : boost::noncopyable
+		{
+
+			public :
+
+				EditScope( GraphComponent *subject, Stage stage );
+				~EditScope();
+
+			private :
+
+				GraphComponent *m_subject;
+				Stage m_stage;
+
+		};
+
 		bool m_done;
 
 };
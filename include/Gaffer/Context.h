@@ -171,6 +171,10 @@ class Context : public IECore::RefCounted
 		/// A signal emitted when an element of the context is changed.
 		ChangedSignal &changedSignal();
 
+		/// Returns a hash of all the values, excluding those whose
+		/// names begin with "ui:". The hash is independent of the order
+		/// in which names were interned, so it is the same in every
+		/// process.
 		IECore::MurmurHash hash() const;
 
 		bool operator == ( const Context &other ) const;
@@ -231,6 +235,47 @@ class Context : public IECore::RefCounted
 
 		};
 
+		/// The EditableScope class provides an efficient means of varying
+		/// a context for the duration of a computation. It makes current
+		/// a temporary copy which borrows all values from the original,
+		/// and which inherits the hashes of the original values, so that
+		/// only the edited variables need to be rehashed. The copies are
+		/// recycled on a per-thread basis, along with the values set on
+		/// them, so in the common case no allocations are made.
+		/// \note The context being copied must remain alive and unchanged
+		/// for the lifetime of the scope. This is guaranteed for the current
+		/// context within a compute() or hash() method.
+		class EditableScope : boost::noncopyable
+		{
+
+			public :
+
+				EditableScope( const Context *context );
+				~EditableScope();
+
+				/// Equivalent to Context::set(). Repeated calls for the same
+				/// variable update the value in place, avoiding allocations.
+				template<typename T>
+				void set( const IECore::InternedString &name, const T &value );
+				/// Sets a variable to reference `value` directly, without copying
+				/// it or even incrementing its reference count. It is the
+				/// responsibility of the caller to ensure that the value remains
+				/// alive and unchanged for the lifetime of the scope.
+				void setBorrowed( const IECore::InternedString &name, const IECore::Data *value );
+				void setFrame( float frame );
+				void remove( const IECore::InternedString &name );
+
+				const Context *context() const;
+
+			private :
+
+				static Ptr acquireContext( const Context *context );
+
+				Ptr m_context;
+				Scope m_scope;
+
+		};
+
 		/// Returns the current context for the calling thread.
 		static const Context *current();
 
@@ -238,6 +283,18 @@ class Context : public IECore::RefCounted
 
 		void substituteInternal( const char *s, std::string &result, const int recursionDepth, unsigned substitutions ) const;
 
+		struct Storage;
+		// Updates the hashes and emits changedSignal() following
+		// a change to the value in storage.
+		void valueChanged( const IECore::InternedString &name, Storage &storage );
+		void updateHash();
+
+		// Used by EditableScope to reuse contexts and the values
+		// set on them, rather than allocating new ones.
+		void borrowFrom( const Context &other );
+		template<typename DataType>
+		bool reuseSpareData( Storage &storage );
+
 		// Storage for each entry.
 		struct Storage
 		{
@@ -248,14 +305,23 @@ class Context : public IECore::RefCounted
 			// And use this ownership flag to tell us when we need to do explicit
 			// reference count management.
 			Ownership ownership;
+			// Hash of the data, computed whenever the data is set. This is
+			// copied along with the data, so a context copied from another
+			// only needs to hash the values that are subsequently edited.
+			// Computing it up front rather than lazily in hash() means that
+			// hash() never modifies the context, so is safe to call
+			// concurrently from multiple threads.
+			IECore::MurmurHash hash;
 		};
 
 		typedef boost::container::flat_map<IECore::InternedString, Storage> Map;
 
 		Map m_map;
 		ChangedSignal *m_changedSignal;
-		mutable IECore::MurmurHash m_hash;
-		mutable bool m_hashValid;
+		IECore::MurmurHash m_hash;
+		// Values previously set by an EditableScope, kept for reuse
+		// by the next scope to use this context.
+		std::vector<IECore::DataPtr> m_spareData;
 
 };
 
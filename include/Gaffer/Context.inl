@@ -143,6 +143,10 @@ struct Context::Accessor<T, typename boost::enable_if<boost::is_base_of<IECore::
 {
 	typedef typename boost::remove_pointer<T>::type ValueType;
 	typedef const ValueType *ResultType;
+	// We always take a copy of the value in set(), so there is
+	// nothing to gain from reusing spare data. No spare will
+	// ever have the abstract Data type, so this disables reuse.
+	typedef IECore::Data DataType;
 
 	bool set( Storage &storage, const T &value )
 	{
@@ -181,11 +185,7 @@ void Context::set( const IECore::InternedString &name, const T &value )
 	Storage &s = m_map[name];
 	if( Accessor<T>().set( s, value ) )
 	{
-		m_hashValid = false;
-		if( m_changedSignal )
-		{
-			(*m_changedSignal)( this, name );
-		}
+		valueChanged( name, s );
 	}
 }
 
@@ -211,6 +211,55 @@ typename Context::Accessor<T>::ResultType Context::get( const IECore::InternedSt
 	return Accessor<T>().get( it->second.data );
 }
 
+template<typename DataType>
+bool Context::reuseSpareData( Storage &storage )
+{
+	if( storage.data && storage.ownership == Copied )
+	{
+		// Accessor::set() can already update this in place.
+		return false;
+	}
+
+	for( std::vector<IECore::DataPtr>::iterator it = m_spareData.begin(), eIt = m_spareData.end(); it != eIt; ++it )
+	{
+		if( (*it)->typeId() != DataType::staticTypeId() )
+		{
+			continue;
+		}
+
+		if( storage.data && storage.ownership != Borrowed )
+		{
+			storage.data->removeRef();
+		}
+		storage.data = it->get();
+		storage.data->addRef();
+		storage.ownership = Copied;
+
+		*it = m_spareData.back();
+		m_spareData.pop_back();
+		return true;
+	}
+
+	return false;
+}
+
+template<typename T>
+void Context::EditableScope::set( const IECore::InternedString &name, const T &value )
+{
+	Storage &s = m_context->m_map[name];
+	if( m_context->reuseSpareData<typename Accessor<T>::DataType>( s ) )
+	{
+		// The spare holds an unrelated value, so we must update
+		// the hash even if Accessor::set() reports no change.
+		Accessor<T>().set( s, value );
+		m_context->valueChanged( name, s );
+	}
+	else if( Accessor<T>().set( s, value ) )
+	{
+		m_context->valueChanged( name, s );
+	}
+}
+
 } // namespace Gaffer
 
 #endif // GAFFER_CONTEXT_INL
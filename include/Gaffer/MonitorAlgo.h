@@ -55,9 +55,11 @@ enum PerformanceMetric
 	PerHashDuration,
 	PerComputeDuration,
 	HashesPerCompute,
+	ComputeWaitCount,
+	ComputeWaitDuration,
 
 	First = HashCount,
-	Last = HashesPerCompute
+	Last = ComputeWaitDuration
 };
 
 std::string formatStatistics( const PerformanceMonitor &monitor, size_t maxLinesPerMetric = 50 );
@@ -54,7 +54,10 @@ namespace Gaffer
 IE_CORE_FORWARDDECLARE( Plug )
 
 /// A monitor which collects statistics about the frequency
-/// of hash and compute processes per plug.
+/// of hash and compute processes per plug. It also records
+/// the number of times a compute was avoided by waiting for
+/// an identical computation being performed concurrently on
+/// another thread.
 class PerformanceMonitor : public Monitor
 {
 
@@ -70,13 +73,21 @@ class PerformanceMonitor : public Monitor
 				size_t hashCount = 0,
 				size_t computeCount = 0,
 				boost::chrono::nanoseconds hashDuration = boost::chrono::nanoseconds( 0 ),
-				boost::chrono::nanoseconds computeDuration = boost::chrono::nanoseconds( 0 )
+				boost::chrono::nanoseconds computeDuration = boost::chrono::nanoseconds( 0 ),
+				size_t computeWaitCount = 0,
+				boost::chrono::nanoseconds computeWaitDuration = boost::chrono::nanoseconds( 0 )
 			);
 
 			size_t hashCount;
 			size_t computeCount;
 			boost::chrono::nanoseconds hashDuration;
 			boost::chrono::nanoseconds computeDuration;
+			/// The number of times a thread waited for another
+			/// thread to compute the value, instead of computing
+			/// it itself.
+			size_t computeWaitCount;
+			/// The time spent waiting.
+			boost::chrono::nanoseconds computeWaitDuration;
 
 			Statistics & operator += ( const Statistics &rhs );
 
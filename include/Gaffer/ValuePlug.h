@@ -112,6 +112,63 @@ class ValuePlug : public Plug
 		static void setCacheMemoryLimit( size_t bytes );
 		/// Returns the current memory usage of the cache in bytes.
 		static size_t cacheMemoryUsage();
+		/// Removes all values from the cache.
+		static void clearCache();
+		typedef boost::signal<void ()> CacheClearedSignal;
+		/// Emitted when the cache is cleared, either by clearCache() or
+		/// by setting a memory limit of 0. Clients which keep their own
+		/// records of computed results should discard them at this point.
+		static CacheClearedSignal &cacheClearedSignal();
+		/// Sets a directory in which computed values are stored as a
+		/// second level of caching. This allows values to be reused
+		/// between sessions, and shared between processes using the same
+		/// directory. Only cacheable plugs are stored, and small values
+		/// which are cheaper to recompute than to load are ignored. An
+		/// empty string disables the disk cache, which is the default.
+		///
+		/// \note Values are identified by hash alone, and the hashes of
+		/// nodes which read files typically depend only on the file name,
+		/// not on the file's contents or modification time. If such files
+		/// are modified in place, stale values will be loaded from the disk
+		/// cache, even in new sessions. It is the client's responsibility
+		/// to call clearDiskCache() when this happens.
+		///
+		/// \note Only values of types which are known to survive a round
+		/// trip through IECore::Object::save() and load() are stored. These
+		/// are the types defined by Cortex itself, plus any registered with
+		/// registerDiskCacheType().
+		static void setDiskCacheDirectory( const std::string &directory );
+		/// Returns the directory used for the disk cache.
+		static std::string getDiskCacheDirectory();
+		/// Returns the maximum size of the disk cache in bytes.
+		static size_t getDiskCacheSizeLimit();
+		/// Sets the maximum size of the disk cache in bytes. When the
+		/// limit is exceeded, the least recently used files are removed.
+		static void setDiskCacheSizeLimit( size_t bytes );
+		/// Returns the current size of the disk cache in bytes.
+		static size_t diskCacheUsage();
+		/// Removes all files from the disk cache directory, including
+		/// those written by other sessions.
+		static void clearDiskCache();
+		/// Registers a type as being suitable for storage in the disk
+		/// cache. This should only be used for types whose save() and
+		/// load() methods faithfully round-trip all values.
+		static void registerDiskCacheType( IECore::TypeId typeId );
+		/// Returns the maximum number of entries in the cache of
+		/// recently computed hashes.
+		static size_t getHashCacheSizeLimit();
+		/// Sets the maximum number of entries in the hash cache.
+		/// When the limit is exceeded, the least recently used
+		/// entries are discarded.
+		static void setHashCacheSizeLimit( size_t maxEntries );
+		/// Returns the current number of entries in the hash cache.
+		static size_t hashCacheUsage();
+		/// Returns the total number of hash cache lookups which
+		/// have been satisfied from the cache.
+		static size_t hashCacheHits();
+		/// Returns the total number of hash cache lookups which
+		/// have required a call to ComputeNode::hash().
+		static size_t hashCacheMisses();
 		//@}
 
 	protected :
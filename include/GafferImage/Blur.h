@@ -40,6 +40,7 @@
 #include "Gaffer/CompoundNumericPlug.h"
 
 #include "GafferImage/ImageProcessor.h"
+#include "GafferImage/ImageSwitch.h"
 
 namespace GafferImage
 {
@@ -55,6 +56,17 @@ class Blur : public ImageProcessor
 
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferImage::Blur, BlurTypeId, ImageProcessor );
 
+		enum Mode
+		{
+			/// Filters the input image directly, at a cost
+			/// proportional to the radius.
+			Exact,
+			/// Downsamples the input image before filtering
+			/// when the radius is large, so that the cost is
+			/// independent of the radius.
+			Pyramid
+		};
+
 		Gaffer::V2fPlug *radiusPlug();
 		const Gaffer::V2fPlug *radiusPlug() const;
 
@@ -64,6 +76,16 @@ class Blur : public ImageProcessor
 		Gaffer::BoolPlug *expandDataWindowPlug();
 		const Gaffer::BoolPlug *expandDataWindowPlug() const;
 
+		Gaffer::IntPlug *modePlug();
+		const Gaffer::IntPlug *modePlug() const;
+
+		/// In Pyramid mode, the input is downsampled by the largest
+		/// power of two which keeps the radius at the lower resolution
+		/// at or above this value. Larger values trade speed for
+		/// accuracy.
+		Gaffer::FloatPlug *pyramidRadiusPlug();
+		const Gaffer::FloatPlug *pyramidRadiusPlug() const;
+
 		virtual void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const;
 
 	protected :
@@ -76,6 +98,13 @@ class Blur : public ImageProcessor
 		Gaffer::V2fPlug *filterWidthPlug();
 		const Gaffer::V2fPlug *filterWidthPlug() const;
 
+		// Output plugs to compute the data window and enabled state for the internal
+		// downsampling Resample used in Pyramid mode.
+		Gaffer::AtomicBox2fPlug *downsampledDataWindowPlug();
+		const Gaffer::AtomicBox2fPlug *downsampledDataWindowPlug() const;
+		Gaffer::BoolPlug *downsampleEnabledPlug();
+		const Gaffer::BoolPlug *downsampleEnabledPlug() const;
+
 		// Input plug to receive the expanded data window from the internal Resample.
 		Gaffer::AtomicBox2iPlug *resampledDataWindowPlug();
 		const Gaffer::AtomicBox2iPlug *resampledDataWindowPlug() const;
@@ -88,6 +117,15 @@ class Blur : public ImageProcessor
 		Resample *resample();
 		const Resample *resample() const;
 
+		// Internal resample node used to downsample the input in Pyramid mode.
+		Resample *downsample();
+		const Resample *downsample() const;
+
+		// Internal switch which only routes the input through
+		// the downsample in Pyramid mode.
+		ImageSwitch *downsampleSwitch();
+		const ImageSwitch *downsampleSwitch() const;
+
 		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
 
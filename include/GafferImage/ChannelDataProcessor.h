@@ -72,6 +72,9 @@ class ChannelDataProcessor : public ImageProcessor
 
 		/// Implemented to initialize the output tile and then call processChannelData()
 		/// All other ImagePlug children are passed through via direct connection to the input values.
+		/// ChannelDataProcessors connected directly upstream are fused into the same compute,
+		/// with their processChannelData() methods being applied in turn to a single copy of the
+		/// input tile.
 		virtual IECore::ConstFloatVectorDataPtr computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const;
 
 		/// Should be implemented by derived classes to processes each channel's data.
@@ -84,6 +87,11 @@ class ChannelDataProcessor : public ImageProcessor
 
 	private :
 
+		// ColorProcessor fuses ChannelDataProcessors into
+		// its own processing, and therefore needs access
+		// to processChannelData() and friends.
+		friend class ColorProcessor;
+
 		static size_t g_firstPlugIndex;
 
 };
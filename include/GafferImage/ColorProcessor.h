@@ -66,6 +66,9 @@ class ColorProcessor : public ImageProcessor
 
 		/// Implemented to process the color data and stash the results on colorDataPlug()
 		/// format, dataWindow, metadata, and channelNames are passed through via direct connection to the input values.
+		/// ColorProcessors and ChannelDataProcessors connected directly upstream are fused into
+		/// the same compute, with their processing being applied in turn to a single copy of the
+		/// input tiles.
 		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
 		/// Implemented to use the results of colorDataPlug() via processColorData()
 		virtual IECore::ConstFloatVectorDataPtr computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const;
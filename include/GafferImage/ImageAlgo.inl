@@ -40,6 +40,8 @@
 #include "tbb/tbb.h"
 #include "boost/tuple/tuple.hpp"
 
+#include "IECore/SimpleTypedData.h"
+
 #include "Gaffer/Context.h"
 #include "GafferImage/ImagePlug.h"
 #include "GafferImage/BufferAlgo.h"
@@ -82,8 +84,7 @@ class ProcessTiles
 
 		void operator()( const tbb::blocked_range2d<size_t>& r ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			Imath::V2i tileId;
 			Imath::V2i tileIdMax( r.rows().end(), r.cols().end() );
@@ -93,7 +94,7 @@ class ProcessTiles
 				for( tileId.y = r.cols().begin(); tileId.y < tileIdMax.y; ++tileId.y )
 				{
 					Imath::V2i tileOrigin = m_tilesOrigin + ( tileId * ImagePlug::tileSize() );
-					context->set( ImagePlug::tileOriginContextName, tileOrigin );
+					context.set( ImagePlug::tileOriginContextName, tileOrigin );
 
 					m_functor( m_imagePlug, tileOrigin );
 				}
@@ -102,8 +103,7 @@ class ProcessTiles
 
 		void operator()( const tbb::blocked_range3d<size_t>& r ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			Imath::V2i tileId;
 			Imath::V2i tileIdMax( r.rows().end(), r.cols().end() );
@@ -113,11 +113,11 @@ class ProcessTiles
 				for( tileId.y = r.cols().begin(); tileId.y < tileIdMax.y; ++tileId.y )
 				{
 					Imath::V2i tileOrigin = m_tilesOrigin + ( tileId * ImagePlug::tileSize() );
-					context->set( ImagePlug::tileOriginContextName, tileOrigin );
+					context.set( ImagePlug::tileOriginContextName, tileOrigin );
 
 					for( size_t channelIndex = r.pages().begin(); channelIndex < r.pages().end(); ++channelIndex )
 					{
-						context->set( ImagePlug::channelNameContextName, m_channelNames[channelIndex] );
+						context.set( ImagePlug::channelNameContextName, m_channelNames[channelIndex] );
 
 						m_functor( m_imagePlug, m_channelNames[channelIndex], tileOrigin );
 					}
@@ -284,6 +284,17 @@ class TileInputFilter
 		InputIterator &m_it;
 };
 
+inline std::vector<IECore::ConstStringDataPtr> channelNameData( const std::vector<std::string> &channelNames )
+{
+	std::vector<IECore::ConstStringDataPtr> result;
+	result.reserve( channelNames.size() );
+	for( std::vector<std::string>::const_iterator it = channelNames.begin(), eIt = channelNames.end(); it != eIt; ++it )
+	{
+		result.push_back( new IECore::StringData( *it ) );
+	}
+	return result;
+}
+
 template<class TileFunctor>
 class TileFunctorFilter
 {
@@ -309,32 +320,31 @@ class TileFunctorFilter
 			) :
 				m_functor( functor ),
 				m_imagePlug( imagePlug ),
-				m_channelNames( channelNames ),
+				m_channelNames( channelNameData( channelNames ) ),
 				m_tilesOrigin( tilesOrigin ),
 				m_parentContext( context )
 		{}
 
 		boost::tuple<size_t, Imath::V2i, typename TileFunctor::Result> operator()( boost::tuple<size_t, Imath::V2i> &it ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			const Imath::V2i tileOrigin = m_tilesOrigin + ( boost::get<1>( it ) * ImagePlug::tileSize() );
-			context->set( ImagePlug::tileOriginContextName, tileOrigin );
-			context->set( ImagePlug::channelNameContextName, m_channelNames[boost::get<0>( it )] );
+			context.set( ImagePlug::tileOriginContextName, tileOrigin );
+			const IECore::StringData *channelName = m_channelNames[boost::get<0>( it )].get();
+			context.setBorrowed( ImagePlug::channelNameContextName, channelName );
 
-			typename TileFunctor::Result result = m_functor( m_imagePlug, m_channelNames[boost::get<0>( it )], tileOrigin );
+			typename TileFunctor::Result result = m_functor( m_imagePlug, channelName->readable(), tileOrigin );
 
 			return boost::tuple<size_t, Imath::V2i, typename TileFunctor::Result>( boost::get<0>( it ), boost::get<1>( it ), result );
 		}
 
 		boost::tuple<Imath::V2i, typename TileFunctor::Result> operator()( boost::tuple<Imath::V2i> &it ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			const Imath::V2i tileOrigin = m_tilesOrigin + ( boost::get<0>( it ) * ImagePlug::tileSize() );
-			context->set( ImagePlug::tileOriginContextName, tileOrigin );
+			context.set( ImagePlug::tileOriginContextName, tileOrigin );
 
 			typename TileFunctor::Result result = m_functor( m_imagePlug, tileOrigin );
 
@@ -344,7 +354,9 @@ class TileFunctorFilter
 	private:
 		TileFunctor &m_functor;
 		const ImagePlug *m_imagePlug;
-		const std::vector<std::string> m_channelNames; // Don't declare as a reference, as it may not be set in the constructor
+		// Held as data so that it can be borrowed by the context for each tile,
+		// rather than being copied.
+		const std::vector<IECore::ConstStringDataPtr> m_channelNames;
 		const Imath::V2i &m_tilesOrigin;
 		const Gaffer::Context *m_parentContext;
 };
@@ -374,30 +386,29 @@ class GatherFunctorFilter
 			) :
 				m_functor( functor ),
 				m_imagePlug( imagePlug ),
-				m_channelNames( channelNames ),
+				m_channelNames( channelNameData( channelNames ) ),
 				m_tilesOrigin( tilesOrigin ),
 				m_parentContext( context )
 		{}
 
 		void operator()( boost::tuple<size_t, Imath::V2i, typename TileFunctor::Result> &it ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			const Imath::V2i tileOrigin = m_tilesOrigin + ( boost::get<1>( it ) * ImagePlug::tileSize() );
-			context->set( ImagePlug::tileOriginContextName, tileOrigin );
-			context->set( ImagePlug::channelNameContextName, m_channelNames[boost::get<0>( it )] );
+			context.set( ImagePlug::tileOriginContextName, tileOrigin );
+			const IECore::StringData *channelName = m_channelNames[boost::get<0>( it )].get();
+			context.setBorrowed( ImagePlug::channelNameContextName, channelName );
 
-			m_functor( m_imagePlug, m_channelNames[boost::get<0>( it )], tileOrigin, boost::get<2>( it ) );
+			m_functor( m_imagePlug, channelName->readable(), tileOrigin, boost::get<2>( it ) );
 		}
 
 		void operator()( boost::tuple<Imath::V2i, typename TileFunctor::Result> &it ) const
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_parentContext, Gaffer::Context::Borrowed );
-			Gaffer::Context::Scope scope( context.get() );
+			Gaffer::Context::EditableScope context( m_parentContext );
 
 			const Imath::V2i tileOrigin = m_tilesOrigin + ( boost::get<0>( it ) * ImagePlug::tileSize() );
-			context->set( ImagePlug::tileOriginContextName, tileOrigin );
+			context.set( ImagePlug::tileOriginContextName, tileOrigin );
 
 			m_functor( m_imagePlug, tileOrigin, boost::get<1>( it ) );
 		}
@@ -405,7 +416,9 @@ class GatherFunctorFilter
 	private:
 		GatherFunctor &m_functor;
 		const ImagePlug *m_imagePlug;
-		const std::vector<std::string> m_channelNames; // Don't declare as a reference, as it may not be set in the constructor
+		// Held as data so that it can be borrowed by the context for each tile,
+		// rather than being copied.
+		const std::vector<IECore::ConstStringDataPtr> m_channelNames;
 		const Imath::V2i m_tilesOrigin;
 		const Gaffer::Context *m_parentContext;
 };
@@ -506,7 +519,7 @@ void parallelProcessTiles( const ImagePlug *imagePlug, ThreadableFunctor &functo
 	}
 
 	const Imath::V2i tilesOrigin = ImagePlug::tileOrigin( processWindow.min );
-	const Imath::V2i numTiles = ( ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) - tilesOrigin ) / ImagePlug::tileSize();
+	const Imath::V2i numTiles = ( ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) - tilesOrigin ) / ImagePlug::tileSize() + Imath::V2i( 1 );
 
 	parallel_for( tbb::blocked_range2d<size_t>( 0, numTiles.x, 1, 0, numTiles.y, 1 ),
 			  GafferImage::Detail::ProcessTiles<ThreadableFunctor>( functor, imagePlug, tilesOrigin, Gaffer::Context::current() ) );
@@ -546,7 +559,7 @@ void parallelGatherTiles( const ImagePlug *imagePlug, TileFunctor &tileFunctor,
 	}
 
 	const Imath::V2i tilesOrigin = ImagePlug::tileOrigin( processWindow.min );
-	const Imath::V2i numTiles = ( ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) - tilesOrigin ) / ImagePlug::tileSize();
+	const Imath::V2i numTiles = ( ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) - tilesOrigin ) / ImagePlug::tileSize() + Imath::V2i( 1 );
 
 	GafferImage::Detail::TileInputIterator inputIterator( numTiles, tileOrder );
 
@@ -103,6 +103,13 @@ class ImagePlug : public Gaffer::ValuePlug
 		const Gaffer::CompoundObjectPlug *metadataPlug() const;
 		Gaffer::StringVectorDataPlug *channelNamesPlug();
 		const Gaffer::StringVectorDataPlug *channelNamesPlug() const;
+		/// \todo Channel data is always float, so tiles computed from half
+		/// or 8 bit images take two or four times their native memory in the
+		/// compute cache. The OpenImageIOReader keeps tiles at native precision
+		/// in its own cache, and leaves its outputs uncached, so pass-through
+		/// graphs don't pay this cost. Supporting reduced precision in other
+		/// nodes would require an alternative representation here, with all
+		/// nodes able to accept it.
 		Gaffer::FloatVectorDataPlug *channelDataPlug();
 		const Gaffer::FloatVectorDataPlug *channelDataPlug() const;
 		//@}
@@ -91,6 +91,14 @@ class ImageProcessor : public ImageNode
 		/// Reimplemented from ImageNode to pass through the inPlug() computations when the node is disabled.
 		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
 
+		/// Returns the ImageProcessor whose output channel data is connected
+		/// directly to the channel data of `image`, provided that connection
+		/// is its only output. Returns NULL otherwise. This allows derived classes
+		/// to fuse their processing with that of the nodes upstream, applying it
+		/// all in a single compute rather than computing and caching an
+		/// intermediate result per node.
+		static const ImageProcessor *exclusiveUpstreamProcessor( const ImagePlug *image );
+
 	private :
 
 		static size_t g_firstPlugIndex;
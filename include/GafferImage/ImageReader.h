@@ -95,6 +95,12 @@ class ImageReader : public ImageNode
 		Gaffer::IntPlug *missingFrameModePlug();
 		const Gaffer::IntPlug *missingFrameModePlug() const;
 
+		Gaffer::IntPlug *mipLevelPlug();
+		const Gaffer::IntPlug *mipLevelPlug() const;
+
+		Gaffer::IntPlug *readAheadPlug();
+		const Gaffer::IntPlug *readAheadPlug() const;
+
 		Gaffer::IntPlug *startModePlug();
 		const Gaffer::IntPlug *startModePlug() const;
 
@@ -40,6 +40,8 @@
 #include "Gaffer/ComputeNode.h"
 #include "Gaffer/CompoundNumericPlug.h"
 #include "Gaffer/BoxPlug.h"
+#include "Gaffer/NumericPlug.h"
+#include "Gaffer/TypedObjectPlug.h"
 
 #include "GafferImage/ImagePlug.h"
 #include "GafferImage/ChannelMaskPlug.h"
@@ -48,7 +50,10 @@ namespace GafferImage
 {
 
 /// Provides statistics on an image's colour profile.
-/// The ImageStats node outputs the minimum, maximum and average values of the pixel values within a region of interest in the image.
+/// The ImageStats node outputs the minimum, maximum, average and percentile values of the pixel values within a region
+/// of interest in the image, along with a histogram and counts of non-finite values. All statistics for all channels are
+/// computed together in a single tile-parallel pass over the input, and stored on an internal plug from which the
+/// individual outputs are read.
 class ImageStats : public Gaffer::ComputeNode
 {
 
@@ -67,31 +72,63 @@ class ImageStats : public Gaffer::ComputeNode
 		const ChannelMaskPlug *channelsPlug() const;
 		Gaffer::Box2iPlug *regionOfInterestPlug();
 		const Gaffer::Box2iPlug *regionOfInterestPlug() const;
+		Gaffer::IntPlug *histogramBinsPlug();
+		const Gaffer::IntPlug *histogramBinsPlug() const;
+		Gaffer::V2fPlug *histogramRangePlug();
+		const Gaffer::V2fPlug *histogramRangePlug() const;
+		Gaffer::FloatPlug *percentilePlug();
+		const Gaffer::FloatPlug *percentilePlug() const;
 		Gaffer::Color4fPlug *averagePlug();
 		const Gaffer::Color4fPlug *averagePlug() const;
 		Gaffer::Color4fPlug *minPlug();
 		const Gaffer::Color4fPlug *minPlug() const;
 		Gaffer::Color4fPlug *maxPlug();
 		const Gaffer::Color4fPlug *maxPlug() const;
+		/// The value below which `percentile` percent of the
+		/// finite pixel values fall. This is estimated from the
+		/// histogram, so its accuracy depends on the histogram
+		/// settings.
+		Gaffer::Color4fPlug *percentileValuePlug();
+		const Gaffer::Color4fPlug *percentileValuePlug() const;
+		/// Has an IntVectorDataPlug child per channel, named
+		/// "r", "g", "b" and "a". Values outside the histogram
+		/// range are counted in the first or last bin.
+		Gaffer::ValuePlug *histogramPlug();
+		const Gaffer::ValuePlug *histogramPlug() const;
+		/// The total number of NaN and infinite values found
+		/// in all channels. Non-finite values are excluded from
+		/// all other statistics.
+		Gaffer::IntPlug *nanCountPlug();
+		const Gaffer::IntPlug *nanCountPlug() const;
+		Gaffer::IntPlug *infCountPlug();
+		const Gaffer::IntPlug *infCountPlug() const;
 
 	protected :
 
 		/// Implemented to hash the area we are sampling along with the channel context and regionOfInterest.
 		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 
-		/// Computes the min, max and average plugs by analyzing the input ImagePlug.
+		/// Computes the statistics for all channels in one pass over the input ImagePlug, and
+		/// then the individual outputs from those.
 		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
 
 	private :
 
-		/// Sets channelName to the channel which corresponds to the output plug. The channel name is
-		/// computed from the intersection of the "in" plug's channels and the "channels" plug's channels.
-		/// If multiple channels are found to have the same channel index, the first is used.
-		/// For more information on this, please see ChannelMaskPlug::removeDuplicateIndices().
-		void channelNameFromOutput( const Gaffer::ValuePlug *output, std::string &channelName ) const;
-
-		/// A convenience function to just set the plug to 0 or 1 depending on what it's index is.
-		void setOutputToDefault( Gaffer::FloatPlug *output ) const;
+		/// Holds a CompoundObject containing the statistics for all channels.
+		Gaffer::ObjectPlug *statisticsPlug();
+		const Gaffer::ObjectPlug *statisticsPlug() const;
+
+		/// Fills channelNames with the channel to be analysed for each of the four
+		/// channel indices, leaving an empty string where there is no such channel. The
+		/// channel names are computed from the intersection of the "in" plug's channels and
+		/// the "channels" plug's channels. If multiple channels are found to have the same
+		/// channel index, the first is used. For more information on this, please see
+		/// ChannelMaskPlug::removeDuplicateIndices().
+		void statisticsChannels( std::string channelNames[4] ) const;
+
+		/// Returns the channel index (0-3) of a per-channel output, or
+		/// -1 if the plug is not a per-channel output.
+		int channelIndexFromOutput( const Gaffer::ValuePlug *output ) const;
 
 		/// Implemented to initialize the default format settings if they don't exist already.
 		void parentChanging( Gaffer::GraphComponent *newParent );
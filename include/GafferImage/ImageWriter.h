@@ -87,6 +87,9 @@ class ImageWriter : public GafferDispatch::TaskNode
 		virtual IECore::MurmurHash hash( const Gaffer::Context *context ) const;
 
 		virtual void execute() const;
+		/// Overlaps the computation of each frame with the writing
+		/// of the previous one.
+		virtual void executeSequence( const std::vector<float> &frames ) const;
 
 		const std::string currentFileFormat() const;
 
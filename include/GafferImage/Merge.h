@@ -51,8 +51,9 @@ namespace GafferImage
 ///
 /// - For some operations (multiply for instance) our output data window could be the intersection
 ///   of all input windows, rather than the union.
-/// - For some operations (add for instance) we could entirely skip invalid input tiles, and tiles
-///   where channelData == ImagePlug::blackTile().
+/// - For some operations (add for instance) we could entirely skip tiles where
+///   channelData == ImagePlug::blackTile(), as we already do for tiles outside the
+///   input's data window.
 /// - For some operations we do not need to track the intermediate alpha values at all.
 /// - We could improve our masking of invalid pixels with special cases for wholly valid tiles,
 ///   wholly invalid tiles, and by chunking the work on the valid sections.
@@ -89,6 +90,9 @@ class Merge : public ImageProcessor
 
 	protected :
 
+		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
+
 		/// Reimplemented to hash the connected input plugs
 		virtual void hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual void hashChannelNames( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
@@ -103,9 +107,22 @@ class Merge : public ImageProcessor
 
 	private :
 
+		// Spatial index of the connected inputs, listing the inputs
+		// whose data windows overlap each tile. This allows us to
+		// consider only the relevant inputs when processing a tile,
+		// rather than every input in turn.
+		Gaffer::CompoundObjectPlug *inputIndexPlug();
+		const Gaffer::CompoundObjectPlug *inputIndexPlug() const;
+
+		// A single input to be composited into a tile.
+		struct Layer;
+		// Fills `layers` with the inputs which must be composited into the
+		// specified tile, omitting those which cannot affect the result.
+		void layers( Operation operation, const std::string &channelName, const Imath::V2i &tileOrigin, std::vector<Layer> &layers ) const;
+
 		// Performs the merge operation using the functor 'F'.
 		template<typename F>
-		IECore::ConstFloatVectorDataPtr merge( F f, const std::string &channelName, const Imath::V2i &tileOrigin ) const;
+		IECore::ConstFloatVectorDataPtr merge( F f, const std::vector<Layer> &layers, const std::string &channelName, const Imath::V2i &tileOrigin ) const;
 
 		static size_t g_firstPlugIndex;
 
@@ -82,6 +82,21 @@ class OpenImageIOReader : public ImageNode
 		Gaffer::IntVectorDataPlug *availableFramesPlug();
 		const Gaffer::IntVectorDataPlug *availableFramesPlug() const;
 
+		/// The MIP level to read from mip-mapped files. Level 0
+		/// is full resolution, and each subsequent level halves the
+		/// resolution. Levels beyond those present in the file
+		/// are clamped to the lowest resolution available.
+		Gaffer::IntPlug *mipLevelPlug();
+		const Gaffer::IntPlug *mipLevelPlug() const;
+
+		/// The number of frames of a file sequence to read ahead
+		/// of the current frame. When non-zero, each tile requested
+		/// for the current frame causes the same tile to be loaded
+		/// into the cache for the following available frames, on
+		/// background threads.
+		Gaffer::IntPlug *readAheadPlug();
+		const Gaffer::IntPlug *readAheadPlug() const;
+
 		virtual void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const;
 
 		static size_t supportedExtensions( std::vector<std::string> &extensions );
@@ -111,6 +126,7 @@ class OpenImageIOReader : public ImageNode
 	private :
 
 		void hashFileName( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		void readAhead( const std::string &fileName, int mipLevel, const Imath::V2i &tileOrigin, const Gaffer::Context *context ) const;
 
 		void plugSet( Gaffer::Plug *plug );
 
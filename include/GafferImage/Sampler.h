@@ -95,6 +95,16 @@ class Sampler
 		/// 0.5, 0.5.
 		inline float sample( float x, float y );
 
+		/// Fills `result` with the values of the pixels from
+		/// `xBegin` up to but not including `xEnd` in row `y`.
+		/// Each tile is looked up only once, and its pixels are
+		/// copied in bulk, so this is much faster than calling
+		/// sample() for every pixel in the row. It is the caller's
+		/// responsibility to ensure that the row is contained within
+		/// the sample window passed to the constructor, and that `result`
+		/// has room for `xEnd - xBegin` values.
+		inline void sampleRow( int y, int xBegin, int xEnd, float *result );
+
 		/// Appends a hash that represent all the pixel
 		/// values within the requested sample area.
 		void hash( IECore::MurmurHash &h ) const;
@@ -111,6 +121,10 @@ class Sampler
 		/// @param tileIndex XY indices that can be used to access the colour value of point 'p' from tileData.
 		inline void cachedData( Imath::V2i p, const float *& tileData, Imath::V2i &tileOrigin, Imath::V2i &tileIndex );
 
+		/// Returns the value of a pixel which has already been
+		/// clamped to lie within the data window.
+		inline float dataWindowSample( const Imath::V2i &p );
+
 		const ImagePlug *m_plug;
 		const std::string m_channelName;
 		Imath::Box2i m_sampleWindow;
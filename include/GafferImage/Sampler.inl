@@ -34,6 +34,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "OpenImageIO/fmath.h"
 
 #include "GafferImage/BufferAlgo.h"
@@ -67,11 +69,7 @@ float Sampler::sample( int x, int y )
 		p = clamp( p, m_dataWindow );
 	}
 
-	const float *tileData;
-	Imath::V2i tileOrigin;
-	Imath::V2i tileIndex;
-	cachedData( p, tileData, tileOrigin, tileIndex );
-	return *(tileData + tileIndex.y * ImagePlug::tileSize() + tileIndex.x);
+	return dataWindowSample( p );
 }
 
 float Sampler::sample( float x, float y )
@@ -89,6 +87,71 @@ float Sampler::sample( float x, float y )
 	return OIIO::bilerp( x0y0, x1y0, x0y1, x1y1, xf, yf );
 }
 
+void Sampler::sampleRow( int y, int xBegin, int xEnd, float *result )
+{
+
+#ifndef NDEBUG
+
+	// It is the caller's responsibility to ensure that sampling
+	// is only performed within the sample window.
+	assert( xBegin <= xEnd );
+	assert( contains( m_sampleWindow, Imath::V2i( xBegin, y ) ) );
+	assert( xEnd <= m_sampleWindow.max.x );
+
+#endif
+
+	// Deal with rows outside of the data window.
+	if( empty( m_dataWindow ) || ( m_boundingMode == Black && ( y < m_dataWindow.min.y || y >= m_dataWindow.max.y ) ) )
+	{
+		std::fill( result, result + ( xEnd - xBegin ), 0.0f );
+		return;
+	}
+
+	y = std::max( m_dataWindow.min.y, std::min( y, m_dataWindow.max.y - 1 ) );
+
+	// Pixels to the left of the data window.
+	int x = xBegin;
+	const int dataBegin = std::min( std::max( xBegin, m_dataWindow.min.x ), xEnd );
+	if( x < dataBegin )
+	{
+		const float v = m_boundingMode == Black ? 0.0f : dataWindowSample( Imath::V2i( m_dataWindow.min.x, y ) );
+		std::fill( result, result + ( dataBegin - x ), v );
+		result += dataBegin - x;
+		x = dataBegin;
+	}
+
+	// Pixels inside the data window, copied a tile at a time.
+	const int dataEnd = std::max( std::min( xEnd, m_dataWindow.max.x ), dataBegin );
+	while( x < dataEnd )
+	{
+		const float *tileData;
+		Imath::V2i tileOrigin;
+		Imath::V2i tileIndex;
+		cachedData( Imath::V2i( x, y ), tileData, tileOrigin, tileIndex );
+
+		const int spanEnd = std::min( dataEnd, tileOrigin.x + ImagePlug::tileSize() );
+		const float *span = tileData + tileIndex.y * ImagePlug::tileSize() + tileIndex.x;
+		result = std::copy( span, span + ( spanEnd - x ), result );
+		x = spanEnd;
+	}
+
+	// Pixels to the right of the data window.
+	if( x < xEnd )
+	{
+		const float v = m_boundingMode == Black ? 0.0f : dataWindowSample( Imath::V2i( m_dataWindow.max.x - 1, y ) );
+		std::fill( result, result + ( xEnd - x ), v );
+	}
+}
+
+float Sampler::dataWindowSample( const Imath::V2i &p )
+{
+	const float *tileData;
+	Imath::V2i tileOrigin;
+	Imath::V2i tileIndex;
+	cachedData( p, tileData, tileOrigin, tileIndex );
+	return *(tileData + tileIndex.y * ImagePlug::tileSize() + tileIndex.x);
+}
+
 void Sampler::cachedData( Imath::V2i p, const float *& tileData, Imath::V2i &tileOrigin, Imath::V2i &tileIndex )
 {
 	// Get the smart pointer to the tile we want.
@@ -0,0 +1,170 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFERIMAGEUI_FRAMECACHE_H
+#define GAFFERIMAGEUI_FRAMECACHE_H
+
+#include "boost/signals.hpp"
+#include "boost/shared_ptr.hpp"
+#include "boost/thread.hpp"
+
+#include "IECore/RefCounted.h"
+#include "IECore/VectorTypedData.h"
+#include "IECore/MurmurHash.h"
+
+namespace Gaffer
+{
+
+IE_CORE_FORWARDDECLARE( Plug )
+IE_CORE_FORWARDDECLARE( Context )
+
+} // namespace Gaffer
+
+namespace GafferImage
+{
+
+IE_CORE_FORWARDDECLARE( ImagePlug )
+
+} // namespace GafferImage
+
+namespace GafferImageUI
+{
+
+/// Computes the RGBA tiles of an image for a list of frames on a
+/// background thread, and stores them so that they can be played
+/// back in real time. Tiles are held independently of the ValuePlug
+/// cache, with their own memory limit. Cached frames are discarded
+/// when the image is dirtied, or when the context changes in any way
+/// other than the frame.
+///
+/// Computation is cancelled before any edit is made to a graph, and
+/// resumed once the edit is complete. Edits don't wait for cancelled
+/// computations to finish, as they may be waiting for the GIL, which
+/// the editor may hold. Instead, any results they produce are
+/// discarded.
+class FrameCache : public IECore::RefCounted, public boost::signals::trackable
+{
+
+	public :
+
+		FrameCache( GafferImage::ConstImagePlugPtr image, Gaffer::ContextPtr context );
+		virtual ~FrameCache();
+
+		IE_CORE_DECLAREMEMBERPTR( FrameCache );
+
+		const GafferImage::ImagePlug *getImage() const;
+		const Gaffer::Context *getContext() const;
+
+		/// The memory limit is specified in bytes. Frames which
+		/// have not been requested are evicted to stay within
+		/// the limit, and computation stops once there are no
+		/// more to evict.
+		void setMemoryLimit( size_t memoryLimit );
+		size_t getMemoryLimit() const;
+		size_t memoryUsage() const;
+
+		/// Starts computing the frames in the background, in the order
+		/// given, replacing any previous request. Returns immediately.
+		void prefetch( const std::vector<float> &frames );
+		/// Cancels any computation in progress and discards all
+		/// cached frames.
+		void clear();
+		/// Cancels any computation in progress and waits for the
+		/// background thread to finish. Cached frames are kept, and
+		/// computation is resumed by the next call to prefetch().
+		void stop();
+		/// Stops the computation for all FrameCaches, including any
+		/// that have been destroyed but whose background threads have
+		/// not yet finished. This must be called before exit.
+		static void stopAll();
+
+		void cachedFrames( std::vector<float> &frames ) const;
+		bool isCached( float frame ) const;
+
+		/// Returns the channel data for a tile, or NULL if it has not
+		/// been cached. If `hash` is passed, it is filled with the hash
+		/// of the channel data, so that clients may avoid updating tiles
+		/// which haven't changed from frame to frame.
+		IECore::ConstFloatVectorDataPtr channelData( float frame, const std::string &channelName, const Imath::V2i &tileOrigin, IECore::MurmurHash *hash = NULL ) const;
+
+		typedef boost::signal<void ( FrameCache * )> UnarySignal;
+		/// Emitted on the UI thread when frames are added
+		/// or removed.
+		UnarySignal &changedSignal();
+
+	private :
+
+		void plugDirtied( const Gaffer::Plug *plug );
+		void contextChanged( const IECore::InternedString &name );
+
+		// Everything shared with the background thread lives in
+		// the State, so that the thread can outlive the FrameCache
+		// without keeping it alive.
+		struct State;
+		IE_CORE_DECLAREPTR( State );
+
+		// These must be called with the mutex for the list
+		// of all FrameCaches locked.
+		void startThread();
+		// Tells the background thread to exit, without
+		// waiting for it.
+		void cancelThread();
+		// Cancels the background thread and waits for it.
+		void stopThread();
+
+		static void preAction();
+		static void postAction();
+
+		static void backgroundThread( StatePtr state, unsigned thread );
+		static void emitChanged( StatePtr state );
+
+		GafferImage::ConstImagePlugPtr m_image;
+		Gaffer::ContextPtr m_context;
+		StatePtr m_state;
+		boost::shared_ptr<boost::thread> m_thread;
+
+		UnarySignal m_changedSignal;
+
+		boost::signals::scoped_connection m_plugDirtiedConnection;
+		boost::signals::scoped_connection m_contextChangedConnection;
+
+};
+
+IE_CORE_DECLAREPTR( FrameCache )
+
+} // namespace GafferImageUI
+
+#endif // GAFFERIMAGEUI_FRAMECACHE_H
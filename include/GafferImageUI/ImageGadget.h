@@ -73,6 +73,8 @@ IE_CORE_FORWARDDECLARE( ImagePlug )
 namespace GafferImageUI
 {
 
+IE_CORE_FORWARDDECLARE( FrameCache )
+
 class ImageGadget : public GafferUI::Gadget
 {
 
@@ -101,6 +103,12 @@ class ImageGadget : public GafferUI::Gadget
 
 		Imath::V2f pixelAt( const IECore::LineSegment3f &lineInGadgetSpace ) const;
 
+		/// Specifies a FrameCache to take tiles from where
+		/// possible, rather than computing them. May be NULL.
+		void setFrameCache( FrameCachePtr frameCache );
+		FrameCache *getFrameCache();
+		const FrameCache *getFrameCache() const;
+
 	protected :
 
 		virtual void doRender( const GafferUI::Style *style ) const;
@@ -116,6 +124,7 @@ class ImageGadget : public GafferUI::Gadget
 
 		GafferImage::ConstImagePlugPtr m_image;
 		Gaffer::ContextPtr m_context;
+		FrameCachePtr m_frameCache;
 
 		boost::signals::scoped_connection m_plugDirtiedConnection;
 		boost::signals::scoped_connection m_contextChangedConnection;
@@ -187,11 +196,22 @@ class ImageGadget : public GafferUI::Gadget
 			IECoreGL::TexturePtr texture;
 		};
 
-		void updateTiles() const;
+		// Returns the region of the data window which is visible
+		// in the viewport, expanded to whole tiles. Only tiles within
+		// this window are computed and drawn, so that zooming into a
+		// small part of a large image doesn't require the whole
+		// image to be computed.
+		Imath::Box2i visibleTileWindow() const;
+
+		void updateTiles( const Imath::Box2i &window ) const;
 		void removeOutOfBoundsTiles() const;
 
 		typedef tbb::concurrent_unordered_map<TileIndex, Tile> Tiles;
 		mutable Tiles m_tiles;
+		// The window within which all tiles are known to be up
+		// to date. Tiles outside it may be stale, and must be
+		// updated before they are drawn.
+		mutable Imath::Box2i m_tilesWindow;
 
 		friend size_t tbb_hasher( const ImageGadget::TileIndex &tileIndex );
 
@@ -199,7 +219,7 @@ class ImageGadget : public GafferUI::Gadget
 
 		// Rendering.
 
-		void renderTiles() const;
+		void renderTiles( const Imath::Box2i &window ) const;
 		void renderText( const std::string &text, const Imath::V2f &position, const Imath::V2f &alignment, const GafferUI::Style *style ) const;
 
 };
@@ -69,6 +69,7 @@ namespace GafferImageUI
 {
 
 IE_CORE_FORWARDDECLARE( ImageGadget )
+IE_CORE_FORWARDDECLARE( FrameCache )
 
 /// \todo Refactor this into smaller components, along the lines of the SceneView class.
 /// Consider redesigning the View/Tool classes so that view functionality can be built up
@@ -102,6 +103,16 @@ class ImageView : public GafferUI::View
 		Gaffer::StringPlug *displayTransformPlug();
 		const Gaffer::StringPlug *displayTransformPlug() const;
 
+		/// When on, frames are computed ahead of time in the
+		/// background and cached for fast playback. The frames
+		/// to compute are specified via frameCache()->prefetch().
+		Gaffer::BoolPlug *frameCachePlug();
+		const Gaffer::BoolPlug *frameCachePlug() const;
+
+		/// Returns NULL unless frameCachePlug() is on.
+		FrameCache *frameCache();
+		const FrameCache *frameCache() const;
+
 		virtual void setContext( Gaffer::ContextPtr context );
 
 		typedef boost::function<GafferImage::ImageProcessorPtr ()> DisplayTransformCreator;
@@ -137,11 +148,13 @@ class ImageView : public GafferUI::View
 		void preRender();
 
 		void insertDisplayTransform();
+		void updateFrameCache();
 
 		typedef std::map<std::string, GafferImage::ImageProcessorPtr> DisplayTransformMap;
 		DisplayTransformMap m_displayTransforms;
 
 		ImageGadgetPtr m_imageGadget;
+		FrameCachePtr m_frameCache;
 		bool m_framed;
 
 		class ColorInspector;
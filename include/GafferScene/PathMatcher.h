@@ -81,6 +81,12 @@ class PathMatcher
 		/// Removes all specified paths, returning true if any paths
 		/// were removed, and false if none existed anyway.
 		bool removePaths( const PathMatcher &paths );
+		/// Removes all paths which are not also present in `paths`,
+		/// returning true if any were removed.
+		/// \note addPaths(), removePaths() and intersectPaths() process
+		/// sibling subtrees in parallel, and reuse any subtrees which
+		/// are shared with `paths` rather than recursing into them.
+		bool intersectPaths( const PathMatcher &paths );
 
 		/// Removes the specified path and all descendant paths.
 		/// Returns true if something was removed, false otherwise.
@@ -96,6 +102,17 @@ class PathMatcher
 
 		bool isEmpty() const;
 
+		/// Converts the internal representation to a compact immutable
+		/// form, which uses several times less memory per path and is
+		/// faster to iterate, compare and hash. Parts of the tree which
+		/// are subsequently edited are converted back to the mutable form
+		/// on demand, so it is always safe to call this, but it is best
+		/// called only once a PathMatcher has been fully built and is
+		/// going to be held onto, as is the case for computed sets.
+		void compact();
+		/// Returns true if the entire tree is held in the compact form.
+		bool isCompact() const;
+
 		/// Fills the paths container with all the paths held
 		/// within this matcher. Iterators should be preferred
 		/// over this method.
@@ -173,13 +190,98 @@ class PathMatcher
 				// achieved by using an ordered container, and having the
 				// less than operation for Names sort first on hasWildcards
 				// and second on the name.
-				typedef std::map<Name, NodePtr> ChildMap;
-				typedef ChildMap::iterator ChildMapIterator;
-				typedef ChildMap::value_type ChildMapValue;
-				typedef ChildMap::const_iterator ConstChildMapIterator;
+				//
+				// The children may be stored in one of two forms. The mutable
+				// form uses a std::map, which is cheap to insert into. The
+				// compact form uses a sorted contiguous array, which is
+				// several times smaller and much faster to iterate, but
+				// which is immutable. Both forms share the same sort order,
+				// so the rest of the code needn't care which is in use,
+				// other than to ensure that only mutable nodes are edited.
+				class ChildMap;
+				typedef std::pair<const Name, NodePtr> ChildMapValue;
+
+				class ConstChildMapIterator : public boost::iterator_facade<ConstChildMapIterator, const ChildMapValue, boost::forward_traversal_tag>
+				{
+
+					public :
+
+						typedef std::map<Name, NodePtr>::const_iterator MapIterator;
+
+						ConstChildMapIterator();
+						ConstChildMapIterator( MapIterator it );
+						ConstChildMapIterator( const ChildMapValue *it );
+
+					private :
+
+						friend class boost::iterator_core_access;
+
+						void increment();
+						bool equal( const ConstChildMapIterator &other ) const;
+						const ChildMapValue &dereference() const;
+
+						// Only one of these is used, depending on the
+						// form of the ChildMap we came from.
+						MapIterator m_mapIt;
+						const ChildMapValue *m_arrayIt;
+						bool m_array;
+
+				};
+
+				class ChildMap
+				{
+
+					public :
+
+						// Constructs an empty map in the mutable form.
+						ChildMap();
+						// Constructs a copy of other, in the mutable form.
+						ChildMap( const ChildMap &other );
+						~ChildMap();
+
+						ConstChildMapIterator begin() const;
+						ConstChildMapIterator end() const;
+						ConstChildMapIterator find( const Name &name ) const;
+						ConstChildMapIterator lower_bound( const Name &name ) const;
+
+						size_t size() const;
+						bool empty() const;
+
+						bool isCompact() const;
+
+						// Editing methods. These may only be used on
+						// the mutable form.
+						NodePtr &operator[]( const Name &name );
+						void erase( const Name &name );
+						void clear();
+
+						// Converts an empty mutable map into the compact form,
+						// with storage for `size` children. The children must
+						// then be added in sort order using `appendCompact()`,
+						// after which the map must be treated as immutable.
+						void reserveCompact( size_t size );
+						void appendCompact( const Name &name, const NodePtr &child );
+
+					private :
+
+						// Not implemented.
+						ChildMap &operator = ( const ChildMap &other );
+
+						static bool nameLess( const ChildMapValue &child, const Name &name );
+
+						typedef std::map<Name, NodePtr> Map;
+
+						// Non-null only for non-empty mutable maps.
+						Map *m_map;
+						// Non-null only for non-empty compact maps.
+						ChildMapValue *m_array;
+						size_t m_arraySize;
+						bool m_compact;
+
+				};
 
 				Node( bool terminator = false );
-				// Shallow copy.
+				// Shallow copy. The copy always uses the mutable form.
 				Node( const Node &other );
 				~Node();
 
@@ -212,17 +314,34 @@ class PathMatcher
 
 		typedef std::vector<IECore::InternedString>::const_iterator NameIterator;
 
-		// Utility used in lazy-copy-on-write.
-		PathMatcher::Node *writable( Node *node, NodePtr &writableCopy, bool shared );
+		// Utility used in lazy-copy-on-write. Compact nodes are treated
+		// as shared, so that they are copied into the mutable form before
+		// being edited.
+		static PathMatcher::Node *writable( Node *node, NodePtr &writableCopy, bool shared );
 
 		// Recursive method used to add a path to a Node tree. Since nodes may be shared among multiple
 		// trees, we perform lazy-copy-on-write when needing to edit a shared node. When we do this,
 		// the copy is returned so that it can be used to replace the old child.
 		NodePtr addWalk( Node *node, const NameIterator &start, const NameIterator &end, bool shared, bool &added );
 		NodePtr removeWalk( Node *node, const NameIterator &start, const NameIterator &end, bool shared, const bool prune, bool &removed );
-		NodePtr addPathsWalk( Node *node, const Node *srcNode, bool shared, bool &added );
+		static NodePtr addPathsWalk( Node *node, const Node *srcNode, bool shared, bool &added );
 		NodePtr addPrefixedPathsWalk( Node *node, const Node *srcNode, const NameIterator &start, const NameIterator &end, bool shared, bool &added  );
-		NodePtr removePathsWalk( Node *node, const Node *srcNode, bool shared, bool &removed );
+		static NodePtr removePathsWalk( Node *node, const Node *srcNode, bool shared, bool &removed );
+		static NodePtr intersectPathsWalk( Node *node, const Node *srcNode, bool shared, bool &removed );
+		// Replaces or erases a child following a call to removePathsWalk() or intersectPathsWalk().
+		static void updateChild( Node *node, NodePtr &writableCopy, bool shared, const Name &name, Node *child, const NodePtr &newChild );
+
+		// The walks above which combine two trees recurse into corresponding
+		// pairs of children. Since the pairs are disjoint subtrees, we can
+		// recurse into them in parallel using childPairsWalk(), storing the
+		// new children to be applied serially by the caller.
+		typedef NodePtr (*PairWalk)( Node *node, const Node *srcNode, bool shared, bool &changed );
+		typedef std::vector<std::pair<Node *, const Node *> > ChildPairs;
+		struct ChildPairsTask;
+		static void childPairsWalk( PairWalk walk, const ChildPairs &childPairs, bool shared, std::vector<NodePtr> &newChildren, bool &changed );
+		// Returns a compact copy of node, reusing any descendants which are
+		// already compact.
+		static NodePtr compactWalk( Node *node );
 
 		void matchWalk( const Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const;
 
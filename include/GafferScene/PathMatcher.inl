@@ -60,6 +60,88 @@ void PathMatcher::init( PathIterator pathsBegin, PathIterator pathsEnd )
 	}
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Node::ConstChildMapIterator
+//////////////////////////////////////////////////////////////////////////
+
+inline PathMatcher::Node::ConstChildMapIterator::ConstChildMapIterator()
+	:	m_arrayIt( NULL ), m_array( true )
+{
+}
+
+inline PathMatcher::Node::ConstChildMapIterator::ConstChildMapIterator( MapIterator it )
+	:	m_mapIt( it ), m_arrayIt( NULL ), m_array( false )
+{
+}
+
+inline PathMatcher::Node::ConstChildMapIterator::ConstChildMapIterator( const ChildMapValue *it )
+	:	m_arrayIt( it ), m_array( true )
+{
+}
+
+inline void PathMatcher::Node::ConstChildMapIterator::increment()
+{
+	if( m_array )
+	{
+		++m_arrayIt;
+	}
+	else
+	{
+		++m_mapIt;
+	}
+}
+
+inline bool PathMatcher::Node::ConstChildMapIterator::equal( const ConstChildMapIterator &other ) const
+{
+	if( m_array != other.m_array )
+	{
+		return false;
+	}
+	return m_array ? m_arrayIt == other.m_arrayIt : m_mapIt == other.m_mapIt;
+}
+
+inline const PathMatcher::Node::ChildMapValue &PathMatcher::Node::ConstChildMapIterator::dereference() const
+{
+	return m_array ? *m_arrayIt : *m_mapIt;
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Node::ChildMap
+//////////////////////////////////////////////////////////////////////////
+
+inline PathMatcher::Node::ConstChildMapIterator PathMatcher::Node::ChildMap::begin() const
+{
+	if( m_map )
+	{
+		return ConstChildMapIterator( m_map->begin() );
+	}
+	return ConstChildMapIterator( m_array );
+}
+
+inline PathMatcher::Node::ConstChildMapIterator PathMatcher::Node::ChildMap::end() const
+{
+	if( m_map )
+	{
+		return ConstChildMapIterator( m_map->end() );
+	}
+	return ConstChildMapIterator( m_array + m_arraySize );
+}
+
+inline size_t PathMatcher::Node::ChildMap::size() const
+{
+	return m_map ? m_map->size() : m_arraySize;
+}
+
+inline bool PathMatcher::Node::ChildMap::empty() const
+{
+	return size() == 0;
+}
+
+inline bool PathMatcher::Node::ChildMap::isCompact() const
+{
+	return m_compact;
+}
+
 //////////////////////////////////////////////////////////////////////////
 // RawIterator
 //////////////////////////////////////////////////////////////////////////
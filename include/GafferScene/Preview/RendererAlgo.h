@@ -37,6 +37,8 @@
 #ifndef GAFFERSCENE_PREVIEW_RENDERERALGO_H
 #define GAFFERSCENE_PREVIEW_RENDERERALGO_H
 
+#include <map>
+
 #include "boost/container/flat_map.hpp"
 
 #include "IECore/VectorTypedData.h"
@@ -89,20 +91,39 @@ class RenderSets : boost::noncopyable
 
 		struct Set
 		{
+			Set() : indexDirty( false ) {}
 			IECore::InternedString unprefixedName; // With "render:" stripped off
 			IECore::MurmurHash hash;
 			PathMatcher set;
+			// Previous value of `set`, held by the Updater until
+			// the membership index has been updated to match.
+			PathMatcher previousSet;
+			bool indexDirty;
 		};
 
 		typedef boost::container::flat_map<IECore::InternedString, Set> Sets;
 
+		// Inverted index from each location to the names of the
+		// "render:" sets which contain it exactly, so that setsAttribute()
+		// doesn't need to query every set for every location. Sets
+		// containing wildcards can't be indexed, and are stored in
+		// m_unindexedSets to be matched directly instead.
+		typedef std::map<std::vector<IECore::InternedString>, std::vector<IECore::InternedString> > MembershipIndex;
+
 		struct Updater;
 
+		void updateIndex( const IECore::InternedString &setName, const PathMatcher &oldSet, const PathMatcher &newSet );
+		void addToIndex( const std::vector<IECore::InternedString> &path, const IECore::InternedString &setName );
+		void removeFromIndex( const std::vector<IECore::InternedString> &path, const IECore::InternedString &setName );
+
 		// Stores all the "render:" sets.
 		Sets m_sets;
 		Set m_camerasSet;
 		Set m_lightsSet;
 
+		MembershipIndex m_membershipIndex;
+		std::vector<IECore::InternedString> m_unindexedSets;
+
 };
 
 void outputCameras( const ScenePlug *scene, const IECore::CompoundObject *globals, const RenderSets &renderSets, IECoreScenePreview::Renderer *renderer );
@@ -76,7 +76,10 @@ void matchingPaths( const Gaffer::IntPlug *filterPlug, const ScenePlug *scene, P
 void matchingPaths( const PathMatcher &filter, const ScenePlug *scene, PathMatcher &paths );
 
 /// Calls a functor on all paths in the scene
-/// The functor must take ( const ScenePlug*, const ScenePlug::ScenePath& ), and can return false to prune traversal
+/// The functor must take ( const ScenePlug*, const ScenePlug::ScenePath& ), and can return false to prune traversal.
+/// The functor is called with the path already set in the current context, so it may query
+/// `scene->fullTransformPlug()->getValue()` and `scene->fullAttributesPlug()->getValue()` directly,
+/// at the cost of a single cache lookup per location.
 template <class ThreadableFunctor>
 void parallelTraverse( const ScenePlug *scene, ThreadableFunctor &f );
 
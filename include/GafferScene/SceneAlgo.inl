@@ -65,9 +65,8 @@ class TraverseTask : public tbb::task
 		virtual task *execute()
 		{
 
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_context, Gaffer::Context::Borrowed );
-			context->set( ScenePlug::scenePathContextName, m_path );
-			Gaffer::Context::Scope scopedContext( context.get() );
+			Gaffer::Context::EditableScope context( m_context );
+			context.set( ScenePlug::scenePathContextName, m_path );
 
 			if( m_f( m_scene, m_path ) )
 			{
@@ -111,6 +111,17 @@ class ScenePlug : public Gaffer::ValuePlug
 		/// which set to compute.
 		PathMatcherDataPlug *setPlug();
 		const PathMatcherDataPlug *setPlug() const;
+		/// The plug used to pass the absolute (world) transform for the current
+		/// node. This is computed automatically by the SceneNode from transformPlug()
+		/// and the fullTransformPlug() value for the parent location, so when
+		/// traversing a scene each location reuses the cached value for its parent.
+		Gaffer::M44fPlug *fullTransformPlug();
+		const Gaffer::M44fPlug *fullTransformPlug() const;
+		/// The plug used to pass the full set of inherited attributes for the current
+		/// node. This is computed from attributesPlug() and the parent value in the
+		/// same way as fullTransformPlug().
+		Gaffer::CompoundObjectPlug *fullAttributesPlug();
+		const Gaffer::CompoundObjectPlug *fullAttributesPlug() const;
 		//@}
 
 		/// The type used to specify the current scene path in
@@ -170,6 +181,49 @@ class ScenePlug : public Gaffer::ValuePlug
 		IECore::MurmurHash setHash( const IECore::InternedString &setName ) const;
 		//@}
 
+		/// @name Batched queries
+		/// These are convenience functions to query several properties of a location,
+		/// or properties of all the children of a location, in a single call. Each
+		/// property is still evaluated with its own `getValue()` call, so there is no
+		/// sharing of hashing or computation between properties. `location()` and
+		/// `childLocations()` do avoid constructing a new context per property, and
+		/// `childLocations()` reuses a single context for all the children.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Flags used to specify the properties to be queried.
+		enum LocationProperties
+		{
+			NoProperties = 0,
+			BoundProperty = 1,
+			TransformProperty = 2,
+			AttributesProperty = 4,
+			ObjectProperty = 8,
+			ChildNamesProperty = 16,
+			AllProperties = BoundProperty | TransformProperty | AttributesProperty | ObjectProperty | ChildNamesProperty
+		};
+		/// The result of a batched query. Only the requested
+		/// properties are filled in.
+		struct Location
+		{
+			Imath::Box3f bound;
+			Imath::M44f transform;
+			IECore::ConstCompoundObjectPtr attributes;
+			IECore::ConstObjectPtr object;
+			IECore::ConstInternedStringVectorDataPtr childNames;
+		};
+		/// Queries the properties specified by the LocationProperties
+		/// bitmask for a single location.
+		void location( const ScenePath &scenePath, unsigned properties, Location &result ) const;
+		/// As above, but for the location specified by the current context.
+		/// This is equivalent to calling `getValue()` on each of the
+		/// requested plugs in turn.
+		void currentLocation( unsigned properties, Location &result ) const;
+		/// Queries the specified properties for all the children of a location,
+		/// filling `result` in the order of the child names. The child names may
+		/// be passed if they are already known, otherwise they are computed.
+		void childLocations( const ScenePath &scenePath, unsigned properties, std::vector<Location> &result, const IECore::InternedStringVectorData *childNames = NULL ) const;
+		//@}
+
 		/// Utility function to convert a string into a path by splitting on '/'.
 		/// \todo Many of the places we use this, it would be preferable if the source data was already
 		/// a path. Perhaps a ScenePathPlug could take care of this for us?
@@ -73,7 +73,9 @@ class SceneWriter : public GafferDispatch::TaskNode
 		virtual void execute() const;
 
 		/// Re-implemented to open the file for writing, then iterate through the
-		/// frames, modifying the current Context and calling writeLocation().
+		/// frames, writing the scene for each. Locations are computed in parallel
+		/// and written in order, with only a limited number held in memory at
+		/// any one time.
 		virtual void executeSequence( const std::vector<float> &frames ) const;
 
 		/// Re-implemented to return true, since the entire file must be written at once.
@@ -82,7 +84,6 @@ class SceneWriter : public GafferDispatch::TaskNode
 	private :
 
 		void createDirectories( const std::string &fileName ) const;
-		void writeLocation( const GafferScene::ScenePlug *scene, const ScenePlug::ScenePath &scenePath, Gaffer::Context *context, IECore::SceneInterface *output, double time ) const;
 
 		static size_t g_firstPlugIndex;
 
@@ -37,6 +37,8 @@
 #ifndef GAFFERSCENETEST_PATHMATCHERTEST_H
 #define GAFFERSCENETEST_PATHMATCHERTEST_H
 
+#include <cstddef>
+
 namespace GafferSceneTest
 {
 
@@ -44,6 +46,11 @@ void testPathMatcherRawIterator();
 void testPathMatcherIteratorPrune();
 void testPathMatcherFind();
 
+/// Benchmarks the parallel set algebra operations against serial
+/// evaluation, checking that the results match. The defaults produce
+/// synthetic sets whose union contains 10 million paths.
+void testPathMatcherSetAlgebraPerformance( size_t numGroups = 1000, size_t numChildren = 10000 );
+
 } // namespace GafferSceneTest
 
 #endif // GAFFERSCENETEST_PATHMATCHERTEST_H
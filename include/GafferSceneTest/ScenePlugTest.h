@@ -37,10 +37,13 @@
 #ifndef GAFFERSCENETEST_SCENEPLUGTEST_H
 #define GAFFERSCENETEST_SCENEPLUGTEST_H
 
+#include "GafferScene/ScenePlug.h"
+
 namespace GafferSceneTest
 {
 
 void testManyStringToPathCalls();
+void testLocationQueries( const GafferScene::ScenePlug *scene );
 
 } // namespace GafferSceneTest
 
@@ -45,10 +45,16 @@ import Gaffer
 
 class PythonExpressionEngine( Gaffer.Expression.Engine ) :
 
+	__maxMemoSize = 10000
+	__memoisableTypes = ( bool, int, long, float, str, unicode, type( None ) )
+
 	def __init__( self ) :
 
 		Gaffer.Expression.Engine.__init__( self )
 
+		self.__memo = None
+		self.__cacheClearedConnection = Gaffer.ValuePlug.cacheClearedSignal().connect( Gaffer.WeakMethod( self.__cacheCleared ) )
+
 	def parse( self, node, expression, inPlugs, outPlugs, contextNames ) :
 
 		parser = _Parser( expression )
@@ -56,38 +62,68 @@ class PythonExpressionEngine( Gaffer.Expression.Engine ) :
 		self.__expression = expression
 		self.__inPlugPaths = list( parser.plugReads )
 		self.__outPlugPaths = list( parser.plugWrites )
+		self.__contextNames = list( parser.contextReads )
 
 		inPlugs.extend( [ self.__plug( node, p ) for p in self.__inPlugPaths ] )
 		outPlugs.extend( [ self.__plug( node, p ) for p in self.__outPlugPaths ] )
-		contextNames.extend( parser.contextReads )
+		contextNames.extend( self.__contextNames )
+
+		# Compile once up front, so that execute() doesn't need to
+		# reparse the expression every time it is called.
+		self.__code = compile( expression, "<string>", "exec" )
+		self.__inPlugPathsSplit = [ p.split( "." ) for p in self.__inPlugPaths ]
+		self.__outPlugPathsSplit = [ p.split( "." ) for p in self.__outPlugPaths ]
+
+		# Expressions which don't read from any plugs depend only on
+		# the context, so we can memoise their results based on the
+		# values of the context variables they read.
+		self.__memo = {} if not self.__inPlugPaths else None
 
 	def execute( self, context, inputs ) :
 
+		memoKey = None
+		if self.__memo is not None :
+			values = [ context.get( n, None ) for n in self.__contextNames ]
+			# Other types are either unhashable or hashed by identity,
+			# and since context.get() returns a new object each time,
+			# memoising them would just fill the memo with misses.
+			if all( isinstance( v, self.__memoisableTypes ) for v in values ) :
+				# We include the types, because 1, 1.0 and True compare
+				# equal, but may give different results.
+				memoKey = tuple( ( type( v ), v ) for v in values )
+				result = self.__memo.get( memoKey )
+				if result is not None :
+					# Return a copy, so the caller can't modify our memo.
+					return result.copy()
+
 		plugDict = {}
-		for plugPath, plug in zip( self.__inPlugPaths, inputs ) :
+		for plugPathSplit, plug in zip( self.__inPlugPathsSplit, inputs ) :
 			parentDict = plugDict
-			plugPathSplit = plugPath.split( "." )
 			for p in plugPathSplit[:-1] :
 				parentDict = parentDict.setdefault( p, {} )
 			parentDict[plugPathSplit[-1]] = plug.getValue()
 
-		for plugPath in self.__outPlugPaths :
+		for plugPathSplit in self.__outPlugPathsSplit :
 			parentDict = plugDict
-			for p in plugPath.split( "." )[:-1] :
+			for p in plugPathSplit[:-1] :
 				parentDict = parentDict.setdefault( p, {} )
 
 		executionDict = { "IECore" : IECore, "parent" : plugDict, "context" : context }
 
-		exec( self.__expression, executionDict, executionDict )
+		exec( self.__code, executionDict, executionDict )
 
 		result = IECore.ObjectVector()
-		for plugPath in self.__outPlugPaths :
+		for plugPathSplit in self.__outPlugPathsSplit :
 			parentDict = plugDict
-			plugPathSplit = plugPath.split( "." )
 			for p in plugPathSplit[:-1] :
 				parentDict = parentDict[p]
 			result.append( parentDict.get( plugPathSplit[-1], IECore.NullObject.defaultNullObject() ) )
 
+		if memoKey is not None :
+			if len( self.__memo ) >= self.__maxMemoSize :
+				self.__memo.clear()
+			self.__memo[memoKey] = result.copy()
+
 		return result
 
 	def apply( self, proxyOutput, topLevelProxyOutput, value ) :
@@ -187,6 +223,11 @@ class PythonExpressionEngine( Gaffer.Expression.Engine ) :
 
 		return result
 
+	def __cacheCleared( self ) :
+
+		if self.__memo is not None :
+			self.__memo.clear()
+
 	def __plug( self, node, plugPath ) :
 
 		plug = node.parent().descendant( plugPath )
@@ -382,6 +382,7 @@ class ArnoldShaderTest( GafferSceneTest.SceneTestCase ) :
 			[
 				a["shader"],
 				a["out"]["attributes"],
+				a["out"]["fullAttributes"],
 				a["out"],
 			],
 		)
@@ -36,6 +36,8 @@
 
 import os
 import errno
+import json
+import select
 import signal
 import shlex
 import subprocess32 as subprocess
@@ -57,6 +59,10 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		self["executeInBackground"] = Gaffer.BoolPlug( defaultValue = False )
 		self["ignoreScriptLoadErrors"] = Gaffer.BoolPlug( defaultValue = False )
 		self["environmentCommand"] = Gaffer.StringPlug()
+		self["maxConcurrency"] = Gaffer.IntPlug( defaultValue = 1, minValue = 1 )
+		self["useWorkers"] = Gaffer.BoolPlug( defaultValue = False )
+		self["workerBatchLimit"] = Gaffer.IntPlug( defaultValue = 100, minValue = 0 )
+		self["workerMemoryLimit"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
 
 		self.__jobPool = jobPool if jobPool else LocalDispatcher.defaultJobPool()
 
@@ -91,6 +97,11 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__environmentCommand = Gaffer.Context.current().substitute(
 				dispatcher["environmentCommand"].getValue()
 			)
+			self.__maxConcurrency = max( 1, dispatcher["maxConcurrency"].getValue() )
+			self.__useWorkers = dispatcher["useWorkers"].getValue()
+			self.__workerBatchLimit = dispatcher["workerBatchLimit"].getValue()
+			self.__workerMemoryLimit = dispatcher["workerMemoryLimit"].getValue()
+			self.__idleWorkers = []
 
 			self.__messageHandler = IECore.CapturingMessageHandler()
 			self.__messageTitle = "%s : Job %s %s" % ( self.__dispatcher.getName(), self.__name, self.__id )
@@ -115,38 +126,47 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 		def description( self ) :
 
-			batch = self.__currentBatch()
-			if batch is None or batch.plug() is None :
+			batches = [ b for b in self.__runningBatches() if b.plug() is not None ]
+			if not batches :
 				return "N/A"
 
-			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
-
-			return "Executing " + batch.blindData()["nodeName"].value + " on frames " + frames
+			return ", ".join(
+				"Executing " + batch.blindData()["nodeName"].value + " on frames " + self.__frameList( batch )
+				for batch in batches
+			)
 
 		def statistics( self ) :
 
-			batch = self.__currentBatch()
-			if batch is None or "pid" not in batch.blindData().keys() :
-				return {}
+			result = {}
+
+			batchTimes = self.__batchTimes()
+			if batchTimes :
+				result["batchTimes"] = batchTimes
+
+			pids = [ b.blindData()["pid"].value for b in self.__runningBatches() if "pid" in b.blindData().keys() ]
+			if not pids :
+				return result
 
 			rss = 0
 			pcpu = 0.0
-			pid = batch.blindData().get( "pid" )
 
 			try :
 				stats = subprocess.Popen( ( "ps -Ao pid,ppid,pgid,sess,pcpu,rss" ).split( " " ), stdout=subprocess.PIPE, stderr=subprocess.PIPE ).communicate()[0].split()
 				for i in range( 0, len(stats), 6 ) :
-					if str(pid) in stats[i:i+4] :
+					if any( str(pid) in stats[i:i+4] for pid in pids ) :
 						pcpu += float(stats[i+4])
 						rss += float(stats[i+5])
 			except :
-				return {}
+				return result
 
-			return {
-				"pid" : pid,
+			result.update( {
+				"pid" : pids[0],
+				"pids" : pids,
 				"pcpu" : pcpu,
 				"rss" : rss,
-			}
+			} )
+
+			return result
 
 		def messageHandler( self ) :
 
@@ -227,24 +247,87 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		def __backgroundDispatch( self ) :
 
 			with self.__messageHandler :
-				self.__doBackgroundDispatch( self.__batch )
+				try :
+					self.__doBackgroundDispatch( self.__batch )
+				finally :
+					for worker in self.__idleWorkers :
+						worker.terminate()
+					self.__idleWorkers = []
 
 		def __doBackgroundDispatch( self, batch ) :
 
-			if self.__getStatus( batch ) == LocalDispatcher.Job.Status.Complete :
-				return True
+			# We schedule batches in the same depth-first order that a serial
+			# walk would visit them in, so that with a concurrency of 1 the
+			# first pending batch is always ready to run. With higher concurrency
+			# we additionally launch any later batches whose preTasks have all
+			# completed, up to the maximum number of simultaneous processes.
+			pending = [ b for b in self.__postOrderBatches( batch ) if self.__getStatus( b ) != LocalDispatcher.Job.Status.Complete ]
+			processes = {}
+			failedBatch = None
+			launchable = True
 
-			for upstreamBatch in batch.preTasks() :
-				if not self.__doBackgroundDispatch( upstreamBatch ) :
+			while pending or processes :
+
+				if batch.blindData().get( "killed" ) :
+					for runningBatch, process in list( processes.items() ) :
+						try :
+							os.killpg( process.pid, signal.SIGTERM )
+						except OSError :
+							# Already exited.
+							pass
+						# Reap the process, so it isn't left as a zombie.
+						process.wait()
+						self.__setStatus( runningBatch, LocalDispatcher.Job.Status.Killed )
+					self.__reportKilled( batch )
 					return False
 
-			if batch.blindData().get( "killed" ) :
-				self.__reportKilled( batch )
-				return False
+				for runningBatch, process in list( processes.items() ) :
 
-			if not batch.plug() :
-				self.__reportCompleted( batch )
-				return True
+					if process.poll() is None :
+						continue
+
+					del processes[runningBatch]
+					self.__releaseProcess( process )
+					launchable = True
+					if process.returncode :
+						self.__setStatus( runningBatch, LocalDispatcher.Job.Status.Failed )
+						failedBatch = failedBatch or runningBatch
+					else :
+						self.__setStatus( runningBatch, LocalDispatcher.Job.Status.Complete )
+
+				if failedBatch is not None :
+					# Don't launch anything new, but let any batches that are
+					# already running finish before we report the failure.
+					if not processes :
+						self.__reportFailed( failedBatch )
+						return False
+					time.sleep( 0.01 )
+					continue
+
+				while launchable and len( processes ) < self.__maxConcurrency :
+
+					readyBatch = next( ( b for b in pending if self.__preTasksComplete( b ) ), None )
+					if readyBatch is None :
+						# Nothing can be launched until another batch completes.
+						launchable = False
+						break
+
+					pending.remove( readyBatch )
+
+					if not readyBatch.plug() :
+						self.__reportCompleted( readyBatch )
+						return True
+
+					process = self.__launchBatch( readyBatch )
+					if process is not None :
+						processes[readyBatch] = process
+
+				if processes :
+					time.sleep( 0.01 )
+
+			return True
+
+		def __launchBatch( self, batch ) :
 
 			if len( batch.frames() ) == 0 :
 				# This case occurs for nodes like TaskList and TaskContextProcessors,
@@ -254,53 +337,102 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 				# provide progress feedback to the user.
 				self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
 				IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, "Finished " + batch.blindData()["nodeName"].value )
-				return True
+				return None
 
 			taskContext = batch.context()
-			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
+			frames = self.__frameList( batch )
+
+			contextArgs = []
+			for entry in [ k for k in taskContext.keys() if k != "frame" and not k.startswith( "ui:" ) ] :
+				if entry not in self.__context.keys() or taskContext[entry] != self.__context[entry] :
+					contextArgs.extend( [ "-" + entry, repr(taskContext[entry]) ] )
+
+			if self.__useWorkers :
+				process = self.__acquireWorker()
+				self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
+				IECore.msg(
+					IECore.MessageHandler.Level.Info, self.__messageTitle,
+					"Executing %s on frames %s in worker %d" % ( batch.blindData()["nodeName"].value, frames, process.pid )
+				)
+				process.execute( batch.blindData()["nodeName"].value, frames, contextArgs )
+			else :
+				args = self.__executeArgs() + [
+					"-nodes", batch.blindData()["nodeName"].value,
+					"-frames", frames,
+				]
+				if contextArgs :
+					args.extend( [ "-context" ] + contextArgs )
+				self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
+				IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, " ".join( args ) )
+				process = subprocess.Popen( args, start_new_session=True )
 
-			args = [
+			batch.blindData()["pid"] = IECore.IntData( process.pid )
+
+			return process
+
+		def __executeArgs( self ) :
+
+			args = shlex.split( self.__environmentCommand ) + [
 				"gaffer", "execute",
 				"-script", self.__scriptFile,
-				"-nodes", batch.blindData()["nodeName"].value,
-				"-frames", frames,
 			]
 
-			args = shlex.split( self.__environmentCommand ) + args
-
 			if self.__ignoreScriptLoadErrors :
 				args.append( "-ignoreScriptLoadErrors" )
 
-			contextArgs = []
-			for entry in [ k for k in taskContext.keys() if k != "frame" and not k.startswith( "ui:" ) ] :
-				if entry not in self.__context.keys() or taskContext[entry] != self.__context[entry] :
-					contextArgs.extend( [ "-" + entry, repr(taskContext[entry]) ] )
+			return args
+
+		def __acquireWorker( self ) :
 
-			if contextArgs :
-				args.extend( [ "-context" ] + contextArgs )
+			if self.__idleWorkers :
+				return self.__idleWorkers.pop()
 
-			self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
+			args = self.__executeArgs() + [ "-worker" ]
 			IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, " ".join( args ) )
-			process = subprocess.Popen( args, start_new_session=True )
-			batch.blindData()["pid"] = IECore.IntData( process.pid )
 
-			while process.poll() is None :
+			return LocalDispatcher._Worker( args )
 
-				if batch.blindData().get( "killed" ) :
-					os.killpg( process.pid, signal.SIGTERM )
-					self.__reportKilled( batch )
-					return False
+		def __releaseProcess( self, process ) :
 
-				time.sleep( 0.01 )
+			if not isinstance( process, LocalDispatcher._Worker ) :
+				return
 
-			if process.returncode :
-				self.__reportFailed( batch )
-				return False
+			# Workers are recycled after a failure, because there is no telling
+			# what state the failed task left the script in, and also when they
+			# reach the batch or memory limits.
+			if (
+				process.returncode or
+				( self.__workerBatchLimit and process.numBatches() >= self.__workerBatchLimit ) or
+				( self.__workerMemoryLimit and process.memoryUsage() >= self.__workerMemoryLimit * 1024 )
+			) :
+				process.terminate()
+			else :
+				self.__idleWorkers.append( process )
 
-			self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
+		def __preTasksComplete( self, batch ) :
+
+			for upstreamBatch in batch.preTasks() :
+				if self.__getStatus( upstreamBatch ) != LocalDispatcher.Job.Status.Complete :
+					return False
 
 			return True
 
+		def __postOrderBatches( self, batch, visited = None, result = None ) :
+
+			if visited is None :
+				visited = set()
+				result = []
+
+			if batch in visited :
+				return result
+
+			visited.add( batch )
+			for upstreamBatch in batch.preTasks() :
+				self.__postOrderBatches( upstreamBatch, visited, result )
+			result.append( batch )
+
+			return result
+
 		def __getStatus( self, batch ) :
 
 			return LocalDispatcher.Job.Status( batch.blindData().get( "status", IECore.IntData( int(LocalDispatcher.Job.Status.Waiting) ) ).value )
@@ -309,6 +441,13 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			batch.blindData()["status"] = IECore.IntData( int(status) )
 
+			# Record wall clock times so that we can report
+			# how long each batch took in `statistics()`.
+			if status == LocalDispatcher.Job.Status.Running :
+				batch.blindData()["startTime"] = IECore.DoubleData( time.time() )
+			elif status != LocalDispatcher.Job.Status.Waiting and "startTime" in batch.blindData() :
+				batch.blindData()["endTime"] = IECore.DoubleData( time.time() )
+
 		def __reportCompleted( self, batch ) :
 
 			self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
@@ -319,8 +458,7 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			self.__setStatus( batch, LocalDispatcher.Job.Status.Failed )
 			self.__dispatcher.jobPool()._fail( self )
-			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
-			IECore.msg( IECore.MessageHandler.Level.Error, self.__messageTitle, "Failed to execute " + batch.blindData()["nodeName"].value + " on frames " + frames )
+			IECore.msg( IECore.MessageHandler.Level.Error, self.__messageTitle, "Failed to execute " + batch.blindData()["nodeName"].value + " on frames " + self.__frameList( batch ) )
 
 		def __reportKilled( self, batch ) :
 
@@ -328,28 +466,29 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__dispatcher.jobPool()._remove( self )
 			IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, "Killed " + self.name() )
 
-		def __currentBatch( self ) :
+		def __runningBatches( self ) :
 
-			## \todo Consider just storing the current batch, rather
-			# than searching each time it is requested.
-			return self.__currentBatchWalk( self.__batch, set() )
+			return [
+				b for b in self.__postOrderBatches( self.__batch )
+				if self.__getStatus( b ) == LocalDispatcher.Job.Status.Running
+			]
 
-		def __currentBatchWalk( self, batch, visited ) :
+		def __batchTimes( self ) :
 
-			if batch in visited :
-				return None
-
-			visited.add( batch )
+			result = {}
+			for batch in self.__postOrderBatches( self.__batch ) :
+				if batch.plug() is None or "startTime" not in batch.blindData() :
+					continue
+				endTime = batch.blindData()["endTime"].value if "endTime" in batch.blindData() else time.time()
+				key = "%s : %s" % ( batch.blindData()["nodeName"].value, self.__frameList( batch ) )
+				result[key] = endTime - batch.blindData()["startTime"].value
 
-			if self.__getStatus( batch ) == LocalDispatcher.Job.Status.Running :
-				return batch
+			return result
 
-			for upstreamBatch in batch.preTasks() :
-				currentBatch = self.__currentBatchWalk( upstreamBatch, visited )
-				if currentBatch is not None :
-					return currentBatch
+		@staticmethod
+		def __frameList( batch ) :
 
-			return None
+			return str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
 
 		def __initBatchWalk( self, batch ) :
 
@@ -367,6 +506,92 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			for upstreamBatch in batch.preTasks() :
 				self.__initBatchWalk( upstreamBatch )
 
+	# A long-lived `gaffer execute -worker` process, which loads the script
+	# once and then executes a series of batches on request. Provides the
+	# parts of the `subprocess.Popen` interface used by `Job`, so that it
+	# can be monitored and killed in the same way as a regular process.
+	class _Worker( object ) :
+
+		def __init__( self, args ) :
+
+			self.__process = subprocess.Popen(
+				args, stdin = subprocess.PIPE, stdout = subprocess.PIPE, start_new_session = True
+			)
+			self.pid = self.__process.pid
+			self.returncode = None
+			self.__numBatches = 0
+			self.__memoryUsage = 0
+
+		def execute( self, nodeName, frames, contextArgs ) :
+
+			self.returncode = None
+			self.__numBatches += 1
+
+			request = {
+				"nodes" : [ nodeName ],
+				"frames" : frames,
+				"context" : dict( zip( [ a.lstrip( "-" ) for a in contextArgs[::2] ], contextArgs[1::2] ) ),
+			}
+
+			try :
+				self.__process.stdin.write( json.dumps( request ) + "\n" )
+				self.__process.stdin.flush()
+			except IOError :
+				# The worker has died, perhaps because the script failed
+				# to load. We'll report the failure from `poll()`.
+				pass
+
+		def poll( self ) :
+
+			if self.returncode is not None :
+				return self.returncode
+
+			if not select.select( [ self.__process.stdout ], [], [], 0 )[0] :
+				if self.__process.poll() is not None :
+					self.returncode = self.__process.returncode or 1
+				return self.returncode
+
+			response = self.__process.stdout.readline()
+			if not response :
+				# The worker exited without responding.
+				self.__process.wait()
+				self.returncode = self.__process.returncode or 1
+				return self.returncode
+
+			response = json.loads( response )
+			self.__memoryUsage = response["rss"]
+			self.returncode = response["result"]
+
+			return self.returncode
+
+		def wait( self ) :
+
+			self.__process.wait()
+			self.returncode = self.__process.returncode
+			return self.returncode
+
+		def numBatches( self ) :
+
+			return self.__numBatches
+
+		## Returns the peak memory usage of the worker in kilobytes.
+		def memoryUsage( self ) :
+
+			return self.__memoryUsage
+
+		def terminate( self ) :
+
+			if self.__process.poll() is not None :
+				return
+
+			try :
+				self.__process.stdin.close()
+				os.killpg( self.pid, signal.SIGTERM )
+			except OSError :
+				pass
+
+			self.__process.wait()
+
 	class JobPool( IECore.RunTimeTyped ) :
 
 		def __init__( self ) :
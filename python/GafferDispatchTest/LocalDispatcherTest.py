@@ -39,6 +39,7 @@ import stat
 import shutil
 import unittest
 import time
+import inspect
 
 import IECore
 
@@ -786,6 +787,150 @@ class LocalDispatcherTest( GafferTest.TestCase ) :
 
 		d.jobPool().waitForAll()
 
+	def testMaxConcurrency( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		# Each task records when it starts and finishes, so we can
+		# reconstruct how many were running at any one time.
+		s["l"] = GafferDispatch.TaskList()
+		for i in range( 0, 6 ) :
+			s["c%d" % i] = GafferDispatch.PythonCommand()
+			s["c%d" % i]["command"].setValue( inspect.cleandoc(
+				"""
+				import time
+				with open( "/tmp/dispatcherTest/%s.start" % self.getName(), "w" ) as f :
+					f.write( repr( time.time() ) )
+				time.sleep( 1 )
+				with open( "/tmp/dispatcherTest/%s.end" % self.getName(), "w" ) as f :
+					f.write( repr( time.time() ) )
+				"""
+			) )
+			s["l"]["preTasks"][i].setInput( s["c%d" % i]["task"] )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "LocalTest" )
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CurrentFrame )
+		dispatcher["maxConcurrency"].setValue( 2 )
+
+		dispatcher.dispatch( [ s["l"] ] )
+		job = dispatcher.jobPool().jobs()[0]
+		dispatcher.jobPool().waitForAll()
+
+		self.assertFalse( job.failed() )
+
+		events = []
+		for i in range( 0, 6 ) :
+			with open( "/tmp/dispatcherTest/c%d.start" % i ) as f :
+				events.append( ( float( f.read() ), 1 ) )
+			with open( "/tmp/dispatcherTest/c%d.end" % i ) as f :
+				events.append( ( float( f.read() ), -1 ) )
+
+		# Sorting puts ends before starts at the same time, so
+		# back-to-back tasks aren't counted as overlapping.
+		running = 0
+		maxRunning = 0
+		for t, delta in sorted( events ) :
+			running += delta
+			maxRunning = max( maxRunning, running )
+
+		self.assertEqual( running, 0 )
+		self.assertLessEqual( maxRunning, 2 )
+		self.assertGreater( maxRunning, 1 )
+
+	def testMaxConcurrencyRespectsPreTasks( self ) :
+
+		fileName = "/tmp/dispatcherTest/result.txt"
+
+		def createWriter( text ) :
+			node = GafferDispatchTest.TextWriter()
+			node["mode"].setValue( "a" )
+			node["fileName"].setValue( fileName )
+			node["text"].setValue( text + ";" )
+			return node
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = createWriter( "n1" )
+		s["n2"] = createWriter( "n2" )
+		s["n2a"] = createWriter( "n2a" )
+		s["n2b"] = createWriter( "n2b" )
+		s["n1"]["preTasks"][0].setInput( s["n2"]["task"] )
+		s["n2"]["preTasks"][0].setInput( s["n2a"]["task"] )
+		s["n2"]["preTasks"][1].setInput( s["n2b"]["task"] )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "LocalTest" )
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["maxConcurrency"].setValue( 4 )
+		dispatcher.dispatch( [ s["n1"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		with file( fileName, "r" ) as f :
+			text = f.read().split( ";" )
+
+		self.assertEqual( set( text[:2] ), { "n2a", "n2b" } )
+		self.assertEqual( text[2:], [ "n2", "n1", "" ] )
+
+	def testWorkers( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["c"] = GafferDispatch.PythonCommand()
+		s["c"]["command"].setValue(
+			"import os\n"
+			"open( '/tmp/dispatcherTest/pid.%d.txt' % context.getFrame(), 'w' ).write( str( os.getpid() ) )"
+		)
+
+		dispatcher = GafferDispatch.Dispatcher.create( "LocalTest" )
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-4" )
+
+		def pids() :
+			result = set()
+			for frame in range( 1, 5 ) :
+				with open( "/tmp/dispatcherTest/pid.%d.txt" % frame ) as f :
+					result.add( f.read() )
+			return result
+
+		dispatcher.dispatch( [ s["c"] ] )
+		dispatcher.jobPool().waitForAll()
+		self.assertEqual( len( pids() ), 4 )
+
+		dispatcher["useWorkers"].setValue( True )
+		dispatcher.dispatch( [ s["c"] ] )
+		dispatcher.jobPool().waitForAll()
+		self.assertEqual( len( pids() ), 1 )
+
+		dispatcher["workerBatchLimit"].setValue( 2 )
+		dispatcher.dispatch( [ s["c"] ] )
+		dispatcher.jobPool().waitForAll()
+		self.assertEqual( len( pids() ), 2 )
+
+	def testWorkerFailure( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = GafferDispatchTest.TextWriter()
+		s["n1"]["fileName"].setValue( "/tmp/dispatcherTest/n1_####.txt" )
+		s["n1"]["text"].setValue( "n1 on ${frame}" )
+		s["n2"] = GafferDispatchTest.TextWriter()
+		s["n2"]["fileName"].setValue( "" )
+		s["n2"]["text"].setValue( "n2 on ${frame}" )
+		s["n1"]["preTasks"][0].setInput( s["n2"]["task"] )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "LocalTest" )
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["useWorkers"].setValue( True )
+
+		failedJobs = GafferTest.CapturingSlot( dispatcher.jobPool().jobFailedSignal() )
+
+		dispatcher.dispatch( [ s["n1"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( failedJobs ), 1 )
+		self.assertTrue( failedJobs[0][0].failed() )
+		self.assertFalse( os.path.isfile( s.context().substitute( s["n1"]["fileName"].getValue() ) ) )
+
+		dispatcher.jobPool()._remove( failedJobs[0][0], force = True )
+
 	def tearDown( self ) :
 
 		GafferTest.TestCase.tearDown( self )
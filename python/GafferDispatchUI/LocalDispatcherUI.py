@@ -53,6 +53,8 @@ Gaffer.Metadata.registerNode(
 	may be dispatched in the background to keep the UI responsive.
 	""",
 
+	"layout:activator:useWorkers", lambda node : node["useWorkers"].getValue(),
+
 	plugs = {
 
 		"executeInBackground" : (
@@ -97,6 +99,62 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"maxConcurrency" : (
+
+			"description",
+			"""
+			The maximum number of batches to execute simultaneously
+			when executing in the background. Batches are launched as
+			soon as all their preTasks have completed, so independent
+			branches of the task graph (such as the variations generated
+			by a Wedge) may run concurrently. The default of 1 executes
+			one batch at a time.
+			""",
+
+		),
+
+		"useWorkers" : (
+
+			"description",
+			"""
+			Executes background batches using long-lived worker processes,
+			rather than launching a new `gaffer execute` process for every
+			batch. Each worker loads the script once, and then executes
+			many batches in turn, avoiding the cost of process startup and
+			script loading. This is most beneficial for quick tasks such
+			as PythonCommands and SystemCommands. Tasks must not modify
+			the script they belong to, as the modifications would be seen
+			by subsequent batches executed by the same worker.
+			""",
+
+		),
+
+		"workerBatchLimit" : (
+
+			"description",
+			"""
+			The number of batches a worker executes before it is replaced
+			with a fresh process. A value of 0 places no limit on the number
+			of batches.
+			""",
+
+			"layout:activator", "useWorkers",
+
+		),
+
+		"workerMemoryLimit" : (
+
+			"description",
+			"""
+			The memory usage, in megabytes, above which a worker is replaced
+			with a fresh process after completing its current batch. A value
+			of 0 places no limit on memory usage.
+			""",
+
+			"layout:activator", "useWorkers",
+
+		),
+
 	}
 
 )
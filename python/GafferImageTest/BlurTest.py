@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import os
 import unittest
 
 import IECore
@@ -41,8 +42,9 @@ import IECore
 import Gaffer
 import GafferTest
 import GafferImage
+import GafferImageTest
 
-class BlurTest( GafferTest.TestCase ) :
+class BlurTest( GafferImageTest.ImageTestCase ) :
 
 	def testPassThrough( self ) :
 
@@ -126,5 +128,62 @@ class BlurTest( GafferTest.TestCase ) :
 			blur["radius"].setValue( IECore.V2f( i * 0.5 ) )
 			self.assertAlmostEqual( stats["average"]["r"].getValue(), 1 / 100., delta = 0.0001 )
 
+	def testPyramidMode( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( os.path.expandvars( "$GAFFER_ROOT/python/GafferImageTest/images/checker.exr" ) )
+
+		exact = GafferImage.Blur()
+		exact["in"].setInput( reader["out"] )
+		exact["radius"].setValue( IECore.V2f( 4 ) )
+
+		pyramid = GafferImage.Blur()
+		pyramid["in"].setInput( reader["out"] )
+		pyramid["radius"].setValue( IECore.V2f( 4 ) )
+		pyramid["mode"].setValue( GafferImage.Blur.Mode.Pyramid )
+
+		# Small radii are computed exactly.
+
+		self.assertEqual( pyramid["out"].imageHash(), exact["out"].imageHash() )
+
+		# Large radii are computed at a lower resolution, but
+		# should still closely match the exact result.
+
+		for radius in ( 32, 64 ) :
+
+			exact["radius"].setValue( IECore.V2f( radius ) )
+			pyramid["radius"].setValue( IECore.V2f( radius ) )
+
+			self.assertNotEqual( pyramid["out"].imageHash(), exact["out"].imageHash() )
+			self.assertImagesEqual( pyramid["out"], exact["out"], maxDifference = 0.05 )
+
+		# Increasing the pyramid radius improves accuracy until
+		# no downsampling is necessary.
+
+		pyramid["pyramidRadius"].setValue( 64 )
+		self.assertEqual( pyramid["out"].imageHash(), exact["out"].imageHash() )
+
+	def testExactModeBypassesDownsample( self ) :
+
+		constant = GafferImage.Constant()
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( constant["out"] )
+		blur["radius"].setValue( IECore.V2f( 64 ) )
+
+		# In Exact mode the internal resample reads
+		# straight from the input.
+
+		self.assertTrue( blur["__resample"]["in"].source().isSame( constant["out"] ) )
+
+		# Whereas in Pyramid mode it reads from the
+		# downsampled input.
+
+		blur["mode"].setValue( GafferImage.Blur.Mode.Pyramid )
+		self.assertFalse( blur["__resample"]["in"].source().isSame( constant["out"] ) )
+
+		blur["mode"].setValue( GafferImage.Blur.Mode.Exact )
+		self.assertTrue( blur["__resample"]["in"].source().isSame( constant["out"] ) )
+
 if __name__ == "__main__":
 	unittest.main()
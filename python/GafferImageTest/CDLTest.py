@@ -172,5 +172,61 @@ class CDLTest( GafferImageTest.ImageTestCase ) :
 		self.assertEqual( i["out"]["metadata"].getValue(), o["out"]["metadata"].getValue() )
 		self.assertEqual( i["out"]["channelNames"].getValue(), o["out"]["channelNames"].getValue() )
 
+	def testFusedChain( self ) :
+
+		# Chains of ColorProcessors and ChannelDataProcessors are fused
+		# into a single compute. Check that this gives the same results
+		# as computing each node in turn.
+
+		r = GafferImage.ImageReader()
+		r["fileName"].setValue( self.imageFile )
+
+		g = GafferImage.Grade()
+		g["in"].setInput( r["out"] )
+		g["gain"].setValue( IECore.Color3f( 2, 1, 0.5 ) )
+
+		c = GafferImage.CDL()
+		c["in"].setInput( g["out"] )
+		c["slope"].setValue( IECore.Color3f( 1, 2, 3 ) )
+
+		l = GafferImage.Clamp()
+		l["in"].setInput( c["out"] )
+
+		s = GafferImage.ColorSpace()
+		s["in"].setInput( l["out"] )
+		s["inputSpace"].setValue( "linear" )
+		s["outputSpace"].setValue( "sRGB" )
+
+		def clearCache() :
+
+			cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
+		for disabled in ( None, g, c, l ) :
+
+			if disabled is not None :
+				disabled["enabled"].setValue( False )
+
+			clearCache()
+			fused = s["out"].image()
+
+			# An additional output on each intermediate node
+			# prevents it from being fused.
+			consumers = []
+			for n in ( g, c, l ) :
+				consumer = GafferImage.Grade()
+				consumer["in"].setInput( n["out"] )
+				consumers.append( consumer )
+
+			clearCache()
+			self.assertEqual( s["out"].image(), fused )
+
+			for consumer in consumers :
+				consumer["in"].setInput( None )
+
+			if disabled is not None :
+				disabled["enabled"].setValue( True )
+
 if __name__ == "__main__":
 	unittest.main()
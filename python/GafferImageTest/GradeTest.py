@@ -165,3 +165,32 @@ class GradeTest( GafferImageTest.ImageTestCase ) :
 						s["c"]["out"]["channelData"].getValue( _copy=False )
 					)
 				)
+
+	def testChainedGrades( self ) :
+
+		i = GafferImage.ImageReader()
+		i["fileName"].setValue( self.checkerFile )
+
+		g1 = GafferImage.Grade()
+		g1["in"].setInput( i["out"] )
+		g1["gain"].setValue( IECore.Color3f( 2, 1, 0.5 ) )
+
+		g2 = GafferImage.Grade()
+		g2["in"].setInput( g1["out"] )
+		g2["offset"].setValue( IECore.Color3f( 0.1, 0.2, 0.3 ) )
+		g2["gamma"].setValue( IECore.Color3f( 2 ) )
+
+		# g1 is fused into the compute for g2, so this
+		# computes both grades in a single pass.
+		fused = g2["out"].image()
+
+		# Whereas here g1 has two outputs, so isn't fused,
+		# and g2 computes from the output of g1 instead.
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
+		g3 = GafferImage.Grade()
+		g3["in"].setInput( g1["out"] )
+
+		self.assertEqual( g2["out"].image(), fused )
@@ -122,5 +122,26 @@ class ImageProcessorTest( GafferImageTest.ImageTestCase ) :
 		self.assertEqual( n["in"].minSize(), 2 )
 		self.assertEqual( n["in"].maxSize(), Gaffer.ArrayPlug().maxSize() )
 
+	def testDisabledPassThroughWithoutCache( self ) :
+
+		# A disabled node passes through the hash of its input, so computing
+		# its output requests an input value with an identical hash. With the
+		# cache disabled this must not deadlock waiting for itself.
+
+		c = GafferImage.Constant()
+		c["color"].setValue( IECore.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+		g = GafferImage.Grade()
+		g["in"].setInput( c["out"] )
+		g["enabled"].setValue( False )
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		try :
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			self.assertEqual( g["out"].channelData( "R", IECore.V2i( 0 ) ), c["out"].channelData( "R", IECore.V2i( 0 ) ) )
+			self.assertEqual( g["out"]["format"].getValue(), c["out"]["format"].getValue() )
+		finally :
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
 if __name__ == "__main__":
 	unittest.main()
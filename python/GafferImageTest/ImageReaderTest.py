@@ -124,6 +124,18 @@ class ImageReaderTest( GafferImageTest.ImageTestCase ) :
 		reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
 		self.assertNotEqual( reader["out"].image(), image1 )
 
+	def testMipLevel( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.fileName )
+
+		image = reader["out"].image()
+		hash = reader["out"].imageHash()
+
+		reader["mipLevel"].setValue( 1 )
+		self.assertNotEqual( reader["out"].imageHash(), hash )
+		self.assertEqual( reader["out"].image(), image )
+
 	def testNonexistentFiles( self ) :
 
 		reader = GafferImage.ImageReader()
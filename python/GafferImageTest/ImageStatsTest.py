@@ -168,6 +168,87 @@ class ImageStatsTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertEqual( s["max"]["r"].getValue(), 0 )
 
+	def testHistogram( self ) :
+
+		c = GafferImage.Constant()
+		c["format"].setValue( GafferImage.Format( 100, 100 ) )
+		c["color"].setValue( IECore.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+		s = GafferImage.ImageStats()
+		s["in"].setInput( c["out"] )
+		s["regionOfInterest"].setValue( IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 100 ) ) )
+		s["histogramBins"].setValue( 4 )
+
+		self.assertEqual( s["histogram"]["r"].getValue(), IECore.IntVectorData( [ 0, 10000, 0, 0 ] ) )
+		self.assertEqual( s["histogram"]["g"].getValue(), IECore.IntVectorData( [ 0, 0, 10000, 0 ] ) )
+		self.assertEqual( s["histogram"]["b"].getValue(), IECore.IntVectorData( [ 0, 0, 0, 10000 ] ) )
+		# Values outside the range are counted in the end bins.
+		self.assertEqual( s["histogram"]["a"].getValue(), IECore.IntVectorData( [ 0, 0, 0, 10000 ] ) )
+
+		# Pixels in the region of interest but outside the
+		# data window are black.
+		s["regionOfInterest"].setValue( IECore.Box2i( IECore.V2i( 50, 0 ), IECore.V2i( 150, 100 ) ) )
+		self.assertEqual( s["histogram"]["r"].getValue(), IECore.IntVectorData( [ 5000, 5000, 0, 0 ] ) )
+		self.__assertColour( s["average"].getValue(), IECore.Color4f( 0.125, 0.25, 0.375, 0.5 ) )
+		self.__assertColour( s["min"].getValue(), IECore.Color4f( 0 ) )
+		self.__assertColour( s["max"].getValue(), IECore.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+	def testPercentile( self ) :
+
+		r = GafferImage.ImageReader()
+		r["fileName"].setValue( self.__rgbFilePath )
+
+		s = GafferImage.ImageStats()
+		s["in"].setInput( r["out"] )
+		s["channels"].setValue( IECore.StringVectorData( [ "R", "G", "B", "A" ] ) )
+		s["regionOfInterest"].setValue( r["out"]["format"].getValue().getDisplayWindow() )
+
+		s["percentile"].setValue( 0 )
+		self.__assertColour( s["percentileValue"].getValue(), s["min"].getValue() )
+
+		s["percentile"].setValue( 100 )
+		self.__assertColour( s["percentileValue"].getValue(), s["max"].getValue() )
+
+		# Percentiles must increase monotonically.
+		previous = s["min"].getValue()
+		for percentile in range( 10, 100, 10 ) :
+			s["percentile"].setValue( percentile )
+			value = s["percentileValue"].getValue()
+			for i in range( 0, 4 ) :
+				self.assertGreaterEqual( value[i], previous[i] )
+			previous = value
+
+	def testNonFiniteValues( self ) :
+
+		c = GafferImage.Constant()
+		c["format"].setValue( GafferImage.Format( 10, 10 ) )
+		c["color"].setValue( IECore.Color4f( float( "nan" ), float( "inf" ), 0.5, 1 ) )
+
+		s = GafferImage.ImageStats()
+		s["in"].setInput( c["out"] )
+		s["regionOfInterest"].setValue( IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 10 ) ) )
+
+		self.assertEqual( s["nanCount"].getValue(), 100 )
+		self.assertEqual( s["infCount"].getValue(), 100 )
+
+		# Non-finite values are excluded from the other statistics.
+		self.__assertColour( s["average"].getValue(), IECore.Color4f( 0, 0, 0.5, 1 ) )
+		self.__assertColour( s["max"].getValue(), IECore.Color4f( 0, 0, 0.5, 1 ) )
+
+		c["color"].setValue( IECore.Color4f( 0.5 ) )
+		self.assertEqual( s["nanCount"].getValue(), 0 )
+		self.assertEqual( s["infCount"].getValue(), 0 )
+
+	def testNegativeMax( self ) :
+
+		c = GafferImage.Constant()
+		c["color"].setValue( IECore.Color4f( -1 ) )
+		s = GafferImage.ImageStats()
+		s["in"].setInput( c["out"] )
+		s["regionOfInterest"].setValue( c["out"]["format"].getValue().getDisplayWindow() )
+
+		self.assertEqual( s["max"]["r"].getValue(), -1 )
+
 	def __assertColour( self, colour1, colour2 ) :
 		for i in range( 0, 4 ):
 			self.assertEqual( "%.4f" % colour2[i], "%.4f" % colour1[i] )
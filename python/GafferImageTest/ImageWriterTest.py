@@ -986,6 +986,93 @@ class ImageWriterTest( GafferImageTest.ImageTestCase ) :
 		self.assertTrue( os.path.isfile( w["fileName"].getValue() ) )
 		self.assertTrue( os.path.isfile( w["copyFileName"].getValue() ) )
 
+	def testExecuteSequence( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["c"] = GafferImage.Constant()
+		s["c"]["format"].setValue( GafferImage.Format( 100, 100 ) )
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression( 'parent["c"]["color"]["r"] = context.getFrame()' )
+
+		s["w"] = GafferImage.ImageWriter()
+		s["w"]["in"].setInput( s["c"]["out"] )
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/test.####.exr" )
+
+		s["r"] = GafferImage.ImageReader()
+		s["r"]["fileName"].setInput( s["w"]["fileName"] )
+
+		# An odd number of frames, so that one isn't paired
+		# with another to be written in the background.
+		frames = [ 1, 2, 3, 4, 5 ]
+		with s.context() :
+			s["w"]["task"].executeSequence( frames )
+
+		context = Gaffer.Context( s.context() )
+		for frame in frames :
+			context.setFrame( frame )
+			with context :
+				self.assertTrue( os.path.isfile( s["w"]["fileName"].getValue() ) )
+				self.assertImagesEqual( s["r"]["out"], s["c"]["out"], ignoreMetadata = True )
+
+	def testExecuteSequenceToSingleFile( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["c"] = GafferImage.Constant()
+		s["c"]["format"].setValue( GafferImage.Format( 100, 100 ) )
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression( 'parent["c"]["color"]["r"] = context.getFrame()' )
+
+		s["w"] = GafferImage.ImageWriter()
+		s["w"]["in"].setInput( s["c"]["out"] )
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/test.exr" )
+
+		s["r"] = GafferImage.ImageReader()
+		s["r"]["fileName"].setInput( s["w"]["fileName"] )
+
+		# Frames are written in order, so the last
+		# one written should win.
+		with s.context() :
+			s["w"]["task"].executeSequence( [ 1, 2, 3, 4 ] )
+
+		context = Gaffer.Context( s.context() )
+		context.setFrame( 4 )
+		with context :
+			self.assertImagesEqual( s["r"]["out"], s["c"]["out"], ignoreMetadata = True )
+
+	def testDerivedWriterExecuteSequence( self ) :
+
+		class DerivedWriter( GafferImage.ImageWriter ) :
+
+			def __init__( self, name = "DerivedWriter" ) :
+
+				GafferImage.ImageWriter.__init__( self, name )
+				self.executedFrames = []
+
+			def execute( self ) :
+
+				self.executedFrames.append( Gaffer.Context.current().getFrame() )
+				GafferImage.ImageWriter.execute( self )
+
+		s = Gaffer.ScriptNode()
+
+		s["c"] = GafferImage.Constant()
+		s["c"]["format"].setValue( GafferImage.Format( 100, 100 ) )
+
+		s["w"] = DerivedWriter()
+		s["w"]["in"].setInput( s["c"]["out"] )
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/test.####.exr" )
+
+		# The override of execute() must be called for every
+		# frame, in order.
+		with s.context() :
+			s["w"]["task"].executeSequence( [ 1, 2, 3 ] )
+
+		self.assertEqual( s["w"].executedFrames, [ 1, 2, 3 ] )
+		for frame in ( 1, 2, 3 ) :
+			self.assertTrue( os.path.isfile( self.temporaryDirectory() + "/test.%04d.exr" % frame ) )
+
 	def __testFile( self, mode, channels, ext ) :
 
 		return self.temporaryDirectory() + "/test." + channels + "." + str( mode ) + "." + str( ext )
@@ -443,5 +443,135 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertEqual( m["out"]["dataWindow"].getValue(), a["out"]["dataWindow"].getValue() )
 
+	def __sprites( self, count ) :
+
+		result = []
+		for i in range( 0, count ) :
+
+			c = GafferImage.Constant()
+			c["format"].setValue( GafferImage.Format( 500, 500, 1.0 ) )
+			c["color"].setValue( IECore.Color4f( i / float( count ), 0.5, 1 - i / float( count ), 0.25 + i / ( 2.0 * count ) ) )
+
+			crop = GafferImage.Crop()
+			crop["in"].setInput( c["out"] )
+			crop["areaSource"].setValue( crop.AreaSource.Area )
+			crop["area"].setValue( IECore.Box2i( IECore.V2i( 10 + i * 55 ), IECore.V2i( 40 + i * 55 ) ) )
+			crop["affectDisplayWindow"].setValue( False )
+
+			result.append( ( c, crop ) )
+
+		return result
+
+	def testManySmallInputs( self ) :
+
+		b = GafferImage.Constant()
+		b["format"].setValue( GafferImage.Format( 500, 500, 1.0 ) )
+		b["color"].setValue( IECore.Color4f( 0.1, 0.2, 0.3, 0.5 ) )
+
+		sprites = self.__sprites( 8 )
+
+		for operation in (
+			GafferImage.Merge.Operation.Add,
+			GafferImage.Merge.Operation.Atop,
+			GafferImage.Merge.Operation.In,
+			GafferImage.Merge.Operation.Matte,
+			GafferImage.Merge.Operation.Multiply,
+			GafferImage.Merge.Operation.Over,
+			GafferImage.Merge.Operation.Subtract,
+			GafferImage.Merge.Operation.Difference,
+			GafferImage.Merge.Operation.Under,
+		) :
+
+			for first in ( b, sprites[-1][1] ) :
+
+				# Merge all the inputs in one node.
+
+				m = GafferImage.Merge()
+				m["operation"].setValue( operation )
+				m["in"][0].setInput( first["out"] )
+				for i, ( c, crop ) in enumerate( sprites ) :
+					m["in"][i+1].setInput( crop["out"] )
+
+				# And compare against the same operation
+				# applied one input at a time. We keep a reference
+				# to each node in the chain to keep it alive.
+
+				chain = []
+				previous = first
+				for c, crop in sprites :
+					n = GafferImage.Merge()
+					n["operation"].setValue( operation )
+					n["in"][0].setInput( previous["out"] )
+					n["in"][1].setInput( crop["out"] )
+					chain.append( n )
+					previous = n
+
+				self.assertImagesEqual( m["out"], previous["out"] )
+
+	def testUnaffectedTileHashes( self ) :
+
+		b = GafferImage.Constant()
+		b["format"].setValue( GafferImage.Format( 500, 500, 1.0 ) )
+
+		sprites = self.__sprites( 8 )
+
+		m = GafferImage.Merge()
+		m["operation"].setValue( GafferImage.Merge.Operation.Over )
+		m["in"][0].setInput( b["out"] )
+		for i, ( c, crop ) in enumerate( sprites ) :
+			m["in"][i+1].setInput( crop["out"] )
+
+		def tileHashes() :
+
+			result = {}
+			dataWindow = m["out"]["dataWindow"].getValue()
+			for y in range( 0, dataWindow.max.y, GafferImage.ImagePlug.tileSize() ) :
+				for x in range( 0, dataWindow.max.x, GafferImage.ImagePlug.tileSize() ) :
+					result[(x,y)] = m["out"].channelDataHash( "R", IECore.V2i( x, y ) )
+			return result
+
+		hashes = tileHashes()
+
+		# Changing a sprite should only affect the
+		# tiles it overlaps.
+
+		sprites[4][0]["color"]["r"].setValue( 0.75 )
+		spriteWindow = sprites[4][1]["out"]["dataWindow"].getValue()
+
+		for tile, h in tileHashes().items() :
+			tileBound = IECore.Box2i( IECore.V2i( *tile ), IECore.V2i( *tile ) + IECore.V2i( GafferImage.ImagePlug.tileSize() ) )
+			overlaps = (
+				tileBound.min.x < spriteWindow.max.x and spriteWindow.min.x < tileBound.max.x and
+				tileBound.min.y < spriteWindow.max.y and spriteWindow.min.y < tileBound.max.y
+			)
+			if overlaps :
+				self.assertNotEqual( h, hashes[tile] )
+			else :
+				self.assertEqual( h, hashes[tile] )
+
+	def testInputIndexEvaluatedOnce( self ) :
+
+		b = GafferImage.Constant()
+		b["format"].setValue( GafferImage.Format( 500, 500, 1.0 ) )
+
+		sprites = self.__sprites( 8 )
+
+		m = GafferImage.Merge()
+		m["in"][0].setInput( b["out"] )
+		for i, ( c, crop ) in enumerate( sprites ) :
+			m["in"][i+1].setInput( crop["out"] )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			dataWindow = m["out"]["dataWindow"].getValue()
+			for channelName in ( "R", "G", "B", "A" ) :
+				for y in range( 0, dataWindow.max.y, GafferImage.ImagePlug.tileSize() ) :
+					for x in range( 0, dataWindow.max.x, GafferImage.ImagePlug.tileSize() ) :
+						m["out"].channelData( channelName, IECore.V2i( x, y ) )
+
+		# The index doesn't depend on the channel or tile,
+		# so should be hashed and computed only once.
+		self.assertEqual( monitor.plugStatistics( m["__inputIndex"] ).hashCount, 1 )
+		self.assertEqual( monitor.plugStatistics( m["__inputIndex"] ).computeCount, 1 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -54,6 +54,7 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 	negativeDisplayWindowFileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferImageTest/images/negativeDisplayWindow.exr" )
 	circlesExrFileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferImageTest/images/circles.exr" )
 	circlesJpgFileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferImageTest/images/circles.jpg" )
+	mipMappedFileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferImageTest/images/mipMapped.16x16.exr" )
 
 	def testInternalImageSpaceConversion( self ) :
 
@@ -503,5 +504,100 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 			self.assertEqual( reader["out"]["metadata"].hash(), explicitMetadataHash )
 			self.assertEqual( reader["out"]["metadata"].getValue(), sequenceMetadataValue )
 
+	def testMipLevel( self ) :
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( self.fileName )
+
+		for plug in reader["out"].children() :
+			self.assertTrue( plug in reader.affects( reader["mipLevel"] ) )
+
+		image = reader["out"].image()
+		hash = reader["out"].imageHash()
+
+		# the file has no MIP levels, so the level is
+		# clamped and we read at full resolution.
+		reader["mipLevel"].setValue( 2 )
+		self.assertNotEqual( reader["out"].imageHash(), hash )
+		self.assertEqual( reader["out"].image(), image )
+
+	def testMipMappedFile( self ) :
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( self.mipMappedFileName )
+
+		# Each level of the file halves the resolution. Within level `l`,
+		# the pixel at `x` has R = l * 0.1 + x * 0.01, G = 0.5 and B = l.
+
+		def assertLevel( level, size ) :
+
+			window = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( size ) )
+			self.assertEqual( reader["out"]["format"].getValue().getDisplayWindow(), window )
+			self.assertEqual( reader["out"]["dataWindow"].getValue(), window )
+
+			r = reader["out"].channelData( "R", IECore.V2i( 0 ) )
+			g = reader["out"].channelData( "G", IECore.V2i( 0 ) )
+			b = reader["out"].channelData( "B", IECore.V2i( 0 ) )
+			for y in range( 0, size ) :
+				for x in range( 0, size ) :
+					i = y * GafferImage.ImagePlug.tileSize() + x
+					self.assertAlmostEqual( r[i], level * 0.1 + x * 0.01, places = 6 )
+					self.assertAlmostEqual( g[i], 0.5, places = 6 )
+					self.assertAlmostEqual( b[i], level, places = 6 )
+
+		assertLevel( 0, 16 )
+
+		hashes = set( [ reader["out"].imageHash() ] )
+		for level in range( 1, 5 ) :
+			reader["mipLevel"].setValue( level )
+			assertLevel( level, 16 >> level )
+			hashes.add( reader["out"].imageHash() )
+
+		self.assertEqual( len( hashes ), 5 )
+
+		# Levels beyond the smallest are clamped.
+
+		reader["mipLevel"].setValue( 10 )
+		assertLevel( 4, 1 )
+
+		# Reading ahead mustn't change the pixels. We clear the
+		# cache so that the values are really read again.
+
+		reader["mipLevel"].setValue( 1 )
+		reader["readAhead"].setValue( 2 )
+		Gaffer.ValuePlug.clearCache()
+		assertLevel( 1, 8 )
+
+	def testReadAhead( self ) :
+
+		testSequence = IECore.FileSequence( self.temporaryDirectory() + "/incompleteSequence.####.exr" )
+		shutil.copyfile( self.fileName, testSequence.fileNameForFrame( 1 ) )
+		shutil.copyfile( self.offsetDataWindowFileName, testSequence.fileNameForFrame( 3 ) )
+		shutil.copyfile( self.fileName, testSequence.fileNameForFrame( 4 ) )
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( testSequence.fileName )
+		reader["missingFrameMode"].setValue( GafferImage.OpenImageIOReader.MissingFrameMode.Hold )
+
+		# read ahead doesn't affect the output
+		self.assertEqual( reader.affects( reader["readAhead"] ), [] )
+
+		context = Gaffer.Context()
+		images = {}
+		hashes = {}
+		for frame in range( 0, 6 ) :
+			context.setFrame( frame )
+			with context :
+				images[frame] = reader["out"].image()
+				hashes[frame] = reader["out"].imageHash()
+
+		reader["readAhead"].setValue( 2 )
+		Gaffer.ValuePlug.clearCache()
+		for frame in range( 0, 6 ) :
+			context.setFrame( frame )
+			with context :
+				self.assertEqual( reader["out"].image(), images[frame] )
+				self.assertEqual( reader["out"].imageHash(), hashes[frame] )
+
 if __name__ == "__main__":
 	unittest.main()
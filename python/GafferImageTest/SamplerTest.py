@@ -201,6 +201,56 @@ class SamplerTest( GafferImageTest.ImageTestCase ) :
 		empty = self.emptyImage()
 		sampler = GafferImage.Sampler( empty["out"], "R", empty["out"]["format"].getValue().getDisplayWindow(), boundingMode = GafferImage.Sampler.BoundingMode.Clamp )
 		self.assertEqual( sampler.sample( 0, 0 ), 0.0 )
+		self.assertEqual( sampler.sampleRow( 0, 0, 10 ), IECore.FloatVectorData( [ 0 ] * 10 ) )
+
+	def testSampleRow( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.fileName )
+
+		dataWindow = reader["out"]["dataWindow"].getValue()
+		region = IECore.Box2i( dataWindow.min - IECore.V2i( 10 ), dataWindow.max + IECore.V2i( 10 ) )
+
+		for boundingMode in ( GafferImage.Sampler.BoundingMode.Black, GafferImage.Sampler.BoundingMode.Clamp ) :
+
+			sampler = GafferImage.Sampler( reader["out"], "R", region, boundingMode )
+			for y in range( region.min.y, region.max.y, 7 ) :
+
+				for xBegin, xEnd in [
+					( region.min.x, region.max.x ),
+					( dataWindow.min.x + 3, dataWindow.min.x + 70 ),
+					( region.min.x, dataWindow.min.x ),
+					( dataWindow.max.x - 1, region.max.x ),
+				] :
+
+					row = sampler.sampleRow( y, xBegin, xEnd )
+					self.assertEqual( len( row ), xEnd - xBegin )
+					for x in range( xBegin, xEnd ) :
+						self.assertEqual( row[x-xBegin], sampler.sample( x, y ) )
+
+	def testSampleRow( self ) :
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 2048, 1556 ) )
+		constant["color"].setValue( IECore.Color4f( 0.5 ) )
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( self.fileName )
+
+		merge = GafferImage.Merge()
+		merge["in"][0].setInput( constant["out"] )
+		merge["in"][1].setInput( reader["out"] )
+
+		dataWindow = merge["out"]["dataWindow"].getValue()
+		region = IECore.Box2i( dataWindow.min - IECore.V2i( 100 ), dataWindow.max + IECore.V2i( 100 ) )
+
+		for boundingMode in ( GafferImage.Sampler.BoundingMode.Black, GafferImage.Sampler.BoundingMode.Clamp ) :
+
+			# Sampling by row must give exactly the same
+			# results as sampling pixel by pixel.
+			pixelSum = GafferImageTest.sumPixels( merge["out"], "R", region, boundingMode, False )
+			rowSum = GafferImageTest.sumPixels( merge["out"], "R", region, boundingMode, True )
+			self.assertEqual( rowSum, pixelSum )
 
 if __name__ == "__main__":
 	unittest.main()
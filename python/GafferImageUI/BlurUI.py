@@ -91,7 +91,39 @@ Gaffer.Metadata.registerNode(
 			which the blur will bleed onto.
 			"""
 
-		]
+		],
+
+		"mode" : [
+
+			"description",
+			"""
+			The method used to compute the blur. Exact filters the
+			input directly, at a cost which grows with the radius.
+			Pyramid computes large blurs from a downsampled copy of
+			the input, so that the cost no longer depends on the
+			radius, at the expense of a small loss of accuracy.
+			""",
+
+			"preset:Exact", GafferImage.Blur.Mode.Exact,
+			"preset:Pyramid", GafferImage.Blur.Mode.Pyramid,
+
+			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
+
+		],
+
+		"pyramidRadius" : [
+
+			"description",
+			"""
+			Controls the accuracy of the Pyramid mode. The input is
+			only downsampled as far as keeps the blur radius at or
+			above this number of pixels at the lower resolution, so
+			higher values give results closer to the Exact mode, at
+			a higher cost. Blurs with a radius less than twice this
+			value are always computed exactly.
+			""",
+
+		],
 
 	}
 
@@ -103,6 +103,35 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"mipLevel" : [
+
+			"description",
+			"""
+			The MIP level to read from mip-mapped files such as tiled
+			EXRs and textures. Level 0 is full resolution, and each
+			subsequent level halves the resolution. This provides a
+			cheap proxy resolution for viewing, since only the pixels
+			of the lower level are read. Levels beyond those present in
+			the file read the lowest resolution available, and files
+			without MIP levels are always read at full resolution.
+			""",
+
+		],
+
+		"readAhead" : [
+
+			"description",
+			"""
+			The number of frames of a file sequence to read ahead of
+			the current frame. When non-zero, each tile read for the
+			current frame also loads the same tile for the following
+			frames in the background, hiding file access latency during
+			playback and scrubbing. This does not affect the image
+			that is output.
+			""",
+
+		],
+
 		"start" : [
 
 			"description",
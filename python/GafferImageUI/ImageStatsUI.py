@@ -57,8 +57,9 @@ Gaffer.Metadata.registerNode(
 
 	"description",
 	"""
-	Calculates minimum, maximum and average colours for a region of
-	an image. These outputs can then be used to drive other plugs
+	Calculates minimum, maximum, average and percentile colours,
+	histograms and counts of non-finite values for a region of an
+	image. These outputs can then be used to drive other plugs
 	within the node graph.
 	""",
 
@@ -95,6 +96,42 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"histogramBins" : [
+
+			"description",
+			"""
+			The number of bins used for the histogram output.
+			""",
+
+			"nodule:type", "",
+
+		],
+
+		"histogramRange" : [
+
+			"description",
+			"""
+			The range of values covered by the histogram. Values
+			outside this range are counted in the first or last
+			bin.
+			""",
+
+			"nodule:type", "",
+
+		],
+
+		"percentile" : [
+
+			"description",
+			"""
+			The percentile output by the percentileValue plug. For
+			instance, 50 gives the median value.
+			""",
+
+			"nodule:type", "",
+
+		],
+
 		"average" : [
 
 			"description",
@@ -122,6 +159,48 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"percentileValue" : [
+
+			"description",
+			"""
+			The per-channel values below which the specified percentile
+			of the pixel values fall. These are estimated from the
+			histogram, so their accuracy depends on the histogramBins
+			and histogramRange settings.
+			""",
+
+		],
+
+		"histogram" : [
+
+			"description",
+			"""
+			The per-channel histograms computed from the input image region,
+			each holding the number of pixels which fall within each bin.
+			""",
+
+		],
+
+		"nanCount" : [
+
+			"description",
+			"""
+			The total number of NaN values found in the analysed channels.
+			NaN values are excluded from all other statistics.
+			""",
+
+		],
+
+		"infCount" : [
+
+			"description",
+			"""
+			The total number of infinite values found in the analysed channels.
+			Infinite values are excluded from all other statistics.
+			""",
+
+		],
+
 	}
 
 )
@@ -117,6 +117,70 @@ class _DisplayTransformPlugValueWidget( GafferUI.PresetsPlugValueWidget ) :
 		# based on a metadata value?
 		self._qtWidget().setFixedWidth( 100 )
 
+##########################################################################
+# _FrameCachePlugValueWidget
+##########################################################################
+
+# Toggles the frame cache on and off, and while it is on, keeps it
+# prefetching the frames in the Playback range, starting from the
+# current frame. Also reports the cached frames to the Playback so
+# they are shown in the Timeline.
+class _FrameCachePlugValueWidget( GafferUI.BoolPlugValueWidget ) :
+
+	def __init__( self, plug, **kw ) :
+
+		# Must be set before calling the base class constructor,
+		# as it calls _updateFromPlug().
+		self.__frameCache = None
+
+		GafferUI.BoolPlugValueWidget.__init__( self, plug, **kw )
+
+	def _updateFromPlug( self ) :
+
+		GafferUI.BoolPlugValueWidget._updateFromPlug( self )
+
+		view = self.getPlug().node()
+		frameCache = view.frameCache()
+		if frameCache is not None and self.__frameCache is not None and frameCache.isSame( self.__frameCache ) :
+			return
+
+		self.__frameCache = frameCache
+		playback = GafferUI.Playback.acquire( view.getContext() )
+		if frameCache is not None :
+			self.__frameCacheChangedConnection = frameCache.changedSignal().connect( Gaffer.WeakMethod( self.__frameCacheChanged ) )
+			self.__contextChangedConnection = view.getContext().changedSignal().connect( Gaffer.WeakMethod( self.__contextChanged ) )
+			self.__playbackFrameRangeChangedConnection = playback.frameRangeChangedSignal().connect( Gaffer.WeakMethod( self.__prefetch ) )
+			self.__prefetch()
+		else :
+			self.__frameCacheChangedConnection = None
+			self.__contextChangedConnection = None
+			self.__playbackFrameRangeChangedConnection = None
+			playback.setCachedFrames( [] )
+
+	def __contextChanged( self, context, name ) :
+
+		if name == "frame" :
+			self.__prefetch()
+
+	def __prefetch( self, *unused ) :
+
+		if self.__frameCache is None :
+			return
+
+		context = self.__frameCache.getContext()
+		start, end = GafferUI.Playback.acquire( context ).getFrameRange()
+		start, end = int( start ), int( end )
+		current = min( max( int( context.getFrame() ), start ), end )
+
+		# Ahead of the playhead first, then wrapping around
+		# to fill in the frames behind it.
+		frames = range( current, end + 1 ) + range( start, current )
+		self.__frameCache.prefetch( [ float( f ) for f in frames ] )
+
+	def __frameCacheChanged( self, frameCache ) :
+
+		GafferUI.Playback.acquire( frameCache.getContext() ).setCachedFrames( frameCache.cachedFrames() )
+
 ##########################################################################
 # _ColorInspectorPlugValueWidget
 ##########################################################################
@@ -246,6 +310,23 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"frameCache" : [
+
+			"description",
+			"""
+			Computes frames in the background and caches them,
+			so that they can be played back in real time. Frames
+			are computed from the current frame onwards, and the
+			cached frames are shown in the Timeline. Editing the
+			graph discards the cached frames, which are then
+			recomputed when the frame next changes.
+			""",
+
+			"plugValueWidget:type", "GafferImageUI.ImageViewToolbar._FrameCachePlugValueWidget",
+			"label", "Cache",
+
+		],
+
 		"colorInspector" : [
 
 			"plugValueWidget:type", "GafferImageUI.ImageViewToolbar._ColorInspectorPlugValueWidget",
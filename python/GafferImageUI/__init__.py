@@ -35,8 +35,13 @@
 #
 ##########################################################################
 
+import atexit
+
 from _GafferImageUI import *
 
+# Background threads must not outlive the interpreter.
+atexit.register( FrameCache.stopAll )
+
 import DisplayUI
 from FormatPlugValueWidget import FormatPlugValueWidget
 from ChannelMaskPlugValueWidget import ChannelMaskPlugValueWidget
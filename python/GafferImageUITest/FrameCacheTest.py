@@ -0,0 +1,248 @@
+##########################################################################
+#
+#  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import time
+import unittest
+
+import IECore
+
+import Gaffer
+import GafferUITest
+import GafferImage
+import GafferImageUI
+
+class FrameCacheTest( GafferUITest.TestCase ) :
+
+	def testPrefetch( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+		script["constant"]["format"].setValue( GafferImage.Format( 200, 100 ) )
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["constant"]["color"]["r"] = context.getFrame()' )
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		self.assertTrue( frameCache.getImage().isSame( script["constant"]["out"] ) )
+		self.assertTrue( frameCache.getContext().isSame( script.context() ) )
+
+		frameCache.prefetch( [ 3, 1, 2 ] )
+		self.__waitForFrames( frameCache, [ 1, 2, 3 ] )
+
+		self.assertEqual( frameCache.cachedFrames(), [ 1, 2, 3 ] )
+		self.assertFalse( frameCache.isCached( 4 ) )
+		self.assertGreater( frameCache.memoryUsage(), 0 )
+
+		for frame in ( 1, 2, 3 ) :
+			with Gaffer.Context( script.context() ) as context :
+				context.setFrame( frame )
+				for channelName in ( "R", "G", "B", "A" ) :
+					self.assertEqual(
+						frameCache.channelData( frame, channelName, IECore.V2i( 0 ) ),
+						script["constant"]["out"].channelData( channelName, IECore.V2i( 0 ) )
+					)
+
+		self.assertEqual( frameCache.channelData( 4, "R", IECore.V2i( 0 ) ), None )
+		self.assertEqual( frameCache.channelData( 1, "Z", IECore.V2i( 0 ) ), None )
+		self.assertEqual( frameCache.channelData( 1, "R", IECore.V2i( 1024 ) ), None )
+
+	def testInvalidation( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache.prefetch( [ 1, 2 ] )
+		self.__waitForFrames( frameCache, [ 1, 2 ] )
+
+		# Changing the frame doesn't invalidate anything.
+		script.context().setFrame( 10 )
+		self.assertEqual( frameCache.cachedFrames(), [ 1, 2 ] )
+
+		# But editing the graph does.
+		script["constant"]["color"]["r"].setValue( 1 )
+		self.assertEqual( frameCache.cachedFrames(), [] )
+		self.assertEqual( frameCache.memoryUsage(), 0 )
+
+		frameCache.prefetch( [ 1, 2 ] )
+		self.__waitForFrames( frameCache, [ 1, 2 ] )
+
+		# As does changing the context.
+		script.context()["myVariable"] = 1
+		self.assertEqual( frameCache.cachedFrames(), [] )
+
+	def testMemoryLimit( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache.setMemoryLimit( 1 )
+		self.assertEqual( frameCache.getMemoryLimit(), 1 )
+
+		# We stop computing as soon as we're over the limit.
+		frameCache.prefetch( [ 1, 2, 3 ] )
+		self.__waitForFrames( frameCache, [ 1 ] )
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache.cachedFrames(), [ 1 ] )
+
+		# But evict frames which are no longer requested
+		# to make room for those that are.
+		frameCache.prefetch( [ 2, 3 ] )
+		self.__waitForFrames( frameCache, [ 2 ] )
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache.cachedFrames(), [ 2 ] )
+
+	def testStop( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+		script["constant"]["format"].setValue( GafferImage.Format( 2000, 2000 ) )
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["constant"]["color"]["r"] = context.getFrame()' )
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache.prefetch( [ float( f ) for f in range( 1, 100 ) ] )
+		self.__waitForFrames( frameCache, [ 1 ] )
+
+		# Nothing more is computed once we've stopped,
+		# but the frames we have are kept.
+		frameCache.stop()
+		cachedFrames = frameCache.cachedFrames()
+		self.assertTrue( 1 in cachedFrames )
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache.cachedFrames(), cachedFrames )
+
+		# And computation doesn't resume after an edit.
+		script["node"] = Gaffer.Node()
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache.cachedFrames(), cachedFrames )
+
+		# Until we prefetch again.
+		frameCache.prefetch( [ 200, 201 ] )
+		self.__waitForFrames( frameCache, [ 200, 201 ] )
+
+	def testEditsStopComputation( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+		script["constant"]["format"].setValue( GafferImage.Format( 2000, 2000 ) )
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["constant"]["color"]["r"] = context.getFrame()' )
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache.prefetch( [ float( f ) for f in range( 1, 20 ) ] )
+		self.__waitForFrames( frameCache, [ 1 ] )
+
+		# Edits which don't affect the image cancel the
+		# computation, and then let it resume.
+		for i in range( 0, 10 ) :
+			script["node%d" % i] = Gaffer.Node()
+		self.__waitForFrames( frameCache, [ 1, 2, 3 ] )
+
+		# Edits which do affect the image discard the
+		# frames without computation being resumed.
+		with Gaffer.UndoContext( script ) :
+			script["expression"].setExpression( 'parent["constant"]["color"]["g"] = context.getFrame()' )
+		self.assertEqual( frameCache.cachedFrames(), [] )
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache.cachedFrames(), [] )
+
+		frameCache.prefetch( [ 1, 2 ] )
+		self.__waitForFrames( frameCache, [ 1, 2 ] )
+
+		# Likewise for undo.
+		script.undo()
+		self.assertEqual( frameCache.cachedFrames(), [] )
+
+	def testEditsDontWaitForComputation( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+		script["constant"]["format"].setValue( GafferImage.Format( 2000, 2000 ) )
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["constant"]["color"]["r"] = context.getFrame()' )
+		script["node"] = Gaffer.Node()
+		script["node"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		frameCache = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache.prefetch( [ float( f ) for f in range( 1, 20 ) ] )
+		self.__waitForFrames( frameCache, [ 1 ] )
+
+		# These edits are made from bindings which don't release
+		# the GIL, while the background thread needs it to evaluate
+		# the expression. They would hang if they waited for it.
+		for i in range( 0, 10 ) :
+			script["node"].setName( "node%d" % i )
+			script["node%d" % i]["user"]["p"].setFlags( Gaffer.Plug.Flags.Serialisable, i % 2 == 0 )
+			script["node%d" % i].setName( "node" )
+
+		box = Gaffer.Box.create( script, Gaffer.StandardSet( [ script["node"] ] ) )
+		box.promotePlug( box["node"]["user"]["p"] )
+
+		# Computation resumes once the edits are complete.
+		self.__waitForFrames( frameCache, [ 1, 2, 3 ] )
+
+	def testStopAll( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["constant"] = GafferImage.Constant()
+		script["constant"]["format"].setValue( GafferImage.Format( 2000, 2000 ) )
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["constant"]["color"]["r"] = context.getFrame()' )
+
+		frameCache1 = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache1.prefetch( [ float( f ) for f in range( 1, 100 ) ] )
+
+		# Destroying a FrameCache doesn't wait for its
+		# computation, but stopAll() does.
+		frameCache2 = GafferImageUI.FrameCache( script["constant"]["out"], script.context() )
+		frameCache2.prefetch( [ float( f ) for f in range( 1, 100 ) ] )
+		del frameCache2
+
+		GafferImageUI.FrameCache.stopAll()
+		cachedFrames = frameCache1.cachedFrames()
+		time.sleep( 0.5 )
+		self.assertEqual( frameCache1.cachedFrames(), cachedFrames )
+
+	def __waitForFrames( self, frameCache, frames, timeout = 10 ) :
+
+		startTime = time.time()
+		while not all( frameCache.isCached( f ) for f in frames ) :
+			self.assertLess( time.time() - startTime, timeout )
+			time.sleep( 0.01 )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -39,6 +39,7 @@ import unittest
 import IECore
 
 import Gaffer
+import GafferUI
 import GafferUITest
 import GafferImage
 import GafferImageUI
@@ -77,6 +78,65 @@ class ImageGadgetTest( GafferUITest.TestCase ) :
 		g.setImage( c["out"] )
 		self.assertTrue( g.getImage().isSame( c["out"] ) )
 
+	def testOnlyVisibleTilesAreComputed( self ) :
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 2048, 2048 ) )
+
+		# Offset by a non-multiple of the tile size, so that
+		# every tile has a unique hash, and must be computed
+		# separately.
+		offset = GafferImage.Offset()
+		offset["in"].setInput( constant["out"] )
+		offset["offset"].setValue( IECore.V2i( 1 ) )
+
+		dataWindow = offset["out"]["dataWindow"].getValue()
+		tileSize = GafferImage.ImagePlug.tileSize()
+		tilesWindow = IECore.Box2i(
+			GafferImage.ImagePlug.tileOrigin( dataWindow.min ),
+			GafferImage.ImagePlug.tileOrigin( dataWindow.max - IECore.V2i( 1 ) ) + IECore.V2i( tileSize )
+		)
+		numTiles = ( tilesWindow.size().x / tileSize ) * ( tilesWindow.size().y / tileSize )
+		numChannels = len( offset["out"]["channelNames"].getValue() )
+
+		gadget = GafferImageUI.ImageGadget()
+		gadget.setImage( offset["out"] )
+
+		with GafferUI.Window() as window :
+			gadgetWidget = GafferUI.GadgetWidget( gadget )
+
+		viewportGadget = gadgetWidget.getViewportGadget()
+
+		# Only the tiles in the viewport should be computed.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			viewportGadget.frame( IECore.Box3f( IECore.V3f( 0 ), IECore.V3f( 256, 256, 0 ) ) )
+			window.setVisible( True )
+			self.waitForIdle( 1000 )
+
+		computeCount = monitor.plugStatistics( offset["out"]["channelData"] ).computeCount
+		self.assertGreater( computeCount, 0 )
+		self.assertLess( computeCount, numTiles * numChannels / 2 )
+
+		# Panning should compute the newly exposed tiles.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			viewportGadget.frame( IECore.Box3f( IECore.V3f( 1024, 1024, 0 ), IECore.V3f( 1280, 1280, 0 ) ) )
+			self.waitForIdle( 1000 )
+
+		computeCount = monitor.plugStatistics( offset["out"]["channelData"] ).computeCount
+		self.assertGreater( computeCount, 0 )
+		self.assertLess( computeCount, numTiles * numChannels / 2 )
+
+		# But panning back shouldn't recompute the tiles
+		# we already have.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			viewportGadget.frame( IECore.Box3f( IECore.V3f( 0 ), IECore.V3f( 256, 256, 0 ) ) )
+			self.waitForIdle( 1000 )
+
+		self.assertEqual( monitor.plugStatistics( offset["out"]["channelData"] ).computeCount, 0 )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -85,5 +85,25 @@ class ImageViewTest( GafferUITest.TestCase ) :
 		view["exposure"].setValue( 1 )
 		view["gamma"].setValue( 0.5 )
 
+	def testFrameCache( self ) :
+
+		image = GafferImage.Constant()
+		view = GafferUI.View.create( image["out"] )
+		self.assertEqual( view.frameCache(), None )
+		self.assertEqual( view.viewportGadget().getPrimaryChild().getFrameCache(), None )
+
+		view["frameCache"].setValue( True )
+		self.assertTrue( isinstance( view.frameCache(), GafferImageUI.FrameCache ) )
+		self.assertTrue( view.frameCache().getContext().isSame( view.getContext() ) )
+		self.assertTrue( view.viewportGadget().getPrimaryChild().getFrameCache().isSame( view.frameCache() ) )
+
+		context = Gaffer.Context()
+		view.setContext( context )
+		self.assertTrue( view.frameCache().getContext().isSame( context ) )
+
+		view["frameCache"].setValue( False )
+		self.assertEqual( view.frameCache(), None )
+		self.assertEqual( view.viewportGadget().getPrimaryChild().getFrameCache(), None )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -38,6 +38,7 @@ from FormatPlugValueWidgetTest import FormatPlugValueWidgetTest
 from ImageViewTest import ImageViewTest
 from DocumentationTest import DocumentationTest
 from ImageGadgetTest import ImageGadgetTest
+from FrameCacheTest import FrameCacheTest
 
 if __name__ == "__main__":
 	unittest.main()
@@ -138,6 +138,27 @@ class ShadingEngineTest( GafferOSLTest.OSLTestCase ) :
 		for i, c in enumerate( p["Ci"] ) :
 			self.assertEqual( c, rp["colorUserData"][i] )
 
+	def testManyPoints( self ) :
+
+		# Enough points to be shaded in several parallel tasks.
+		rp = self.rectanglePoints( divisions = IECore.V2i( 200 ) )
+
+		shader = self.compileShader( os.path.dirname( __file__ ) + "/shaders/attribute.osl" )
+		e = GafferOSL.ShadingEngine( IECore.ObjectVector( [
+			IECore.Shader( shader, "surface", { "name" : "colorUserData" } ),
+		] ) )
+		p = e.shade( rp )
+
+		self.assertEqual( p["Ci"], rp["colorUserData"] )
+
+		shader = self.compileShader( os.path.dirname( __file__ ) + "/shaders/debugClosure.osl" )
+		e = GafferOSL.ShadingEngine( IECore.ObjectVector( [
+			IECore.Shader( shader, "surface", { "name" : "a", "weight" : IECore.Color3f( 1, 0, 0 ) } ),
+		] ) )
+		p = e.shade( rp )
+
+		self.assertEqual( p["a"], IECore.Color3fVectorData( [ IECore.Color3f( 1, 0, 0 ) ] * len( rp["P"] ) ) )
+
 	def testStructs( self ) :
 
 		shader = self.compileShader( os.path.dirname( __file__ ) + "/shaders/structs.osl" )
@@ -415,10 +415,11 @@ class RenderManShaderTest( GafferRenderManTest.RenderManTestCase ) :
 		coshaderNode["parameters"]["floatParameter"].setValue( 12 )
 
 		dirtiedNames = [ x[0].fullName() for x in cs ]
-		self.assertEqual( len( dirtiedNames ), 3 )
+		self.assertEqual( len( dirtiedNames ), 4 )
 		self.assertEqual( dirtiedNames[0], "ShaderAssignment.shader" )
 		self.assertEqual( dirtiedNames[1], "ShaderAssignment.out.attributes" )
-		self.assertEqual( dirtiedNames[2], "ShaderAssignment.out" )
+		self.assertEqual( dirtiedNames[2], "ShaderAssignment.out.fullAttributes" )
+		self.assertEqual( dirtiedNames[3], "ShaderAssignment.out" )
 
 	def testArrayParameters( self ) :
 
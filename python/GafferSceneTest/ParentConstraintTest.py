@@ -124,10 +124,10 @@ class ParentConstraintTest( GafferSceneTest.SceneTestCase ) :
 
 		constraint["relativeTransform"]["translate"]["x"].setValue( 10 )
 
-		self.assertEqual( len( cs ), 6 )
+		self.assertEqual( len( cs ), 7 )
 		plugs = [ x[0].relativeName( x[0].node() ) for x in cs ]
 		self.assertEqual(
-			set( [ "relativeTransform.translate.x", "relativeTransform.translate", "relativeTransform", "out.bound", "out.transform", "out" ] ),
+			set( [ "relativeTransform.translate.x", "relativeTransform.translate", "relativeTransform", "out.bound", "out.transform", "out.fullTransform", "out" ] ),
 			set( plugs )
 		)
 
@@ -987,5 +987,131 @@ class PathMatcherTest( GafferSceneTest.SceneTestCase ) :
 		s = m.subTree( "" )
 		self.assertTrue( s.isEmpty() )
 
+	def testIntersectPaths( self ) :
+
+		m = GafferScene.PathMatcher( [ "/", "/a", "/a/b", "/a/b/c", "/d/e", "/f/g" ] )
+		self.assertTrue( m.intersectPaths( GafferScene.PathMatcher( [ "/a/b", "/a/b/c/d", "/d/e", "/f", "/x" ] ) ) )
+		self.assertEqual( set( m.paths() ), set( [ "/a/b", "/d/e" ] ) )
+
+		self.assertFalse( m.intersectPaths( GafferScene.PathMatcher( [ "/a/b", "/d/e" ] ) ) )
+		self.assertEqual( set( m.paths() ), set( [ "/a/b", "/d/e" ] ) )
+
+		self.assertFalse( m.intersectPaths( m ) )
+		self.assertEqual( set( m.paths() ), set( [ "/a/b", "/d/e" ] ) )
+
+		self.assertTrue( m.intersectPaths( GafferScene.PathMatcher() ) )
+		self.assertTrue( m.isEmpty() )
+
+	def testCopyAndIntersectPaths( self ) :
+
+		m1 = GafferScene.PathMatcher( [ "/a/b", "/a/c", "/d" ] )
+		m2 = GafferScene.PathMatcher( m1 )
+
+		m1.intersectPaths( GafferScene.PathMatcher( [ "/a/c", "/d/e" ] ) )
+		self.assertEqual( m1.paths(), [ "/a/c" ] )
+		self.assertEqual( set( m2.paths() ), set( [ "/a/b", "/a/c", "/d" ] ) )
+
+	def testRemovePathsFromSelf( self ) :
+
+		m = GafferScene.PathMatcher( [ "/a/b", "/a/c", "/d" ] )
+		self.assertTrue( m.removePaths( m ) )
+		self.assertTrue( m.isEmpty() )
+		self.assertFalse( m.removePaths( m ) )
+
+	def testSetAlgebra( self ) :
+
+		paths1 = [ GafferScene.ScenePlug.pathToString( p ) for p in self.generatePaths( seed = 1, depthRange = ( 2, 5 ), numChildrenRange = ( 2, 10 ) ) ]
+		paths2 = [ GafferScene.ScenePlug.pathToString( p ) for p in self.generatePaths( seed = 2, depthRange = ( 2, 5 ), numChildrenRange = ( 2, 10 ) ) ]
+
+		for compact in ( False, True ) :
+
+			m1 = GafferScene.PathMatcher( paths1 )
+			m2 = GafferScene.PathMatcher( paths2 )
+			if compact :
+				m1.compact()
+				m2.compact()
+
+			u = GafferScene.PathMatcher( m1 )
+			u.addPaths( m2 )
+			self.assertEqual( set( u.paths() ), set( paths1 ) | set( paths2 ) )
+
+			d = GafferScene.PathMatcher( m1 )
+			d.removePaths( m2 )
+			self.assertEqual( set( d.paths() ), set( paths1 ) - set( paths2 ) )
+
+			i = GafferScene.PathMatcher( m1 )
+			i.intersectPaths( m2 )
+			self.assertEqual( set( i.paths() ), set( paths1 ) & set( paths2 ) )
+
+			self.assertEqual( set( m1.paths() ), set( paths1 ) )
+			self.assertEqual( set( m2.paths() ), set( paths2 ) )
+
+	def testSetAlgebraPerformance( self ) :
+
+		# Call with the default arguments, and uncomment the timing output in
+		# the C++ implementation, to benchmark with 10 million paths.
+		GafferSceneTest.testPathMatcherSetAlgebraPerformance( numGroups = 100, numChildren = 1000 )
+
+	def testCompact( self ) :
+
+		paths = [
+			"/a/b/c/d",
+			"/a/b",
+			"/a/b/*/f",
+			"/e/f",
+			"/e/.../g",
+			"/h",
+		]
+
+		m1 = GafferScene.PathMatcher( paths )
+		m2 = GafferScene.PathMatcher( m1 )
+		self.assertFalse( m2.isCompact() )
+
+		m2.compact()
+		self.assertTrue( m2.isCompact() )
+		self.assertEqual( m1, m2 )
+		self.assertEqual( set( m2.paths() ), set( paths ) )
+
+		for path in [ "/", "/a", "/a/b", "/a/b/c", "/a/b/x/f", "/e/x/y/g", "/e/f/g/h", "/h/i", "/z" ] :
+			self.assertEqual( m2.match( path ), m1.match( path ) )
+
+		self.assertEqual( set( m2.subTree( "/a" ).paths() ), set( m1.subTree( "/a" ).paths() ) )
+
+		# Edits should convert back to the mutable form,
+		# without affecting other copies.
+
+		m3 = GafferScene.PathMatcher( m2 )
+
+		self.assertTrue( m2.addPath( "/a/b/c/e" ) )
+		self.assertFalse( m2.addPath( "/a/b/c/d" ) )
+		self.assertFalse( m2.isCompact() )
+		self.assertTrue( m2.removePath( "/e/f" ) )
+		self.assertTrue( m2.prune( "/h" ) )
+		self.assertTrue( m2.addPaths( GafferScene.PathMatcher( [ "/e/i" ] ) ) )
+		self.assertEqual( set( m2.paths() ), set( paths + [ "/a/b/c/e", "/e/i" ] ) - set( [ "/e/f", "/h" ] ) )
+
+		self.assertTrue( m3.isCompact() )
+		self.assertEqual( m3, m1 )
+
+		m2.compact()
+		self.assertTrue( m2.isCompact() )
+		self.assertEqual( set( m2.paths() ), set( paths + [ "/a/b/c/e", "/e/i" ] ) - set( [ "/e/f", "/h" ] ) )
+
+	def testComputedSetsAreCompact( self ) :
+
+		s = GafferScene.Sphere()
+		s["sets"].setValue( "a" )
+
+		self.assertTrue( s["out"].set( "a" ).value.isCompact() )
+
+		setNode = GafferScene.Set()
+		setNode["in"].setInput( s["out"] )
+		setNode["name"].setValue( "a" )
+		setNode["mode"].setValue( setNode.Mode.Add )
+		setNode["paths"].setValue( IECore.StringVectorData( [ "/b" ] ) )
+
+		self.assertTrue( setNode["out"].set( "a" ).value.isCompact() )
+		self.assertEqual( setNode["out"].set( "a" ).value, GafferScene.PathMatcher( [ "/sphere", "/b" ] ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -35,11 +35,13 @@
 #
 ##########################################################################
 
+import os
 import unittest
 
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferScene
 import GafferSceneTest
 
@@ -137,6 +139,106 @@ class ScenePlugTest( GafferSceneTest.SceneTestCase ) :
 			} )
 		)
 
+	def testFullTransformPlug( self ) :
+
+		plane = GafferScene.Plane()
+		plane["transform"]["translate"].setValue( IECore.V3f( 1, 2, 3 ) )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( plane["out"] )
+		group["transform"]["translate"].setValue( IECore.V3f( 10, 0, 0 ) )
+
+		outerGroup = GafferScene.Group()
+		outerGroup["in"][0].setInput( group["out"] )
+		outerGroup["transform"]["rotate"].setValue( IECore.V3f( 0, 90, 0 ) )
+
+		out = outerGroup["out"]
+		expected = {
+			"/" : IECore.M44f(),
+			"/group" : out.transform( "/group" ),
+			"/group/group" : out.transform( "/group/group" ) * out.transform( "/group" ),
+			"/group/group/plane" : out.transform( "/group/group/plane" ) * out.transform( "/group/group" ) * out.transform( "/group" ),
+		}
+
+		for path, transform in expected.items() :
+
+			self.assertEqual( out.fullTransform( path ), transform )
+
+			with Gaffer.Context() as c :
+				c["scene:path"] = GafferScene.ScenePlug.stringToPath( path )
+				self.assertEqual( out["fullTransform"].getValue(), transform )
+				self.assertEqual( out["fullTransform"].hash(), out.fullTransformHash( path ) )
+
+		# Changing an ancestor transform must dirty the full transform,
+		# and change the result for all descendants.
+
+		h = out.fullTransformHash( "/group/group/plane" )
+
+		cs = GafferTest.CapturingSlot( outerGroup.plugDirtiedSignal() )
+		group["transform"]["translate"].setValue( IECore.V3f( 20, 0, 0 ) )
+		self.assertTrue( out["fullTransform"] in [ x[0] for x in cs ] )
+
+		self.assertNotEqual( out.fullTransformHash( "/group/group/plane" ), h )
+		self.assertEqual(
+			out.fullTransform( "/group/group/plane" ),
+			out.transform( "/group/group/plane" ) * out.transform( "/group/group" ) * out.transform( "/group" )
+		)
+
+	def testFullAttributesPlug( self ) :
+
+		plane = GafferScene.Plane()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		planeAttributes = GafferScene.CustomAttributes()
+		planeAttributes["in"].setInput( plane["out"] )
+		planeAttributes["filter"].setInput( planeFilter["out"] )
+		planeAttributes["attributes"].addMember( "a", IECore.IntData( 1 ) )
+		planeAttributes["attributes"].addMember( "b", IECore.IntData( 2 ) )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( planeAttributes["out"] )
+
+		groupFilter = GafferScene.PathFilter()
+		groupFilter["paths"].setValue( IECore.StringVectorData( [ "/group" ] ) )
+
+		groupAttributes = GafferScene.CustomAttributes()
+		groupAttributes["in"].setInput( group["out"] )
+		groupAttributes["filter"].setInput( groupFilter["out"] )
+		groupAttributes["attributes"].addMember( "b", IECore.IntData( 3 ) )
+		c = groupAttributes["attributes"].addMember( "c", IECore.IntData( 4 ) )
+
+		out = groupAttributes["out"]
+		expected = {
+			"/" : IECore.CompoundObject(),
+			"/group" : IECore.CompoundObject( { "b" : IECore.IntData( 3 ), "c" : IECore.IntData( 4 ) } ),
+			"/group/plane" : IECore.CompoundObject( { "a" : IECore.IntData( 1 ), "b" : IECore.IntData( 2 ), "c" : IECore.IntData( 4 ) } ),
+		}
+
+		for path, attributes in expected.items() :
+
+			self.assertEqual( out.fullAttributes( path ), attributes )
+
+			with Gaffer.Context() as context :
+				context["scene:path"] = GafferScene.ScenePlug.stringToPath( path )
+				self.assertEqual( out["fullAttributes"].getValue(), attributes )
+				self.assertEqual( out["fullAttributes"].hash(), out.fullAttributesHash( path ) )
+
+		# The result of fullAttributes() may be modified without
+		# affecting the cached value.
+
+		a = out.fullAttributes( "/group/plane" )
+		a["d"] = IECore.IntData( 5 )
+		self.assertFalse( "d" in out.fullAttributes( "/group/plane" ) )
+
+		# Changing an ancestor's attributes must update the descendants.
+
+		h = out.fullAttributesHash( "/group/plane" )
+		c["value"].setValue( 10 )
+		self.assertNotEqual( out.fullAttributesHash( "/group/plane" ), h )
+		self.assertEqual( out.fullAttributes( "/group/plane" )["c"], IECore.IntData( 10 ) )
+
 	def testCreateCounterpart( self ) :
 
 		s1 = GafferScene.ScenePlug( "a", Gaffer.Plug.Direction.Out )
@@ -208,6 +310,53 @@ class ScenePlugTest( GafferSceneTest.SceneTestCase ) :
 
 		GafferSceneTest.testManyStringToPathCalls()
 
+	def testLocationQueries( self ) :
+
+		sphere = GafferScene.Sphere()
+		plane = GafferScene.Plane()
+		plane["transform"]["translate"].setValue( IECore.V3f( 1, 2, 3 ) )
+
+		sphereFilter = GafferScene.PathFilter()
+		sphereFilter["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+
+		attributes = GafferScene.CustomAttributes()
+		attributes["in"].setInput( sphere["out"] )
+		attributes["filter"].setInput( sphereFilter["out"] )
+		attributes["attributes"].addMember( "a", IECore.IntData( 1 ) )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( attributes["out"] )
+		group["in"][1].setInput( plane["out"] )
+
+		GafferSceneTest.testLocationQueries( group["out"] )
+
+	def testSetDiskCacheRoundTrip( self ) :
+
+		s = GafferScene.Set()
+		s["name"].setValue( "a" )
+		s["paths"].setValue( IECore.StringVectorData( [ "/path%d" % i for i in range( 0, 1000 ) ] ) )
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setDiskCacheDirectory( os.path.join( self.temporaryDirectory(), "diskCache" ) )
+		try :
+
+			set1 = s["out"].set( "a" )
+
+			# Flush the memory cache, so the set must either be
+			# recomputed or loaded from the disk cache.
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
+			set2 = s["out"].set( "a" )
+
+		finally :
+
+			Gaffer.ValuePlug.setDiskCacheDirectory( "" )
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
+		self.assertEqual( set2, set1 )
+		self.assertEqual( len( set2.value.paths() ), 1000 )
+
 	def testSetPlugs( self ) :
 
 		p = GafferScene.ScenePlug()
@@ -97,6 +97,41 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( t.readTransformAsMatrix( 1.5 / 24.0 ), IECore.M44d.createTranslated( IECore.V3d( 1.5, 0, 3 ) ) )
 		self.assertEqual( t.readTransformAsMatrix( 2 / 24.0 ), IECore.M44d.createTranslated( IECore.V3d( 2, 0, 4 ) ) )
 
+	def testWriteAnimatedHierarchy( self ) :
+
+		# Locations are computed in parallel, and the next frame is
+		# started before the previous one has been written, so we check
+		# that everything still ends up in the right place.
+
+		script = Gaffer.ScriptNode()
+		script["group"] = GafferScene.Group()
+		for i in range( 0, 20 ) :
+			script["sphere%d" % i] = GafferScene.Sphere()
+			script["sphere%d" % i]["name"].setValue( "sphere%d" % i )
+			script["sphere%d" % i]["transform"]["translate"]["y"].setValue( i )
+			script["group"]["in"][i].setInput( script["sphere%d" % i]["out"] )
+
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["group"]["transform"]["translate"]["x"] = context.getFrame()' )
+
+		script["writer"] = GafferScene.SceneWriter()
+		script["writer"]["in"].setInput( script["group"]["out"] )
+		script["writer"]["fileName"].setValue( self.temporaryDirectory() + "/test.scc" )
+
+		with Gaffer.Context() :
+			script["writer"].executeSequence( [ 1, 2, 3, 4 ] )
+
+		sc = IECore.SceneCache( self.temporaryDirectory() + "/test.scc", IECore.IndexedIO.OpenMode.Read )
+		g = sc.child( "group" )
+		self.assertEqual( len( g.childNames() ), 20 )
+
+		for frame in [ 1, 2, 3, 4 ] :
+			self.assertEqual( g.readTransformAsMatrix( frame / 24.0 ), IECore.M44d.createTranslated( IECore.V3d( frame, 0, 0 ) ) )
+			for i in range( 0, 20 ) :
+				s = g.child( "sphere%d" % i )
+				self.assertEqual( s.readTransformAsMatrix( frame / 24.0 ), IECore.M44d.createTranslated( IECore.V3d( 0, i, 0 ) ) )
+				self.assertTrue( isinstance( s.readObject( frame / 24.0 ), IECore.SpherePrimitive ) )
+
 	def testSceneCacheRoundtrip( self ) :
 
 		scene = IECore.SceneCache( self.temporaryDirectory() + "/fromPython.scc", IECore.IndexedIO.OpenMode.Write )
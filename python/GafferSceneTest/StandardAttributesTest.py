@@ -117,5 +117,31 @@ class StandardAttributesTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( a["out"].setHash( "flatThings" ), p["out"].setHash( "flatThings" ) )
 		self.assertTrue( a["out"].set( "flatThings", _copy=False ).isSame( p["out"].set( "flatThings", _copy=False ) ) )
 
+	def testFilterMatchingNothingWithoutCache( self ) :
+
+		# At locations the filter doesn't match, the node passes through the
+		# hash of its input, so computing its output requests an input value
+		# with an identical hash. With the cache disabled this must not
+		# deadlock waiting for itself.
+
+		s = GafferScene.Sphere()
+
+		f = GafferScene.PathFilter()
+		f["paths"].setValue( IECore.StringVectorData( [ "/doesNotExist" ] ) )
+
+		a = GafferScene.StandardAttributes()
+		a["in"].setInput( s["out"] )
+		a["filter"].setInput( f["out"] )
+		a["attributes"]["visibility"]["enabled"].setValue( True )
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		try :
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			self.assertEqual( a["out"].attributes( "/sphere" ), s["out"].attributes( "/sphere" ) )
+			self.assertEqual( a["out"].object( "/sphere" ), s["out"].object( "/sphere" ) )
+			self.assertSceneValid( a["out"] )
+		finally :
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -627,5 +627,30 @@ class ContextTest( GafferTest.TestCase ) :
 		self.assertEqual( c.getFramesPerSecond(), 48.0 )
 		self.assertAlmostEqual( c.getTime(), 12.0 / 48.0 )
 
+	def testEditableScope( self ) :
+
+		GafferTest.testEditableScope()
+
+	def testHashOfEditedCopies( self ) :
+
+		c = Gaffer.Context()
+		c["a"] = 1
+		c["b"] = IECore.StringVectorData( [ "b" ] )
+		c.hash()
+
+		for ownership in ( Gaffer.Context.Ownership.Copied, Gaffer.Context.Ownership.Shared, Gaffer.Context.Ownership.Borrowed ) :
+
+			cc = Gaffer.Context( c, ownership )
+			self.assertEqual( cc.hash(), c.hash() )
+
+			cc["a"] = 2
+			cc["c"] = "c"
+
+			d = Gaffer.Context()
+			d["a"] = 2
+			d["b"] = IECore.StringVectorData( [ "b" ] )
+			d["c"] = "c"
+			self.assertEqual( cc.hash(), d.hash() )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -1235,6 +1235,96 @@ class ExpressionTest( GafferTest.TestCase ) :
 			"parent['n']['user']['p'] = parent['n']['user']['p'] * 2"
 		)
 
+	def testContextOnlyExpressionResults( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["f"] = Gaffer.FloatPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		s["n"]["user"]["s"] = Gaffer.StringPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression(
+			"parent['n']['user']['f'] = context.getFrame() * 2\n"
+			"parent['n']['user']['s'] = context.get( 'x', 'default' )"
+		)
+
+		# Results for context-only expressions are memoised by the
+		# engine, so we evaluate twice, clearing the compute cache in
+		# between, to check that the memoised results are correct.
+
+		originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		try :
+			for i in range( 0, 2 ) :
+				Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+				Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
+				with Gaffer.Context() as c :
+					for frame in range( 0, 5 ) :
+						c.setFrame( frame )
+						self.assertEqual( s["n"]["user"]["f"].getValue(), frame * 2 )
+						self.assertEqual( s["n"]["user"]["s"].getValue(), "default" )
+						c["x"] = "x%d" % frame
+						self.assertEqual( s["n"]["user"]["s"].getValue(), "x%d" % frame )
+						del c["x"]
+		finally :
+			Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
+
+		# Changing the expression must not reuse previous results.
+
+		s["e"].setExpression( "parent['n']['user']['f'] = context.getFrame() * 3" )
+		with Gaffer.Context() as c :
+			c.setFrame( 2 )
+			self.assertEqual( s["n"]["user"]["f"].getValue(), 6 )
+
+	def testContextOnlyExpressionResultsDependOnTypes( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["s"] = Gaffer.StringPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression( "parent['n']['user']['s'] = str( context['v'] )" )
+
+		# 1, 1.0 and True compare equal in Python, but
+		# must not share memoised results.
+
+		with Gaffer.Context() as c :
+			for v in ( 1, 1.0, True ) :
+				c["v"] = v
+				self.assertEqual( s["n"]["user"]["s"].getValue(), str( v ) )
+
+	def testContextOnlyExpressionResultsAreClearedWithCache( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["f"] = Gaffer.FloatPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression(
+			"import random\n"
+			"parent['n']['user']['f'] = random.random() + context.getFrame() * 0"
+		)
+
+		with Gaffer.Context() as c :
+
+			f = s["n"]["user"]["f"].getValue()
+			self.assertEqual( s["n"]["user"]["f"].getValue(), f )
+
+			# Clearing the compute cache must clear the memoised
+			# results too, so that the expression is executed again.
+
+			Gaffer.ValuePlug.clearCache()
+			f2 = s["n"]["user"]["f"].getValue()
+			self.assertNotEqual( f2, f )
+
+			originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+			try :
+				Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+				Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
+			finally :
+				Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
+
+			self.assertNotEqual( s["n"]["user"]["f"].getValue(), f2 )
+
 	def testInvalidLanguage( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -36,6 +36,7 @@
 
 import time
 import unittest
+import threading
 
 import IECore
 
@@ -113,23 +114,31 @@ class PerformanceMonitorTest( GafferTest.TestCase ) :
 			hashCount = 10,
 			computeCount = 20,
 			hashDuration = 100,
-			computeDuration = 200
+			computeDuration = 200,
+			computeWaitCount = 5,
+			computeWaitDuration = 50,
 		)
 
 		self.assertEqual( s.hashCount, 10 )
 		self.assertEqual( s.computeCount, 20 )
 		self.assertEqual( s.hashDuration, 100 )
 		self.assertEqual( s.computeDuration, 200 )
+		self.assertEqual( s.computeWaitCount, 5 )
+		self.assertEqual( s.computeWaitDuration, 50 )
 
 		s.hashCount = 20
 		s.computeCount = 30
 		s.hashDuration = 200
 		s.computeDuration = 300
+		s.computeWaitCount = 6
+		s.computeWaitDuration = 60
 
 		self.assertEqual( s.hashCount, 20 )
 		self.assertEqual( s.computeCount, 30 )
 		self.assertEqual( s.hashDuration, 200 )
 		self.assertEqual( s.computeDuration, 300 )
+		self.assertEqual( s.computeWaitCount, 6 )
+		self.assertEqual( s.computeWaitDuration, 60 )
 
 	def testEnterReturnValue( self ) :
 
@@ -229,5 +238,75 @@ class PerformanceMonitorTest( GafferTest.TestCase ) :
 		self.assertAlmostEqual( seconds( m.plugStatistics( n2["out"] ).hashDuration ), 0.2, delta = 0.01 )
 		self.assertAlmostEqual( seconds( m.plugStatistics( n2["out"] ).computeDuration ), 0.2, delta = 0.01 )
 
+	def testConcurrentComputesAreShared( self ) :
+
+		class SlowNode( Gaffer.ComputeNode ) :
+
+			def __init__( self, name = "SlowNode" ) :
+
+				Gaffer.ComputeNode.__init__( self, name )
+
+				self["in"] = Gaffer.IntPlug()
+				self["out"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+
+				self.numComputeCalls = 0
+
+			def affects( self, input ) :
+
+				result = Gaffer.ComputeNode.affects( self, input )
+				if input.isSame( self["in"] ) :
+					result.append( self["out"] )
+
+				return result
+
+			def hash( self, output, context, h ) :
+
+				if output.isSame( self["out"] ) :
+					self["in"].hash( h )
+
+			def compute( self, plug, context ) :
+
+				if plug.isSame( self["out"] ) :
+
+					# Long enough to catch any waiter that
+					# gives up and computes the value itself.
+					time.sleep( 2.5 )
+					self.numComputeCalls += 1
+					self["out"].setValue( self["in"].getValue() * 2 )
+
+				else :
+
+					Gaffer.ComputeNode.compute( self, plug, context )
+
+		IECore.registerRunTimeTyped( SlowNode )
+
+		n = SlowNode()
+		n["in"].setValue( 10 )
+
+		results = []
+		def f() :
+			results.append( n["out"].getValue() )
+
+		with Gaffer.PerformanceMonitor() as m :
+
+			threads = []
+			for i in range( 0, 10 ) :
+				t = threading.Thread( target = f )
+				t.start()
+				threads.append( t )
+
+			for t in threads :
+				t.join()
+
+		self.assertEqual( results, [ 20 ] * 10 )
+
+		# Only one thread should have done the work, with the
+		# others either waiting for it or finding the result in
+		# the cache.
+		self.assertEqual( n.numComputeCalls, 1 )
+		self.assertEqual( m.plugStatistics( n["out"] ).computeCount, 1 )
+		self.assertGreater( m.plugStatistics( n["out"] ).computeWaitCount, 0 )
+		self.assertLessEqual( m.plugStatistics( n["out"] ).computeWaitCount, 9 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -1170,6 +1170,53 @@ a = A()"""
 		self.assertTrue( "Line 2" in c.messages[0].context )
 		self.assertTrue( "name 'iWillFail' is not defined" in c.messages[0].message )
 
+	def testErrorTolerantExecutionWithMultipleErrors( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferTest.AddNode()
+
+		increment = 'parent["n"]["op1"].setValue( parent["n"]["op1"].getValue() + 1 )'
+		script = "\n".join( [
+			increment,
+			increment,
+			"iWillFail()",
+			increment,
+			"for i in range( 0, 2 ) :",
+			"	" + increment,
+			"iWillFailToo()",
+			"iWillFailAsWell()",
+			increment,
+		] )
+
+		with IECore.CapturingMessageHandler() as c :
+			self.assertEqual( s.execute( script, continueOnError = True ), True )
+
+		# Each successful statement must have been executed exactly once.
+		self.assertEqual( s["n"]["op1"].getValue(), 6 )
+
+		self.assertEqual( len( c.messages ), 3 )
+		for message, line, name in zip( c.messages, ( 3, 7, 8 ), ( "iWillFail", "iWillFailToo", "iWillFailAsWell" ) ) :
+			self.assertEqual( message.level, IECore.Msg.Level.Error )
+			self.assertTrue( "Line %d" % line in message.context )
+			self.assertTrue( "name '%s' is not defined" % name in message.message )
+
+	def testErrorTolerantExecutionWithStatementsSharingLines( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferTest.AddNode()
+
+		increment = 'parent["n"]["op1"].setValue( parent["n"]["op1"].getValue() + 1 )'
+		script = "\n".join( [
+			"; ".join( [ increment, "iWillFail()", increment ] ),
+			"; ".join( [ "iWillFailToo()", increment, increment ] ),
+		] )
+
+		with IECore.CapturingMessageHandler() as c :
+			self.assertEqual( s.execute( script, continueOnError = True ), True )
+
+		self.assertEqual( s["n"]["op1"].getValue(), 4 )
+		self.assertEqual( len( c.messages ), 2 )
+
 	def testExecuteReturnValue( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -35,7 +35,9 @@
 #
 ##########################################################################
 
+import os
 import gc
+import subprocess32 as subprocess
 
 import IECore
 
@@ -617,17 +619,157 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		self.failUnless( n["p"] is p )
 
+	def testHashCacheSizeLimit( self ) :
+
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 10 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 10 )
+
+		n = GafferTest.AddNode()
+		n["op1"].setValue( 1 )
+
+		c = Gaffer.Context()
+		for i in range( 0, 100 ) :
+			c.setFrame( i )
+			with c :
+				n["sum"].hash()
+
+		self.assertLessEqual( Gaffer.ValuePlug.hashCacheUsage(), 10 )
+
+	def testHashCacheHitsAndMisses( self ) :
+
+		n = GafferTest.AddNode()
+		n["op1"].setValue( 1 )
+
+		misses = Gaffer.ValuePlug.hashCacheMisses()
+		h = n["sum"].hash()
+		self.assertEqual( Gaffer.ValuePlug.hashCacheMisses(), misses + 1 )
+
+		hits = Gaffer.ValuePlug.hashCacheHits()
+		self.assertEqual( n["sum"].hash(), h )
+		self.assertEqual( Gaffer.ValuePlug.hashCacheHits(), hits + 1 )
+		self.assertEqual( Gaffer.ValuePlug.hashCacheMisses(), misses + 1 )
+
+		# Dirtying must invalidate the cache.
+		n["op2"].setValue( 2 )
+		self.assertNotEqual( n["sum"].hash(), h )
+		self.assertEqual( Gaffer.ValuePlug.hashCacheMisses(), misses + 2 )
+
+	def testDiskCache( self ) :
+
+		self.assertEqual( Gaffer.ValuePlug.getDiskCacheDirectory(), "" )
+
+		directory = os.path.join( self.temporaryDirectory(), "diskCache" )
+		Gaffer.ValuePlug.setDiskCacheDirectory( directory )
+		self.assertEqual( Gaffer.ValuePlug.getDiskCacheDirectory(), directory )
+		self.assertEqual( Gaffer.ValuePlug.diskCacheUsage(), 0 )
+
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "d" * 10000 )
+		v1 = n["out"].getValue()
+
+		self.assertGreater( Gaffer.ValuePlug.diskCacheUsage(), 0 )
+		self.assertEqual( len( os.listdir( directory ) ), 1 )
+
+		# Clear the memory cache, and reinitialise the disk cache
+		# as if in a new session. The value should now be loaded
+		# from disk rather than computed.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		Gaffer.ValuePlug.setDiskCacheDirectory( "" )
+		Gaffer.ValuePlug.setDiskCacheDirectory( directory )
+		self.assertGreater( Gaffer.ValuePlug.diskCacheUsage(), 0 )
+
+		n2 = GafferTest.CachingTestNode()
+		n2["in"].setValue( "d" * 10000 )
+
+		with Gaffer.PerformanceMonitor() as m :
+			v2 = n2["out"].getValue()
+
+		self.assertEqual( v2, v1 )
+		self.assertEqual( m.plugStatistics( n2["out"] ).computeCount, 0 )
+
+		# Reducing the size limit should evict files.
+
+		Gaffer.ValuePlug.setDiskCacheSizeLimit( 0 )
+		self.assertEqual( Gaffer.ValuePlug.diskCacheUsage(), 0 )
+		self.assertEqual( os.listdir( directory ), [] )
+
+	def testClearDiskCache( self ) :
+
+		directory = os.path.join( self.temporaryDirectory(), "diskCache" )
+		Gaffer.ValuePlug.setDiskCacheDirectory( directory )
+
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "d" * 10000 )
+		v1 = n["out"].getValue()
+		self.assertEqual( len( os.listdir( directory ) ), 1 )
+
+		Gaffer.ValuePlug.clearDiskCache()
+		self.assertEqual( Gaffer.ValuePlug.diskCacheUsage(), 0 )
+		self.assertEqual( os.listdir( directory ), [] )
+
+		# The value must now be computed again.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+
+		with Gaffer.PerformanceMonitor() as m :
+			self.assertEqual( n["out"].getValue(), v1 )
+
+		self.assertEqual( m.plugStatistics( n["out"] ).computeCount, 1 )
+
+	def testDiskCacheSharedBetweenProcesses( self ) :
+
+		directory = os.path.join( self.temporaryDirectory(), "diskCache" )
+
+		# Populate the cache from another process.
+
+		contextHash = subprocess.check_output( [
+			"gaffer", "python",
+			os.path.join( os.path.dirname( __file__ ), "pythonScripts", "diskCache.py" ),
+			"-arguments", directory
+		] )
+
+		script = Gaffer.ScriptNode()
+		script["n"] = GafferTest.CachingTestNode()
+		script["e"] = Gaffer.Expression()
+		script["e"].setExpression( 'parent["n"]["in"] = context["diskCacheTest:a"] * context["diskCacheTest:b"]' )
+
+		# Set the variables in the opposite order, so that their
+		# names are interned in a different order from the other
+		# process. Context hashes must not depend on that.
+
+		with Gaffer.Context( script.context() ) as context :
+			context["diskCacheTest:b"] = 10000
+			context["diskCacheTest:a"] = "d"
+			self.assertEqual( str( context.hash() ), contextHash )
+
+			# The value should be loaded from the cache
+			# rather than computed.
+
+			Gaffer.ValuePlug.setDiskCacheDirectory( directory )
+			with Gaffer.PerformanceMonitor() as m :
+				self.assertEqual( script["n"]["out"].getValue(), IECore.StringData( "d" * 10000 ) )
+
+		self.assertEqual( m.plugStatistics( script["n"]["out"] ).computeCount, 0 )
+
 	def setUp( self ) :
 
 		GafferTest.TestCase.setUp( self )
 
 		self.__originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__originalHashCacheSizeLimit = Gaffer.ValuePlug.getHashCacheSizeLimit()
+		self.__originalDiskCacheSizeLimit = Gaffer.ValuePlug.getDiskCacheSizeLimit()
 
 	def tearDown( self ) :
 
 		GafferTest.TestCase.tearDown( self )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( self.__originalHashCacheSizeLimit )
+		Gaffer.ValuePlug.setDiskCacheDirectory( "" )
+		Gaffer.ValuePlug.setDiskCacheSizeLimit( self.__originalDiskCacheSizeLimit )
 
 if __name__ == "__main__":
 	unittest.main()
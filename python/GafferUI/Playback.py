@@ -62,8 +62,11 @@ class Playback( object ) :
 		self.__playTimer = QtCore.QTimer()
 		self.__playTimer.timeout.connect( Gaffer.WeakMethod( self.__timerCallback ) )
 
+		self.__cachedFrames = []
+
 		self.__stateChangedSignal = Gaffer.Signal1()
 		self.__frameRangeChangedSignal = Gaffer.Signal1()
+		self.__cachedFramesChangedSignal = Gaffer.Signal1()
 
 	__instances = []
 	## Acquires the Playback instance for the specified
@@ -132,6 +135,27 @@ class Playback( object ) :
 
 		return self.__frameRangeChangedSignal
 
+	## May be called by anything which caches frames for
+	# fast playback, so that the cached frames can be
+	# shown to the user in the Timeline.
+	def setCachedFrames( self, frames ) :
+
+		frames = sorted( frames )
+		if frames == self.__cachedFrames :
+			return
+
+		self.__cachedFrames = frames
+
+		self.cachedFramesChangedSignal()( self )
+
+	def getCachedFrames( self ) :
+
+		return self.__cachedFrames
+
+	def cachedFramesChangedSignal( self ) :
+
+		return self.__cachedFramesChangedSignal
+
 	## Increments the current frame, wrapping around
 	# if the new frame would be outside the frame range.
 	# Also sets the current state to Stopped in the event
@@ -67,7 +67,7 @@ class Timeline( GafferUI.EditorWidget ) :
 			self.__sliderRangeStart.setToolTip( "Slider minimum" )
 			self.__sliderRangeStartChangedConnection = self.__sliderRangeStart.editingFinishedSignal().connect( Gaffer.WeakMethod( self.__sliderRangeChanged ) )
 
-			self.__slider = GafferUI.NumericSlider(
+			self.__slider = _TimelineSlider(
 				value = self.getContext().getFrame(),
 				min = float( scriptNode["frameRange"]["start"].getValue() ),
 				max = float( scriptNode["frameRange"]["end"].getValue() ),
@@ -117,6 +117,8 @@ class Timeline( GafferUI.EditorWidget ) :
 			self.__playback.setFrameRange( self.__sliderRangeStart.getValue(), self.__sliderRangeEnd.getValue() )
 			self.__playbackStateChangedConnection = self.__playback.stateChangedSignal().connect( Gaffer.WeakMethod( self.__playbackStateChanged ) )
 			self.__playbackFrameRangeChangedConnection = self.__playback.frameRangeChangedSignal().connect( Gaffer.WeakMethod( self.__playbackFrameRangeChanged ) )
+			self.__playbackCachedFramesChangedConnection = self.__playback.cachedFramesChangedSignal().connect( Gaffer.WeakMethod( self.__playbackCachedFramesChanged ) )
+			self.__slider.setCachedFrames( self.__playback.getCachedFrames() )
 
 		if "frame" not in modifiedItems :
 			return
@@ -239,6 +241,10 @@ class Timeline( GafferUI.EditorWidget ) :
 			self.__sliderRangeStart.setValue( minValue )
 			self.__sliderRangeEnd.setValue( maxValue )
 
+	def __playbackCachedFramesChanged( self, playback ) :
+
+		self.__slider.setCachedFrames( playback.getCachedFrames() )
+
 	def __incrementFrame( self, increment = 1 ) :
 
 		self.__playback.incrementFrame( increment )
@@ -248,3 +254,41 @@ class Timeline( GafferUI.EditorWidget ) :
 		return "GafferUI.Timeline( scriptNode )"
 
 GafferUI.EditorWidget.registerType( "Timeline", Timeline )
+
+# Slider which also shows the frames which have been cached
+# for fast playback.
+class _TimelineSlider( GafferUI.NumericSlider ) :
+
+	def __init__( self, **kw ) :
+
+		GafferUI.NumericSlider.__init__( self, **kw )
+
+		self.__cachedFrames = []
+
+	def setCachedFrames( self, frames ) :
+
+		if frames == self.__cachedFrames :
+			return
+
+		self.__cachedFrames = frames
+		self._qtWidget().update()
+
+	def _drawBackground( self, painter ) :
+
+		minValue, maxValue = self.getRange()[:2]
+		valueRange = maxValue - minValue
+		if self.__cachedFrames and valueRange > 0 :
+
+			## \todo The colour should come from the style.
+			size = self.size()
+			painter.setPen( QtCore.Qt.NoPen )
+			painter.setBrush( QtGui.QBrush( QtGui.QColor( 80, 160, 80 ) ) )
+
+			frameWidth = size.x / float( valueRange )
+			for frame in self.__cachedFrames :
+				if frame < minValue or frame > maxValue :
+					continue
+				x = size.x * ( frame - minValue ) / valueRange
+				painter.drawRect( QtCore.QRectF( x, size.y - 3, max( frameWidth, 1 ), 3 ) )
+
+		GafferUI.NumericSlider._drawBackground( self, painter )
@@ -35,6 +35,7 @@
 ##########################################################################
 
 import Gaffer
+import GafferTest
 import GafferUI
 import GafferUITest
 
@@ -62,5 +63,24 @@ class PlaybackTest( GafferUITest.TestCase ) :
 
 		self.assertTrue( p3a is p3b )
 
+	def testCachedFrames( self ) :
+
+		p = GafferUI.Playback.acquire( Gaffer.Context() )
+		self.assertEqual( p.getCachedFrames(), [] )
+
+		cs = GafferTest.CapturingSlot( p.cachedFramesChangedSignal() )
+
+		p.setCachedFrames( [ 3, 1, 2 ] )
+		self.assertEqual( p.getCachedFrames(), [ 1, 2, 3 ] )
+		self.assertEqual( len( cs ), 1 )
+		self.assertTrue( cs[0][0] is p )
+
+		p.setCachedFrames( [ 1, 2, 3 ] )
+		self.assertEqual( len( cs ), 1 )
+
+		p.setCachedFrames( [] )
+		self.assertEqual( p.getCachedFrames(), [] )
+		self.assertEqual( len( cs ), 2 )
+
 if __name__ == "__main__":
 	unittest.main()
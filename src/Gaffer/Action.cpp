@@ -60,6 +60,8 @@ Action::~Action()
 
 void Action::enact( ActionPtr action )
 {
+	EditScope editScope( action->subject(), Do );
+
 	ScriptNode *s = IECore::runTimeCast<ScriptNode>( action->subject() );
 	if( !s )
 	{
@@ -77,6 +79,18 @@ void Action::enact( ActionPtr action )
 
 }
 
+Action::EditSignal &Action::preActionSignal()
+{
+	static EditSignal g_preActionSignal;
+	return g_preActionSignal;
+}
+
+Action::EditSignal &Action::postActionSignal()
+{
+	static EditSignal g_postActionSignal;
+	return g_postActionSignal;
+}
+
 void Action::doAction()
 {
 	if( m_done )
@@ -104,6 +118,21 @@ void Action::merge( const Action *other )
 {
 }
 
+//////////////////////////////////////////////////////////////////////////
+// EditScope implementation
+//////////////////////////////////////////////////////////////////////////
+
+Action::EditScope::EditScope( GraphComponent *subject, Stage stage )
+	:	m_subject( subject ), m_stage( stage )
+{
+	preActionSignal()( m_subject, m_stage );
+}
+
+Action::EditScope::~EditScope()
+{
+	postActionSignal()( m_subject, m_stage );
+}
+
 //////////////////////////////////////////////////////////////////////////
 // SimpleAction implementation and Action::enact() convenience overload.
 //////////////////////////////////////////////////////////////////////////
@@ -45,6 +45,7 @@ static char **environ = *_NSGetEnviron();
 #endif
 
 #include <stack>
+#include <algorithm>
 
 #include "tbb/enumerable_thread_specific.h"
 
@@ -119,14 +120,14 @@ static InternedString g_frame( "frame" );
 static InternedString g_framesPerSecond( "framesPerSecond" );
 
 Context::Context()
-	:	m_changedSignal( NULL ), m_hashValid( false )
+	:	m_changedSignal( NULL )
 {
 	set( g_frame, 1.0f );
 	set( g_framesPerSecond, 24.0f );
 }
 
 Context::Context( const Context &other, Ownership ownership )
-	:	m_map( other.m_map ), m_changedSignal( NULL ), m_hash( other.m_hash ), m_hashValid( other.m_hashValid )
+	:	m_map( other.m_map ), m_changedSignal( NULL ), m_hash( other.m_hash )
 {
 	// We used the (shallow) Map copy constructor in our initialiser above
 	// because it offers a big performance win over iterating and inserting copies
@@ -173,7 +174,7 @@ void Context::remove( const IECore::InternedString &name )
 	if( it != m_map.end() )
 	{
 		m_map.erase( it );
-		m_hashValid = false;
+		updateHash();
 		if( m_changedSignal )
 		{
 			(*m_changedSignal)( this, name );
@@ -183,8 +184,12 @@ void Context::remove( const IECore::InternedString &name )
 
 void Context::changed( const IECore::InternedString &name )
 {
-	m_hashValid = false;
-	if( m_changedSignal )
+	Map::iterator it = m_map.find( name );
+	if( it != m_map.end() )
+	{
+		valueChanged( name, it->second );
+	}
+	else if( m_changedSignal )
 	{
 		(*m_changedSignal)( this, name );
 	}
@@ -245,12 +250,42 @@ Context::ChangedSignal &Context::changedSignal()
 
 IECore::MurmurHash Context::hash() const
 {
-	if( m_hashValid )
+	return m_hash;
+}
+
+void Context::valueChanged( const IECore::InternedString &name, Storage &storage )
+{
+	// We hash the name as a string rather than by address, so that
+	// the hash is the same in every process, and computed values
+	// may be shared via the ValuePlug disk cache. We do it here
+	// rather than in updateHash(), so that it is done only once
+	// per value rather than once per update.
+	storage.hash = IECore::MurmurHash();
+	storage.hash.append( name.string() );
+	storage.data->hash( storage.hash );
+	updateHash();
+	if( m_changedSignal )
+	{
+		(*m_changedSignal)( this, name );
+	}
+}
+
+void Context::updateHash()
+{
+	// The map is ordered by the addresses of the names, which differ
+	// between processes, so we sort the hashes of the individual
+	// values before combining them. We avoid allocation for all but
+	// the largest contexts.
+	IECore::MurmurHash stackHashes[16];
+	std::vector<IECore::MurmurHash> heapHashes;
+	IECore::MurmurHash *hashes = stackHashes;
+	if( m_map.size() > 16 )
 	{
-		return m_hash;
+		heapHashes.resize( m_map.size() );
+		hashes = &heapHashes[0];
 	}
 
-	m_hash = IECore::MurmurHash();
+	size_t numHashes = 0;
 	for( Map::const_iterator it = m_map.begin(), eIt = m_map.end(); it != eIt; ++it )
 	{
 		/// \todo Perhaps at some point the UI should use a different container for
@@ -263,11 +298,46 @@ IECore::MurmurHash Context::hash() const
 		{
 			continue;
 		}
-		m_hash.append( (uint64_t)&name );
-		it->second.data->hash( m_hash );
+		hashes[numHashes++] = it->second.hash;
 	}
-	m_hashValid = true;
-	return m_hash;
+
+	std::sort( hashes, hashes + numHashes );
+
+	m_hash = IECore::MurmurHash();
+	for( size_t i = 0; i < numHashes; ++i )
+	{
+		m_hash.append( hashes[i] );
+	}
+}
+
+void Context::borrowFrom( const Context &other )
+{
+	for( Map::const_iterator it = m_map.begin(), eIt = m_map.end(); it != eIt; ++it )
+	{
+		if( it->second.ownership == Borrowed )
+		{
+			continue;
+		}
+		// Keep values which only we reference, so that EditableScope::set()
+		// can reuse them rather than allocate new ones. We only need a few,
+		// since scopes typically set the same few variables each time.
+		if( it->second.ownership == Copied && it->second.data->refCount() == 1 && m_spareData.size() < 4 )
+		{
+			m_spareData.push_back( const_cast<Data *>( it->second.data ) );
+		}
+		it->second.data->removeRef();
+	}
+
+	// Assignment reuses our existing storage where possible.
+	m_map = other.m_map;
+	for( Map::iterator it = m_map.begin(), eIt = m_map.end(); it != eIt; ++it )
+	{
+		it->second.ownership = Borrowed;
+	}
+	m_hash = other.m_hash;
+
+	delete m_changedSignal;
+	m_changedSignal = NULL;
 }
 
 bool Context::operator == ( const Context &other ) const
@@ -537,3 +607,76 @@ const Context *Context::current()
 	}
 	return stack.top();
 }
+
+//////////////////////////////////////////////////////////////////////////
+// EditableScope implementation
+//////////////////////////////////////////////////////////////////////////
+
+typedef std::vector<ContextPtr> ContextPool;
+typedef tbb::enumerable_thread_specific<ContextPool, tbb::cache_aligned_allocator<ContextPool>, tbb::ets_key_per_instance> ThreadSpecificContextPool;
+
+static ThreadSpecificContextPool g_editableScopeContexts;
+
+Context::EditableScope::EditableScope( const Context *context )
+	:	m_context( acquireContext( context ) ), m_scope( m_context.get() )
+{
+}
+
+Context::EditableScope::~EditableScope()
+{
+	// If nothing else has taken a reference to our context, return
+	// it to the pool for reuse by the next scope on this thread. The
+	// pool only ever holds as many contexts as the deepest nesting of
+	// scopes.
+	if( m_context->refCount() == 1 )
+	{
+		g_editableScopeContexts.local().push_back( m_context );
+	}
+}
+
+Context::Ptr Context::EditableScope::acquireContext( const Context *context )
+{
+	ContextPool &pool = g_editableScopeContexts.local();
+	if( pool.empty() )
+	{
+		return new Context( *context, Borrowed );
+	}
+
+	ContextPtr result = pool.back();
+	pool.pop_back();
+	result->borrowFrom( *context );
+	return result;
+}
+
+void Context::EditableScope::setBorrowed( const IECore::InternedString &name, const IECore::Data *value )
+{
+	Storage &s = m_context->m_map[name];
+	if( s.data == value )
+	{
+		return;
+	}
+
+	if( s.data && s.ownership != Borrowed )
+	{
+		s.data->removeRef();
+	}
+
+	s.data = value;
+	s.ownership = Borrowed;
+	m_context->valueChanged( name, s );
+}
+
+void Context::EditableScope::setFrame( float frame )
+{
+	m_context->setFrame( frame );
+}
+
+void Context::EditableScope::remove( const IECore::InternedString &name )
+{
+	m_context->remove( name );
+}
+
+const Context *Context::EditableScope::context() const
+{
+	return m_context.get();
+}
@@ -44,14 +44,16 @@ using namespace Gaffer;
 /// then we can use the types defined there directly.
 static IECore::InternedString g_hashType( "computeNode:hash" );
 static IECore::InternedString g_computeType( "computeNode:compute" );
+static IECore::InternedString g_computeWaitType( "computeNode:computeWait" );
 static PerformanceMonitor::Statistics g_emptyStatistics;
 
 //////////////////////////////////////////////////////////////////////////
 // PerformanceMonitor::Statistics
 //////////////////////////////////////////////////////////////////////////
 
-PerformanceMonitor::Statistics::Statistics( size_t hashCount, size_t computeCount, boost::chrono::nanoseconds hashDuration, boost::chrono::nanoseconds computeDuration )
-	:	hashCount( hashCount ), computeCount( computeCount ), hashDuration( hashDuration ), computeDuration( computeDuration )
+PerformanceMonitor::Statistics::Statistics( size_t hashCount, size_t computeCount, boost::chrono::nanoseconds hashDuration, boost::chrono::nanoseconds computeDuration, size_t computeWaitCount, boost::chrono::nanoseconds computeWaitDuration )
+	:	hashCount( hashCount ), computeCount( computeCount ), hashDuration( hashDuration ), computeDuration( computeDuration ),
+		computeWaitCount( computeWaitCount ), computeWaitDuration( computeWaitDuration )
 {
 }
 
@@ -61,6 +63,8 @@ PerformanceMonitor::Statistics & PerformanceMonitor::Statistics::operator += ( c
 	computeCount += rhs.computeCount;
 	hashDuration += rhs.hashDuration;
 	computeDuration += rhs.computeDuration;
+	computeWaitCount += rhs.computeWaitCount;
+	computeWaitDuration += rhs.computeWaitDuration;
 	return *this;
 }
 
@@ -70,7 +74,9 @@ bool PerformanceMonitor::Statistics::operator == ( const Statistics &rhs )
 		hashCount == rhs.hashCount &&
 		computeCount == rhs.computeCount &&
 		hashDuration == rhs.hashDuration &&
-		computeDuration == rhs.computeDuration
+		computeDuration == rhs.computeDuration &&
+		computeWaitCount == rhs.computeWaitCount &&
+		computeWaitDuration == rhs.computeWaitDuration
 	;
 }
 
@@ -111,7 +117,7 @@ const PerformanceMonitor::Statistics &PerformanceMonitor::plugStatistics( const
 void PerformanceMonitor::processStarted( const Process *process )
 {
 	const IECore::InternedString type = process->type();
-	if( type != g_hashType && type != g_computeType )
+	if( type != g_hashType && type != g_computeType && type != g_computeWaitType )
 	{
 		return;
 	}
@@ -131,17 +137,22 @@ void PerformanceMonitor::processStarted( const Process *process )
 		s.hashCount++;
 		threadData.durationStack.push( &s.hashDuration );
 	}
-	else
+	else if( type == g_computeType )
 	{
 		s.computeCount++;
 		threadData.durationStack.push( &s.computeDuration );
 	}
+	else
+	{
+		s.computeWaitCount++;
+		threadData.durationStack.push( &s.computeWaitDuration );
+	}
 }
 
 void PerformanceMonitor::processFinished( const Process *process )
 {
 	const IECore::InternedString type = process->type();
-	if( type != g_hashType && type != g_computeType )
+	if( type != g_hashType && type != g_computeType && type != g_computeWaitType )
 	{
 		return;
 	}
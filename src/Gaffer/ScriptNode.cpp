@@ -415,6 +415,8 @@ void ScriptNode::undo()
 		throw IECore::Exception( "Undo not available" );
 	}
 
+	Action::EditScope editScope( this, Action::Undo );
+
 	DirtyPropagationScope dirtyPropagationScope;
 
 	m_currentActionStage = Action::Undo;
@@ -455,6 +457,8 @@ void ScriptNode::redo()
 		throw IECore::Exception( "Redo not available" );
 	}
 
+	Action::EditScope editScope( this, Action::Redo );
+
 	DirtyPropagationScope dirtyPropagationScope;
 
 	m_currentActionStage = Action::Redo;
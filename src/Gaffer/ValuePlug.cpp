@@ -36,10 +36,21 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "tbb/enumerable_thread_specific.h"
+#include "tbb/spin_mutex.h"
+#include "tbb/task_arena.h"
+#include "tbb/tbb_thread.h"
 
 #include "boost/bind.hpp"
 #include "boost/format.hpp"
 #include "boost/unordered_map.hpp"
+#include "boost/unordered_set.hpp"
+#include "boost/shared_ptr.hpp"
+#include "boost/thread/mutex.hpp"
+#include "boost/thread/condition_variable.hpp"
+#include "boost/filesystem.hpp"
+
+#include "IECore/FileIndexedIO.h"
+#include "IECore/MessageHandler.h"
 
 #include "Gaffer/Private/IECorePreview/LRUCache.h"
 
@@ -48,6 +59,7 @@
 #include "Gaffer/Context.h"
 #include "Gaffer/Action.h"
 #include "Gaffer/Process.h"
+#include "Gaffer/Version.h"
 
 using namespace Gaffer;
 
@@ -118,61 +130,67 @@ class ValuePlug::HashProcess : public Process
 			// one per context, computed by ComputeNode::hash(). First we see if we can retrieve the hash
 			// from our cache, and if we can't we'll compute it using a HashProcess instance.
 
-			ThreadData &threadData = g_threadData.local();
-			if( !Process::current() )
-			{
-				// Starting a new root computation.
-				if( ++(threadData.cacheClearCount) == 3200 )
-				{
-					// Prevent unbounded growth in the hash cache
-					// if many computations are being performed
-					// without any plugs being dirtied in between,
-					// by clearing it after every Nth computation.
-					// N == 3200 was observed to be 6x faster than
-					// N == 100 for a procedural instancing scene at
-					// a memory cost of about 100 mb.
-					threadData.clearCache = 1;
-				}
-			}
-
-			if( threadData.clearCache )
-			{
-				threadData.cache.clear();
-				threadData.cacheClearCount = 0;
-				threadData.clearCache = 0;
-			}
+			clearCacheIfRequested();
 
 			const CacheKey key( p, Context::current()->hash() );
-			Cache::iterator it = threadData.cache.find( key );
-			if( it != threadData.cache.end() )
+			ThreadData &threadData = g_threadData.local();
+			IECore::MurmurHash result = g_cache.get( key );
+			if( result != IECore::MurmurHash() )
 			{
-				return it->second;
+				threadData.hits++;
+				return result;
 			}
 
+			threadData.misses++;
 			HashProcess process( p, plug );
-			threadData.cache[key] = process.m_result;
+			g_cache.set( key, process.m_result, 1 );
 			return process.m_result;
 		}
 
 		static void clearCache()
 		{
-			// The docs for enumerable_thread_specific aren't particularly clear
-			// on whether or not it's ok to iterate an e_t_s while concurrently using
-			// local(), which is what we do here. So far in practice it seems to be
-			// OK.
-			tbb::enumerable_thread_specific<ThreadData>::iterator it, eIt;
-			for( it = g_threadData.begin(), eIt = g_threadData.end(); it != eIt; ++it )
+			// Dirtying typically happens for many plugs in quick
+			// succession, so rather than clear the cache immediately
+			// we just record the request, and leave it to the next
+			// call to hash() to perform a single clear. This delay
+			// is OK, because it is illegal to modify a graph while
+			// a computation is being performed with it.
+			g_clearRequestCount++;
+		}
+
+		static size_t getCacheSizeLimit()
+		{
+			return g_cache.getMaxCost();
+		}
+
+		static void setCacheSizeLimit( size_t maxEntries )
+		{
+			g_cache.setMaxCost( maxEntries );
+		}
+
+		static size_t cacheUsage()
+		{
+			return g_cache.currentCost();
+		}
+
+		static size_t cacheHits()
+		{
+			size_t result = 0;
+			for( ThreadDataContainer::const_iterator it = g_threadData.begin(), eIt = g_threadData.end(); it != eIt; ++it )
 			{
-				// We can't clear the cache now, because it is most likely
-				// in use by the owning thread. Instead we set this flag to
-				// politely request that the thread clears the cache itself
-				// at its earliest convenience - in the HashProcess constructor.
-				// This delay in clearing is OK, because it is illegal to modify
-				// a graph while a computation is being performed with it, and
-				// we know that the plug requesting the clear will be removed
-				// from the cache before the next computation starts.
-				it->clearCache = 1;
+				result += it->hits;
 			}
+			return result;
+		}
+
+		static size_t cacheMisses()
+		{
+			size_t result = 0;
+			for( ThreadDataContainer::const_iterator it = g_threadData.begin(), eIt = g_threadData.end(); it != eIt; ++it )
+			{
+				result += it->misses;
+			}
+			return result;
 		}
 
 		static const IECore::InternedString staticType;
@@ -212,33 +230,575 @@ class ValuePlug::HashProcess : public Process
 		// in the length of the chain of nodes - not good. Thanks is due to David Minor for
 		// being the first to point this out.
 		//
-		// We address this problem by keeping a per-thread cache of hashes, indexed
-		// by the plug the hash is for and the context the hash was performed in. The
-		// typedefs below describe that data structure. We use Plug::dirty() to empty
-		// the caches, because they are invalidated whenever an upstream value or
-		// connection is changed. We also clear the cache unconditionally every N
-		// computations, to prevent unbounded growth.
+		// We address this problem by keeping a cache of hashes, shared between
+		// all threads, and indexed by the plug the hash is for and the context
+		// the hash was performed in. We use Plug::dirty() to empty the cache,
+		// because it is invalidated whenever an upstream value or connection is
+		// changed. Each entry has a cost of 1, so the cost limit of the LRUCache
+		// bounds the number of entries, with the least recently used being
+		// discarded first.
 		typedef std::pair<const ValuePlug *, IECore::MurmurHash> CacheKey;
-		typedef boost::unordered_map<CacheKey, IECore::MurmurHash> Cache;
+		typedef IECorePreview::LRUCache<CacheKey, IECore::MurmurHash> Cache;
+
+		static IECore::MurmurHash nullGetter( const CacheKey &key, size_t &cost )
+		{
+			// A default hash is never a valid result (see constructor above),
+			// so we use it to represent a cache miss.
+			cost = 0;
+			return IECore::MurmurHash();
+		}
 
-		// To support multithreading, each thread has it's own state.
+		static void clearCacheIfRequested()
+		{
+			if( g_clearCount == g_clearRequestCount )
+			{
+				return;
+			}
+
+			tbb::spin_mutex::scoped_lock lock( g_clearMutex );
+			const size_t requestCount = g_clearRequestCount;
+			if( g_clearCount != requestCount )
+			{
+				g_cache.clear();
+				g_clearCount = requestCount;
+			}
+		}
+
+		static Cache g_cache;
+		static tbb::atomic<size_t> g_clearRequestCount;
+		static tbb::atomic<size_t> g_clearCount;
+		static tbb::spin_mutex g_clearMutex;
+
+		// Statistics are accumulated per-thread, to avoid contention
+		// on a shared counter.
 		struct ThreadData
 		{
-			ThreadData() : cacheClearCount( 0 ) {}
-			int cacheClearCount;
-			Cache cache;
-			// Flag to request that hashCache be cleared.
-			tbb::atomic<int> clearCache;
+			ThreadData() : hits( 0 ), misses( 0 ) {}
+			size_t hits;
+			size_t misses;
 		};
 
-		static tbb::enumerable_thread_specific<ThreadData, tbb::cache_aligned_allocator<ThreadData>, tbb::ets_key_per_instance > g_threadData;
+		typedef tbb::enumerable_thread_specific<ThreadData, tbb::cache_aligned_allocator<ThreadData>, tbb::ets_key_per_instance> ThreadDataContainer;
+		static ThreadDataContainer g_threadData;
 
 		IECore::MurmurHash m_result;
 
 };
 
 const IECore::InternedString ValuePlug::HashProcess::staticType( "computeNode:hash" );
-tbb::enumerable_thread_specific<ValuePlug::HashProcess::ThreadData, tbb::cache_aligned_allocator<ValuePlug::HashProcess::ThreadData>, tbb::ets_key_per_instance > ValuePlug::HashProcess::g_threadData;
+ValuePlug::HashProcess::Cache ValuePlug::HashProcess::g_cache( nullGetter, 100000 );
+tbb::atomic<size_t> ValuePlug::HashProcess::g_clearRequestCount;
+tbb::atomic<size_t> ValuePlug::HashProcess::g_clearCount;
+tbb::spin_mutex ValuePlug::HashProcess::g_clearMutex;
+ValuePlug::HashProcess::ThreadDataContainer ValuePlug::HashProcess::g_threadData;
+
+//////////////////////////////////////////////////////////////////////////
+// InFlightComputes tracks the computations currently being performed
+// by ComputeProcesses, so that concurrent requests for an identical value
+// can wait for the first computation to complete rather than repeating
+// it themselves.
+//
+// Waiting is only safe because the owner of a computation performs it
+// in an isolated task arena (see ComputeProcess::computeIsolated()).
+// Otherwise, a TBB thread waiting for its own child tasks could steal
+// an unrelated task, and end up indirectly waiting on a thread that is
+// in turn waiting for it. The owner's thread must never wait for its own
+// computation though : that happens whenever a pass-through compute
+// requests an input value with the same hash as its output.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct InFlightCompute : boost::noncopyable
+{
+
+	InFlightCompute()
+		:	owner( tbb::this_tbb_thread::get_id() ), complete( false )
+	{
+	}
+
+	// The thread performing the computation.
+	const tbb::tbb_thread::id owner;
+
+	boost::mutex mutex;
+	boost::condition_variable condition;
+	bool complete;
+	// Remains null if the computation failed.
+	IECore::ConstObjectPtr result;
+
+};
+
+typedef boost::shared_ptr<InFlightCompute> InFlightComputePtr;
+
+class InFlightComputes : boost::noncopyable
+{
+
+	public :
+
+		// Returns the in-flight computation for `hash`. If none exists,
+		// one is created and `owner` is set to true, in which case the caller
+		// is responsible for performing the computation and then calling
+		// `finish()`.
+		InFlightComputePtr acquire( const IECore::MurmurHash &hash, bool &owner )
+		{
+			Bin &b = bin( hash );
+			tbb::spin_mutex::scoped_lock lock( b.mutex );
+			InFlightComputePtr &c = b.map[hash];
+			owner = !c;
+			if( owner )
+			{
+				c.reset( new InFlightCompute );
+			}
+			return c;
+		}
+
+		// Removes the in-flight computation and wakes any threads
+		// waiting for it. A null result signifies failure.
+		void finish( const IECore::MurmurHash &hash, InFlightCompute &c, const IECore::ConstObjectPtr &result )
+		{
+			Bin &b = bin( hash );
+			{
+				tbb::spin_mutex::scoped_lock lock( b.mutex );
+				b.map.erase( hash );
+			}
+
+			{
+				boost::mutex::scoped_lock lock( c.mutex );
+				c.result = result;
+				c.complete = true;
+			}
+			c.condition.notify_all();
+		}
+
+		// Waits for the computation to complete, returning its result.
+		// Returns null if the computation failed, or if it is being
+		// performed by the calling thread itself, further up the stack.
+		// In the latter case the caller must perform the computation
+		// itself.
+		static IECore::ConstObjectPtr wait( InFlightCompute &c )
+		{
+			if( c.owner == tbb::this_tbb_thread::get_id() )
+			{
+				// Either a pass-through compute is requesting its input,
+				// which has the same hash as its output, or we're executing
+				// a child task of the computation while waiting for another.
+				// Waiting would mean waiting forever.
+				return NULL;
+			}
+
+			boost::mutex::scoped_lock lock( c.mutex );
+			while( !c.complete )
+			{
+				c.condition.wait( lock );
+			}
+			return c.result;
+		}
+
+	private :
+
+		typedef boost::unordered_map<IECore::MurmurHash, InFlightComputePtr> Map;
+
+		// We store the in-flight computations in several bins,
+		// so that threads computing different values rarely
+		// contend for the same mutex.
+		struct Bin
+		{
+			tbb::spin_mutex mutex;
+			Map map;
+		};
+
+		Bin &bin( const IECore::MurmurHash &hash )
+		{
+			return m_bins[boost::hash<IECore::MurmurHash>()( hash ) % g_numBins];
+		}
+
+		static const size_t g_numBins = 64;
+		Bin m_bins[g_numBins];
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// DiskCache provides an optional second level of caching for computed
+// values, storing them in files on disk so that they persist between
+// sessions and may be shared between processes.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+class DiskCache : boost::noncopyable
+{
+
+	public :
+
+		DiskCache()
+			:	m_maxCost( size_t( 10 ) * 1024 * 1024 * 1024 ), m_currentCost( 0 ), m_accessCount( 0 )
+		{
+			m_enabled = 0;
+		}
+
+		bool enabled() const
+		{
+			return m_enabled;
+		}
+
+		void setDirectory( const std::string &directory )
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			if( directory == m_directory )
+			{
+				return;
+			}
+
+			if( !directory.empty() )
+			{
+				boost::filesystem::create_directories( directory );
+			}
+
+			m_entries.clear();
+			m_accessOrder.clear();
+			m_currentCost = 0;
+			m_directory = directory;
+			m_enabled = !directory.empty();
+
+			if( !m_enabled )
+			{
+				return;
+			}
+
+			// Adopt any entries left by previous sessions, using the
+			// modification times of the files to determine the order
+			// in which they will be evicted.
+
+			typedef std::vector<std::pair<std::time_t, std::string> > Files;
+			Files files;
+			for( boost::filesystem::directory_iterator it( directory ), eIt; it != eIt; ++it )
+			{
+				if( it->path().extension() != g_extension )
+				{
+					continue;
+				}
+				boost::system::error_code sizeError, timeError;
+				const boost::uintmax_t size = boost::filesystem::file_size( it->path(), sizeError );
+				const std::time_t time = boost::filesystem::last_write_time( it->path(), timeError );
+				if( sizeError || timeError )
+				{
+					continue;
+				}
+				const std::string name = it->path().filename().string();
+				m_entries[name] = Entry( size );
+				m_currentCost += size;
+				files.push_back( Files::value_type( time, name ) );
+			}
+
+			std::sort( files.begin(), files.end() );
+			for( Files::const_iterator it = files.begin(), eIt = files.end(); it != eIt; ++it )
+			{
+				touch( m_entries.find( it->second ) );
+			}
+
+			std::vector<std::string> toRemove;
+			limitCost( toRemove );
+			lock.unlock();
+			removeFiles( toRemove );
+		}
+
+		std::string getDirectory() const
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			return m_directory;
+		}
+
+		void setMaxCost( size_t maxCost )
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			m_maxCost = maxCost;
+			std::vector<std::string> toRemove;
+			limitCost( toRemove );
+			lock.unlock();
+			removeFiles( toRemove );
+		}
+
+		size_t getMaxCost() const
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			return m_maxCost;
+		}
+
+		size_t currentCost() const
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			return m_currentCost;
+		}
+
+		void registerType( IECore::TypeId typeId )
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			m_registeredTypes.insert( typeId );
+		}
+
+		// Removes all files from the cache directory, including
+		// any written by other processes.
+		void clear()
+		{
+			boost::mutex::scoped_lock lock( m_mutex );
+			if( m_directory.empty() )
+			{
+				return;
+			}
+
+			std::vector<std::string> toRemove;
+			for( boost::filesystem::directory_iterator it( m_directory ), eIt; it != eIt; ++it )
+			{
+				if( it->path().extension() == g_extension )
+				{
+					toRemove.push_back( it->path().string() );
+				}
+			}
+
+			m_entries.clear();
+			m_accessOrder.clear();
+			m_currentCost = 0;
+			lock.unlock();
+			removeFiles( toRemove );
+		}
+
+		// Returns NULL if the value is not in the cache.
+		IECore::ConstObjectPtr get( const IECore::MurmurHash &hash )
+		{
+			const std::string name = fileName( hash );
+			std::string path;
+			{
+				boost::mutex::scoped_lock lock( m_mutex );
+				if( m_directory.empty() )
+				{
+					return NULL;
+				}
+
+				path = m_directory + "/" + name;
+				Entries::iterator it = m_entries.find( name );
+				if( it == m_entries.end() )
+				{
+					// The file may have been written by another
+					// process sharing the same directory.
+					boost::system::error_code ec;
+					const boost::uintmax_t size = boost::filesystem::file_size( path, ec );
+					if( ec )
+					{
+						return NULL;
+					}
+					it = m_entries.insert( Entries::value_type( name, Entry( size ) ) ).first;
+					m_currentCost += size;
+				}
+				touch( it );
+			}
+
+			try
+			{
+				IECore::ConstIndexedIOPtr io = new IECore::FileIndexedIO( path, IECore::IndexedIO::rootPath, IECore::IndexedIO::Read );
+				IECore::ConstObjectPtr result = IECore::Object::load( io, g_valueEntry );
+				{
+					// Files may have been written by a process with
+					// different type registrations.
+					boost::mutex::scoped_lock lock( m_mutex );
+					if( !storable( result->typeId() ) )
+					{
+						return NULL;
+					}
+				}
+				// Update the modification time so that eviction order
+				// is preserved for subsequent sessions.
+				boost::system::error_code ec;
+				boost::filesystem::last_write_time( path, std::time( NULL ), ec );
+				return result;
+			}
+			catch( ... )
+			{
+				// Most likely the file has been evicted by another
+				// process sharing the directory, so we treat this
+				// as a cache miss.
+				boost::mutex::scoped_lock lock( m_mutex );
+				erase( name );
+				return NULL;
+			}
+		}
+
+		// The memoryUsage of the value is passed so that small values,
+		// which are typically cheaper to recompute than to load from disk,
+		// can be rejected.
+		void set( const IECore::MurmurHash &hash, const IECore::Object *value, size_t memoryUsage )
+		{
+			if( !m_enabled || memoryUsage < g_minimumMemoryUsage )
+			{
+				return;
+			}
+
+			const std::string name = fileName( hash );
+			std::string directory;
+			{
+				boost::mutex::scoped_lock lock( m_mutex );
+				if( m_directory.empty() || m_entries.find( name ) != m_entries.end() )
+				{
+					return;
+				}
+				if( !storable( value->typeId() ) )
+				{
+					return;
+				}
+				directory = m_directory;
+			}
+
+			// We write to a temporary file and then rename it, so that
+			// other threads and processes never see a partially written
+			// file.
+			const std::string path = directory + "/" + name;
+			const std::string tmpPath = path + "." + boost::filesystem::unique_path().string() + ".tmp";
+			boost::uintmax_t size = 0;
+			try
+			{
+				{
+					IECore::IndexedIOPtr io = new IECore::FileIndexedIO( tmpPath, IECore::IndexedIO::rootPath, IECore::IndexedIO::Write );
+					value->save( io, g_valueEntry );
+				}
+				boost::filesystem::rename( tmpPath, path );
+				size = boost::filesystem::file_size( path );
+			}
+			catch( const std::exception &e )
+			{
+				// Failure to write to the cache must not cause
+				// the computation itself to fail.
+				IECore::msg( IECore::Msg::Warning, "ValuePlug disk cache", e.what() );
+				boost::system::error_code ec;
+				boost::filesystem::remove( tmpPath, ec );
+				return;
+			}
+
+			std::vector<std::string> toRemove;
+			{
+				boost::mutex::scoped_lock lock( m_mutex );
+				if( m_directory != directory )
+				{
+					return;
+				}
+				Entries::iterator it = m_entries.find( name );
+				if( it == m_entries.end() )
+				{
+					it = m_entries.insert( Entries::value_type( name, Entry( size ) ) ).first;
+					m_currentCost += size;
+				}
+				touch( it );
+				limitCost( toRemove );
+			}
+			removeFiles( toRemove );
+		}
+
+	private :
+
+		struct Entry
+		{
+			Entry( size_t cost = 0 ) : cost( cost ), access( 0 ) {}
+			size_t cost;
+			// Position in m_accessOrder, or 0 if not yet accessed.
+			size_t access;
+		};
+
+		typedef boost::unordered_map<std::string, Entry> Entries;
+		typedef std::map<size_t, std::string> AccessOrder;
+
+		static std::string fileName( const IECore::MurmurHash &hash )
+		{
+			// Include the Gaffer version, because the result of a
+			// computation may change between versions even when the
+			// hash doesn't.
+			IECore::MurmurHash h = hash;
+			h.append( GAFFER_MILESTONE_VERSION );
+			h.append( GAFFER_MAJOR_VERSION );
+			h.append( GAFFER_MINOR_VERSION );
+			h.append( GAFFER_PATCH_VERSION );
+			return h.toString() + g_extension;
+		}
+
+		// Must be called with m_mutex locked. Not all types implement
+		// save() and load() such that values survive the round trip -
+		// some just emit a warning and store nothing - so we only store
+		// types which are known to work. Cortex's own types all do, and
+		// others must be registered explicitly.
+		bool storable( IECore::TypeId typeId ) const
+		{
+			return (unsigned)typeId <= g_lastCortexTypeId || m_registeredTypes.find( typeId ) != m_registeredTypes.end();
+		}
+
+		// Must be called with m_mutex locked.
+		void touch( Entries::iterator it )
+		{
+			if( it->second.access )
+			{
+				m_accessOrder.erase( it->second.access );
+			}
+			it->second.access = ++m_accessCount;
+			m_accessOrder[it->second.access] = it->first;
+		}
+
+		// Must be called with m_mutex locked.
+		void erase( const std::string &name )
+		{
+			Entries::iterator it = m_entries.find( name );
+			if( it == m_entries.end() )
+			{
+				return;
+			}
+			m_accessOrder.erase( it->second.access );
+			m_currentCost -= it->second.cost;
+			m_entries.erase( it );
+		}
+
+		// Must be called with m_mutex locked. Paths of evicted
+		// files are appended to toRemove, so that they may be
+		// removed after the mutex has been released.
+		void limitCost( std::vector<std::string> &toRemove )
+		{
+			while( m_currentCost > m_maxCost && !m_accessOrder.empty() )
+			{
+				const std::string name = m_accessOrder.begin()->second;
+				toRemove.push_back( m_directory + "/" + name );
+				erase( name );
+			}
+		}
+
+		static void removeFiles( const std::vector<std::string> &paths )
+		{
+			for( std::vector<std::string>::const_iterator it = paths.begin(), eIt = paths.end(); it != eIt; ++it )
+			{
+				boost::system::error_code ec;
+				boost::filesystem::remove( *it, ec );
+			}
+		}
+
+		mutable boost::mutex m_mutex;
+		tbb::atomic<int> m_enabled;
+		std::string m_directory;
+		size_t m_maxCost;
+		size_t m_currentCost;
+		size_t m_accessCount;
+		Entries m_entries;
+		AccessOrder m_accessOrder;
+		boost::unordered_set<IECore::TypeId> m_registeredTypes;
+
+		static const std::string g_extension;
+		static const IECore::IndexedIO::EntryID g_valueEntry;
+		static const size_t g_minimumMemoryUsage = 1024;
+		// Cortex reserves the TypeIds below this for its core library.
+		static const unsigned g_lastCortexTypeId = 99999;
+
+};
+
+const std::string DiskCache::g_extension( ".fio" );
+const IECore::IndexedIO::EntryID DiskCache::g_valueEntry( "value" );
+
+} // namespace
 
 //////////////////////////////////////////////////////////////////////////
 // The ComputeProcess manages the task of calling ComputeNode::compute()
@@ -265,6 +825,46 @@ class ValuePlug::ComputeProcess : public Process
 			return g_cache.currentCost();
 		}
 
+		static void clearCache()
+		{
+			g_cache.clear();
+		}
+
+		static void setDiskCacheDirectory( const std::string &directory )
+		{
+			g_diskCache.setDirectory( directory );
+		}
+
+		static std::string getDiskCacheDirectory()
+		{
+			return g_diskCache.getDirectory();
+		}
+
+		static size_t getDiskCacheSizeLimit()
+		{
+			return g_diskCache.getMaxCost();
+		}
+
+		static void setDiskCacheSizeLimit( size_t bytes )
+		{
+			g_diskCache.setMaxCost( bytes );
+		}
+
+		static size_t diskCacheUsage()
+		{
+			return g_diskCache.currentCost();
+		}
+
+		static void clearDiskCache()
+		{
+			g_diskCache.clear();
+		}
+
+		static void registerDiskCacheType( IECore::TypeId typeId )
+		{
+			g_diskCache.registerType( typeId );
+		}
+
 		static IECore::ConstObjectPtr value( const ValuePlug *plug, const IECore::MurmurHash *precomputedHash )
 		{
 			const ValuePlug *p = sourcePlug( plug );
@@ -294,11 +894,55 @@ class ValuePlug::ComputeProcess : public Process
 					return result;
 				}
 
-				// Otherwise, use a ComputeProcess instance to do the work.
-				ComputeProcess process( p, plug );
+				// Otherwise, check to see if another thread is already computing
+				// the same value. If it is, we wait for it to finish rather than
+				// duplicate the work.
+				bool owner = false;
+				InFlightComputePtr inFlight = g_inFlightComputes.acquire( hash, owner );
+				if( !owner )
+				{
+					WaitProcess waitProcess( p, plug );
+					result = InFlightComputes::wait( *inFlight );
+					if( result )
+					{
+						return result;
+					}
+					// The other computation failed, or is being performed
+					// further up our own stack, so we fall through and
+					// compute the value ourselves.
+				}
+
+				InFlightScope inFlightScope( owner ? inFlight.get() : NULL, hash );
+
+				// Check the cache again, in case a computation finished
+				// between our first check and the acquisition of the in-flight
+				// computation.
+				result = g_cache.get( hash );
+				if( result )
+				{
+					inFlightScope.finish( result );
+					return result;
+				}
+
+				// Check the disk cache, if one is in use, before going
+				// to the trouble of computing the value.
+				if( g_diskCache.enabled() )
+				{
+					result = g_diskCache.get( hash );
+					if( result )
+					{
+						g_cache.set( hash, result, result->memoryUsage() );
+						inFlightScope.finish( result );
+						return result;
+					}
+				}
+
+				// Do the work in isolation, so that other threads may
+				// safely wait for us.
+				result = computeIsolated( p, plug );
 				// Store the value in the cache, after first checking that this hasn't
 				// been done already. The check is useful because it's common for an
-				// upstream compute triggered by to have already
+				// upstream compute triggered by this one to have already
 				// done the work, and calling memoryUsage() can be very expensive for some
 				// datatypes. A prime example of this is the attribute state passed around
 				// in GafferScene - it's common for a selective filter to mean that the
@@ -307,11 +951,24 @@ class ValuePlug::ComputeProcess : public Process
 				// consists of many small objects for which computing memory usage is slow.
 				/// \todo Accessing the LRUCache multiple times like this does have an
 				/// overhead, and at some point we'll need to address that.
+				size_t memoryUsage = 0;
 				if( !g_cache.get( hash ) )
 				{
-					g_cache.set( hash, process.m_result, process.m_result->memoryUsage() );
+					memoryUsage = result->memoryUsage();
+					g_cache.set( hash, result, memoryUsage );
+				}
+				// The value must be in the cache before we finish the in-flight
+				// computation, so that late arrivals will find it.
+				inFlightScope.finish( result );
+				// Writing to disk is slow, so we only do it once any threads
+				// waiting for the result have been released. The disk cache is
+				// keyed on the same hash as the memory cache, which is the same
+				// in every process because Context::hash() is.
+				if( memoryUsage )
+				{
+					g_diskCache.set( hash, result.get(), memoryUsage );
 				}
-				return process.m_result;
+				return result;
 			}
 			else
 			{
@@ -339,9 +996,143 @@ class ValuePlug::ComputeProcess : public Process
 		}
 
 		static const IECore::InternedString staticType;
+		static const IECore::InternedString waitStaticType;
 
 	private :
 
+		// Process used to represent the time spent waiting for an
+		// in-flight computation on another thread, so that monitors
+		// can report on it.
+		class WaitProcess : public Process
+		{
+
+			public :
+
+				WaitProcess( const ValuePlug *plug, const ValuePlug *downstream )
+					:	Process( waitStaticType, plug, downstream )
+				{
+				}
+
+		};
+
+		// Ensures that an in-flight computation is always finished,
+		// even if an exception is thrown while computing it.
+		class InFlightScope : boost::noncopyable
+		{
+
+			public :
+
+				InFlightScope( InFlightCompute *inFlight, const IECore::MurmurHash &hash )
+					:	m_inFlight( inFlight ), m_hash( hash )
+				{
+				}
+
+				~InFlightScope()
+				{
+					finish( NULL );
+				}
+
+				void finish( const IECore::ConstObjectPtr &result )
+				{
+					if( m_inFlight )
+					{
+						g_inFlightComputes.finish( m_hash, *m_inFlight, result );
+						m_inFlight = NULL;
+					}
+				}
+
+			private :
+
+				InFlightCompute *m_inFlight;
+				const IECore::MurmurHash m_hash;
+
+		};
+
+		// Functor for use with tbb::task_arena::execute().
+		class IsolatedCompute
+		{
+
+			public :
+
+				IsolatedCompute( const ValuePlug *plug, const ValuePlug *downstream, IECore::ConstObjectPtr &result )
+					:	m_plug( plug ), m_downstream( downstream ), m_result( result )
+				{
+				}
+
+				void operator()() const
+				{
+					m_result = ComputeProcess( m_plug, m_downstream ).m_result;
+				}
+
+			private :
+
+				const ValuePlug *m_plug;
+				const ValuePlug *m_downstream;
+				IECore::ConstObjectPtr &m_result;
+
+		};
+
+		// Performs the computation in a task arena of its own. While
+		// waiting for its child tasks, this thread may then only execute
+		// other tasks belonging to the same computation. It will never
+		// steal an unrelated task which might wait for a computation that
+		// is itself waiting for this one, so other threads may wait for our
+		// result without risk of deadlock.
+		//
+		// Arenas are reused from a pool rather than constructed for every
+		// computation. Since each is used by only one computation at a time,
+		// the calling thread always joins the arena and executes the functor
+		// itself, so exceptions propagate to the caller unchanged.
+		static IECore::ConstObjectPtr computeIsolated( const ValuePlug *plug, const ValuePlug *downstream )
+		{
+			IECore::ConstObjectPtr result;
+			ArenaScope arena;
+			arena->execute( IsolatedCompute( plug, downstream, result ) );
+			return result;
+		}
+
+		// Acquires a task arena from the pool for the
+		// lifetime of the scope.
+		class ArenaScope : boost::noncopyable
+		{
+
+			public :
+
+				ArenaScope()
+				{
+					tbb::spin_mutex::scoped_lock lock( g_arenasMutex );
+					if( g_arenas.empty() )
+					{
+						m_arena.reset( new tbb::task_arena );
+					}
+					else
+					{
+						m_arena = g_arenas.back();
+						g_arenas.pop_back();
+					}
+				}
+
+				~ArenaScope()
+				{
+					tbb::spin_mutex::scoped_lock lock( g_arenasMutex );
+					g_arenas.push_back( m_arena );
+				}
+
+				tbb::task_arena *operator -> () const
+				{
+					return m_arena.get();
+				}
+
+			private :
+
+				boost::shared_ptr<tbb::task_arena> m_arena;
+
+		};
+
+		typedef std::vector<boost::shared_ptr<tbb::task_arena> > Arenas;
+		static Arenas g_arenas;
+		static tbb::spin_mutex g_arenasMutex;
+
 		ComputeProcess( const ValuePlug *plug, const ValuePlug *downstream )
 			:	Process( staticType, plug, downstream )
 		{
@@ -389,12 +1180,24 @@ class ValuePlug::ComputeProcess : public Process
 		typedef IECorePreview::LRUCache<IECore::MurmurHash, IECore::ConstObjectPtr> Cache;
 		static Cache g_cache;
 
+		static InFlightComputes g_inFlightComputes;
+
+		// An optional second level cache, for results which
+		// are evicted from g_cache or computed in previous
+		// sessions.
+		static DiskCache g_diskCache;
+
 		IECore::ConstObjectPtr m_result;
 
 };
 
 const IECore::InternedString ValuePlug::ComputeProcess::staticType( "computeNode:compute" );
+const IECore::InternedString ValuePlug::ComputeProcess::waitStaticType( "computeNode:computeWait" );
 ValuePlug::ComputeProcess::Cache ValuePlug::ComputeProcess::g_cache( nullGetter, 1024 * 1024 * 500 );
+InFlightComputes ValuePlug::ComputeProcess::g_inFlightComputes;
+DiskCache ValuePlug::ComputeProcess::g_diskCache;
+ValuePlug::ComputeProcess::Arenas ValuePlug::ComputeProcess::g_arenas;
+tbb::spin_mutex ValuePlug::ComputeProcess::g_arenasMutex;
 
 //////////////////////////////////////////////////////////////////////////
 // SetValueAction implementation
@@ -788,9 +1591,85 @@ size_t ValuePlug::getCacheMemoryLimit()
 void ValuePlug::setCacheMemoryLimit( size_t bytes )
 {
 	ComputeProcess::setCacheMemoryLimit( bytes );
+	if( !bytes )
+	{
+		cacheClearedSignal()();
+	}
 }
 
 size_t ValuePlug::cacheMemoryUsage()
 {
 	return ComputeProcess::cacheMemoryUsage();
 }
+
+void ValuePlug::clearCache()
+{
+	ComputeProcess::clearCache();
+	cacheClearedSignal()();
+}
+
+ValuePlug::CacheClearedSignal &ValuePlug::cacheClearedSignal()
+{
+	static CacheClearedSignal s;
+	return s;
+}
+
+void ValuePlug::setDiskCacheDirectory( const std::string &directory )
+{
+	ComputeProcess::setDiskCacheDirectory( directory );
+}
+
+std::string ValuePlug::getDiskCacheDirectory()
+{
+	return ComputeProcess::getDiskCacheDirectory();
+}
+
+size_t ValuePlug::getDiskCacheSizeLimit()
+{
+	return ComputeProcess::getDiskCacheSizeLimit();
+}
+
+void ValuePlug::setDiskCacheSizeLimit( size_t bytes )
+{
+	ComputeProcess::setDiskCacheSizeLimit( bytes );
+}
+
+size_t ValuePlug::diskCacheUsage()
+{
+	return ComputeProcess::diskCacheUsage();
+}
+
+void ValuePlug::clearDiskCache()
+{
+	ComputeProcess::clearDiskCache();
+}
+
+void ValuePlug::registerDiskCacheType( IECore::TypeId typeId )
+{
+	ComputeProcess::registerDiskCacheType( typeId );
+}
+
+size_t ValuePlug::getHashCacheSizeLimit()
+{
+	return HashProcess::getCacheSizeLimit();
+}
+
+void ValuePlug::setHashCacheSizeLimit( size_t maxEntries )
+{
+	HashProcess::setCacheSizeLimit( maxEntries );
+}
+
+size_t ValuePlug::hashCacheUsage()
+{
+	return HashProcess::cacheUsage();
+}
+
+size_t ValuePlug::hashCacheHits()
+{
+	return HashProcess::cacheHits();
+}
+
+size_t ValuePlug::hashCacheMisses()
+{
+	return HashProcess::cacheMisses();
+}
@@ -37,6 +37,8 @@
 #include "boost/python.hpp"
 #include "boost/lexical_cast.hpp"
 
+#include "IECorePython/ScopedGILRelease.h"
+
 #include "Gaffer/Animation.h"
 
 #include "GafferBindings/DependencyNodeBinding.h"
@@ -95,6 +97,21 @@ class CurvePlugSerialiser : public ValuePlugSerialiser
 
 };
 
+// Keys are edited via Action::enact(), which may wait for background
+// computations that need the GIL, so we release it.
+
+void addKey( Animation::CurvePlug &p, const Animation::Key &k )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	p.addKey( k );
+}
+
+void removeKey( Animation::CurvePlug &p, float time )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	p.removeKey( time );
+}
+
 } // namespace
 
 void GafferBindings::bindAnimation()
@@ -143,10 +160,10 @@ void GafferBindings::bindAnimation()
 				)
 			)
 		)
-		.def( "addKey", &Animation::CurvePlug::addKey )
+		.def( "addKey", &addKey )
 		.def( "hasKey", &Animation::CurvePlug::hasKey )
 		.def( "getKey", &Animation::CurvePlug::getKey )
-		.def( "removeKey", &Animation::CurvePlug::removeKey )
+		.def( "removeKey", &removeKey )
 		.def( "closestKey", &Animation::CurvePlug::closestKey )
 		.def( "previousKey", &Animation::CurvePlug::previousKey )
 		.def( "nextKey", &Animation::CurvePlug::nextKey )
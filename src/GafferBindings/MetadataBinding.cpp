@@ -41,6 +41,7 @@
 
 #include "IECore/SimpleTypedData.h"
 #include "IECorePython/ScopedGILLock.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "Gaffer/Plug.h"
 #include "Gaffer/Node.h"
@@ -282,6 +283,33 @@ void registerPlugDescription( IECore::TypeId nodeTypeId, const char *plugPath, o
 	Metadata::registerPlugDescription( nodeTypeId, plugPath, objectToPlugValueFunction( g_descriptionName, description ) );
 }
 
+// Instance metadata is registered via Action::enact(), which may wait
+// for background computations that need the GIL, so we release it.
+
+void registerInstanceNodeValue( Node *node, InternedString key, ConstDataPtr value, bool persistent )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	Metadata::registerNodeValue( node, key, value, persistent );
+}
+
+void deregisterInstanceNodeValue( Node *node, InternedString key )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	Metadata::deregisterNodeValue( node, key );
+}
+
+void registerInstancePlugValue( Plug *plug, InternedString key, ConstDataPtr value, bool persistent )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	Metadata::registerPlugValue( plug, key, value, persistent );
+}
+
+void deregisterInstancePlugValue( Plug *plug, InternedString key )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	Metadata::deregisterPlugValue( plug, key );
+}
+
 struct ValueChangedSlotCaller
 {
 
@@ -387,7 +415,7 @@ void bindMetadata()
 		.staticmethod( "value" )
 
 		.def( "registerNodeValue", &registerNodeValue )
-		.def( "registerNodeValue", (void (*)( Node *, InternedString key, ConstDataPtr value, bool ))&Metadata::registerNodeValue,
+		.def( "registerNodeValue", &registerInstanceNodeValue,
 			(
 				boost::python::arg( "node" ),
 				boost::python::arg( "value" ),
@@ -418,7 +446,7 @@ void bindMetadata()
 		.staticmethod( "nodeValue" )
 
 		.def( "deregisterNodeValue", (void (*)( IECore::TypeId, InternedString ))&Metadata::deregisterNodeValue )
-		.def( "deregisterNodeValue", (void (*)( Node *, InternedString ))&Metadata::deregisterNodeValue )
+		.def( "deregisterNodeValue", &deregisterInstanceNodeValue )
 		.staticmethod( "deregisterNodeValue" )
 
 		.def( "registerNodeDescription", boost::python::raw_function( &registerNodeDescription, 2 ) )
@@ -436,7 +464,7 @@ void bindMetadata()
 		.staticmethod( "nodeDescription" )
 
 		.def( "registerPlugValue", &registerPlugValue )
-		.def( "registerPlugValue", (void (*)( Plug *, InternedString key, ConstDataPtr value, bool ))&Metadata::registerPlugValue,
+		.def( "registerPlugValue", &registerInstancePlugValue,
 			(
 				boost::python::arg( "plug" ),
 				boost::python::arg( "value" ),
@@ -467,7 +495,7 @@ void bindMetadata()
 		.staticmethod( "plugValue" )
 
 		.def( "deregisterPlugValue", (void (*)( IECore::TypeId, const MatchPattern &, InternedString ))&Metadata::deregisterPlugValue )
-		.def( "deregisterPlugValue", (void (*)( Plug *, InternedString ))&Metadata::deregisterPlugValue )
+		.def( "deregisterPlugValue", &deregisterInstancePlugValue )
 		.staticmethod( "deregisterPlugValue" )
 
 		.def( "registerPlugDescription", &registerPlugDescription )
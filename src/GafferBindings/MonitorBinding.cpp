@@ -64,11 +64,13 @@ void exitScope( Monitor &m, object type, object value, object traceBack )
 std::string repr( PerformanceMonitor::Statistics &s )
 {
 	return boost::str(
-		boost::format( "Gaffer.PerformanceMonitor.Statistics( hashCount = %d, computeCount = %d, hashDuration = %d, computeDuration = %d )" )
+		boost::format( "Gaffer.PerformanceMonitor.Statistics( hashCount = %d, computeCount = %d, hashDuration = %d, computeDuration = %d, computeWaitCount = %d, computeWaitDuration = %d )" )
 			% s.hashCount
 			% s.computeCount
 			% s.hashDuration.count()
 			% s.computeDuration.count()
+			% s.computeWaitCount
+			% s.computeWaitDuration.count()
 	);
 }
 
@@ -76,10 +78,15 @@ PerformanceMonitor::Statistics *statisticsConstructor(
 	size_t hashCount,
 	size_t computeCount,
 	boost::chrono::nanoseconds::rep hashDuration,
-	boost::chrono::nanoseconds::rep computeDuration
+	boost::chrono::nanoseconds::rep computeDuration,
+	size_t computeWaitCount,
+	boost::chrono::nanoseconds::rep computeWaitDuration
 )
 {
-	return new PerformanceMonitor::Statistics( hashCount, computeCount, boost::chrono::nanoseconds( hashDuration ), boost::chrono::nanoseconds( computeDuration ) );
+	return new PerformanceMonitor::Statistics(
+		hashCount, computeCount, boost::chrono::nanoseconds( hashDuration ), boost::chrono::nanoseconds( computeDuration ),
+		computeWaitCount, boost::chrono::nanoseconds( computeWaitDuration )
+	);
 }
 
 boost::chrono::nanoseconds::rep getHashDuration( PerformanceMonitor::Statistics &s )
@@ -102,6 +109,16 @@ void setComputeDuration( PerformanceMonitor::Statistics &s, boost::chrono::nanos
 	s.computeDuration = boost::chrono::nanoseconds( v );
 }
 
+boost::chrono::nanoseconds::rep getComputeWaitDuration( PerformanceMonitor::Statistics &s )
+{
+	return s.computeWaitDuration.count();
+}
+
+void setComputeWaitDuration( PerformanceMonitor::Statistics &s, boost::chrono::nanoseconds::rep v )
+{
+	s.computeWaitDuration = boost::chrono::nanoseconds( v );
+}
+
 dict allStatistics( PerformanceMonitor &m )
 {
 	dict result;
@@ -128,6 +145,8 @@ void GafferBindings::bindMonitor()
 		.value( "PerHashDuration", PerHashDuration )
 		.value( "PerComputeDuration", PerComputeDuration )
 		.value( "HashesPerCompute", HashesPerCompute )
+		.value( "ComputeWaitCount", ComputeWaitCount )
+		.value( "ComputeWaitDuration", ComputeWaitDuration )
 	;
 
 	def(
@@ -167,7 +186,9 @@ void GafferBindings::bindMonitor()
 					arg( "hashCount" ) = 0,
 					arg( "computeCount" ) = 0,
 					arg( "hashDuration" ) = 0,
-					arg( "computeDuration" ) = 0
+					arg( "computeDuration" ) = 0,
+					arg( "computeWaitCount" ) = 0,
+					arg( "computeWaitDuration" ) = 0
 				)
 			)
 		)
@@ -175,6 +196,8 @@ void GafferBindings::bindMonitor()
 		.def_readwrite( "computeCount", &PerformanceMonitor::Statistics::computeCount )
 		.add_property( "hashDuration", &getHashDuration, &setHashDuration )
 		.add_property( "computeDuration", &getComputeDuration, &setComputeDuration )
+		.def_readwrite( "computeWaitCount", &PerformanceMonitor::Statistics::computeWaitCount )
+		.add_property( "computeWaitDuration", &getComputeWaitDuration, &setComputeWaitDuration )
 		.def( self == self )
 		.def( self != self )
 		.def( "__repr__", &repr )
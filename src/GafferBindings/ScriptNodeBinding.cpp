@@ -82,6 +82,10 @@ using namespace GafferBindings;
 namespace
 {
 
+// Variable used to record the index of the statement being
+// executed by ScriptNodeWrapper::tolerantExec().
+const char *g_statementIndexName = "__gafferStatementIndex";
+
 /// The ScriptNodeWrapper class implements the scripting
 /// components of the ScriptNode base class. In this way
 /// scripting is available provided that the ScriptNode was
@@ -265,9 +269,13 @@ class ScriptNodeWrapper : public NodeWrapper<ScriptNode>
 			return result;
 		}
 
-		// Execute the script one top level statement at a time,
-		// reporting errors that occur, but otherwise continuing
-		// with execution.
+		// Execute the script, reporting errors that occur, but otherwise
+		// continuing with execution. Executing one top level statement
+		// at a time is slow for large scripts, so instead we execute all
+		// the remaining statements in one go, and only when an error occurs
+		// do we report it and resume from the statement following the one
+		// that failed. To identify the failed statement, each statement is
+		// preceded by an assignment recording its index.
 		/////////////////////////////////////////////////////////
 		bool tolerantExec( const char *pythonScript, boost::python::object globals, boost::python::object locals, const std::string &context )
 		{
@@ -287,15 +295,25 @@ class ScriptNodeWrapper : public NodeWrapper<ScriptNode>
 
 			assert( mod->kind == Module_kind );
 
-			// Loop over the top-level statements in the module body,
-			// executing one at a time.
+			// The arena takes ownership of the identifier.
+			PyObject *indexName = PyString_InternFromString( g_statementIndexName );
+			PyArena_AddPyObject( arena.get(), indexName );
+
 			bool result = false;
-			int numStatements = asdl_seq_LEN( mod->v.Module.body );
-			for( int i=0; i<numStatements; ++i )
+			asdl_seq *body = mod->v.Module.body;
+			const int numStatements = asdl_seq_LEN( body );
+			int begin = 0;
+			while( begin < numStatements )
 			{
-				// Make a new module containing just this one statement.
-				asdl_seq *newBody = asdl_seq_new( 1, arena.get() );
-				asdl_seq_SET( newBody, 0, asdl_seq_GET( mod->v.Module.body, i ) );
+				// Make a new module containing the remaining statements,
+				// each preceded by the assignment of its index.
+				asdl_seq *newBody = asdl_seq_new( 2 * ( numStatements - begin ), arena.get() );
+				for( int i = begin; i < numStatements; ++i )
+				{
+					stmt_ty statement = static_cast<stmt_ty>( asdl_seq_GET( body, i ) );
+					asdl_seq_SET( newBody, 2 * ( i - begin ), statementIndexAssignment( indexName, i, statement, arena.get() ) );
+					asdl_seq_SET( newBody, 2 * ( i - begin ) + 1, statement );
+				}
 				mod_ty newModule = Module(
 					newBody,
 					arena.get()
@@ -313,16 +331,59 @@ class ScriptNodeWrapper : public NodeWrapper<ScriptNode>
 					)
 				) );
 
-				// Report any errors.
-				if( v == NULL)
+				if( v != NULL )
 				{
-					int lineNumber = 0;
-					std::string message = formatPythonException( /* withTraceback = */ false, &lineNumber );
-					IECore::msg( IECore::Msg::Error, formattedErrorContext( lineNumber, context ), message );
-					result = true;
+					break;
 				}
+
+				// Report the error, and continue after the statement
+				// that caused it.
+				const int failedStatement = failedStatementIndex( locals );
+				int lineNumber = 0;
+				std::string message = formatPythonException( /* withTraceback = */ false, &lineNumber );
+				IECore::msg( IECore::Msg::Error, formattedErrorContext( lineNumber, context ), message );
+				result = true;
+				begin = failedStatement + 1;
 			}
 
+			PyDict_DelItemString( locals.ptr(), g_statementIndexName );
+			PyErr_Clear(); // In case it didn't exist
+
+			return result;
+		}
+
+		// Returns an AST for `<indexName> = <index>`, positioned at
+		// the start of the specified statement.
+		static stmt_ty statementIndexAssignment( PyObject *indexName, int index, stmt_ty statement, PyArena *arena )
+		{
+			PyObject *indexObject = PyInt_FromLong( index );
+			PyArena_AddPyObject( arena, indexObject );
+
+			asdl_seq *targets = asdl_seq_new( 1, arena );
+			asdl_seq_SET( targets, 0, Name( indexName, Store, statement->lineno, statement->col_offset, arena ) );
+
+			return Assign(
+				targets,
+				Num( indexObject, statement->lineno, statement->col_offset, arena ),
+				statement->lineno, statement->col_offset,
+				arena
+			);
+		}
+
+		// Returns the index of the statement that was executing when
+		// the current python exception was raised.
+		static int failedStatementIndex( boost::python::object locals )
+		{
+			PyObject *type, *value, *traceback;
+			PyErr_Fetch( &type, &value, &traceback );
+
+			// The assignment precedes each statement, so is always
+			// made before the statement can fail.
+			PyObject *index = PyDict_GetItemString( locals.ptr(), g_statementIndexName );
+			assert( index && PyInt_Check( index ) );
+			const int result = PyInt_AsLong( index );
+
+			PyErr_Restore( type, value, traceback );
 			return result;
 		}
 
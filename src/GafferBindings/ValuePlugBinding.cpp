@@ -47,6 +47,7 @@
 #include "GafferBindings/ValuePlugBinding.h"
 #include "GafferBindings/PlugBinding.h"
 #include "GafferBindings/Serialisation.h"
+#include "GafferBindings/SignalBinding.h"
 
 using namespace boost::python;
 using namespace GafferBindings;
@@ -269,7 +270,7 @@ bool ValuePlugSerialiser::valueNeedsSerialisation( const Gaffer::ValuePlug *plug
 
 void GafferBindings::bindValuePlug()
 {
-	PlugClass<ValuePlug, PlugWrapper<ValuePlug> >()
+	scope s = PlugClass<ValuePlug, PlugWrapper<ValuePlug> >()
 		.def( boost::python::init<const std::string &, Plug::Direction, unsigned>(
 				(
 					boost::python::arg_( "name" ) = GraphComponent::defaultName<ValuePlug>(),
@@ -290,8 +291,38 @@ void GafferBindings::bindValuePlug()
 		.staticmethod( "setCacheMemoryLimit" )
 		.def( "cacheMemoryUsage", &ValuePlug::cacheMemoryUsage )
 		.staticmethod( "cacheMemoryUsage" )
+		.def( "clearCache", &ValuePlug::clearCache )
+		.staticmethod( "clearCache" )
+		.def( "cacheClearedSignal", &ValuePlug::cacheClearedSignal, return_value_policy<reference_existing_object>() )
+		.staticmethod( "cacheClearedSignal" )
+		.def( "setDiskCacheDirectory", &ValuePlug::setDiskCacheDirectory )
+		.staticmethod( "setDiskCacheDirectory" )
+		.def( "getDiskCacheDirectory", &ValuePlug::getDiskCacheDirectory )
+		.staticmethod( "getDiskCacheDirectory" )
+		.def( "getDiskCacheSizeLimit", &ValuePlug::getDiskCacheSizeLimit )
+		.staticmethod( "getDiskCacheSizeLimit" )
+		.def( "setDiskCacheSizeLimit", &ValuePlug::setDiskCacheSizeLimit )
+		.staticmethod( "setDiskCacheSizeLimit" )
+		.def( "diskCacheUsage", &ValuePlug::diskCacheUsage )
+		.staticmethod( "diskCacheUsage" )
+		.def( "clearDiskCache", &ValuePlug::clearDiskCache )
+		.staticmethod( "clearDiskCache" )
+		.def( "registerDiskCacheType", &ValuePlug::registerDiskCacheType )
+		.staticmethod( "registerDiskCacheType" )
+		.def( "getHashCacheSizeLimit", &ValuePlug::getHashCacheSizeLimit )
+		.staticmethod( "getHashCacheSizeLimit" )
+		.def( "setHashCacheSizeLimit", &ValuePlug::setHashCacheSizeLimit )
+		.staticmethod( "setHashCacheSizeLimit" )
+		.def( "hashCacheUsage", &ValuePlug::hashCacheUsage )
+		.staticmethod( "hashCacheUsage" )
+		.def( "hashCacheHits", &ValuePlug::hashCacheHits )
+		.staticmethod( "hashCacheHits" )
+		.def( "hashCacheMisses", &ValuePlug::hashCacheMisses )
+		.staticmethod( "hashCacheMisses" )
 		.def( "__repr__", &repr )
 	;
 
+	SignalClass<ValuePlug::CacheClearedSignal>( "CacheClearedSignal" );
+
 	Serialisation::registerSerialiser( Gaffer::ValuePlug::staticTypeId(), new ValuePlugSerialiser );
 }
@@ -38,11 +38,55 @@
 
 #include "GafferImage/Blur.h"
 #include "GafferImage/Resample.h"
+#include "GafferImage/BufferAlgo.h"
 
 using namespace Imath;
 using namespace Gaffer;
 using namespace GafferImage;
 
+//////////////////////////////////////////////////////////////////////////
+// Utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Returns the factor by which the input is downsampled before
+// blurring in Pyramid mode. This is the largest power of two
+// which keeps the radius at or above `pyramidRadius` at the
+// lower resolution.
+float downsampleFactor( float radius, float pyramidRadius )
+{
+	pyramidRadius = std::max( pyramidRadius, 1.0f );
+	float result = 1.0f;
+	while( radius / ( result * 2.0f ) >= pyramidRadius )
+	{
+		result *= 2.0f;
+	}
+	return result;
+}
+
+V2f downsampleFactor( const Blur *blur )
+{
+	if( blur->modePlug()->getValue() != Blur::Pyramid )
+	{
+		return V2f( 1 );
+	}
+
+	const V2f radius = blur->radiusPlug()->getValue();
+	const float pyramidRadius = blur->pyramidRadiusPlug()->getValue();
+	return V2f(
+		downsampleFactor( radius.x, pyramidRadius ),
+		downsampleFactor( radius.y, pyramidRadius )
+	);
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Blur
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( Blur );
 
 size_t Blur::g_firstPlugIndex = 0;
@@ -53,20 +97,44 @@ Blur::Blur( const std::string &name )
 	storeIndexOfNextChild( g_firstPlugIndex );
 
 	ResamplePtr resample = new Resample( "__resample" );
+	ResamplePtr downsample = new Resample( "__downsample" );
+	ImageSwitchPtr downsampleSwitch = new ImageSwitch( "__downsampleSwitch" );
 
 	addChild( new V2fPlug( "radius", Plug::In, V2f( 0 ), V2f( 0 ) ) );
 	addChild( resample->boundingModePlug()->createCounterpart( "boundingMode", Plug::In ) );
 	addChild( new BoolPlug( "expandDataWindow" ) );
+	addChild( new IntPlug( "mode", Plug::In, Exact, Exact, Pyramid ) );
+	addChild( new FloatPlug( "pyramidRadius", Plug::In, 8.0f, 1.0f ) );
 
 	addChild( new AtomicBox2fPlug( "__dataWindow", Plug::Out ) );
 	addChild( new V2fPlug( "__filterWidth", Plug::Out ) );
+	addChild( new AtomicBox2fPlug( "__downsampledDataWindow", Plug::Out ) );
+	addChild( new BoolPlug( "__downsampleEnabled", Plug::Out ) );
 
 	addChild( new AtomicBox2iPlug( "__resampledDataWindow", Plug::In, Box2i(), Plug::Default & ~Plug::Serialisable ) );
 	addChild( new FloatVectorDataPlug( "__resampledChannelData", Plug::In, ImagePlug::blackTile(), Plug::Default & ~Plug::Serialisable ) );
 
 	addChild( resample );
-
-	resample->inPlug()->setInput( inPlug() );
+	addChild( downsample );
+	addChild( downsampleSwitch );
+
+	// In Pyramid mode, we box filter the input down to a lower
+	// resolution, and then let the main resample blur it back up to
+	// the original resolution. The downsample is disabled whenever
+	// the radius is small enough that no downsampling is needed.
+	// In Exact mode, the switch connects the main resample straight
+	// to the input, so the downsample isn't involved at all.
+	downsample->inPlug()->setInput( inPlug() );
+	downsample->enabledPlug()->setInput( downsampleEnabledPlug() );
+	downsample->filterPlug()->setValue( "box" );
+	downsample->boundingModePlug()->setInput( boundingModePlug() );
+	downsample->dataWindowPlug()->setInput( downsampledDataWindowPlug() );
+
+	downsampleSwitch->inPlugs()->getChild<ImagePlug>( 0 )->setInput( inPlug() );
+	downsampleSwitch->inPlugs()->getChild<ImagePlug>( 1 )->setInput( downsample->outPlug() );
+	downsampleSwitch->indexPlug()->setInput( modePlug() );
+
+	resample->inPlug()->setInput( downsampleSwitch->outPlug() );
 	resample->filterPlug()->setValue( "smoothGaussian" );
 	resample->boundingModePlug()->setInput( boundingModePlug() );
 	resample->filterWidthPlug()->setInput( filterWidthPlug() );
@@ -115,54 +183,114 @@ const Gaffer::BoolPlug *Blur::expandDataWindowPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
 }
 
+Gaffer::IntPlug *Blur::modePlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
+const Gaffer::IntPlug *Blur::modePlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
+Gaffer::FloatPlug *Blur::pyramidRadiusPlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::FloatPlug *Blur::pyramidRadiusPlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
 Gaffer::AtomicBox2fPlug *Blur::dataWindowPlug()
 {
-	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 3 );
+	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 5 );
 }
 
 const Gaffer::AtomicBox2fPlug *Blur::dataWindowPlug() const
 {
-	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 3 );
+	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 5 );
 }
 
 Gaffer::V2fPlug *Blur::filterWidthPlug()
 {
-	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
+	return getChild<V2fPlug>( g_firstPlugIndex + 6 );
 }
 
 const Gaffer::V2fPlug *Blur::filterWidthPlug() const
 {
-	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
+	return getChild<V2fPlug>( g_firstPlugIndex + 6 );
+}
+
+Gaffer::AtomicBox2fPlug *Blur::downsampledDataWindowPlug()
+{
+	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 7 );
+}
+
+const Gaffer::AtomicBox2fPlug *Blur::downsampledDataWindowPlug() const
+{
+	return getChild<AtomicBox2fPlug>( g_firstPlugIndex + 7 );
+}
+
+Gaffer::BoolPlug *Blur::downsampleEnabledPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::BoolPlug *Blur::downsampleEnabledPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 8 );
 }
 
 Gaffer::AtomicBox2iPlug *Blur::resampledDataWindowPlug()
 {
-	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 5 );
+	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 9 );
 }
 
 const Gaffer::AtomicBox2iPlug *Blur::resampledDataWindowPlug() const
 {
-	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 5 );
+	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 9 );
 }
 
 Gaffer::FloatVectorDataPlug *Blur::resampledChannelDataPlug()
 {
-	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 6 );
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 10 );
 }
 
 const Gaffer::FloatVectorDataPlug *Blur::resampledChannelDataPlug() const
 {
-	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 6 );
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 10 );
 }
 
 Resample *Blur::resample()
 {
-	return getChild<Resample>( g_firstPlugIndex + 7 );
+	return getChild<Resample>( g_firstPlugIndex + 11 );
 }
 
 const Resample *Blur::resample() const
 {
-	return getChild<Resample>( g_firstPlugIndex + 7 );
+	return getChild<Resample>( g_firstPlugIndex + 11 );
+}
+
+Resample *Blur::downsample()
+{
+	return getChild<Resample>( g_firstPlugIndex + 12 );
+}
+
+const Resample *Blur::downsample() const
+{
+	return getChild<Resample>( g_firstPlugIndex + 12 );
+}
+
+ImageSwitch *Blur::downsampleSwitch()
+{
+	return getChild<ImageSwitch>( g_firstPlugIndex + 13 );
+}
+
+const ImageSwitch *Blur::downsampleSwitch() const
+{
+	return getChild<ImageSwitch>( g_firstPlugIndex + 13 );
 }
 
 void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
@@ -172,6 +300,7 @@ void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs )
 	if( input == inPlug()->dataWindowPlug() )
 	{
 		outputs.push_back( dataWindowPlug() );
+		outputs.push_back( downsampledDataWindowPlug() );
 		outputs.push_back( outPlug()->dataWindowPlug() );
 	}
 	else if(
@@ -184,9 +313,21 @@ void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs )
 	else if( input->parent<V2fPlug>() == radiusPlug() )
 	{
 		outputs.push_back( filterWidthPlug()->getChild<ValuePlug>( input->getName() ) );
+		outputs.push_back( dataWindowPlug() );
+		outputs.push_back( downsampledDataWindowPlug() );
+		outputs.push_back( downsampleEnabledPlug() );
 		outputs.push_back( outPlug()->dataWindowPlug() );
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
+	else if(
+		input == modePlug() ||
+		input == pyramidRadiusPlug()
+	)
+	{
+		outputs.push_back( dataWindowPlug() );
+		outputs.push_back( downsampledDataWindowPlug() );
+		outputs.push_back( downsampleEnabledPlug() );
+	}
 	else if(
 		input == resampledChannelDataPlug()
 	)
@@ -199,9 +340,14 @@ void Blur::hash( const ValuePlug *output, const Context *context, IECore::Murmur
 {
 	ImageProcessor::hash( output, context, h );
 
-	if( output == dataWindowPlug() )
+	if( output == dataWindowPlug() || output == downsampledDataWindowPlug() )
 	{
 		inPlug()->dataWindowPlug()->hash( h );
+		h.append( downsampleFactor( this ) );
+	}
+	else if( output == downsampleEnabledPlug() )
+	{
+		h.append( downsampleFactor( this ) );
 	}
 	else if( output->parent<ValuePlug>() == filterWidthPlug() )
 	{
@@ -214,7 +360,33 @@ void Blur::compute( ValuePlug *output, const Context *context ) const
 	if( output == dataWindowPlug() )
 	{
 		const Box2i b = inPlug()->dataWindowPlug()->getValue();
-		static_cast<AtomicBox2fPlug *>( output )->setValue( Box2f( b.min, b.max ) );
+		const V2f factor = downsampleFactor( this );
+		if( factor == V2f( 1 ) || empty( b ) )
+		{
+			static_cast<AtomicBox2fPlug *>( output )->setValue( Box2f( b.min, b.max ) );
+		}
+		else
+		{
+			// The downsampled image has a data window with whole pixels
+			// covering the input data window. We upsample it back to
+			// the equivalent window at full resolution, so that the pixels
+			// of the two resolutions line up exactly.
+			const V2f downsampledMin( floorf( b.min.x / factor.x ), floorf( b.min.y / factor.y ) );
+			const V2f downsampledMax( ceilf( b.max.x / factor.x ), ceilf( b.max.y / factor.y ) );
+			static_cast<AtomicBox2fPlug *>( output )->setValue( Box2f( downsampledMin * factor, downsampledMax * factor ) );
+		}
+		return;
+	}
+	else if( output == downsampledDataWindowPlug() )
+	{
+		const Box2i b = inPlug()->dataWindowPlug()->getValue();
+		const V2f factor = downsampleFactor( this );
+		static_cast<AtomicBox2fPlug *>( output )->setValue( Box2f( V2f( b.min ) / factor, V2f( b.max ) / factor ) );
+		return;
+	}
+	else if( output == downsampleEnabledPlug() )
+	{
+		static_cast<BoolPlug *>( output )->setValue( downsampleFactor( this ) != V2f( 1 ) );
 		return;
 	}
 	else if( output->parent<ValuePlug>() == filterWidthPlug() )
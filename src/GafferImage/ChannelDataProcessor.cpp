@@ -108,7 +108,32 @@ bool ChannelDataProcessor::channelEnabled( const std::string &channel ) const
 
 IECore::ConstFloatVectorDataPtr ChannelDataProcessor::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	IECore::FloatVectorDataPtr outData = inPlug()->channelData( channelName, tileOrigin )->copy();
+	// Rather than pull on the output of each ChannelDataProcessor directly
+	// upstream, each of which would allocate and cache its own copy of the
+	// tile, we gather them up and apply their processing ourselves.
+	std::vector<const ChannelDataProcessor *> upstream;
+	const ImagePlug *in = inPlug();
+	while( const ImageProcessor *processor = exclusiveUpstreamProcessor( in ) )
+	{
+		const ChannelDataProcessor *channelDataProcessor = IECore::runTimeCast<const ChannelDataProcessor>( processor );
+		if( !channelDataProcessor )
+		{
+			break;
+		}
+		upstream.push_back( channelDataProcessor );
+		in = channelDataProcessor->inPlug();
+	}
+
+	IECore::FloatVectorDataPtr outData = in->channelData( channelName, tileOrigin )->copy();
+
+	for( std::vector<const ChannelDataProcessor *>::const_reverse_iterator it = upstream.rbegin(), eIt = upstream.rend(); it != eIt; ++it )
+	{
+		if( (*it)->enabled() && (*it)->channelEnabled( channelName ) )
+		{
+			(*it)->processChannelData( context, (*it)->outPlug(), channelName, outData );
+		}
+	}
+
 	processChannelData( context, parent, channelName, outData );
 	return outData;
 }
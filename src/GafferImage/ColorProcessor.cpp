@@ -39,6 +39,7 @@
 #include "Gaffer/Context.h"
 
 #include "GafferImage/ColorProcessor.h"
+#include "GafferImage/ChannelDataProcessor.h"
 
 using namespace std;
 using namespace IECore;
@@ -121,24 +122,67 @@ void ColorProcessor::compute( Gaffer::ValuePlug *output, const Gaffer::Context *
 {
 	if( output == colorDataPlug() )
 	{
-		FloatVectorDataPtr r, g, b;
+		// Rather than pull on the output of each ColorProcessor or
+		// ChannelDataProcessor directly upstream, each of which would
+		// allocate and cache its own copy of the tile, we gather them
+		// up and apply their processing ourselves, in place.
+		vector<const ImageProcessor *> upstream;
+		const ImagePlug *in = inPlug();
+		while( const ImageProcessor *processor = exclusiveUpstreamProcessor( in ) )
+		{
+			if( !processor->isInstanceOf( ColorProcessor::staticTypeId() ) && !processor->isInstanceOf( ChannelDataProcessor::staticTypeId() ) )
+			{
+				break;
+			}
+			upstream.push_back( processor );
+			in = processor->inPlug();
+		}
+
+		static const string channelNames[3] = { "R", "G", "B" };
+		FloatVectorDataPtr rgb[3];
 		{
 			ContextPtr tmpContext = new Context( *context, Context::Borrowed );
 			Context::Scope scopedContext( tmpContext.get() );
-			tmpContext->set( ImagePlug::channelNameContextName, string( "R" ) );
-			r = inPlug()->channelDataPlug()->getValue()->copy();
-			tmpContext->set( ImagePlug::channelNameContextName, string( "G" ) );
-			g = inPlug()->channelDataPlug()->getValue()->copy();
-			tmpContext->set( ImagePlug::channelNameContextName, string( "B" ) );
-			b = inPlug()->channelDataPlug()->getValue()->copy();
+			for( int i = 0; i < 3; ++i )
+			{
+				tmpContext->set( ImagePlug::channelNameContextName, channelNames[i] );
+				rgb[i] = in->channelDataPlug()->getValue()->copy();
+			}
+
+			for( vector<const ImageProcessor *>::const_reverse_iterator it = upstream.rbegin(), eIt = upstream.rend(); it != eIt; ++it )
+			{
+				if( const ColorProcessor *colorProcessor = runTimeCast<const ColorProcessor>( *it ) )
+				{
+					if( colorProcessor->enabled() )
+					{
+						colorProcessor->processColorData( context, rgb[0].get(), rgb[1].get(), rgb[2].get() );
+					}
+				}
+				else
+				{
+					const ChannelDataProcessor *channelDataProcessor = static_cast<const ChannelDataProcessor *>( *it );
+					if( !channelDataProcessor->enabled() )
+					{
+						continue;
+					}
+					for( int i = 0; i < 3; ++i )
+					{
+						tmpContext->set( ImagePlug::channelNameContextName, channelNames[i] );
+						if( channelDataProcessor->channelEnabled( channelNames[i] ) )
+						{
+							channelDataProcessor->processChannelData( tmpContext.get(), channelDataProcessor->outPlug(), channelNames[i], rgb[i] );
+						}
+					}
+				}
+			}
 		}
 
-		processColorData( context, r.get(), g.get(), b.get() );
+		processColorData( context, rgb[0].get(), rgb[1].get(), rgb[2].get() );
 
 		ObjectVectorPtr result = new ObjectVector();
-		result->members().push_back( r );
-		result->members().push_back( g );
-		result->members().push_back( b );
+		result->members().push_back( rgb[0] );
+		result->members().push_back( rgb[1] );
+		result->members().push_back( rgb[2] );
 
 		static_cast<ObjectPlug *>( output )->setValue( result );
 		return;
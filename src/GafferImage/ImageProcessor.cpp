@@ -188,3 +188,20 @@ void ImageProcessor::compute( ValuePlug *output, const Context *context ) const
 		ImageNode::compute( output, context );
 	}
 }
+
+const ImageProcessor *ImageProcessor::exclusiveUpstreamProcessor( const ImagePlug *image )
+{
+	const ValuePlug *input = image->channelDataPlug()->getInput<ValuePlug>();
+	if( !input || input->outputs().size() != 1 )
+	{
+		return NULL;
+	}
+
+	const ImageProcessor *processor = IECore::runTimeCast<const ImageProcessor>( input->node() );
+	if( !processor || input != processor->outPlug()->channelDataPlug() )
+	{
+		return NULL;
+	}
+
+	return processor;
+}
@@ -72,6 +72,8 @@ ImageReader::ImageReader( const std::string &name )
 	);
 	addChild( new IntPlug( "refreshCount" ) );
 	addChild( new IntPlug( "missingFrameMode", Plug::In, Error, /* min */ Error, /* max */ Hold ) );
+	addChild( new IntPlug( "mipLevel", Plug::In, 0, /* min */ 0 ) );
+	addChild( new IntPlug( "readAhead", Plug::In, 0, /* min */ 0 ) );
 
 	ValuePlugPtr startPlug = new ValuePlug( "start", Plug::In );
 	startPlug->addChild( new IntPlug( "mode", Plug::In, None, /* min */ None, /* max */ ClampToFrame ) );
@@ -95,6 +97,8 @@ ImageReader::ImageReader( const std::string &name )
 	oiioReader->fileNamePlug()->setInput( fileNamePlug() );
 	oiioReader->refreshCountPlug()->setInput( refreshCountPlug() );
 	oiioReader->missingFrameModePlug()->setInput( missingFrameModePlug() );
+	oiioReader->mipLevelPlug()->setInput( mipLevelPlug() );
+	oiioReader->readAheadPlug()->setInput( readAheadPlug() );
 	intermediateMetadataPlug()->setInput( oiioReader->outPlug()->metadataPlug() );
 
 	ColorSpacePtr colorSpace = new ColorSpace( "__colorSpace" );
@@ -139,94 +143,114 @@ const IntPlug *ImageReader::missingFrameModePlug() const
 	return getChild<IntPlug>( g_firstChildIndex + 2 );
 }
 
+IntPlug *ImageReader::mipLevelPlug()
+{
+	return getChild<IntPlug>( g_firstChildIndex + 3 );
+}
+
+const IntPlug *ImageReader::mipLevelPlug() const
+{
+	return getChild<IntPlug>( g_firstChildIndex + 3 );
+}
+
+IntPlug *ImageReader::readAheadPlug()
+{
+	return getChild<IntPlug>( g_firstChildIndex + 4 );
+}
+
+const IntPlug *ImageReader::readAheadPlug() const
+{
+	return getChild<IntPlug>( g_firstChildIndex + 4 );
+}
+
 IntPlug *ImageReader::startModePlug()
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 3 )->getChild<IntPlug>( 0 );
+	return getChild<ValuePlug>( g_firstChildIndex + 5 )->getChild<IntPlug>( 0 );
 }
 
 const IntPlug *ImageReader::startModePlug() const
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 3 )->getChild<IntPlug>( 0 );
+	return getChild<ValuePlug>( g_firstChildIndex + 5 )->getChild<IntPlug>( 0 );
 }
 
 IntPlug *ImageReader::startFramePlug()
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 3 )->getChild<IntPlug>( 1 );
+	return getChild<ValuePlug>( g_firstChildIndex + 5 )->getChild<IntPlug>( 1 );
 }
 
 const IntPlug *ImageReader::startFramePlug() const
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 3 )->getChild<IntPlug>( 1 );
+	return getChild<ValuePlug>( g_firstChildIndex + 5 )->getChild<IntPlug>( 1 );
 }
 
 IntPlug *ImageReader::endModePlug()
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 4 )->getChild<IntPlug>( 0 );
+	return getChild<ValuePlug>( g_firstChildIndex + 6 )->getChild<IntPlug>( 0 );
 }
 
 const IntPlug *ImageReader::endModePlug() const
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 4 )->getChild<IntPlug>( 0 );
+	return getChild<ValuePlug>( g_firstChildIndex + 6 )->getChild<IntPlug>( 0 );
 }
 
 IntPlug *ImageReader::endFramePlug()
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 4 )->getChild<IntPlug>( 1 );
+	return getChild<ValuePlug>( g_firstChildIndex + 6 )->getChild<IntPlug>( 1 );
 }
 
 const IntPlug *ImageReader::endFramePlug() const
 {
-	return getChild<ValuePlug>( g_firstChildIndex + 4 )->getChild<IntPlug>( 1 );
+	return getChild<ValuePlug>( g_firstChildIndex + 6 )->getChild<IntPlug>( 1 );
 }
 
 CompoundObjectPlug *ImageReader::intermediateMetadataPlug()
 {
-	return getChild<CompoundObjectPlug>( g_firstChildIndex + 5 );
+	return getChild<CompoundObjectPlug>( g_firstChildIndex + 7 );
 }
 
 const CompoundObjectPlug *ImageReader::intermediateMetadataPlug() const
 {
-	return getChild<CompoundObjectPlug>( g_firstChildIndex + 5 );
+	return getChild<CompoundObjectPlug>( g_firstChildIndex + 7 );
 }
 
 StringPlug *ImageReader::intermediateColorSpacePlug()
 {
-	return getChild<StringPlug>( g_firstChildIndex + 6 );
+	return getChild<StringPlug>( g_firstChildIndex + 8 );
 }
 
 const StringPlug *ImageReader::intermediateColorSpacePlug() const
 {
-	return getChild<StringPlug>( g_firstChildIndex + 6 );
+	return getChild<StringPlug>( g_firstChildIndex + 8 );
 }
 
 ImagePlug *ImageReader::intermediateImagePlug()
 {
-	return getChild<ImagePlug>( g_firstChildIndex + 7 );
+	return getChild<ImagePlug>( g_firstChildIndex + 9 );
 }
 
 const ImagePlug *ImageReader::intermediateImagePlug() const
 {
-	return getChild<ImagePlug>( g_firstChildIndex + 7 );
+	return getChild<ImagePlug>( g_firstChildIndex + 9 );
 }
 
 OpenImageIOReader *ImageReader::oiioReader()
 {
-	return getChild<OpenImageIOReader>( g_firstChildIndex + 8 );
+	return getChild<OpenImageIOReader>( g_firstChildIndex + 10 );
 }
 
 const OpenImageIOReader *ImageReader::oiioReader() const
 {
-	return getChild<OpenImageIOReader>( g_firstChildIndex + 8 );
+	return getChild<OpenImageIOReader>( g_firstChildIndex + 10 );
 }
 
 ColorSpace *ImageReader::colorSpace()
 {
-	return getChild<ColorSpace>( g_firstChildIndex + 9 );
+	return getChild<ColorSpace>( g_firstChildIndex + 11 );
 }
 
 const ColorSpace *ImageReader::colorSpace() const
 {
-	return getChild<ColorSpace>( g_firstChildIndex + 9 );
+	return getChild<ColorSpace>( g_firstChildIndex + 11 );
 }
 
 size_t ImageReader::supportedExtensions( std::vector<std::string> &extensions )
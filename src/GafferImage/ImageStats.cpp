@@ -34,6 +34,12 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <limits>
+
+#include "IECore/CompoundObject.h"
+#include "IECore/SimpleTypedData.h"
+#include "IECore/VectorTypedData.h"
+
 #include "Gaffer/TypedPlug.h"
 #include "Gaffer/BoxPlug.h"
 #include "Gaffer/ScriptNode.h"
@@ -43,10 +49,243 @@
 #include "GafferImage/ChannelMaskPlug.h"
 #include "GafferImage/FormatPlug.h"
 #include "GafferImage/ImageAlgo.h"
+#include "GafferImage/BufferAlgo.h"
 
+using namespace std;
+using namespace Imath;
+using namespace IECore;
 using namespace GafferImage;
 using namespace Gaffer;
 
+//////////////////////////////////////////////////////////////////////////
+// Utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+InternedString g_channelKeys[4] = { "r", "g", "b", "a" };
+InternedString g_minKey( "min" );
+InternedString g_maxKey( "max" );
+InternedString g_averageKey( "average" );
+InternedString g_histogramKey( "histogram" );
+InternedString g_nanCountKey( "nanCount" );
+InternedString g_infCountKey( "infCount" );
+
+// Accumulates statistics for a single channel. We
+// compute one of these per tile in parallel, and then
+// merge them together.
+struct Statistics
+{
+
+	Statistics( int numBins = 1, const V2f &range = V2f( 0, 1 ) )
+		:	min( limits<float>::max() ), max( -limits<float>::max() ), sum( 0 ), count( 0 ), nanCount( 0 ), infCount( 0 ),
+			histogram( std::max( numBins, 1 ), 0 ),
+			m_rangeMin( range[0] ), m_binScale( range[1] > range[0] ? histogram.size() / ( range[1] - range[0] ) : 0.0f )
+	{
+	}
+
+	// Adds `n` copies of the value `v`.
+	void add( float v, size_t n = 1 )
+	{
+		if( v != v )
+		{
+			nanCount += n;
+			return;
+		}
+		else if( v == numeric_limits<float>::infinity() || v == -numeric_limits<float>::infinity() )
+		{
+			infCount += n;
+			return;
+		}
+
+		min = std::min( min, v );
+		max = std::max( max, v );
+		sum += v * n;
+		count += n;
+
+		// Compute the bin in floating point to avoid integer overflow
+		// for values far outside the range.
+		const float bin = ( v - m_rangeMin ) * m_binScale;
+		size_t binIndex = 0;
+		if( bin >= histogram.size() )
+		{
+			binIndex = histogram.size() - 1;
+		}
+		else if( bin > 0 )
+		{
+			binIndex = static_cast<size_t>( bin );
+		}
+		histogram[binIndex] += n;
+	}
+
+	void merge( const Statistics &other )
+	{
+		min = std::min( min, other.min );
+		max = std::max( max, other.max );
+		sum += other.sum;
+		count += other.count;
+		nanCount += other.nanCount;
+		infCount += other.infCount;
+		for( size_t i = 0, e = histogram.size(); i < e; ++i )
+		{
+			histogram[i] += other.histogram[i];
+		}
+	}
+
+	float min;
+	float max;
+	double sum;
+	size_t count;
+	size_t nanCount;
+	size_t infCount;
+	vector<size_t> histogram;
+
+	private :
+
+		float m_rangeMin;
+		float m_binScale;
+
+};
+
+// Computes the Statistics for a single tile of a single channel,
+// for use with parallelGatherTiles().
+class TileStatistics
+{
+
+	public :
+
+		typedef Statistics Result;
+
+		TileStatistics( const Box2i &regionOfInterest, const Box2i &dataWindow, int numBins, const V2f &range )
+			:	m_regionOfInterest( regionOfInterest ), m_dataWindow( dataWindow ), m_numBins( numBins ), m_range( range )
+		{
+		}
+
+		Result operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin )
+		{
+			Statistics result( m_numBins, m_range );
+
+			const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
+			const Box2i region = intersection( tileBound, m_regionOfInterest );
+			if( empty( region ) )
+			{
+				return result;
+			}
+
+			// Pixels outside the data window are black. We account for them
+			// in one go, and only fetch channel data for the pixels that
+			// really need it.
+
+			const Box2i dataRegion = intersection( region, m_dataWindow );
+			const V2i regionSize = region.size();
+			size_t numBlackPixels = regionSize.x * regionSize.y;
+			if( !empty( dataRegion ) )
+			{
+				const V2i dataRegionSize = dataRegion.size();
+				numBlackPixels -= dataRegionSize.x * dataRegionSize.y;
+
+				ConstFloatVectorDataPtr channelData = imagePlug->channelDataPlug()->getValue();
+				const vector<float> &channel = channelData->readable();
+				for( int y = dataRegion.min.y; y < dataRegion.max.y; ++y )
+				{
+					const float *p = &channel[index( V2i( dataRegion.min.x, y ), tileBound )];
+					for( int x = dataRegion.min.x; x < dataRegion.max.x; ++x )
+					{
+						result.add( *p++ );
+					}
+				}
+			}
+
+			if( numBlackPixels )
+			{
+				result.add( 0.0f, numBlackPixels );
+			}
+
+			return result;
+		}
+
+	private :
+
+		const Box2i m_regionOfInterest;
+		const Box2i m_dataWindow;
+		const int m_numBins;
+		const V2f m_range;
+
+};
+
+// Merges the per-tile Statistics into a per-channel
+// total, for use with parallelGatherTiles().
+class GatherStatistics
+{
+
+	public :
+
+		GatherStatistics( const vector<string> &channelNames, int numBins, const V2f &range )
+			:	m_channelNames( channelNames ), m_statistics( channelNames.size(), Statistics( numBins, range ) )
+		{
+		}
+
+		void operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin, const Statistics &tileStatistics )
+		{
+			const size_t i = std::find( m_channelNames.begin(), m_channelNames.end(), channelName ) - m_channelNames.begin();
+			m_statistics[i].merge( tileStatistics );
+		}
+
+		const Statistics &statistics( size_t channelIndex ) const
+		{
+			return m_statistics[channelIndex];
+		}
+
+	private :
+
+		const vector<string> &m_channelNames;
+		vector<Statistics> m_statistics;
+
+};
+
+// Estimates a percentile from a histogram, interpolating
+// linearly within the bin containing it.
+float percentileFromHistogram( const vector<int> &histogram, const V2f &range, float percentile, float min, float max )
+{
+	size_t total = 0;
+	for( vector<int>::const_iterator it = histogram.begin(), eIt = histogram.end(); it != eIt; ++it )
+	{
+		total += *it;
+	}
+	if( !total )
+	{
+		return 0.0f;
+	}
+
+	const double target = total * Imath::clamp( percentile, 0.0f, 100.0f ) / 100.0;
+	const float binWidth = ( range[1] - range[0] ) / histogram.size();
+
+	size_t cumulative = 0;
+	float result = max;
+	for( size_t i = 0, e = histogram.size(); i < e; ++i )
+	{
+		if( histogram[i] && cumulative + histogram[i] >= target )
+		{
+			const float binFraction = std::max( 0.0, target - cumulative ) / histogram[i];
+			result = range[0] + ( i + binFraction ) * binWidth;
+			break;
+		}
+		cumulative += histogram[i];
+	}
+
+	// Values outside the range are counted in the end bins, and
+	// values may not fill the bins evenly, so we use the known
+	// extremes to tighten the estimate.
+	return Imath::clamp( result, min, max );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// ImageStats
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( ImageStats );
 
 size_t ImageStats::g_firstPlugIndex = 0;
@@ -65,9 +304,24 @@ ImageStats::ImageStats( const std::string &name )
 		)
 	);
 	addChild( new Box2iPlug( "regionOfInterest", Gaffer::Plug::In ) );
+	addChild( new IntPlug( "histogramBins", Gaffer::Plug::In, 256, 1 ) );
+	addChild( new V2fPlug( "histogramRange", Gaffer::Plug::In, V2f( 0, 1 ) ) );
+	addChild( new FloatPlug( "percentile", Gaffer::Plug::In, 50.0f, 0.0f, 100.0f ) );
 	addChild( new Color4fPlug( "average", Gaffer::Plug::Out ) );
 	addChild( new Color4fPlug( "min", Gaffer::Plug::Out ) );
 	addChild( new Color4fPlug( "max", Gaffer::Plug::Out ) );
+	addChild( new Color4fPlug( "percentileValue", Gaffer::Plug::Out ) );
+
+	ValuePlugPtr histogram = new ValuePlug( "histogram", Gaffer::Plug::Out );
+	for( int i = 0; i < 4; ++i )
+	{
+		histogram->addChild( new IntVectorDataPlug( g_channelKeys[i], Gaffer::Plug::Out, new IntVectorData ) );
+	}
+	addChild( histogram );
+
+	addChild( new IntPlug( "nanCount", Gaffer::Plug::Out ) );
+	addChild( new IntPlug( "infCount", Gaffer::Plug::Out ) );
+	addChild( new ObjectPlug( "__statistics", Gaffer::Plug::Out, new CompoundObject ) );
 }
 
 ImageStats::~ImageStats()
@@ -104,34 +358,114 @@ const Box2iPlug *ImageStats::regionOfInterestPlug() const
 	return getChild<Box2iPlug>( g_firstPlugIndex + 2 );
 }
 
+IntPlug *ImageStats::histogramBinsPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
+const IntPlug *ImageStats::histogramBinsPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
+V2fPlug *ImageStats::histogramRangePlug()
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
+}
+
+const V2fPlug *ImageStats::histogramRangePlug() const
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
+}
+
+FloatPlug *ImageStats::percentilePlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 5 );
+}
+
+const FloatPlug *ImageStats::percentilePlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 5 );
+}
+
 Color4fPlug *ImageStats::averagePlug()
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 3 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 6 );
 }
 
 const Color4fPlug *ImageStats::averagePlug() const
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 3 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 6 );
 }
 
 Color4fPlug *ImageStats::minPlug()
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 4 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 7 );
 }
 
 const Color4fPlug *ImageStats::minPlug() const
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 4 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 7 );
 }
 
 Color4fPlug *ImageStats::maxPlug()
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 5 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 8 );
 }
 
 const Color4fPlug *ImageStats::maxPlug() const
 {
-	return getChild<Color4fPlug>( g_firstPlugIndex + 5 );
+	return getChild<Color4fPlug>( g_firstPlugIndex + 8 );
+}
+
+Color4fPlug *ImageStats::percentileValuePlug()
+{
+	return getChild<Color4fPlug>( g_firstPlugIndex + 9 );
+}
+
+const Color4fPlug *ImageStats::percentileValuePlug() const
+{
+	return getChild<Color4fPlug>( g_firstPlugIndex + 9 );
+}
+
+ValuePlug *ImageStats::histogramPlug()
+{
+	return getChild<ValuePlug>( g_firstPlugIndex + 10 );
+}
+
+const ValuePlug *ImageStats::histogramPlug() const
+{
+	return getChild<ValuePlug>( g_firstPlugIndex + 10 );
+}
+
+IntPlug *ImageStats::nanCountPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 11 );
+}
+
+const IntPlug *ImageStats::nanCountPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 11 );
+}
+
+IntPlug *ImageStats::infCountPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 12 );
+}
+
+const IntPlug *ImageStats::infCountPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 12 );
+}
+
+ObjectPlug *ImageStats::statisticsPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 13 );
+}
+
+const ObjectPlug *ImageStats::statisticsPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 13 );
 }
 
 void ImageStats::parentChanging( Gaffer::GraphComponent *newParent )
@@ -155,86 +489,87 @@ void ImageStats::parentChanging( Gaffer::GraphComponent *newParent )
 void ImageStats::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	ComputeNode::affects( input, outputs );
-	if (
-			input == channelsPlug() ||
-			input->parent<ImagePlug>() == inPlug() ||
-			regionOfInterestPlug()->isAncestorOf( input )
-	   )
+
+	if(
+		input == channelsPlug() ||
+		input->parent<ImagePlug>() == inPlug() ||
+		regionOfInterestPlug()->isAncestorOf( input ) ||
+		input == histogramBinsPlug() ||
+		histogramRangePlug()->isAncestorOf( input )
+	)
+	{
+		outputs.push_back( statisticsPlug() );
+	}
+	else if( input == statisticsPlug() )
 	{
 		for( unsigned int i = 0; i < 4; ++i )
 		{
-			outputs.push_back( minPlug()->getChild(i) );
-			outputs.push_back( averagePlug()->getChild(i) );
-			outputs.push_back( maxPlug()->getChild(i) );
+			outputs.push_back( minPlug()->getChild( i ) );
+			outputs.push_back( averagePlug()->getChild( i ) );
+			outputs.push_back( maxPlug()->getChild( i ) );
+			outputs.push_back( percentileValuePlug()->getChild( i ) );
+			outputs.push_back( histogramPlug()->getChild<ValuePlug>( i ) );
+		}
+		outputs.push_back( nanCountPlug() );
+		outputs.push_back( infCountPlug() );
+	}
+	else if( input == percentilePlug() )
+	{
+		for( unsigned int i = 0; i < 4; ++i )
+		{
+			outputs.push_back( percentileValuePlug()->getChild( i ) );
 		}
-		return;
 	}
 }
 
 void ImageStats::hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const
 {
-	ComputeNode::hash( output, context, h);
+	ComputeNode::hash( output, context, h );
 
-	bool earlyOut = true;
-	for( int i = 0; i < 4; ++i )
+	if( output == statisticsPlug() )
 	{
-		if (
-				output == minPlug()->getChild(i) ||
-				output == maxPlug()->getChild(i) ||
-				output == averagePlug()->getChild(i)
-		   )
+		const Box2i regionOfInterest = regionOfInterestPlug()->getValue();
+		if( empty( regionOfInterest ) )
 		{
-			earlyOut = false;
-			break;
+			return;
 		}
-	}
-	if( earlyOut )
-	{
-		return;
-	}
-
-	const Imath::Box2i regionOfInterest( regionOfInterestPlug()->getValue() );
-	regionOfInterestPlug()->hash( h );
-	inPlug()->channelNamesPlug()->hash( h );
-	inPlug()->dataWindowPlug()->hash( h );
-
-	IECore::ConstStringVectorDataPtr channelNamesData = inPlug()->channelNamesPlug()->getValue();
-	std::vector<std::string> maskChannels = channelNamesData->readable();
-	channelsPlug()->maskChannels( maskChannels );
-	const int nChannels( maskChannels.size() );
 
-	if ( nChannels > 0 )
-	{
-		std::vector<std::string> uniqueChannels = maskChannels;
-		GafferImage::ChannelMaskPlug::removeDuplicateIndices( uniqueChannels );
-		std::string channel;
-		channelNameFromOutput( output, channel );
+		regionOfInterestPlug()->hash( h );
+		histogramBinsPlug()->hash( h );
+		histogramRangePlug()->hash( h );
 
-		if ( !channel.empty() )
+		std::string channelNames[4];
+		statisticsChannels( channelNames );
+		for( int i = 0; i < 4; ++i )
 		{
-			h.append( channel );
-			Sampler s( inPlug(), channel, regionOfInterest );
+			if( channelNames[i].empty() )
+			{
+				continue;
+			}
+			h.append( i );
+			h.append( channelNames[i] );
+			Sampler s( inPlug(), channelNames[i], regionOfInterest );
 			s.hash( h );
-			return;
 		}
 	}
-
-	// If our node is not enabled then we just append the default value that we will give the plug.
-	if(
-			output == maxPlug()->getChild(3) ||
-			output == minPlug()->getChild(3) ||
-			output == averagePlug()->getChild(3)
-	  )
+	else if( output == nanCountPlug() || output == infCountPlug() )
 	{
-		h.append( 0 );
+		statisticsPlug()->hash( h );
 	}
-	else
+	else if( channelIndexFromOutput( output ) != -1 )
 	{
-		h.append( 1 );
+		// The output name is hashed by ComputeNode::hash(), so
+		// all we need to append is the statistics we read from.
+		statisticsPlug()->hash( h );
+		if( output->parent<ValuePlug>() == percentileValuePlug() )
+		{
+			percentilePlug()->hash( h );
+			histogramRangePlug()->hash( h );
+		}
 	}
 }
 
-void ImageStats::channelNameFromOutput( const ValuePlug *output, std::string &channelName ) const
+void ImageStats::statisticsChannels( std::string channelNames[4] ) const
 {
 	IECore::ConstStringVectorDataPtr channelNamesData = inPlug()->channelNamesPlug()->getValue();
 	std::vector<std::string> maskChannels = channelNamesData->readable();
@@ -243,99 +578,179 @@ void ImageStats::channelNameFromOutput( const ValuePlug *output, std::string &ch
 	/// As the channelMaskPlug allows any combination of channels to be input we need to make sure that
 	/// the channels that it masks each have a distinct channelIndex. Otherwise multiple channels would be
 	/// outputting to the same plug.
-	std::vector<std::string> uniqueChannels = maskChannels;
-	GafferImage::ChannelMaskPlug::removeDuplicateIndices( uniqueChannels );
+	GafferImage::ChannelMaskPlug::removeDuplicateIndices( maskChannels );
 
-	for( int channelIndex = 0; channelIndex < 4; ++channelIndex )
+	for( std::vector<std::string>::const_iterator it = maskChannels.begin(); it != maskChannels.end(); ++it )
 	{
-		if ( output == minPlug()->getChild( channelIndex ) ||
-			 output == maxPlug()->getChild( channelIndex ) ||
-			 output == averagePlug()->getChild( channelIndex )
-		   )
+		const int channelIndex = colorIndex( *it );
+		if( channelIndex >= 0 && channelNames[channelIndex].empty() )
 		{
-			for( std::vector<std::string>::iterator it( uniqueChannels.begin() ); it != uniqueChannels.end(); ++it )
-			{
-				if ( colorIndex( *it ) == channelIndex )
-				{
-					channelName = *it;
-					return;
-				}
-			}
+			channelNames[channelIndex] = *it;
 		}
 	}
-	return;
 }
 
-void ImageStats::setOutputToDefault( FloatPlug *output ) const
+int ImageStats::channelIndexFromOutput( const ValuePlug *output ) const
 {
-	if (
-			output == minPlug()->getChild(3) ||
-			output == maxPlug()->getChild(3) ||
-			output == averagePlug()->getChild(3)
-	   )
+	const ValuePlug *parent = output->parent<ValuePlug>();
+	if(
+		parent != minPlug() &&
+		parent != maxPlug() &&
+		parent != averagePlug() &&
+		parent != percentileValuePlug() &&
+		parent != histogramPlug()
+	)
 	{
-		output->setValue( 1. );
+		return -1;
 	}
-	else
+
+	for( int i = 0; i < 4; ++i )
 	{
-		output->setValue( 0. );
+		if( parent->getChild<ValuePlug>( i ) == output )
+		{
+			return i;
+		}
 	}
+
+	return -1;
 }
 
 void ImageStats::compute( ValuePlug *output, const Context *context ) const
 {
-	const Imath::Box2i &regionOfInterest( regionOfInterestPlug()->getValue() );
-	if( regionOfInterest.isEmpty() )
+	if( output == statisticsPlug() )
 	{
-		setOutputToDefault( static_cast<FloatPlug*>( output ) );
+		CompoundObjectPtr result = new CompoundObject;
+
+		const Box2i regionOfInterest = regionOfInterestPlug()->getValue();
+		std::string channelNames[4];
+		if( !empty( regionOfInterest ) )
+		{
+			statisticsChannels( channelNames );
+		}
+
+		vector<string> channelsToCompute;
+		for( int i = 0; i < 4; ++i )
+		{
+			if( !channelNames[i].empty() )
+			{
+				channelsToCompute.push_back( channelNames[i] );
+			}
+		}
+
+		if( channelsToCompute.size() )
+		{
+			const int numBins = std::max( histogramBinsPlug()->getValue(), 1 );
+			const V2f range = histogramRangePlug()->getValue();
+
+			// Visit every tile of every channel exactly once, computing
+			// all statistics at the same time. The gather is done in a
+			// fixed order so that the floating point sums are
+			// deterministic.
+			TileStatistics tileStatistics( regionOfInterest, inPlug()->dataWindowPlug()->getValue(), numBins, range );
+			GatherStatistics gatherStatistics( channelsToCompute, numBins, range );
+			parallelGatherTiles( inPlug(), channelsToCompute, tileStatistics, gatherStatistics, regionOfInterest, BottomToTop );
+
+			size_t channelsToComputeIndex = 0;
+			for( int i = 0; i < 4; ++i )
+			{
+				if( channelNames[i].empty() )
+				{
+					continue;
+				}
+
+				const Statistics &statistics = gatherStatistics.statistics( channelsToComputeIndex++ );
+
+				CompoundDataPtr channelResult = new CompoundData;
+				CompoundDataMap &members = channelResult->writable();
+				members[g_minKey] = new FloatData( statistics.count ? statistics.min : 0.0f );
+				members[g_maxKey] = new FloatData( statistics.count ? statistics.max : 0.0f );
+				members[g_averageKey] = new FloatData( statistics.count ? statistics.sum / statistics.count : 0.0f );
+				members[g_nanCountKey] = new IntData( statistics.nanCount );
+				members[g_infCountKey] = new IntData( statistics.infCount );
+				IntVectorDataPtr histogram = new IntVectorData;
+				histogram->writable().insert( histogram->writable().end(), statistics.histogram.begin(), statistics.histogram.end() );
+				members[g_histogramKey] = histogram;
+
+				result->members()[g_channelKeys[i]] = channelResult;
+			}
+		}
+
+		static_cast<ObjectPlug *>( output )->setValue( result );
 		return;
 	}
 
-	std::string channelName;
-	channelNameFromOutput( output, channelName );
-	if ( channelName.empty() )
+	ConstCompoundObjectPtr statistics = boost::static_pointer_cast<const CompoundObject>( statisticsPlug()->getValue() );
+
+	if( output == nanCountPlug() || output == infCountPlug() )
 	{
-		setOutputToDefault( static_cast<FloatPlug*>( output ) );
+		const InternedString &key = output == nanCountPlug() ? g_nanCountKey : g_infCountKey;
+		int count = 0;
+		for( CompoundObject::ObjectMap::const_iterator it = statistics->members().begin(), eIt = statistics->members().end(); it != eIt; ++it )
+		{
+			count += static_cast<const CompoundData *>( it->second.get() )->member<IntData>( key )->readable();
+		}
+		static_cast<IntPlug *>( output )->setValue( count );
 		return;
 	}
 
-	const int channelIndex = colorIndex( channelName );
-
-	// Loop over the ROI and compute the min, max and average channel values and then set our outputs.
-	Sampler s( inPlug(), channelName, regionOfInterest );
-
-	float min = Imath::limits<float>::max();
-	float max = Imath::limits<float>::min();
+	const int channelIndex = channelIndexFromOutput( output );
+	if( channelIndex == -1 )
+	{
+		ComputeNode::compute( output, context );
+		return;
+	}
 
-	float average = 0.f;
+	const ValuePlug *parent = output->parent<ValuePlug>();
+	const CompoundData *channelStatistics = statistics->member<CompoundData>( g_channelKeys[channelIndex] );
 
-	double sum = 0.;
-	for( int y = regionOfInterest.min.y; y < regionOfInterest.max.y; ++y )
+	if( parent == histogramPlug() )
 	{
-		for( int x = regionOfInterest.min.x; x < regionOfInterest.max.x; ++x )
+		IntVectorDataPlug *histogramOutput = static_cast<IntVectorDataPlug *>( output );
+		if( channelStatistics )
+		{
+			histogramOutput->setValue( channelStatistics->member<IntVectorData>( g_histogramKey ) );
+		}
+		else
 		{
-			float v = s.sample( x, y );
-			min = std::min( v, min );
-			max = std::max( v, max );
-			sum += v;
+			histogramOutput->setValue( histogramOutput->defaultValue() );
 		}
+		return;
 	}
-	average = sum / double( (regionOfInterest.size().x) * (regionOfInterest.size().y) );
 
-	if ( minPlug()->getChild( channelIndex ) == output )
+	if( !channelStatistics )
 	{
-		static_cast<FloatPlug *>( output )->setValue( min );
+		// No channel to analyse - output black with an
+		// opaque alpha.
+		static_cast<FloatPlug *>( output )->setValue( channelIndex == 3 ? 1.0f : 0.0f );
+		return;
 	}
-	else if ( maxPlug()->getChild( channelIndex ) == output )
+
+	const float min = channelStatistics->member<FloatData>( g_minKey )->readable();
+	const float max = channelStatistics->member<FloatData>( g_maxKey )->readable();
+
+	float value = 0.0f;
+	if( parent == minPlug() )
 	{
-		static_cast<FloatPlug *>( output )->setValue( max );
+		value = min;
 	}
-	else if ( averagePlug()->getChild( channelIndex ) == output )
+	else if( parent == maxPlug() )
 	{
-		static_cast<FloatPlug *>( output )->setValue( average );
+		value = max;
+	}
+	else if( parent == averagePlug() )
+	{
+		value = channelStatistics->member<FloatData>( g_averageKey )->readable();
 	}
 	else
 	{
-		static_cast<FloatPlug *>( output )->setValue( 0 );
+		assert( parent == percentileValuePlug() );
+		value = percentileFromHistogram(
+			channelStatistics->member<IntVectorData>( g_histogramKey )->readable(),
+			histogramRangePlug()->getValue(),
+			percentilePlug()->getValue(),
+			min, max
+		);
 	}
+
+	static_cast<FloatPlug *>( output )->setValue( value );
 }
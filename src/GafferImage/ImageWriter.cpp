@@ -34,10 +34,12 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <set>
 #include <sys/utsname.h>
 #include <zlib.h>
 
 #include "tbb/spin_mutex.h"
+#include "tbb/pipeline.h"
 
 #include "boost/filesystem.hpp"
 
@@ -826,6 +828,58 @@ ImageSpec createImageSpec( const ImageWriter *node, const ImageOutput *out, cons
 	return spec;
 }
 
+// Generates the contexts for the frames to be written by
+// ImageWriter::executeSequence().
+class FrameGenerator
+{
+
+	public :
+
+		FrameGenerator( const std::vector<ContextPtr> &contexts )
+			:	m_contexts( contexts ), m_next( 0 )
+		{
+		}
+
+		const Context *operator()( tbb::flow_control &flowControl ) const
+		{
+			if( m_next == m_contexts.size() )
+			{
+				flowControl.stop();
+				return NULL;
+			}
+			return m_contexts[m_next++].get();
+		}
+
+	private :
+
+		const std::vector<ContextPtr> &m_contexts;
+		mutable size_t m_next;
+
+};
+
+// Writes a single frame.
+class FrameWriter
+{
+
+	public :
+
+		FrameWriter( const ImageWriter *writer )
+			:	m_writer( writer )
+		{
+		}
+
+		void operator()( const Context *context ) const
+		{
+			Context::Scope scopedContext( context );
+			m_writer->ImageWriter::execute();
+		}
+
+	private :
+
+		const ImageWriter *m_writer;
+
+};
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -1130,3 +1184,46 @@ void ImageWriter::execute() const
 
 	out->close();
 }
+
+void ImageWriter::executeSequence( const std::vector<float> &frames ) const
+{
+	if( typeId() != (IECore::TypeId)ImageWriterTypeId )
+	{
+		// A derived class may have overridden execute(), and
+		// won't be expecting it to be called concurrently. Python
+		// subclasses are dealt with in the bindings, since they
+		// don't necessarily have a type of their own.
+		TaskNode::executeSequence( frames );
+		return;
+	}
+
+	// Make a context for each frame, checking that each will be
+	// written to a different file. If not, we must write the frames
+	// one at a time, in order, so that the last frame wins.
+	std::vector<ContextPtr> contexts;
+	std::set<std::string> fileNames;
+	for( std::vector<float>::const_iterator it = frames.begin(), eIt = frames.end(); it != eIt; ++it )
+	{
+		ContextPtr context = new Context( *Context::current(), Context::Borrowed );
+		context->setFrame( *it );
+		Context::Scope scopedContext( context.get() );
+		if( !fileNames.insert( fileNamePlug()->getValue() ).second )
+		{
+			TaskNode::executeSequence( frames );
+			return;
+		}
+		contexts.push_back( context );
+	}
+
+	// Writing to an ImageOutput is serial, so while a frame is being
+	// written there are typically idle cores. We use them to compute
+	// and write the next frame, by running a pipeline with two frames
+	// in flight. As soon as one frame is finished, work starts on the
+	// one after the next. Limiting the pipeline to two frames keeps
+	// memory usage comparable to writing frames one at a time.
+	tbb::parallel_pipeline(
+		2,
+		tbb::make_filter<void, const Context *>( tbb::filter::serial_in_order, FrameGenerator( contexts ) ) &
+		tbb::make_filter<const Context *, void>( tbb::filter::parallel, FrameWriter( this ) )
+	);
+}
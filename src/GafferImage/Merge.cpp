@@ -34,13 +34,12 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
-#include "IECore/BoxOps.h"
-
 #include "Gaffer/ArrayPlug.h"
 #include "Gaffer/Context.h"
 
 #include "GafferImage/Merge.h"
 #include "GafferImage/ImageAlgo.h"
+#include "GafferImage/BufferAlgo.h"
 
 using namespace std;
 using namespace Imath;
@@ -64,8 +63,66 @@ float opSubtract( float A, float B, float a, float b){ return A - B; }
 float opDifference( float A, float B, float a, float b){ return fabs( A - B ); }
 float opUnder( float A, float B, float a, float b){ return A*(1.-b) + B; }
 
+// Returns true if compositing an input with no valid pixels
+// (A == a == 0) over an existing result leaves it unchanged.
+bool emptyLayersAreNeutral( Merge::Operation operation )
+{
+	switch( operation )
+	{
+		case Merge::Add :
+		case Merge::Atop :
+		case Merge::Matte :
+		case Merge::Over :
+		case Merge::Under :
+			return true;
+		default :
+			return false;
+	}
+}
+
+// Returns true if an input with no valid pixels can also be
+// omitted when it is the first layer. This requires that using
+// the next layer to initialise the result gives the same result
+// as compositing that layer over black.
+bool emptyFirstLayersAreNeutral( Merge::Operation operation )
+{
+	switch( operation )
+	{
+		case Merge::Add :
+		case Merge::Over :
+		case Merge::Under :
+			return true;
+		default :
+			return false;
+	}
+}
+
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// Layer
+//////////////////////////////////////////////////////////////////////////
+
+struct Merge::Layer
+{
+
+	Layer()
+		:	image( NULL ), hasChannel( false ), hasAlpha( false )
+	{
+	}
+
+	// NULL for an input with no valid pixels in the tile.
+	const ImagePlug *image;
+	Box2i validBound;
+	bool hasChannel;
+	bool hasAlpha;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// Merge
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( Merge );
 
 size_t Merge::g_firstPlugIndex = 0;
@@ -84,6 +141,8 @@ Merge::Merge( const std::string &name )
 		)
 	);
 
+	addChild( new CompoundObjectPlug( "__inputIndex", Plug::Out, new CompoundObject() ) );
+
 	// We don't ever want to change these, so we make pass-through connections.
 	outPlug()->formatPlug()->setInput( inPlug()->formatPlug() );
 	outPlug()->metadataPlug()->setInput( inPlug()->metadataPlug() );
@@ -103,11 +162,21 @@ const Gaffer::IntPlug *Merge::operationPlug() const
 	return getChild<IntPlug>( g_firstPlugIndex );
 }
 
+Gaffer::CompoundObjectPlug *Merge::inputIndexPlug()
+{
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 1 );
+}
+
+const Gaffer::CompoundObjectPlug *Merge::inputIndexPlug() const
+{
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 1 );
+}
+
 void Merge::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	ImageProcessor::affects( input, outputs );
 
-	if( input == operationPlug() )
+	if( input == operationPlug() || input == inputIndexPlug() )
 	{
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
@@ -116,10 +185,125 @@ void Merge::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 		if( inputImage->parent<ArrayPlug>() == inPlugs() )
 		{
 			outputs.push_back( outPlug()->getChild<ValuePlug>( input->getName() ) );
+			if( input == inputImage->dataWindowPlug() )
+			{
+				outputs.push_back( inputIndexPlug() );
+			}
 		}
 	}
 }
 
+void Merge::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	ImageProcessor::hash( output, context, h );
+
+	if( output == inputIndexPlug() )
+	{
+		for( ImagePlugIterator it( inPlugs() ); !it.done(); ++it )
+		{
+			if( (*it)->getInput<ValuePlug>() )
+			{
+				(*it)->dataWindowPlug()->hash( h );
+			}
+			else
+			{
+				h.append( false );
+			}
+		}
+	}
+}
+
+void Merge::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
+{
+	if( output == inputIndexPlug() )
+	{
+		// Find the range of tiles covered by each
+		// connected input, and by all inputs together.
+		IntVectorDataPtr connectedData = new IntVectorData;
+		std::vector<int> &connected = connectedData->writable();
+		std::vector<Box2i> inputTiles;
+		Box2i tileWindow;
+
+		int i = 0;
+		for( ImagePlugIterator it( inPlugs() ); !it.done(); ++it, ++i )
+		{
+			if( !(*it)->getInput<ValuePlug>() )
+			{
+				continue;
+			}
+
+			connected.push_back( i );
+			const Box2i dataWindow = (*it)->dataWindowPlug()->getValue();
+			if( GafferImage::empty( dataWindow ) )
+			{
+				inputTiles.push_back( Box2i() );
+				continue;
+			}
+
+			const Box2i tiles(
+				ImagePlug::tileOrigin( dataWindow.min ) / ImagePlug::tileSize(),
+				ImagePlug::tileOrigin( dataWindow.max - V2i( 1 ) ) / ImagePlug::tileSize() + V2i( 1 )
+			);
+			inputTiles.push_back( tiles );
+			tileWindow.extendBy( tiles );
+		}
+
+		// Build a grid listing the inputs which overlap each tile,
+		// stored as a flat list of inputs with offsets into it
+		// for each tile.
+		IntVectorDataPtr offsetsData = new IntVectorData;
+		IntVectorDataPtr inputsData = new IntVectorData;
+		if( !GafferImage::empty( tileWindow ) )
+		{
+			std::vector<int> &offsets = offsetsData->writable();
+			std::vector<int> &inputs = inputsData->writable();
+			const V2i size = tileWindow.size();
+			offsets.resize( size.x * size.y + 1, 0 );
+
+			for( size_t j = 0, e = connected.size(); j < e; ++j )
+			{
+				const Box2i &tiles = inputTiles[j];
+				for( int y = tiles.min.y; y < tiles.max.y; ++y )
+				{
+					for( int x = tiles.min.x; x < tiles.max.x; ++x )
+					{
+						offsets[GafferImage::index( V2i( x, y ), tileWindow ) + 1]++;
+					}
+				}
+			}
+
+			for( size_t j = 1, e = offsets.size(); j < e; ++j )
+			{
+				offsets[j] += offsets[j-1];
+			}
+
+			inputs.resize( offsets.back() );
+			std::vector<int> next( offsets.begin(), offsets.end() - 1 );
+			for( size_t j = 0, e = connected.size(); j < e; ++j )
+			{
+				const Box2i &tiles = inputTiles[j];
+				for( int y = tiles.min.y; y < tiles.max.y; ++y )
+				{
+					for( int x = tiles.min.x; x < tiles.max.x; ++x )
+					{
+						inputs[next[GafferImage::index( V2i( x, y ), tileWindow )]++] = connected[j];
+					}
+				}
+			}
+		}
+
+		CompoundObjectPtr result = new CompoundObject;
+		result->members()["connected"] = connectedData;
+		result->members()["tileWindow"] = new Box2iData( tileWindow );
+		result->members()["offsets"] = offsetsData;
+		result->members()["inputs"] = inputsData;
+		static_cast<CompoundObjectPlug *>( output )->setValue( result );
+		return;
+	}
+
+	ImageProcessor::compute( output, context );
+}
+
 void Merge::hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageProcessor::hashDataWindow( output, context, h );
@@ -190,26 +374,20 @@ void Merge::hashChannelData( const GafferImage::ImagePlug *output, const Gaffer:
 
 	const std::string channelName = context->get<std::string>( ImagePlug::channelNameContextName );
 	const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
-	const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
-
-	for( ImagePlugIterator it( inPlugs() ); !it.done(); ++it )
-	{
-		if( !(*it)->getInput<ValuePlug>() )
-		{
-			continue;
-		}
 
-		IECore::ConstStringVectorDataPtr channelNamesData = (*it)->channelNamesPlug()->getValue();
-		const std::vector<std::string> &channelNames = channelNamesData->readable();
+	std::vector<Layer> tileLayers;
+	layers( (Operation)operationPlug()->getValue(), channelName, tileOrigin, tileLayers );
 
-		if( channelExists( channelNames, channelName ) )
+	for( std::vector<Layer>::const_iterator it = tileLayers.begin(), eIt = tileLayers.end(); it != eIt; ++it )
+	{
+		if( it->hasChannel )
 		{
-			(*it)->channelDataPlug()->hash( h );
+			it->image->channelDataPlug()->hash( h );
 		}
 
-		if( channelExists( channelNames, "A" ) )
+		if( it->hasAlpha )
 		{
-			h.append( (*it)->channelDataHash( "A", tileOrigin ) );
+			h.append( it->image->channelDataHash( "A", tileOrigin ) );
 		}
 
 		// The hash of the channel data we include above represents just the data in
@@ -222,8 +400,7 @@ void Merge::hashChannelData( const GafferImage::ImagePlug *output, const Gaffer:
 		// input data windows, we may be using/revealing the invalid parts of a tile. We
 		// deal with this in computeChannelData() by treating the invalid parts as black,
 		// and must therefore hash in the valid bound here to take that into account.
-		const Box2i validBound = boxIntersection( tileBound, (*it)->dataWindowPlug()->getValue() );
-		h.append( validBound );
+		h.append( it->validBound );
 	}
 
 	operationPlug()->hash( h );
@@ -231,78 +408,178 @@ void Merge::hashChannelData( const GafferImage::ImagePlug *output, const Gaffer:
 
 IECore::ConstFloatVectorDataPtr Merge::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	switch( operationPlug()->getValue() )
+	const Operation operation = (Operation)operationPlug()->getValue();
+
+	std::vector<Layer> tileLayers;
+	layers( operation, channelName, tileOrigin, tileLayers );
+
+	switch( operation )
 	{
 		case Add :
-			return merge( opAdd, channelName, tileOrigin);
+			return merge( opAdd, tileLayers, channelName, tileOrigin );
 		case Atop :
-			return merge( opAtop, channelName, tileOrigin);
+			return merge( opAtop, tileLayers, channelName, tileOrigin );
 		case Divide :
-			return merge( opDivide, channelName, tileOrigin);
+			return merge( opDivide, tileLayers, channelName, tileOrigin );
 		case In :
-			return merge( opIn, channelName, tileOrigin);
+			return merge( opIn, tileLayers, channelName, tileOrigin );
 		case Out :
-			return merge( opOut, channelName, tileOrigin);
+			return merge( opOut, tileLayers, channelName, tileOrigin );
 		case Mask :
-			return merge( opMask, channelName, tileOrigin);
+			return merge( opMask, tileLayers, channelName, tileOrigin );
 		case Matte :
-			return merge( opMatte, channelName, tileOrigin);
+			return merge( opMatte, tileLayers, channelName, tileOrigin );
 		case Multiply :
-			return merge( opMultiply, channelName, tileOrigin);
+			return merge( opMultiply, tileLayers, channelName, tileOrigin );
 		case Over :
-			return merge( opOver, channelName, tileOrigin);
+			return merge( opOver, tileLayers, channelName, tileOrigin );
 		case Subtract :
-			return merge( opSubtract, channelName, tileOrigin);
+			return merge( opSubtract, tileLayers, channelName, tileOrigin );
 		case Difference :
-			return merge( opDifference, channelName, tileOrigin);
+			return merge( opDifference, tileLayers, channelName, tileOrigin );
 		case Under :
-			return merge( opUnder, channelName, tileOrigin);
+			return merge( opUnder, tileLayers, channelName, tileOrigin );
 	}
 
 	throw Exception( "Merge::computeChannelData : Invalid operation mode." );
 }
 
+void Merge::layers( Operation operation, const std::string &channelName, const Imath::V2i &tileOrigin, std::vector<Layer> &layers ) const
+{
+	ConstCompoundObjectPtr index;
+	{
+		// The index doesn't depend on the channel or tile, so we evaluate
+		// it in a context without them. Otherwise we'd be hashing it
+		// separately for every tile of every channel.
+		Context::EditableScope indexScope( Context::current() );
+		indexScope.remove( ImagePlug::channelNameContextName );
+		indexScope.remove( ImagePlug::tileOriginContextName );
+		index = inputIndexPlug()->getValue();
+	}
+
+	const std::vector<int> &connected = index->member<IntVectorData>( "connected" )->readable();
+	const Box2i &tileWindow = index->member<Box2iData>( "tileWindow" )->readable();
+	const std::vector<int> &offsets = index->member<IntVectorData>( "offsets" )->readable();
+	const std::vector<int> &inputs = index->member<IntVectorData>( "inputs" )->readable();
+
+	// Find the inputs which overlap this tile.
+	std::vector<int>::const_iterator overlappingBegin = inputs.end();
+	std::vector<int>::const_iterator overlappingEnd = inputs.end();
+	const V2i tile = tileOrigin / ImagePlug::tileSize();
+	if( contains( tileWindow, tile ) )
+	{
+		const size_t i = GafferImage::index( tile, tileWindow );
+		overlappingBegin = inputs.begin() + offsets[i];
+		overlappingEnd = inputs.begin() + offsets[i+1];
+	}
+
+	// Decide which inputs we need to consider. When empty layers are
+	// neutral we need only visit the overlapping inputs, unless the
+	// first connected input doesn't overlap and still has an effect
+	// as the first layer. Otherwise we must visit all inputs, but can
+	// still avoid fetching data for the ones which don't overlap.
+	std::vector<int> candidates;
+	if( emptyLayersAreNeutral( operation ) )
+	{
+		if( !emptyFirstLayersAreNeutral( operation ) && connected.size() && ( overlappingBegin == overlappingEnd || *overlappingBegin != connected.front() ) )
+		{
+			candidates.push_back( connected.front() );
+		}
+		candidates.insert( candidates.end(), overlappingBegin, overlappingEnd );
+	}
+	else
+	{
+		candidates = connected;
+	}
+
+	const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
+	std::vector<int>::const_iterator overlappingIt = overlappingBegin;
+	for( std::vector<int>::const_iterator it = candidates.begin(), eIt = candidates.end(); it != eIt; ++it )
+	{
+		// Both lists are sorted, so we can step through the overlapping
+		// inputs in tandem with the candidates.
+		while( overlappingIt != overlappingEnd && *overlappingIt < *it )
+		{
+			++overlappingIt;
+		}
+
+		Layer layer;
+		if( overlappingIt != overlappingEnd && *overlappingIt == *it )
+		{
+			const ImagePlug *image = inPlugs()->getChild<ImagePlug>( *it );
+
+			IECore::ConstStringVectorDataPtr channelNamesData = image->channelNamesPlug()->getValue();
+			const std::vector<std::string> &channelNames = channelNamesData->readable();
+
+			layer.hasChannel = channelExists( channelNames, channelName );
+			layer.hasAlpha = channelExists( channelNames, "A" );
+			if( layer.hasChannel || layer.hasAlpha )
+			{
+				layer.validBound = intersection( tileBound, image->dataWindowPlug()->getValue() );
+				if( !GafferImage::empty( layer.validBound ) )
+				{
+					layer.image = image;
+				}
+			}
+
+			if( !layer.image )
+			{
+				layer = Layer();
+			}
+		}
+
+		if( !layer.image )
+		{
+			// An input with no valid pixels in this tile. We don't
+			// need its data, and may not need it at all.
+			if( layers.empty() ? emptyFirstLayersAreNeutral( operation ) : emptyLayersAreNeutral( operation ) )
+			{
+				continue;
+			}
+		}
+
+		layers.push_back( layer );
+	}
+}
+
 template<typename F>
-IECore::ConstFloatVectorDataPtr Merge::merge( F f, const std::string &channelName, const Imath::V2i &tileOrigin ) const
+IECore::ConstFloatVectorDataPtr Merge::merge( F f, const std::vector<Layer> &layers, const std::string &channelName, const Imath::V2i &tileOrigin ) const
 {
+	if( layers.empty() )
+	{
+		return ImagePlug::blackTile();
+	}
+
 	FloatVectorDataPtr resultData = NULL;
 	// Temporary buffer for computing the alpha of intermediate composited layers.
 	FloatVectorDataPtr resultAlphaData = NULL;
 
 	const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
 
-	for( ImagePlugIterator it( inPlugs() ); !it.done(); ++it )
+	for( std::vector<Layer>::const_iterator it = layers.begin(), eIt = layers.end(); it != eIt; ++it )
 	{
-		if( !(*it)->getInput<ValuePlug>() )
-		{
-			continue;
-		}
-
-		IECore::ConstStringVectorDataPtr channelNamesData = (*it)->channelNamesPlug()->getValue();
-		const std::vector<std::string> &channelNames = channelNamesData->readable();
-
 		ConstFloatVectorDataPtr channelData;
 		ConstFloatVectorDataPtr alphaData;
 
-		if( channelExists( channelNames, channelName ) )
+		if( it->hasChannel )
 		{
-			channelData = (*it)->channelDataPlug()->getValue();
+			channelData = it->image->channelDataPlug()->getValue();
 		}
 		else
 		{
 			channelData = ImagePlug::blackTile();
 		}
 
-		if( channelExists( channelNames, "A" ) )
+		if( it->hasAlpha )
 		{
-			alphaData = (*it)->channelData( "A", tileOrigin );
+			alphaData = it->image->channelData( "A", tileOrigin );
 		}
 		else
 		{
 			alphaData = ImagePlug::blackTile();
 		}
 
-		const Box2i validBound = boxIntersection( tileBound, (*it)->dataWindowPlug()->getValue() );
+		const Box2i &validBound = it->validBound;
 
 		if( !resultData )
 		{
@@ -35,12 +35,18 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <set>
+
 #include "boost/bind.hpp"
 #include "boost/filesystem/path.hpp"
 #include "boost/regex.hpp"
+#include "boost/thread.hpp"
+
+#include "tbb/concurrent_queue.h"
 
 #include "OpenEXR/half.h"
 
+#include "OpenImageIO/imageio.h"
 #include "OpenImageIO/imagecache.h"
 OIIO_NAMESPACE_USING
 
@@ -81,15 +87,11 @@ ImageCache *imageCache()
 		if( lock.upgrade_to_writer() )
 		{
 			cache = ImageCache::create();
-			// ImageReaderTest.testOIIOJpgRead exposes a bug in
-			// OpenImageIO where ImageCache::get_pixels() returns
-			// incorrect data when reading from non-float images.
-			// By forcing the image to be float on loading, we
-			// can work around that problem.
-			/// \todo Consider removing this once the bug is fixed in
-			/// OIIO - and test any performance implications of performing
-			/// the conversion in get_pixels() rather than immediately on load.
-			cache->attribute( "forcefloat", 1 );
+			// We deliberately don't set "forcefloat", so that
+			// the cache holds tiles at the native precision of the
+			// file. Half float images therefore take half the memory
+			// and 8 bit images a quarter, and we convert to float
+			// lazily as tiles are requested in computeChannelData().
 
 			// Set an initial cache size of 500Mb
 			cache->attribute( "max_memory_MB", 500.0f );
@@ -98,10 +100,11 @@ ImageCache *imageCache()
 	return cache;
 }
 
-// Returns the OIIO ImageSpec for the given filename in the current
-// context. Throws if the file is invalid, and returns NULL if
-// the filename is empty.
-const ImageSpec *imageSpec( std::string &fileName, OpenImageIOReader::MissingFrameMode mode, const OpenImageIOReader *node, const Context *context )
+// Returns the OIIO ImageSpec for the given filename and MIP level
+// in the current context. Throws if the file is invalid, and returns
+// NULL if the filename is empty. The MIP level is clamped to the levels
+// available in the file.
+const ImageSpec *imageSpec( std::string &fileName, int &mipLevel, OpenImageIOReader::MissingFrameMode mode, const OpenImageIOReader *node, const Context *context )
 {
 	if( fileName.empty() )
 	{
@@ -143,7 +146,7 @@ const ImageSpec *imageSpec( std::string &fileName, OpenImageIOReader::MissingFra
 				ContextPtr holdContext = new Context( *context, Context::Shared );
 				holdContext->setFrame( *fIt );
 
-				return imageSpec( fileName, OpenImageIOReader::Error, node, holdContext.get() );
+				return imageSpec( fileName, mipLevel, OpenImageIOReader::Error, node, holdContext.get() );
 			}
 
 			// if we got here, there was no suitable file sequence
@@ -155,6 +158,21 @@ const ImageSpec *imageSpec( std::string &fileName, OpenImageIOReader::MissingFra
 		}
 	}
 
+	if( mipLevel > 0 )
+	{
+		int numMipLevels = 1;
+		cache->get_image_info( ustring( resolvedFileName ), 0, 0, ustring( "miplevels" ), TypeDesc::INT, &numMipLevels );
+		mipLevel = std::min( mipLevel, std::max( numMipLevels - 1, 0 ) );
+		if( mipLevel > 0 )
+		{
+			spec = cache->imagespec( ustring( resolvedFileName ), 0, mipLevel );
+			if( !spec )
+			{
+				throw( IECore::Exception( cache->geterror() ) );
+			}
+		}
+	}
+
 	// we overwrite the incoming fileName with
 	// the final successful fileName because
 	// computeChannelData needs to know the real
@@ -167,6 +185,152 @@ const ImageSpec *imageSpec( std::string &fileName, OpenImageIOReader::MissingFra
 
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// Read-ahead. When playing back or scrubbing a sequence, the latency of
+// opening files and reading tiles (particularly from network storage)
+// dominates. We hide it by loading the tiles for upcoming frames into the
+// image cache on a small pool of background threads, so that by the time
+// they are requested by computeChannelData() they are already resident.
+// We use dedicated threads rather than TBB tasks because the work is I/O
+// bound, and would otherwise tie up the workers needed for computation.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct ReadAheadRequest
+{
+
+	ReadAheadRequest()
+		:	mipLevel( 0 )
+	{
+	}
+
+	ReadAheadRequest( const std::string &fileName, int mipLevel, const V2i &tileOrigin )
+		:	fileName( fileName ), mipLevel( mipLevel ), tileOrigin( tileOrigin )
+	{
+	}
+
+	bool operator < ( const ReadAheadRequest &rhs ) const
+	{
+		if( fileName != rhs.fileName )
+		{
+			return fileName < rhs.fileName;
+		}
+		if( mipLevel != rhs.mipLevel )
+		{
+			return mipLevel < rhs.mipLevel;
+		}
+		if( tileOrigin.x != rhs.tileOrigin.x )
+		{
+			return tileOrigin.x < rhs.tileOrigin.x;
+		}
+		return tileOrigin.y < rhs.tileOrigin.y;
+	}
+
+	std::string fileName;
+	int mipLevel;
+	V2i tileOrigin;
+
+};
+
+class ReadAheadQueue : boost::noncopyable
+{
+
+	public :
+
+		static ReadAheadQueue &instance()
+		{
+			// Deliberately leaked, so that we don't destroy
+			// the queue while the threads are blocked on it
+			// during shutdown.
+			static ReadAheadQueue *q = new ReadAheadQueue;
+			return *q;
+		}
+
+		// Queues the request unless it has been made recently.
+		// Returns immediately - the request is dropped rather than
+		// blocking if the queue is already full.
+		void push( const ReadAheadRequest &request )
+		{
+			{
+				boost::lock_guard<boost::mutex> lock( m_requestedMutex );
+				if( !m_requested.insert( request ).second )
+				{
+					return;
+				}
+				if( m_requested.size() > g_maxRequested )
+				{
+					m_requested.clear();
+				}
+			}
+			m_queue.try_push( request );
+		}
+
+	private :
+
+		ReadAheadQueue()
+		{
+			m_queue.set_capacity( g_capacity );
+			for( int i = 0; i < g_numThreads; ++i )
+			{
+				boost::thread thread( boost::bind( &ReadAheadQueue::readThread, this ) );
+				thread.detach();
+			}
+		}
+
+		void readThread()
+		{
+			std::vector<float> buffer;
+			while( true )
+			{
+				ReadAheadRequest request;
+				m_queue.pop( request );
+
+				ImageCache *cache = imageCache();
+				const ustring fileName( request.fileName );
+				const ImageSpec *spec = cache->imagespec( fileName, 0, request.mipLevel );
+				if( !spec )
+				{
+					// The frame may legitimately be missing. Clear the
+					// error so that it doesn't accumulate on this thread.
+					cache->geterror();
+					continue;
+				}
+
+				const Format format( Imath::Box2i( Imath::V2i( spec->full_x, spec->full_y ), Imath::V2i( spec->full_width + spec->full_x, spec->full_height + spec->full_y ) ) );
+				const int y = format.toEXRSpace( request.tileOrigin.y + ImagePlug::tileSize() - 1 );
+
+				buffer.resize( ImagePlug::tileSize() * ImagePlug::tileSize() * spec->nchannels );
+				if( !cache->get_pixels(
+					fileName,
+					0, request.mipLevel,
+					request.tileOrigin.x, request.tileOrigin.x + ImagePlug::tileSize(),
+					y, y + ImagePlug::tileSize(),
+					0, 1,
+					0, spec->nchannels,
+					TypeDesc::FLOAT,
+					&(buffer[0])
+				) )
+				{
+					cache->geterror();
+				}
+			}
+		}
+
+		static const int g_numThreads = 4;
+		static const int g_capacity = 1024;
+		static const size_t g_maxRequested = 100000;
+
+		tbb::concurrent_bounded_queue<ReadAheadRequest> m_queue;
+
+		boost::mutex m_requestedMutex;
+		std::set<ReadAheadRequest> m_requested;
+
+};
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // Utility for converting OIIO::TypeDesc types to IECore::Data types.
 //////////////////////////////////////////////////////////////////////////
@@ -368,6 +532,8 @@ OpenImageIOReader::OpenImageIOReader( const std::string &name )
 	addChild( new IntPlug( "refreshCount" ) );
 	addChild( new IntPlug( "missingFrameMode", Plug::In, Error, /* min */ Error, /* max */ Hold ) );
 	addChild( new IntVectorDataPlug( "availableFrames", Plug::Out, new IntVectorData ) );
+	addChild( new IntPlug( "mipLevel", Plug::In, 0, /* min */ 0 ) );
+	addChild( new IntPlug( "readAhead", Plug::In, 0, /* min */ 0 ) );
 
 	// disable caching on our outputs, as OIIO is already doing caching for us.
 	for( OutputPlugIterator it( outPlug() ); !it.done(); ++it )
@@ -422,6 +588,26 @@ const Gaffer::IntVectorDataPlug *OpenImageIOReader::availableFramesPlug() const
 	return getChild<IntVectorDataPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::IntPlug *OpenImageIOReader::mipLevelPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::IntPlug *OpenImageIOReader::mipLevelPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::IntPlug *OpenImageIOReader::readAheadPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::IntPlug *OpenImageIOReader::readAheadPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 5 );
+}
+
 size_t OpenImageIOReader::supportedExtensions( std::vector<std::string> &extensions )
 {
 	std::string attr;
@@ -455,7 +641,7 @@ void OpenImageIOReader::affects( const Gaffer::Plug *input, AffectedPlugsContain
 		outputs.push_back( availableFramesPlug() );
 	}
 
-	if( input == fileNamePlug() || input == refreshCountPlug() || input == missingFrameModePlug() )
+	if( input == fileNamePlug() || input == refreshCountPlug() || input == missingFrameModePlug() || input == mipLevelPlug() )
 	{
 		for( ValuePlugIterator it( outPlug() ); !it.done(); ++it )
 		{
@@ -517,12 +703,38 @@ void OpenImageIOReader::hashFileName( const Gaffer::Context *context, IECore::Mu
 	}
 }
 
+void OpenImageIOReader::readAhead( const std::string &fileName, int mipLevel, const Imath::V2i &tileOrigin, const Gaffer::Context *context ) const
+{
+	const int numFrames = readAheadPlug()->getValue();
+	if( !numFrames || !( Context::substitutions( fileName ) & Context::FrameSubstitutions ) )
+	{
+		return;
+	}
+
+	ConstIntVectorDataPtr framesData = availableFramesPlug()->getValue();
+	const std::vector<int> &frames = framesData->readable();
+	std::vector<int>::const_iterator fIt = std::upper_bound( frames.begin(), frames.end(), (int)context->getFrame() );
+	if( fIt == frames.end() )
+	{
+		return;
+	}
+
+	ReadAheadQueue &queue = ReadAheadQueue::instance();
+	ContextPtr frameContext = new Context( *context, Context::Borrowed );
+	for( int i = 0; i < numFrames && fIt != frames.end(); ++i, ++fIt )
+	{
+		frameContext->setFrame( *fIt );
+		queue.push( ReadAheadRequest( frameContext->substitute( fileName ), mipLevel, tileOrigin ) );
+	}
+}
+
 void OpenImageIOReader::hashFormat( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageNode::hashFormat( output, context, h );
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 }
 
 GafferImage::Format OpenImageIOReader::computeFormat( const Gaffer::Context *context, const ImagePlug *parent ) const
@@ -532,7 +744,8 @@ GafferImage::Format OpenImageIOReader::computeFormat( const Gaffer::Context *con
 	// match the format of the Hold frame.
 	MissingFrameMode mode = (MissingFrameMode)missingFrameModePlug()->getValue();
 	mode = ( mode == Black ) ? Hold : mode;
-	const ImageSpec *spec = imageSpec( fileName, mode, this, context );
+	int mipLevel = mipLevelPlug()->getValue();
+	const ImageSpec *spec = imageSpec( fileName, mipLevel, mode, this, context );
 	if( !spec )
 	{
 		return FormatPlug::getDefaultFormat( context );
@@ -553,12 +766,14 @@ void OpenImageIOReader::hashDataWindow( const GafferImage::ImagePlug *output, co
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 }
 
 Imath::Box2i OpenImageIOReader::computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
 	std::string fileName = fileNamePlug()->getValue();
-	const ImageSpec *spec = imageSpec( fileName, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
+	int mipLevel = mipLevelPlug()->getValue();
+	const ImageSpec *spec = imageSpec( fileName, mipLevel, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
 	if( !spec )
 	{
 		return parent->dataWindowPlug()->defaultValue();
@@ -576,12 +791,14 @@ void OpenImageIOReader::hashMetadata( const GafferImage::ImagePlug *output, cons
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 }
 
 IECore::ConstCompoundObjectPtr OpenImageIOReader::computeMetadata( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
 	std::string fileName = fileNamePlug()->getValue();
-	const ImageSpec *spec = imageSpec( fileName, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
+	int mipLevel = mipLevelPlug()->getValue();
+	const ImageSpec *spec = imageSpec( fileName, mipLevel, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
 	if( !spec )
 	{
 		return parent->metadataPlug()->defaultValue();
@@ -599,12 +816,14 @@ void OpenImageIOReader::hashChannelNames( const GafferImage::ImagePlug *output,
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 }
 
 IECore::ConstStringVectorDataPtr OpenImageIOReader::computeChannelNames( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
 	std::string fileName = fileNamePlug()->getValue();
-	const ImageSpec *spec = imageSpec( fileName, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
+	int mipLevel = mipLevelPlug()->getValue();
+	const ImageSpec *spec = imageSpec( fileName, mipLevel, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
 	if( !spec )
 	{
 		return parent->channelNamesPlug()->defaultValue();
@@ -623,12 +842,18 @@ void OpenImageIOReader::hashChannelData( const GafferImage::ImagePlug *output, c
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 }
 
 IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	std::string fileName = fileNamePlug()->getValue();
-	const ImageSpec *spec = imageSpec( fileName, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
+	const std::string unresolvedFileName = fileNamePlug()->getValue();
+	std::string fileName = unresolvedFileName;
+	int mipLevel = mipLevelPlug()->getValue();
+	const ImageSpec *spec = imageSpec( fileName, mipLevel, (MissingFrameMode)missingFrameModePlug()->getValue(), this, context );
+
+	readAhead( unresolvedFileName, mipLevel, tileOrigin, context );
+
 	if( !spec )
 	{
 		return parent->channelDataPlug()->defaultValue();
@@ -645,16 +870,22 @@ IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std
 	Format format( Imath::Box2i( Imath::V2i( spec->full_x, spec->full_y ), Imath::V2i( spec->full_width + spec->full_x, spec->full_height + spec->full_y ) ) );
 	const int newY = format.toEXRSpace( tileOrigin.y + ImagePlug::tileSize() - 1 );
 
-	std::vector<float> channelData( ImagePlug::tileSize() * ImagePlug::tileSize() );
-	size_t channelIndex = channelIt - spec->channelnames.begin();
+	// ImageReaderTest.testOIIOJpgRead exposes a bug in OpenImageIO
+	// where ImageCache::get_pixels() returns incorrect data when converting
+	// a single channel of a non-float image. We therefore ask for the channel
+	// in its native format, which requires no conversion in OIIO, and do
+	// the conversion to float ourselves.
+	const size_t channelIndex = channelIt - spec->channelnames.begin();
+	const TypeDesc channelFormat = spec->channelformat( channelIndex );
+	std::vector<char> channelData( ImagePlug::tileSize() * ImagePlug::tileSize() * channelFormat.size() );
 	imageCache()->get_pixels(
 		ustring( fileName ),
-		0, 0, // subimage, miplevel
+		0, mipLevel, // subimage, miplevel
 		tileOrigin.x, tileOrigin.x + ImagePlug::tileSize(),
 		newY, newY + ImagePlug::tileSize(),
 		0, 1,
 		channelIndex, channelIndex + 1,
-		TypeDesc::FLOAT,
+		channelFormat,
 		&(channelData[0])
 	);
 
@@ -663,10 +894,16 @@ IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std
 	vector<float> &result = resultData->writable();
 	result.resize( ImagePlug::tileSize() * ImagePlug::tileSize() );
 
-	// Flip the tile in the Y axis to convert it to our internal image data representation.
+	// Convert to float, flipping the tile in the Y axis to convert it to our
+	// internal image data representation.
+	const size_t scanlineSize = ImagePlug::tileSize() * channelFormat.size();
 	for( int y = 0; y < ImagePlug::tileSize(); ++y )
 	{
-		memcpy( &(result[ ( ImagePlug::tileSize() - y - 1 ) * ImagePlug::tileSize() ]), &(channelData[ y * ImagePlug::tileSize() ]), sizeof(float)*ImagePlug::tileSize()  );
+		convert_types(
+			channelFormat, &(channelData[ y * scanlineSize ]),
+			TypeDesc::FLOAT, &(result[ ( ImagePlug::tileSize() - y - 1 ) * ImagePlug::tileSize() ]),
+			ImagePlug::tileSize()
+		);
 	}
 
 	return resultData;
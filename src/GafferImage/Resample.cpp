@@ -535,10 +535,11 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 	Filter2DPtr filter = createFilter( filterPlug()->getValue(), filterWidthPlug()->getValue(), ratio );
 	const unsigned passes = requiredPasses( this, parent, filter.get() );
 
+	const Box2i region = inputRegion( tileOrigin, passes, ratio, offset, filter.get() );
 	Sampler sampler(
 		passes == Vertical ? horizontalPassPlug() : inPlug(),
 		channelName,
-		inputRegion( tileOrigin, passes, ratio, offset, filter.get() ),
+		region,
 		(Sampler::BoundingMode)boundingModePlug()->getValue()
 	);
 
@@ -549,6 +550,12 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 	resultData->writable().resize( ImagePlug::tileSize() * ImagePlug::tileSize() );
 	std::vector<float>::iterator pIt = resultData->writable().begin();
 
+	// Rather than sample the input a pixel at a time, we fetch
+	// whole rows from the Sampler and then filter from those.
+
+	const V2i regionSize = region.size();
+	std::vector<float> input;
+
 	if( passes == Both )
 	{
 		// When the filter isn't separable we must perform all the
@@ -557,6 +564,12 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 		// version can be validated - use the SinglePass debug mode
 		// to force the use of this code path.
 
+		input.resize( regionSize.x * regionSize.y );
+		for( int y = region.min.y; y < region.max.y; ++y )
+		{
+			sampler.sampleRow( y, region.min.x, region.max.x, &input[( y - region.min.y ) * regionSize.x] );
+		}
+
 		V2i oP; // output pixel position
 		V2f iP; // input pixel position (floating point)
 		V2i iPI; // input pixel position (floored to int)
@@ -577,9 +590,9 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 				float totalW = 0.0f;
 				for( fP.y = -filterRadius.y; fP.y<= filterRadius.y; ++fP.y )
 				{
+					const float *row = &input[( iPI.y + fP.y - region.min.y ) * regionSize.x] + ( iPI.x - region.min.x );
 					for( fP.x = -filterRadius.x; fP.x<= filterRadius.x; ++fP.x )
 					{
-						/// \todo version of sample taking V2i.
 						const float w = (*filter)(
 							ratio.x * (fP.x - ( iPF.x - 0.5f )),
 							ratio.y * (fP.y - ( iPF.y - 0.5f ))
@@ -590,7 +603,7 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 							continue;
 						}
 
-						v += w * sampler.sample( iPI.x + fP.x, iPI.y + fP.y );
+						v += w * row[fP.x];
 						totalW += w;
 					}
 				}
@@ -612,28 +625,34 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 		// it is cached for use in the vertical pass. The HorizontalPass
 		// debug mode causes this pass to be output directly for inspection.
 
-		// Pixels in the same column share the same filter weights, so
-		// we precompute the weights now to avoid repeating work later.
+		// Pixels in the same column share the same filter weights and
+		// input positions, so we precompute them now to avoid repeating
+		// work later.
 		std::vector<float> weights;
 		filterWeights( filter.get(), filterRadius.x, tileBound.min.x, ratio.x, offset.x, Horizontal, weights );
 
-		V2i oP; // output pixel position
-		float iX; // input pixel x coordinate (floating point)
-		int iXI; // input pixel position (floored to int)
+		std::vector<int> inputOffsets;
+		inputOffsets.reserve( ImagePlug::tileSize() );
+		for( int oX = tileBound.min.x; oX < tileBound.max.x; ++oX )
+		{
+			const float iX = ( oX + 0.5 ) / ratio.x + offset.x; // input pixel x coordinate (floating point)
+			int iXI; // input pixel position (floored to int)
+			OIIO::floorfrac( iX, &iXI );
+			inputOffsets.push_back( iXI - filterRadius.x - region.min.x );
+		}
 
-		for( oP.y = tileBound.min.y; oP.y < tileBound.max.y; ++oP.y )
+		input.resize( regionSize.x );
+		for( int oY = tileBound.min.y; oY < tileBound.max.y; ++oY )
 		{
+			sampler.sampleRow( oY, region.min.x, region.max.x, &input[0] );
+
 			std::vector<float>::const_iterator wIt = weights.begin();
-			for( oP.x = tileBound.min.x; oP.x < tileBound.max.x; ++oP.x )
+			for( std::vector<int>::const_iterator oIt = inputOffsets.begin(), oEIt = inputOffsets.end(); oIt != oEIt; ++oIt )
 			{
-
-				iX = ( oP.x + 0.5 ) / ratio.x + offset.x;
-				OIIO::floorfrac( iX, &iXI );
-
-				int fX; // relative filter position
+				const float *row = &input[*oIt];
 				float v = 0.0f;
 				float totalW = 0.0f;
-				for( fX = -filterRadius.x; fX<= filterRadius.x; ++fX )
+				for( int fX = 0, eX = 2 * filterRadius.x; fX <= eX; ++fX )
 				{
 					const float w = *wIt++;
 					if( w == 0.0f )
@@ -641,7 +660,7 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 						continue;
 					}
 
-					v += w * sampler.sample( iXI + fX, oP.y );
+					v += w * row[fX];
 					totalW += w;
 				}
 
@@ -656,44 +675,55 @@ IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string
 	}
 	else if( passes == Vertical )
 	{
-		V2i oP; // output pixel position
-		float iY; // input pixel position (floating point)
-		int iYI; // input pixel position (floored to int)
-
 		// Pixels in the same row share the same filter weights, so
 		// we precompute the weights now to avoid repeating work later.
 		std::vector<float> weights;
 		filterWeights( filter.get(), filterRadius.y, tileBound.min.y, ratio.y, offset.y, Vertical, weights );
 
-		for( oP.y = tileBound.min.y; oP.y < tileBound.max.y; ++oP.y )
+		// The input region spans the same columns as the tile.
+		assert( region.min.x == tileBound.min.x && region.max.x == tileBound.max.x );
+		input.resize( ImagePlug::tileSize() * regionSize.y );
+		for( int y = region.min.y; y < region.max.y; ++y )
+		{
+			sampler.sampleRow( y, tileBound.min.x, tileBound.max.x, &input[( y - region.min.y ) * ImagePlug::tileSize()] );
+		}
+
+		// Process a whole row of output pixels at once, accumulating
+		// the weighted input rows in turn. The inner loops have no
+		// dependencies between pixels, so can be vectorised.
+		std::vector<float> totals( ImagePlug::tileSize() );
+		float *result = &resultData->writable()[0];
+		for( int oY = tileBound.min.y; oY < tileBound.max.y; ++oY, result += ImagePlug::tileSize() )
 		{
-			iY = ( oP.y + 0.5 ) / ratio.y + offset.y;
+			const float iY = ( oY + 0.5 ) / ratio.y + offset.y; // input pixel position (floating point)
+			int iYI; // input pixel position (floored to int)
 			OIIO::floorfrac( iY, &iYI );
 
-			for( oP.x = tileBound.min.x; oP.x < tileBound.max.x; ++oP.x )
+			std::fill( totals.begin(), totals.end(), 0.0f );
+			float totalW = 0.0f;
+			std::vector<float>::const_iterator wIt = weights.begin() + ( oY - tileBound.min.y ) * ( filterRadius.y * 2 + 1);
+			for( int fY = -filterRadius.y; fY<= filterRadius.y; ++fY )
 			{
-				int fY; // relative filter position
-				float v = 0.0f;
-				float totalW = 0.0f;
-				std::vector<float>::const_iterator wIt = weights.begin() + ( oP.y - tileBound.min.y ) * ( filterRadius.y * 2 + 1);
-				for( fY = -filterRadius.y; fY<= filterRadius.y; ++fY )
+				const float w = *wIt++;
+				if( w == 0.0f )
 				{
-					const float w = *wIt++;
-					if( w == 0.0f )
-					{
-						continue;
-					}
-
-					v += w * sampler.sample( oP.x, iYI + fY );
-					totalW += w;
+					continue;
 				}
 
-				if( totalW != 0.0f )
+				const float *row = &input[( iYI + fY - region.min.y ) * ImagePlug::tileSize()];
+				for( int x = 0; x < ImagePlug::tileSize(); ++x )
 				{
-					*pIt = v / totalW;
+					totals[x] += w * row[x];
 				}
+				totalW += w;
+			}
 
-				++pIt;
+			if( totalW != 0.0f )
+			{
+				for( int x = 0; x < ImagePlug::tileSize(); ++x )
+				{
+					result[x] = totals[x] / totalW;
+				}
 			}
 		}
 	}
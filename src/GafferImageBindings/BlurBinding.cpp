@@ -47,7 +47,12 @@ namespace GafferImageBindings
 
 void bindBlur()
 {
-	GafferBindings::DependencyNodeClass<Blur>();
+	scope s = GafferBindings::DependencyNodeClass<Blur>();
+
+	enum_<Blur::Mode>( "Mode" )
+		.value( "Exact", Blur::Exact )
+		.value( "Pyramid", Blur::Pyramid )
+	;
 }
 
 } // namespace GafferImageBindings
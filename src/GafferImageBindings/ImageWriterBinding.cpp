@@ -45,10 +45,47 @@
 using namespace GafferImage;
 using namespace GafferDispatchBindings;
 
-void GafferImageBindings::bindImageWriter()
+namespace
+{
+
+class ImageWriterWrapper : public TaskNodeWrapper<ImageWriter>
 {
 
-	typedef TaskNodeWrapper<ImageWriter> ImageWriterWrapper;
+	public :
+
+		ImageWriterWrapper( PyObject *self, const std::string &name )
+			:	TaskNodeWrapper<ImageWriter>( self, name )
+		{
+		}
+
+		virtual void executeSequence( const std::vector<float> &frames ) const
+		{
+			// ImageWriter::executeSequence() writes frames concurrently
+			// using its own implementation of execute(), so we must fall
+			// back to executing frame by frame if a Python subclass has
+			// overridden execute() without also overriding executeSequence().
+			if( isSubclassed() && overridesExecuteOnly() )
+			{
+				GafferDispatch::TaskNode::executeSequence( frames );
+				return;
+			}
+			TaskNodeWrapper<ImageWriter>::executeSequence( frames );
+		}
+
+	private :
+
+		bool overridesExecuteOnly() const
+		{
+			IECorePython::ScopedGILLock gilLock;
+			return methodOverride( "execute" ) && !methodOverride( "executeSequence" );
+		}
+
+};
+
+} // namespace
+
+void GafferImageBindings::bindImageWriter()
+{
 
 	boost::python::scope s = TaskNodeClass<ImageWriter, ImageWriterWrapper>()
 		.def( "currentFileFormat", &ImageWriter::currentFileFormat )
@@ -39,6 +39,22 @@
 using namespace boost::python;
 using namespace GafferImage;
 
+namespace
+{
+
+IECore::FloatVectorDataPtr sampleRow( Sampler &sampler, int y, int xBegin, int xEnd )
+{
+	IECore::FloatVectorDataPtr result = new IECore::FloatVectorData;
+	result->writable().resize( std::max( xEnd - xBegin, 0 ) );
+	if( result->readable().size() )
+	{
+		sampler.sampleRow( y, xBegin, xEnd, &result->writable()[0] );
+	}
+	return result;
+}
+
+} // namespace
+
 namespace GafferImageBindings
 {
 
@@ -69,6 +85,7 @@ void bindSampler()
 		.def( "hash", (void (Sampler::*)( IECore::MurmurHash & ) const)&Sampler::hash )
 		.def( "sample", (float (Sampler::*)( float, float ) )&Sampler::sample )
 		.def( "sample", (float (Sampler::*)( int, int ) )&Sampler::sample )
+		.def( "sampleRow", &sampleRow )
 	;
 }
 
@@ -0,0 +1,77 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferImageTest/SamplerTest.h"
+
+using namespace std;
+using namespace Imath;
+using namespace GafferImage;
+
+namespace GafferImageTest
+{
+
+double sumPixels( const GafferImage::ImagePlug *imagePlug, const std::string &channelName, const Imath::Box2i &region, GafferImage::Sampler::BoundingMode boundingMode, bool useSampleRow )
+{
+	Sampler sampler( imagePlug, channelName, region, boundingMode );
+
+	double result = 0;
+	if( useSampleRow )
+	{
+		vector<float> row( region.size().x );
+		for( int y = region.min.y; y < region.max.y; ++y )
+		{
+			sampler.sampleRow( y, region.min.x, region.max.x, &row[0] );
+			for( vector<float>::const_iterator it = row.begin(), eIt = row.end(); it != eIt; ++it )
+			{
+				result += *it;
+			}
+		}
+	}
+	else
+	{
+		for( int y = region.min.y; y < region.max.y; ++y )
+		{
+			for( int x = region.min.x; x < region.max.x; ++x )
+			{
+				result += sampler.sample( x, y );
+			}
+		}
+	}
+
+	return result;
+}
+
+} // namespace GafferImageTest
@@ -42,6 +42,7 @@
 
 #include "GafferImageTest/ProcessTiles.h"
 #include "GafferImageTest/ImageReaderTest.h"
+#include "GafferImageTest/SamplerTest.h"
 
 using namespace boost::python;
 using namespace GafferImageTest;
@@ -52,9 +53,16 @@ static void processTilesWrapper( GafferImage::ImagePlug *imagePlug )
 	processTiles( imagePlug );
 }
 
+static double sumPixelsWrapper( GafferImage::ImagePlug *imagePlug, const std::string &channelName, const Imath::Box2i &region, GafferImage::Sampler::BoundingMode boundingMode, bool useSampleRow )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return sumPixels( imagePlug, channelName, region, boundingMode, useSampleRow );
+}
+
 BOOST_PYTHON_MODULE( _GafferImageTest )
 {
 	def( "processTiles", &processTilesWrapper );
 	def( "testOIIOJpgRead", &testOIIOJpgRead );
 	def( "testOIIOExrRead", &testOIIOExrRead );
+	def( "sumPixels", &sumPixelsWrapper );
 }
@@ -0,0 +1,696 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <map>
+#include <set>
+#include <algorithm>
+
+#include "boost/bind.hpp"
+#include "boost/thread.hpp"
+#include "boost/algorithm/string/predicate.hpp"
+
+#include "tbb/atomic.h"
+
+#include "Gaffer/Node.h"
+#include "Gaffer/Context.h"
+#include "Gaffer/Action.h"
+
+#include "GafferUI/Gadget.h"
+
+#include "GafferImage/ImagePlug.h"
+#include "GafferImage/ImageAlgo.h"
+#include "GafferImage/BufferAlgo.h"
+
+#include "GafferImageUI/FrameCache.h"
+
+using namespace std;
+using namespace Imath;
+using namespace IECore;
+using namespace Gaffer;
+using namespace GafferImage;
+using namespace GafferImageUI;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const size_t g_defaultMemoryLimit = 1024 * 1024 * 1024;
+
+struct Tile
+{
+	MurmurHash hash;
+	ConstFloatVectorDataPtr channelData;
+};
+
+// The cached tiles for a single frame. The tiles for each channel are
+// stored in a vector in scanline order, starting from the tile
+// containing the bottom left of the data window.
+struct Frame : public RefCounted
+{
+
+	Frame( const Box2i &dataWindow )
+		:	dataWindow( dataWindow ), memoryUsage( 0 )
+	{
+		if( !empty( dataWindow ) )
+		{
+			tilesWindow = Box2i(
+				ImagePlug::tileOrigin( dataWindow.min ),
+				ImagePlug::tileOrigin( dataWindow.max - V2i( 1 ) ) + V2i( ImagePlug::tileSize() )
+			);
+		}
+	}
+
+	size_t numTiles() const
+	{
+		const V2i s = tilesWindow.size() / ImagePlug::tileSize();
+		return empty( tilesWindow ) ? 0 : s.x * s.y;
+	}
+
+	// Returns the index of the tile, or -1 if it is outside the data window.
+	int tileIndex( const V2i &tileOrigin ) const
+	{
+		if( !contains( tilesWindow, tileOrigin ) )
+		{
+			return -1;
+		}
+		const V2i t = ( tileOrigin - tilesWindow.min ) / ImagePlug::tileSize();
+		return t.y * ( tilesWindow.size().x / ImagePlug::tileSize() ) + t.x;
+	}
+
+	typedef map<InternedString, vector<Tile> > Channels;
+
+	Box2i dataWindow;
+	Box2i tilesWindow;
+	Channels channels;
+	size_t memoryUsage;
+
+};
+
+IE_CORE_DECLAREPTR( Frame )
+
+// All the FrameCaches in existence, so that their computations
+// can be stopped before any edit is made to a graph.
+set<FrameCache *> g_frameCaches;
+// Background threads which have been cancelled, but which may not
+// have finished yet. We never wait for these during an edit, because
+// they may be waiting for the GIL, which the editor may hold.
+vector<boost::shared_ptr<boost::thread> > g_orphanedThreads;
+// The nesting depth of the actions currently being performed.
+// Computation isn't started while this is non-zero.
+int g_actionDepth = 0;
+// Protects all of the above.
+boost::mutex g_frameCachesMutex;
+
+// Joins the orphaned threads. If `wait` is false, only the
+// threads which have already finished are joined, so that
+// we never block. Must be called with g_frameCachesMutex
+// locked.
+void joinOrphanedThreads( bool wait )
+{
+	for( vector<boost::shared_ptr<boost::thread> >::iterator it = g_orphanedThreads.begin(); it != g_orphanedThreads.end(); )
+	{
+		if( wait )
+		{
+			(*it)->join();
+			it = g_orphanedThreads.erase( it );
+		}
+		else if( (*it)->timed_join( boost::posix_time::seconds( 0 ) ) )
+		{
+			it = g_orphanedThreads.erase( it );
+		}
+		else
+		{
+			++it;
+		}
+	}
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// State
+//////////////////////////////////////////////////////////////////////////
+
+struct FrameCache::State : public RefCounted
+{
+
+	State( ConstImagePlugPtr image )
+		:	image( image ), owner( NULL ), memoryLimit( g_defaultMemoryLimit ), memoryUsage( 0 ), running( false ), currentThread( 0 )
+	{
+		generation = 0;
+	}
+
+	typedef map<float, FramePtr> Frames;
+
+	const ConstImagePlugPtr image;
+	// Only accessed on the UI thread, so doesn't need
+	// protection by the mutex.
+	FrameCache *owner;
+	// Incremented to cancel any computation in progress.
+	tbb::atomic<unsigned> generation;
+
+	// Everything below is protected by the mutex.
+	mutable boost::mutex mutex;
+
+	Frames frames;
+	set<float> failedFrames;
+	vector<float> requestedFrames;
+	ConstContextPtr requestContext;
+	size_t memoryLimit;
+	size_t memoryUsage;
+	// True while the current background thread is running.
+	bool running;
+	// Identifies the current background thread. Incremented
+	// to tell the thread to exit, without discarding the
+	// requested frames.
+	unsigned currentThread;
+
+	// Chooses the next frame to compute, making room for it
+	// by evicting frames which are no longer requested.
+	// Returns false if there is nothing more to do. Must be
+	// called with the mutex locked.
+	bool nextFrame( float &frame )
+	{
+		for( vector<float>::const_iterator it = requestedFrames.begin(), eIt = requestedFrames.end(); it != eIt; ++it )
+		{
+			if( frames.find( *it ) != frames.end() || failedFrames.find( *it ) != failedFrames.end() )
+			{
+				continue;
+			}
+
+			for( Frames::iterator fIt = frames.begin(); fIt != frames.end() && memoryUsage >= memoryLimit; )
+			{
+				if( find( requestedFrames.begin(), requestedFrames.end(), fIt->first ) == requestedFrames.end() )
+				{
+					memoryUsage -= fIt->second->memoryUsage;
+					frames.erase( fIt++ );
+				}
+				else
+				{
+					++fIt;
+				}
+			}
+
+			if( memoryUsage >= memoryLimit )
+			{
+				return false;
+			}
+
+			frame = *it;
+			return true;
+		}
+
+		return false;
+	}
+
+	void clear()
+	{
+		frames.clear();
+		failedFrames.clear();
+		memoryUsage = 0;
+	}
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// Frame computation
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct TileFunctor
+{
+
+	TileFunctor( Frame *frame, const tbb::atomic<unsigned> &generation, unsigned expectedGeneration )
+		:	m_frame( frame ), m_generation( generation ), m_expectedGeneration( expectedGeneration )
+	{
+	}
+
+	void operator()( const ImagePlug *image, const string &channelName, const V2i &tileOrigin )
+	{
+		if( m_generation != m_expectedGeneration )
+		{
+			// Cancelled.
+			return;
+		}
+
+		// Each tile has its own slot in the vector, so no
+		// locking is needed when filling them in parallel.
+		Tile &tile = m_frame->channels[channelName][m_frame->tileIndex( tileOrigin )];
+		tile.hash = image->channelDataPlug()->hash();
+		tile.channelData = image->channelDataPlug()->getValue( &tile.hash );
+	}
+
+	private :
+
+		Frame *m_frame;
+		const tbb::atomic<unsigned> &m_generation;
+		const unsigned m_expectedGeneration;
+
+};
+
+// Returns NULL if cancelled part way through.
+FramePtr computeFrame( const ImagePlug *image, const tbb::atomic<unsigned> &generation, unsigned expectedGeneration )
+{
+	FramePtr frame = new Frame( image->dataWindowPlug()->getValue() );
+
+	ConstStringVectorDataPtr channelNamesData = image->channelNamesPlug()->getValue();
+	const vector<string> &channelNames = channelNamesData->readable();
+
+	const char *rgba[] = { "R", "G", "B", "A" };
+	vector<string> channelsToCompute;
+	for( int i = 0; i < 4; ++i )
+	{
+		if( find( channelNames.begin(), channelNames.end(), rgba[i] ) != channelNames.end() )
+		{
+			channelsToCompute.push_back( rgba[i] );
+			// Preallocate, so that the TileFunctor can fill
+			// the tiles concurrently.
+			frame->channels[rgba[i]].resize( frame->numTiles() );
+		}
+	}
+
+	TileFunctor tileFunctor( frame.get(), generation, expectedGeneration );
+	parallelProcessTiles( image, channelsToCompute, tileFunctor, frame->dataWindow );
+
+	if( generation != expectedGeneration )
+	{
+		return NULL;
+	}
+
+	for( Frame::Channels::const_iterator it = frame->channels.begin(), eIt = frame->channels.end(); it != eIt; ++it )
+	{
+		for( vector<Tile>::const_iterator tIt = it->second.begin(), teIt = it->second.end(); tIt != teIt; ++tIt )
+		{
+			if( tIt->channelData )
+			{
+				frame->memoryUsage += tIt->channelData->readable().size() * sizeof( float );
+			}
+		}
+	}
+
+	return frame;
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// FrameCache
+//////////////////////////////////////////////////////////////////////////
+
+FrameCache::FrameCache( GafferImage::ConstImagePlugPtr image, Gaffer::ContextPtr context )
+	:	m_image( image ), m_context( context ), m_state( new State( image ) )
+{
+	m_state->owner = this;
+
+	{
+		boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+		static bool connected = false;
+		if( !connected )
+		{
+			Action::preActionSignal().connect( boost::bind( &FrameCache::preAction ) );
+			Action::postActionSignal().connect( boost::bind( &FrameCache::postAction ) );
+			connected = true;
+		}
+		g_frameCaches.insert( this );
+	}
+
+	if( const Node *node = m_image->node() )
+	{
+		m_plugDirtiedConnection = const_cast<Node *>( node )->plugDirtiedSignal().connect( boost::bind( &FrameCache::plugDirtied, this, ::_1 ) );
+	}
+	m_contextChangedConnection = m_context->changedSignal().connect( boost::bind( &FrameCache::contextChanged, this, ::_2 ) );
+}
+
+FrameCache::~FrameCache()
+{
+	// Cancel any computation in progress. We don't wait for the
+	// background thread to finish, because it may be waiting on the
+	// GIL, which our caller may hold. Instead we leave the thread to
+	// be joined once it has finished, or by stopAll().
+	m_state->owner = NULL;
+
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+	g_frameCaches.erase( this );
+
+	{
+		boost::lock_guard<boost::mutex> stateLock( m_state->mutex );
+		m_state->generation++;
+		m_state->requestedFrames.clear();
+		m_state->clear();
+	}
+
+	if( m_thread )
+	{
+		g_orphanedThreads.push_back( m_thread );
+	}
+}
+
+const GafferImage::ImagePlug *FrameCache::getImage() const
+{
+	return m_image.get();
+}
+
+const Gaffer::Context *FrameCache::getContext() const
+{
+	return m_context.get();
+}
+
+void FrameCache::setMemoryLimit( size_t memoryLimit )
+{
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+	m_state->memoryLimit = memoryLimit;
+}
+
+size_t FrameCache::getMemoryLimit() const
+{
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+	return m_state->memoryLimit;
+}
+
+size_t FrameCache::memoryUsage() const
+{
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+	return m_state->memoryUsage;
+}
+
+void FrameCache::prefetch( const std::vector<float> &frames )
+{
+	// Take a copy of the context, because the original
+	// may be modified on the UI thread while the background
+	// thread is using it.
+	ConstContextPtr context = new Context( *m_context );
+
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+
+	bool running;
+	{
+		boost::lock_guard<boost::mutex> stateLock( m_state->mutex );
+		m_state->requestedFrames = frames;
+		m_state->requestContext = context;
+		running = m_state->running;
+	}
+
+	if( !running )
+	{
+		// The thread has run out of work and exited, or
+		// is just about to, so joining it won't block.
+		if( m_thread )
+		{
+			m_thread->join();
+			m_thread.reset();
+		}
+		startThread();
+	}
+}
+
+void FrameCache::clear()
+{
+	{
+		boost::lock_guard<boost::mutex> lock( m_state->mutex );
+		m_state->generation++;
+		// We don't restart computation automatically, as
+		// the user is likely to be in the middle of a series
+		// of edits. It'll be restarted by the next call to
+		// prefetch().
+		m_state->requestedFrames.clear();
+		m_state->clear();
+	}
+	changedSignal()( this );
+}
+
+void FrameCache::stop()
+{
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+	stopThread();
+
+	// Make sure we don't resume after the next edit.
+	boost::lock_guard<boost::mutex> stateLock( m_state->mutex );
+	m_state->requestedFrames.clear();
+}
+
+void FrameCache::stopAll()
+{
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+	for( set<FrameCache *>::const_iterator it = g_frameCaches.begin(), eIt = g_frameCaches.end(); it != eIt; ++it )
+	{
+		(*it)->stopThread();
+		boost::lock_guard<boost::mutex> stateLock( (*it)->m_state->mutex );
+		(*it)->m_state->requestedFrames.clear();
+	}
+
+	joinOrphanedThreads( /* wait = */ true );
+}
+
+void FrameCache::cachedFrames( std::vector<float> &frames ) const
+{
+	frames.clear();
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+	for( State::Frames::const_iterator it = m_state->frames.begin(), eIt = m_state->frames.end(); it != eIt; ++it )
+	{
+		frames.push_back( it->first );
+	}
+}
+
+bool FrameCache::isCached( float frame ) const
+{
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+	return m_state->frames.find( frame ) != m_state->frames.end();
+}
+
+IECore::ConstFloatVectorDataPtr FrameCache::channelData( float frame, const std::string &channelName, const Imath::V2i &tileOrigin, IECore::MurmurHash *hash ) const
+{
+	boost::lock_guard<boost::mutex> lock( m_state->mutex );
+
+	State::Frames::const_iterator it = m_state->frames.find( frame );
+	if( it == m_state->frames.end() )
+	{
+		return NULL;
+	}
+
+	Frame::Channels::const_iterator cIt = it->second->channels.find( channelName );
+	const int tileIndex = it->second->tileIndex( tileOrigin );
+	if( cIt == it->second->channels.end() || tileIndex < 0 )
+	{
+		return NULL;
+	}
+
+	const Tile &tile = cIt->second[tileIndex];
+	if( hash )
+	{
+		*hash = tile.hash;
+	}
+	return tile.channelData;
+}
+
+FrameCache::UnarySignal &FrameCache::changedSignal()
+{
+	return m_changedSignal;
+}
+
+void FrameCache::plugDirtied( const Gaffer::Plug *plug )
+{
+	if( plug->parent<ImagePlug>() == m_image )
+	{
+		clear();
+	}
+}
+
+void FrameCache::contextChanged( const IECore::InternedString &name )
+{
+	if( name != "frame" && !boost::starts_with( name.string(), "ui:" ) )
+	{
+		clear();
+	}
+}
+
+void FrameCache::startThread()
+{
+	if( m_thread || g_actionDepth )
+	{
+		return;
+	}
+
+	unsigned currentThread;
+	{
+		boost::lock_guard<boost::mutex> stateLock( m_state->mutex );
+		if( m_state->requestedFrames.empty() )
+		{
+			return;
+		}
+		m_state->running = true;
+		currentThread = m_state->currentThread;
+	}
+
+	m_thread.reset( new boost::thread( boost::bind( &FrameCache::backgroundThread, m_state, currentThread ) ) );
+}
+
+void FrameCache::cancelThread()
+{
+	boost::lock_guard<boost::mutex> stateLock( m_state->mutex );
+	m_state->generation++;
+	m_state->currentThread++;
+	m_state->running = false;
+}
+
+void FrameCache::stopThread()
+{
+	if( !m_thread )
+	{
+		return;
+	}
+
+	cancelThread();
+	m_thread->join();
+	m_thread.reset();
+}
+
+void FrameCache::preAction()
+{
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+	if( g_actionDepth++ )
+	{
+		// Already cancelled by an outer action.
+		return;
+	}
+
+	// We cancel the computations in progress, but don't wait for
+	// them, because they may be waiting for the GIL, which the editor
+	// may hold. Anything they compute from here on is discarded, since
+	// the generation no longer matches.
+	for( set<FrameCache *>::const_iterator it = g_frameCaches.begin(), eIt = g_frameCaches.end(); it != eIt; ++it )
+	{
+		FrameCache *frameCache = *it;
+		if( frameCache->m_thread )
+		{
+			frameCache->cancelThread();
+			g_orphanedThreads.push_back( frameCache->m_thread );
+			frameCache->m_thread.reset();
+		}
+	}
+
+	joinOrphanedThreads( /* wait = */ false );
+}
+
+void FrameCache::postAction()
+{
+	boost::lock_guard<boost::mutex> lock( g_frameCachesMutex );
+	if( --g_actionDepth )
+	{
+		return;
+	}
+
+	// If the edit dirtied an image, the requested frames will
+	// have been cleared, and we won't restart computation for it.
+	for( set<FrameCache *>::const_iterator it = g_frameCaches.begin(), eIt = g_frameCaches.end(); it != eIt; ++it )
+	{
+		(*it)->startThread();
+	}
+}
+
+void FrameCache::backgroundThread( StatePtr state, unsigned thread )
+{
+	while( true )
+	{
+		float frame;
+		unsigned generation;
+		ContextPtr context;
+		{
+			boost::lock_guard<boost::mutex> lock( state->mutex );
+			if( state->currentThread != thread )
+			{
+				// We've been cancelled, and another thread
+				// may already have taken our place.
+				return;
+			}
+			if( !state->nextFrame( frame ) )
+			{
+				state->running = false;
+				return;
+			}
+			generation = state->generation;
+			context = new Context( *state->requestContext );
+		}
+
+		context->setFrame( frame );
+
+		FramePtr result;
+		bool failed = false;
+		try
+		{
+			Context::Scope scopedContext( context.get() );
+			result = computeFrame( state->image.get(), state->generation, generation );
+		}
+		catch( ... )
+		{
+			// Errors are reported by the Viewer when the frame
+			// is displayed, so we just avoid trying again.
+			failed = true;
+		}
+
+		{
+			boost::lock_guard<boost::mutex> lock( state->mutex );
+			if( state->generation != generation )
+			{
+				continue;
+			}
+			else if( failed )
+			{
+				state->failedFrames.insert( frame );
+				continue;
+			}
+			else if( result )
+			{
+				state->frames[frame] = result;
+				state->memoryUsage += result->memoryUsage;
+			}
+		}
+
+		GafferUI::Gadget::executeOnUIThread( boost::bind( &FrameCache::emitChanged, state ) );
+	}
+}
+
+void FrameCache::emitChanged( StatePtr state )
+{
+	if( FrameCache *owner = state->owner )
+	{
+		owner->changedSignal()( owner );
+	}
+}
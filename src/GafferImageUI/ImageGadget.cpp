@@ -53,8 +53,10 @@
 
 #include "GafferImage/ImagePlug.h"
 #include "GafferImage/ImageAlgo.h"
+#include "GafferImage/BufferAlgo.h"
 
 #include "GafferImageUI/ImageGadget.h"
+#include "GafferImageUI/FrameCache.h"
 
 using namespace std;
 using namespace boost;
@@ -171,6 +173,27 @@ int ImageGadget::getSoloChannel() const
 	return m_soloChannel;
 }
 
+void ImageGadget::setFrameCache( FrameCachePtr frameCache )
+{
+	if( frameCache == m_frameCache )
+	{
+		return;
+	}
+
+	m_frameCache = frameCache;
+	requestRender();
+}
+
+FrameCache *ImageGadget::getFrameCache()
+{
+	return m_frameCache.get();
+}
+
+const FrameCache *ImageGadget::getFrameCache() const
+{
+	return m_frameCache.get();
+}
+
 Imath::V2f ImageGadget::pixelAt( const IECore::LineSegment3f &lineInGadgetSpace ) const
 {
 	V3f i;
@@ -319,19 +342,31 @@ inline size_t GafferImageUI::tbb_hasher( const ImageGadget::TileIndex &tileIndex
 struct ImageGadget::TileFunctor
 {
 
-	TileFunctor( Tiles &tiles )
-		:	m_tiles( tiles )
+	TileFunctor( Tiles &tiles, const FrameCache *frameCache, float frame )
+		:	m_tiles( tiles ), m_frameCache( frameCache ), m_frame( frame )
 	{
 	}
 
 	void operator()( const ImagePlug *image, const string &channelName, const V2i &tileOrigin )
 	{
 		Tile &tile = m_tiles[TileIndex(tileOrigin, channelName)];
+
+		// If the tile is in the frame cache, we can
+		// avoid even computing the hash.
+		IECore::MurmurHash h;
 		ConstFloatVectorDataPtr channelData;
-		const IECore::MurmurHash h = image->channelDataPlug()->hash();
+		if( m_frameCache )
+		{
+			channelData = m_frameCache->channelData( m_frame, channelName, tileOrigin, &h );
+		}
+		if( !channelData )
+		{
+			h = image->channelDataPlug()->hash();
+		}
+
 		if( !tile.texture || tile.channelDataHash != h )
 		{
-			tile.channelDataToConvert = image->channelDataPlug()->getValue( &h );
+			tile.channelDataToConvert = channelData ? channelData : image->channelDataPlug()->getValue( &h );
 			tile.channelDataHash = h;
 		}
 	}
@@ -339,17 +374,50 @@ struct ImageGadget::TileFunctor
 	private :
 
 		Tiles &m_tiles;
+		const FrameCache *m_frameCache;
+		const float m_frame;
 
 };
 
-void ImageGadget::updateTiles() const
+Imath::Box2i ImageGadget::visibleTileWindow() const
 {
-	if( !(m_dirtyFlags & TilesDirty) )
+	const Box2i &dataWindow = this->dataWindow();
+	const ViewportGadget *viewport = ancestor<ViewportGadget>();
+	if( !viewport || empty( dataWindow ) )
 	{
-		return;
+		return dataWindow;
 	}
 
-	removeOutOfBoundsTiles();
+	const V2i viewportSize = viewport->getViewport();
+	Box2f visible;
+	visible.extendBy( pixelAt( viewport->rasterToGadgetSpace( V2f( 0 ), this ) ) );
+	visible.extendBy( pixelAt( viewport->rasterToGadgetSpace( V2f( viewportSize ), this ) ) );
+
+	const Box2i visibleTiles(
+		ImagePlug::tileOrigin( V2i( (int)floorf( visible.min.x ), (int)floorf( visible.min.y ) ) ),
+		ImagePlug::tileOrigin( V2i( (int)ceilf( visible.max.x ), (int)ceilf( visible.max.y ) ) ) + V2i( ImagePlug::tileSize() )
+	);
+
+	return intersection( visibleTiles, dataWindow );
+}
+
+void ImageGadget::updateTiles( const Imath::Box2i &window ) const
+{
+	if( m_dirtyFlags & TilesDirty )
+	{
+		removeOutOfBoundsTiles();
+		m_tilesWindow = Box2i();
+		m_dirtyFlags &= ~TilesDirty;
+	}
+
+	// Tiles only need updating if the window contains
+	// some we haven't checked since the image last changed.
+	// This is the case when the image is dirtied, or when
+	// panning or zooming reveals a new part of the image.
+	if( empty( window ) || ( !empty( m_tilesWindow ) && contains( m_tilesWindow, window ) ) )
+	{
+		return;
+	}
 
 	// Decide which channels to compute. This is the intersection
 	// of the available channels (channelNames) and the channels
@@ -369,10 +437,10 @@ void ImageGadget::updateTiles() const
 
 	// Use parallelGatherTiles() to do the hard work of launching
 	// threads and iterating over tiles to get any modified channelData.
-	TileFunctor tileFunctor( m_tiles );
+	TileFunctor tileFunctor( m_tiles, m_frameCache.get(), m_context->getFrame() );
 	{
 		Context::Scope scopedContext( m_context.get() );
-		parallelProcessTiles( m_image.get(), channelsToCompute, tileFunctor, dataWindow() );
+		parallelProcessTiles( m_image.get(), channelsToCompute, tileFunctor, window );
 	}
 
 	// Now take the new channelData and convert it into textures for display.
@@ -398,7 +466,8 @@ void ImageGadget::updateTiles() const
 			it->second.channelDataToConvert = NULL;
 		}
 	}
-	m_dirtyFlags &= ~TilesDirty;
+
+	m_tilesWindow = window;
 }
 
 void ImageGadget::removeOutOfBoundsTiles() const
@@ -518,7 +587,7 @@ IECoreGL::Texture *blackTexture()
 
 } // namespace
 
-void ImageGadget::renderTiles() const
+void ImageGadget::renderTiles( const Imath::Box2i &window ) const
 {
 	GLint previousProgram;
 	glGetIntegerv( GL_CURRENT_PROGRAM, &previousProgram );
@@ -547,10 +616,13 @@ void ImageGadget::renderTiles() const
 	const Box2i dataWindow = this->dataWindow();
 	const float pixelAspect = this->format().getPixelAspect();
 
-	V2i tileOrigin = ImagePlug::tileOrigin( dataWindow.min );
-	for( ; tileOrigin.y < dataWindow.max.y; tileOrigin.y += ImagePlug::tileSize() )
+	// Only tiles within `window` are up to date, so
+	// we draw just those. The rest are outside the
+	// viewport anyway.
+	V2i tileOrigin = ImagePlug::tileOrigin( window.min );
+	for( ; tileOrigin.y < window.max.y; tileOrigin.y += ImagePlug::tileSize() )
 	{
-		for( tileOrigin.x = ImagePlug::tileOrigin( dataWindow.min ).x; tileOrigin.x < dataWindow.max.x; tileOrigin.x += ImagePlug::tileSize() )
+		for( tileOrigin.x = ImagePlug::tileOrigin( window.min ).x; tileOrigin.x < window.max.x; tileOrigin.x += ImagePlug::tileSize() )
 		{
 			for( int i = 0; i < 4; ++i )
 			{
@@ -631,11 +703,13 @@ void ImageGadget::doRender( const GafferUI::Style *style ) const
 
 	Format format;
 	Box2i dataWindow;
+	Box2i tileWindow;
 	try
 	{
 		format = this->format();
 		dataWindow = this->dataWindow();
-		updateTiles();
+		tileWindow = visibleTileWindow();
+		updateTiles( tileWindow );
 	}
 	catch( ... )
 	{
@@ -674,7 +748,7 @@ void ImageGadget::doRender( const GafferUI::Style *style ) const
 
 	// Draw the image tiles over the top.
 
-	renderTiles();
+	renderTiles( tileWindow );
 
 	// And add overlays for the display and data windows.
 
@@ -71,6 +71,7 @@
 #include "GafferImage/ImageSampler.h"
 
 #include "GafferImageUI/ImageGadget.h"
+#include "GafferImageUI/FrameCache.h"
 #include "GafferImageUI/ImageView.h"
 
 using namespace boost;
@@ -228,6 +229,8 @@ ImageView::ImageView( const std::string &name )
 
 	addChild( new StringPlug( "displayTransform", Plug::In, "Default", Plug::Default & ~Plug::AcceptsInputs ) );
 
+	addChild( new BoolPlug( "frameCache", Plug::In, false, Plug::Default & ~Plug::AcceptsInputs ) ); // dealt with in plugSet()
+
 	ImagePlugPtr preprocessorOutput = new ImagePlug( "out", Plug::Out );
 	preprocessor->addChild( preprocessorOutput );
 	preprocessorOutput->setInput( gradeNode->outPlug() );
@@ -332,6 +335,26 @@ const Gaffer::StringPlug *ImageView::displayTransformPlug() const
 	return getChild<StringPlug>( "displayTransform" );
 }
 
+Gaffer::BoolPlug *ImageView::frameCachePlug()
+{
+	return getChild<BoolPlug>( "frameCache" );
+}
+
+const Gaffer::BoolPlug *ImageView::frameCachePlug() const
+{
+	return getChild<BoolPlug>( "frameCache" );
+}
+
+FrameCache *ImageView::frameCache()
+{
+	return m_frameCache.get();
+}
+
+const FrameCache *ImageView::frameCache() const
+{
+	return m_frameCache.get();
+}
+
 GafferImage::Clamp *ImageView::clampNode()
 {
 	return getPreprocessor<Node>()->getChild<Clamp>( "__clamp" );
@@ -356,6 +379,7 @@ void ImageView::setContext( Gaffer::ContextPtr context )
 {
 	View::setContext( context );
 	m_imageGadget->setContext( context );
+	updateFrameCache();
 }
 
 void ImageView::plugSet( Gaffer::Plug *plug )
@@ -377,6 +401,10 @@ void ImageView::plugSet( Gaffer::Plug *plug )
 	{
 		insertDisplayTransform();
 	}
+	else if( plug == frameCachePlug() )
+	{
+		updateFrameCache();
+	}
 }
 
 bool ImageView::keyPress( const GafferUI::KeyEvent &event )
@@ -452,6 +480,25 @@ void ImageView::insertDisplayTransform()
 	}
 }
 
+void ImageView::updateFrameCache()
+{
+	if( frameCachePlug()->getValue() )
+	{
+		// The FrameCache is specific to a particular context,
+		// so we must make a new one if the context changes.
+		if( !m_frameCache || m_frameCache->getContext() != getContext() )
+		{
+			m_frameCache = new FrameCache( preprocessedInPlug<ImagePlug>(), getContext() );
+		}
+	}
+	else
+	{
+		m_frameCache = NULL;
+	}
+
+	m_imageGadget->setFrameCache( m_frameCache );
+}
+
 void ImageView::registerDisplayTransform( const std::string &name, DisplayTransformCreator creator )
 {
 	displayTransformCreators()[name] = creator;
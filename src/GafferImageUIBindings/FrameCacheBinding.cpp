@@ -0,0 +1,162 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "boost/python.hpp"
+#include "boost/python/suite/indexing/container_utils.hpp"
+
+#include "IECorePython/RefCountedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "Gaffer/Context.h"
+
+#include "GafferBindings/SignalBinding.h"
+
+#include "GafferImage/ImagePlug.h"
+
+#include "GafferImageUI/FrameCache.h"
+#include "GafferImageUIBindings/FrameCacheBinding.h"
+
+using namespace boost::python;
+using namespace Gaffer;
+using namespace GafferBindings;
+using namespace GafferImage;
+using namespace GafferImageUI;
+
+namespace
+{
+
+ImagePlugPtr getImage( const FrameCache &f )
+{
+	return ImagePlugPtr( const_cast<ImagePlug *>( f.getImage() ) );
+}
+
+ContextPtr getContext( const FrameCache &f )
+{
+	return ContextPtr( const_cast<Context *>( f.getContext() ) );
+}
+
+void prefetch( FrameCache &f, object pythonFrames )
+{
+	std::vector<float> frames;
+	boost::python::container_utils::extend_container( frames, pythonFrames );
+	IECorePython::ScopedGILRelease gilRelease;
+	f.prefetch( frames );
+}
+
+void clear( FrameCache &f )
+{
+	// Releasing the GIL because clear() emits changedSignal().
+	IECorePython::ScopedGILRelease gilRelease;
+	f.clear();
+}
+
+void stop( FrameCache &f )
+{
+	// Releasing the GIL because the background thread
+	// may need it before it can finish.
+	IECorePython::ScopedGILRelease gilRelease;
+	f.stop();
+}
+
+void stopAll()
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	FrameCache::stopAll();
+}
+
+list cachedFrames( const FrameCache &f )
+{
+	std::vector<float> frames;
+	f.cachedFrames( frames );
+
+	list result;
+	for( std::vector<float>::const_iterator it = frames.begin(), eIt = frames.end(); it != eIt; ++it )
+	{
+		result.append( *it );
+	}
+	return result;
+}
+
+IECore::FloatVectorDataPtr channelData( const FrameCache &f, float frame, const std::string &channelName, const Imath::V2i &tileOrigin )
+{
+	IECore::ConstFloatVectorDataPtr d = f.channelData( frame, channelName, tileOrigin );
+	if( !d )
+	{
+		return NULL;
+	}
+	return d->copy();
+}
+
+struct UnarySlotCaller
+{
+	boost::signals::detail::unusable operator()( boost::python::object slot, FrameCachePtr f )
+	{
+		try
+		{
+			slot( f );
+		}
+		catch( const error_already_set &e )
+		{
+			PyErr_PrintEx( 0 ); // clears the error status
+		}
+		return boost::signals::detail::unusable();
+	}
+};
+
+} // namespace
+
+void GafferImageUIBindings::bindFrameCache()
+{
+	scope s = IECorePython::RefCountedClass<FrameCache, IECore::RefCounted>( "FrameCache" )
+		.def( init<ConstImagePlugPtr, ContextPtr>() )
+		.def( "getImage", &getImage )
+		.def( "getContext", &getContext )
+		.def( "setMemoryLimit", &FrameCache::setMemoryLimit )
+		.def( "getMemoryLimit", &FrameCache::getMemoryLimit )
+		.def( "memoryUsage", &FrameCache::memoryUsage )
+		.def( "prefetch", &prefetch )
+		.def( "clear", &clear )
+		.def( "stop", &stop )
+		.def( "stopAll", &stopAll )
+		.staticmethod( "stopAll" )
+		.def( "cachedFrames", &cachedFrames )
+		.def( "isCached", &FrameCache::isCached )
+		.def( "channelData", &channelData )
+		.def( "changedSignal", &FrameCache::changedSignal, return_internal_reference<1>() )
+	;
+
+	SignalClass<FrameCache::UnarySignal, DefaultSignalCaller<FrameCache::UnarySignal>, UnarySlotCaller>( "UnarySignal" );
+}
@@ -45,6 +45,7 @@
 #include "GafferImage/ImagePlug.h"
 
 #include "GafferImageUI/ImageGadget.h"
+#include "GafferImageUI/FrameCache.h"
 #include "GafferImageUIBindings/ImageGadgetBinding.h"
 
 using namespace boost::python;
@@ -69,6 +70,11 @@ Imath::V2f pixelAt( const ImageGadget &g, const IECore::LineSegment3f &lineInGad
 	return g.pixelAt( lineInGadgetSpace );
 }
 
+FrameCachePtr getFrameCache( ImageGadget &g )
+{
+	return g.getFrameCache();
+}
+
 } // namespace
 
 void GafferImageUIBindings::bindImageGadget()
@@ -82,5 +88,7 @@ void GafferImageUIBindings::bindImageGadget()
 		.def( "setSoloChannel", &ImageGadget::setSoloChannel )
 		.def( "getSoloChannel", &ImageGadget::getSoloChannel )
 		.def( "pixelAt", &pixelAt )
+		.def( "setFrameCache", &ImageGadget::setFrameCache )
+		.def( "getFrameCache", &getFrameCache )
 	;
 }
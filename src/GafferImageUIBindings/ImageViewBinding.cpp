@@ -41,6 +41,7 @@
 #include "GafferImage/ImageProcessor.h"
 
 #include "GafferImageUI/ImageView.h"
+#include "GafferImageUI/FrameCache.h"
 #include "GafferImageUIBindings/ImageViewBinding.h"
 
 using namespace std;
@@ -100,12 +101,18 @@ static boost::python::list registeredDisplayTransforms()
 	return result;
 }
 
+static FrameCachePtr frameCache( ImageView &v )
+{
+	return v.frameCache();
+}
+
 void GafferImageUIBindings::bindImageView()
 {
 
 	GafferBindings::NodeClass<ImageView, ImageViewWrapper>()
 		.def( init<const std::string &>() )
 		.def( "_insertConverter", &ImageView::insertConverter )
+		.def( "frameCache", &frameCache )
 		.def( "registerDisplayTransform", &registerDisplayTransform )
 		.staticmethod( "registerDisplayTransform" )
 		.def( "registeredDisplayTransforms", &registeredDisplayTransforms )
@@ -39,6 +39,7 @@
 
 #include "GafferImageUIBindings/ImageViewBinding.h"
 #include "GafferImageUIBindings/ImageGadgetBinding.h"
+#include "GafferImageUIBindings/FrameCacheBinding.h"
 
 using namespace boost::python;
 
@@ -49,5 +50,6 @@ BOOST_PYTHON_MODULE( _GafferImageUI )
 
 	bindImageView();
 	bindImageGadget();
+	bindFrameCache();
 
 }
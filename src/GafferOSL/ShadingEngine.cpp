@@ -35,6 +35,9 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "tbb/spin_mutex.h"
+#include "tbb/spin_rw_mutex.h"
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 
 #include "boost/algorithm/string/split.hpp"
 #include "boost/algorithm/string/predicate.hpp"
@@ -293,6 +296,11 @@ class RenderState
 			return ShadingSystem::convert_value( value, type, src, it->typeDesc );
 		}
 
+		void setPointIndex( size_t pointIndex )
+		{
+			m_pointIndex = pointIndex;
+		}
+
 		void incrementPointIndex()
 		{
 			m_pointIndex++;
@@ -580,37 +588,26 @@ class ShadingResults
 
 		void addDebug( size_t pointIndex, const DebugParameters *parameters, const Color3f &weight )
 		{
-			vector<DebugResult>::iterator it = lower_bound(
-				m_debugResults.begin(),
-				m_debugResults.end(),
-				parameters->name
-			);
-
-			if( it == m_debugResults.end() || it->name != parameters->name )
+			// Points are shaded concurrently, so we must lock
+			// while finding the result, and upgrade to a write
+			// lock if it needs to be created. Writing the value
+			// itself needs no lock, since each point has its own
+			// element.
+			DebugResult debugResult;
 			{
-				DebugResult result;
-				result.name = parameters->name;
-				result.type = parameters->type != ustring() ? TypeDesc( parameters->type.c_str() ) : TypeDesc::TypeColor;
-				result.type.arraylen = m_ci->size();
-				DataPtr data = dataFromTypeDesc( result.type, result.basePointer );
-				if( !data )
-				{
-					throw IECore::Exception( "Unsupported type specified in debug() closure." );
-				}
-				result.type.unarray(); // so we can use convert_value
-				m_results->writable()[result.name.c_str()] = data;
-				it = m_debugResults.insert( it, result );
+				tbb::spin_rw_mutex::scoped_lock lock( m_debugResultsMutex, /* write = */ false );
+				debugResult = findOrAddDebugResult( parameters, lock );
 			}
 
 			Color3f value = weight * parameters->value;
 
-			char *dst = static_cast<char *>( it->basePointer );
-			dst += pointIndex * it->type.elementsize();
+			char *dst = static_cast<char *>( debugResult.basePointer );
+			dst += pointIndex * debugResult.type.elementsize();
 			ShadingSystem::convert_value(
 				dst,
-				it->type,
+				debugResult.type,
 				&value,
-				it->type.aggregate == TypeDesc::SCALAR ? TypeDesc::TypeFloat : TypeDesc::TypeColor
+				debugResult.type.aggregate == TypeDesc::SCALAR ? TypeDesc::TypeFloat : TypeDesc::TypeColor
 			);
 		}
 
@@ -638,9 +635,53 @@ class ShadingResults
 			}
 		};
 
+		DebugResult findOrAddDebugResult( const DebugParameters *parameters, tbb::spin_rw_mutex::scoped_lock &lock )
+		{
+			vector<DebugResult>::iterator it = lower_bound(
+				m_debugResults.begin(),
+				m_debugResults.end(),
+				parameters->name
+			);
+
+			if( it != m_debugResults.end() && it->name == parameters->name )
+			{
+				return *it;
+			}
+
+			if( !lock.upgrade_to_writer() )
+			{
+				// Lock was released temporarily during the upgrade,
+				// so another thread may have added the result.
+				it = lower_bound(
+					m_debugResults.begin(),
+					m_debugResults.end(),
+					parameters->name
+				);
+			}
+
+			if( it == m_debugResults.end() || it->name != parameters->name )
+			{
+				DebugResult result;
+				result.name = parameters->name;
+				result.type = parameters->type != ustring() ? TypeDesc( parameters->type.c_str() ) : TypeDesc::TypeColor;
+				result.type.arraylen = m_ci->size();
+				DataPtr data = dataFromTypeDesc( result.type, result.basePointer );
+				if( !data )
+				{
+					throw IECore::Exception( "Unsupported type specified in debug() closure." );
+				}
+				result.type.unarray(); // so we can use convert_value
+				m_results->writable()[result.name.c_str()] = data;
+				it = m_debugResults.insert( it, result );
+			}
+
+			return *it;
+		}
+
 		CompoundDataPtr m_results;
 		vector<Color3f> *m_ci;
 		vector<DebugResult> m_debugResults; // sorted on name for quick lookups
+		tbb::spin_rw_mutex m_debugResultsMutex;
 
 };
 
@@ -834,6 +875,80 @@ ShadingEngine::~ShadingEngine()
 	delete static_cast<ShaderGroupRef *>( m_shaderGroupRef );
 }
 
+namespace
+{
+
+// Functor for shading a range of points, for use with
+// tbb::parallel_for().
+class ShadeFunctor
+{
+
+	public :
+
+		ShadeFunctor( ShaderGroup &shaderGroup, const ShaderGlobals &shaderGlobals, const RenderState &renderState, const IECore::CompoundData *points, const OSL::Vec3 *p, ShadingResults &results )
+			:	m_shaderGroup( shaderGroup ), m_shaderGlobals( shaderGlobals ), m_renderState( renderState ), m_results( results ), m_p( p )
+		{
+			// Get pointers to varying data, we'll use these to
+			// update the shaderGlobals as we iterate over our points.
+			m_u = varyingValue<float>( points, "u" );
+			m_v = varyingValue<float>( points, "v" );
+			m_n = varyingValue<V3f>( points, "N" );
+
+			/// \todo Get the other globals - match the uniform list
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &r ) const
+		{
+			ShaderGlobals shaderGlobals = m_shaderGlobals;
+			RenderState renderState = m_renderState;
+			renderState.setPointIndex( r.begin() );
+			shaderGlobals.renderstate = &renderState;
+
+			ShadingSystem *shadingSystem = ::shadingSystem();
+			ShadingContext *shadingContext = shadingSystem->get_context();
+
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				shaderGlobals.P = m_p[i];
+				if( m_u )
+				{
+					shaderGlobals.u = m_u[i];
+				}
+				if( m_v )
+				{
+					shaderGlobals.v = m_v[i];
+				}
+				if( m_n )
+				{
+					shaderGlobals.N = m_n[i];
+				}
+
+				shaderGlobals.Ci = NULL;
+
+				shadingSystem->execute( shadingContext, m_shaderGroup, shaderGlobals );
+				m_results.addResult( i, shaderGlobals.Ci );
+				renderState.incrementPointIndex();
+			}
+
+			shadingSystem->release_context( shadingContext );
+		}
+
+	private :
+
+		ShaderGroup &m_shaderGroup;
+		const ShaderGlobals &m_shaderGlobals;
+		const RenderState &m_renderState;
+		ShadingResults &m_results;
+
+		const OSL::Vec3 *m_p;
+		const float *m_u;
+		const float *m_v;
+		const V3f *m_n;
+
+};
+
+} // namespace
+
 IECore::CompoundDataPtr ShadingEngine::shade( const IECore::CompoundData *points ) const
 {
 	// Get the data for "P" - this determines the number of points to be shaded.
@@ -879,54 +994,24 @@ IECore::CompoundDataPtr ShadingEngine::shade( const IECore::CompoundData *points
 	shaderGlobals.dPdu = uniformValue<V3f>( points, "dPdu" );
 	shaderGlobals.dPdv = uniformValue<V3f>( points, "dPdv" );
 
-	// Add a RenderState to the ShaderGlobals. This will
-	// get passed to our RendererServices queries.
+	// Create a RenderState to be passed to our RendererServices
+	// queries. Each task below adds its own copy to the ShaderGlobals,
+	// so that it can track its own point index.
 
 	RenderState renderState( points );
-	shaderGlobals.renderstate = &renderState;
-
-	// Get pointers to varying data, we'll use these to
-	// update the shaderGlobals as we iterate over our points.
-
-	const float *u = varyingValue<float>( points, "u" );
-	const float *v = varyingValue<float>( points, "v" );
-	const V3f *n = varyingValue<V3f>( points, "N" );
-
-	/// \todo Get the other globals - match the uniform list
 
 	// Allocate data for the result
 
 	ShadingResults results( numPoints );
 
-	// Iterate over the input points, doing the shading as we go
+	// Shade the points in parallel, with each task using its
+	// own ShadingContext and writing directly into the results.
 
-	ShadingSystem *shadingSystem = ::shadingSystem();
-	ShadingContext *shadingContext = shadingSystem->get_context();
 	ShaderGroup &shaderGroup = **static_cast<ShaderGroupRef *>( m_shaderGroupRef );
-	for( size_t i = 0; i < numPoints; ++i )
-	{
-		shaderGlobals.P = *p++;
-		if( u )
-		{
-			shaderGlobals.u = *u++;
-		}
-		if( v )
-		{
-			shaderGlobals.v = *v++;
-		}
-		if( n )
-		{
-			shaderGlobals.N = *n++;
-		}
-
-		shaderGlobals.Ci = NULL;
-
-		shadingSystem->execute( shadingContext, shaderGroup, shaderGlobals );
-		results.addResult( i, shaderGlobals.Ci );
-		renderState.incrementPointIndex();
-	}
-
-	shadingSystem->release_context( shadingContext );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numPoints, 1000 ),
+		ShadeFunctor( shaderGroup, shaderGlobals, renderState, points, p, results )
+	);
 
 	return results.results();
 }
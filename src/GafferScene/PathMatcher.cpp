@@ -35,6 +35,11 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+#include <new>
+
+#include "tbb/parallel_for.h"
+
 #include "Gaffer/StringAlgo.h"
 
 #include "GafferScene/PathMatcher.h"
@@ -64,6 +69,112 @@ inline bool PathMatcher::Name::operator < ( const Name &other ) const
 	return type < other.type || ( ( type == other.type ) && name < other.name );
 }
 
+//////////////////////////////////////////////////////////////////////////
+// ChildMap implementation
+//////////////////////////////////////////////////////////////////////////
+
+inline bool PathMatcher::Node::ChildMap::nameLess( const ChildMapValue &child, const Name &name )
+{
+	return child.first < name;
+}
+
+PathMatcher::Node::ChildMap::ChildMap()
+	:	m_map( NULL ), m_array( NULL ), m_arraySize( 0 ), m_compact( false )
+{
+}
+
+PathMatcher::Node::ChildMap::ChildMap( const ChildMap &other )
+	:	m_map( NULL ), m_array( NULL ), m_arraySize( 0 ), m_compact( false )
+{
+	if( !other.empty() )
+	{
+		// Both forms use the same ordering, so this insertion
+		// is linear in the number of children.
+		m_map = new Map( other.begin(), other.end() );
+	}
+}
+
+PathMatcher::Node::ChildMap::~ChildMap()
+{
+	delete m_map;
+	for( size_t i = 0; i < m_arraySize; ++i )
+	{
+		m_array[i].~ChildMapValue();
+	}
+	::operator delete( m_array );
+}
+
+PathMatcher::Node::ConstChildMapIterator PathMatcher::Node::ChildMap::find( const Name &name ) const
+{
+	if( m_map )
+	{
+		return ConstChildMapIterator( m_map->find( name ) );
+	}
+
+	const ChildMapValue *begin = m_array;
+	const ChildMapValue *end = begin + m_arraySize;
+	const ChildMapValue *it = std::lower_bound( begin, end, name, nameLess );
+	if( it != end && !( name < it->first ) )
+	{
+		return ConstChildMapIterator( it );
+	}
+	return ConstChildMapIterator( end );
+}
+
+PathMatcher::Node::ConstChildMapIterator PathMatcher::Node::ChildMap::lower_bound( const Name &name ) const
+{
+	if( m_map )
+	{
+		return ConstChildMapIterator( m_map->lower_bound( name ) );
+	}
+	const ChildMapValue *begin = m_array;
+	return ConstChildMapIterator( std::lower_bound( begin, begin + m_arraySize, name, nameLess ) );
+}
+
+PathMatcher::NodePtr &PathMatcher::Node::ChildMap::operator[]( const Name &name )
+{
+	assert( !m_compact );
+	if( !m_map )
+	{
+		m_map = new Map;
+	}
+	return (*m_map)[name];
+}
+
+void PathMatcher::Node::ChildMap::erase( const Name &name )
+{
+	assert( !m_compact );
+	if( m_map )
+	{
+		m_map->erase( name );
+	}
+}
+
+void PathMatcher::Node::ChildMap::clear()
+{
+	assert( !m_compact );
+	delete m_map;
+	m_map = NULL;
+}
+
+void PathMatcher::Node::ChildMap::reserveCompact( size_t size )
+{
+	assert( !m_map && !m_array );
+	m_compact = true;
+	if( size )
+	{
+		m_array = static_cast<ChildMapValue *>( ::operator new( size * sizeof( ChildMapValue ) ) );
+	}
+}
+
+void PathMatcher::Node::ChildMap::appendCompact( const Name &name, const NodePtr &child )
+{
+	assert( m_compact );
+	assert( !m_arraySize || m_array[m_arraySize-1].first < name );
+	new( m_array + m_arraySize ) ChildMapValue( name, child );
+	++m_arraySize;
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Node implementation
 //////////////////////////////////////////////////////////////////////////
@@ -91,7 +202,7 @@ inline PathMatcher::Node::ConstChildMapIterator PathMatcher::Node::wildcardsBegi
 
 inline PathMatcher::Node *PathMatcher::Node::child( const Name &name )
 {
-	ChildMapIterator it = children.find( name );
+	ConstChildMapIterator it = children.find( name );
 	if( it != children.end() )
 	{
 		return it->second.get();
@@ -111,6 +222,13 @@ inline const PathMatcher::Node *PathMatcher::Node::child( const Name &name ) con
 
 bool PathMatcher::Node::operator == ( const Node &other ) const
 {
+	if( this == &other )
+	{
+		// Nodes are frequently shared between trees, in
+		// which case we needn't recurse.
+		return true;
+	}
+
 	if( terminator != other.terminator )
 	{
 		return false;
@@ -121,10 +239,11 @@ bool PathMatcher::Node::operator == ( const Node &other ) const
 		return false;
 	}
 
-	for( ConstChildMapIterator it = children.begin(), eIt = children.end(); it != eIt; it++ )
+	// Children are sorted in the same order regardless of
+	// which form is being used, so we can walk both in step.
+	for( ConstChildMapIterator it = children.begin(), eIt = children.end(), oIt = other.children.begin(); it != eIt; ++it, ++oIt )
 	{
-		ConstChildMapIterator oIt = other.children.find( it->first );
-		if( oIt == other.children.end() )
+		if( it->first.name != oIt->first.name )
 		{
 			return false;
 		}
@@ -156,7 +275,9 @@ bool PathMatcher::Node::isEmpty()
 
 PathMatcher::Node *PathMatcher::Node::leaf()
 {
-	static NodePtr g_leaf = new Node( true );
+	// The leaf is shared, and therefore immutable anyway. Making it
+	// compact allows compact trees to share it too.
+	static NodePtr g_leaf = compactWalk( NodePtr( new Node( true ) ).get() );
 	assert( g_leaf->terminator );
 	assert( g_leaf->children.empty() );
 	return g_leaf.get();
@@ -191,6 +312,16 @@ bool PathMatcher::isEmpty() const
 	return m_root->isEmpty();
 }
 
+void PathMatcher::compact()
+{
+	m_root = compactWalk( m_root.get() );
+}
+
+bool PathMatcher::isCompact() const
+{
+	return m_root->children.isCompact();
+}
+
 void PathMatcher::paths( std::vector<std::string> &paths ) const
 {
 	for( Iterator it = begin(), eIt = end(); it != eIt; ++it )
@@ -411,6 +542,13 @@ bool PathMatcher::addPaths( const PathMatcher &paths, const std::vector<IECore::
 
 bool PathMatcher::removePaths( const PathMatcher &paths )
 {
+	if( m_root == paths.m_root )
+	{
+		const bool result = !isEmpty();
+		clear();
+		return result;
+	}
+
 	bool result = false;
 	NodePtr newRoot = removePathsWalk( m_root.get(), paths.m_root.get(), /* shared = */ false, result );
 	if( newRoot )
@@ -420,6 +558,22 @@ bool PathMatcher::removePaths( const PathMatcher &paths )
 	return result;
 }
 
+bool PathMatcher::intersectPaths( const PathMatcher &paths )
+{
+	if( m_root == paths.m_root )
+	{
+		return false;
+	}
+
+	bool result = false;
+	NodePtr newRoot = intersectPathsWalk( m_root.get(), paths.m_root.get(), /* shared = */ false, result );
+	if( newRoot )
+	{
+		m_root = newRoot;
+	}
+	return result;
+}
+
 bool PathMatcher::prune( const std::string &path )
 {
 	if( path.empty() )
@@ -483,7 +637,7 @@ PathMatcher::RawIterator PathMatcher::find( const std::vector<IECore::InternedSt
 
 PathMatcher::Node *PathMatcher::writable( Node *node, NodePtr &writableCopy, bool shared )
 {
-	if( !shared )
+	if( !shared && !node->children.isCompact() )
 	{
 		return node;
 	}
@@ -583,7 +737,7 @@ PathMatcher::NodePtr PathMatcher::removeWalk( Node *node, const NameIterator &st
 		return result;
 	}
 
-	Node::ChildMapIterator childIt = node->children.find( *start );
+	Node::ConstChildMapIterator childIt = node->children.find( *start );
 	if( childIt == node->children.end() )
 	{
 		return result;
@@ -617,25 +771,33 @@ PathMatcher::NodePtr PathMatcher::addPathsWalk( Node *node, const Node *srcNode,
 		writable( node, result, shared )->terminator = true;
 	}
 
-	for( Node::ChildMap::const_iterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
+	ChildPairs childPairs;
+	std::vector<const Name *> childNames;
+	for( Node::ConstChildMapIterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
 	{
 		Node *srcChild = it->second.get();
-		NodePtr newChild;
 		if( Node *child = node->child( it->first ) )
 		{
 			if( child != srcChild )
 			{
-				newChild = addPathsWalk( child, srcChild, shared, added );
+				childPairs.push_back( ChildPairs::value_type( child, srcChild ) );
+				childNames.push_back( &it->first );
 			}
 		}
 		else
 		{
-			newChild = srcChild;
+			writable( node, result, shared )->children[it->first] = srcChild;
 			added = true; // source node can only exist if it or a descendant is a terminator
 		}
-		if( newChild )
+	}
+
+	std::vector<NodePtr> newChildren;
+	childPairsWalk( addPathsWalk, childPairs, shared, newChildren, added );
+	for( size_t i = 0, e = newChildren.size(); i < e; ++i )
+	{
+		if( newChildren[i] )
 		{
-			writable( node, result, shared )->children[it->first] = newChild;
+			writable( node, result, shared )->children[*childNames[i]] = newChildren[i];
 		}
 	}
 
@@ -696,23 +858,165 @@ PathMatcher::NodePtr PathMatcher::removePathsWalk( Node *node, const Node *srcNo
 		removed = true;
 	}
 
-	for( Node::ChildMap::const_iterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
+	ChildPairs childPairs;
+	std::vector<const Name *> childNames;
+	for( Node::ConstChildMapIterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
 	{
-		const Node::ChildMapIterator childIt = node->children.find( it->first );
-		if( childIt != node->children.end() )
+		Node *child = node->child( it->first );
+		if( !child )
+		{
+			continue;
+		}
+		if( child == it->second.get() )
 		{
-			Node *child = childIt->second.get();
-			NodePtr newChild = removePathsWalk( child, it->second.get(), shared, removed );
+			// Shared subtree, so everything in it is removed.
+			writable( node, result, shared )->children.erase( it->first );
+			removed = true;
+		}
+		else
+		{
+			childPairs.push_back( ChildPairs::value_type( child, it->second.get() ) );
+			childNames.push_back( &it->first );
+		}
+	}
 
-			if( newChild && !newChild->isEmpty() )
-			{
-				writable( node, result, shared )->children[childIt->first] = newChild;
-			}
-			else if( child->isEmpty() || ( newChild && newChild->isEmpty() ) )
-			{
-				writable( node, result, shared )->children.erase( childIt->first );
-			}
+	std::vector<NodePtr> newChildren;
+	childPairsWalk( removePathsWalk, childPairs, shared, newChildren, removed );
+	for( size_t i = 0, e = newChildren.size(); i < e; ++i )
+	{
+		updateChild( node, result, shared, *childNames[i], childPairs[i].first, newChildren[i] );
+	}
+
+	return result;
+}
+
+PathMatcher::NodePtr PathMatcher::intersectPathsWalk( Node *node, const Node *srcNode, bool shared, bool &removed )
+{
+	shared = shared || node->refCount() > 1;
+	NodePtr result;
+
+	if( node->terminator && !srcNode->terminator )
+	{
+		writable( node, result, shared )->terminator = false;
+		removed = true;
+	}
+
+	ChildPairs childPairs;
+	std::vector<const Name *> childNames;
+	std::vector<const Name *> namesToErase;
+	for( Node::ConstChildMapIterator it = node->children.begin(), eIt = node->children.end(); it != eIt; ++it )
+	{
+		const Node *srcChild = srcNode->child( it->first );
+		if( !srcChild )
+		{
+			namesToErase.push_back( &it->first );
+		}
+		else if( srcChild != it->second.get() )
+		{
+			childPairs.push_back( ChildPairs::value_type( it->second.get(), srcChild ) );
+			childNames.push_back( &it->first );
 		}
+		// Else it's a shared subtree, so everything in it is kept.
+	}
+
+	std::vector<NodePtr> newChildren;
+	childPairsWalk( intersectPathsWalk, childPairs, shared, newChildren, removed );
+	for( size_t i = 0, e = newChildren.size(); i < e; ++i )
+	{
+		updateChild( node, result, shared, *childNames[i], childPairs[i].first, newChildren[i] );
+	}
+
+	// Erasure is deferred until now so as not to invalidate
+	// our iteration of `node->children` above.
+	for( std::vector<const Name *>::const_iterator it = namesToErase.begin(), eIt = namesToErase.end(); it != eIt; ++it )
+	{
+		writable( node, result, shared )->children.erase( **it );
+		removed = true;
+	}
+
+	return result;
+}
+
+void PathMatcher::updateChild( Node *node, NodePtr &writableCopy, bool shared, const Name &name, Node *child, const NodePtr &newChild )
+{
+	if( newChild && !newChild->isEmpty() )
+	{
+		writable( node, writableCopy, shared )->children[name] = newChild;
+	}
+	else if( child->isEmpty() || ( newChild && newChild->isEmpty() ) )
+	{
+		writable( node, writableCopy, shared )->children.erase( name );
+	}
+}
+
+struct PathMatcher::ChildPairsTask
+{
+
+	ChildPairsTask( PairWalk walk, const ChildPairs &childPairs, bool shared, std::vector<NodePtr> &newChildren, std::vector<unsigned char> &changed )
+		:	m_walk( walk ), m_childPairs( childPairs ), m_shared( shared ), m_newChildren( newChildren ), m_changed( changed )
+	{
+	}
+
+	void operator()( const tbb::blocked_range<size_t> &range ) const
+	{
+		for( size_t i = range.begin(); i != range.end(); ++i )
+		{
+			bool changed = false;
+			m_newChildren[i] = m_walk( m_childPairs[i].first, m_childPairs[i].second, m_shared, changed );
+			m_changed[i] = changed;
+		}
+	}
+
+	private :
+
+		PairWalk m_walk;
+		const ChildPairs &m_childPairs;
+		const bool m_shared;
+		std::vector<NodePtr> &m_newChildren;
+		std::vector<unsigned char> &m_changed;
+
+};
+
+void PathMatcher::childPairsWalk( PairWalk walk, const ChildPairs &childPairs, bool shared, std::vector<NodePtr> &newChildren, bool &changed )
+{
+	newChildren.resize( childPairs.size() );
+	if( childPairs.size() < 2 )
+	{
+		// Not worth the overhead of a parallel_for.
+		if( childPairs.size() )
+		{
+			newChildren[0] = walk( childPairs[0].first, childPairs[0].second, shared, changed );
+		}
+		return;
+	}
+
+	std::vector<unsigned char> childChanged( childPairs.size(), 0 );
+	ChildPairsTask task( walk, childPairs, shared, newChildren, childChanged );
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, childPairs.size() ), task );
+
+	if( std::find( childChanged.begin(), childChanged.end(), 1 ) != childChanged.end() )
+	{
+		changed = true;
+	}
+}
+
+PathMatcher::NodePtr PathMatcher::compactWalk( Node *node )
+{
+	if( node->children.isCompact() )
+	{
+		// Compact nodes only ever have compact children, so
+		// there's nothing to do.
+		return node;
+	}
+
+	// We always make a new node rather than converting `node`
+	// in place, because it may be shared with other trees which
+	// are being read concurrently.
+	NodePtr result = new Node( node->terminator );
+	result->children.reserveCompact( node->children.size() );
+	for( Node::ConstChildMapIterator it = node->children.begin(), eIt = node->children.end(); it != eIt; ++it )
+	{
+		result->children.appendCompact( it->first, compactWalk( it->second.get() ) );
 	}
 
 	return result;
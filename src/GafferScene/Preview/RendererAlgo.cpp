@@ -45,6 +45,7 @@
 #include "IECore/NullObject.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/StringAlgo.h"
 
 #include "GafferScene/Preview/RendererAlgo.h"
 #include "GafferScene/ScenePlug.h"
@@ -90,9 +91,8 @@ class LocationTask : public tbb::task
 
 		virtual task *execute()
 		{
-			Gaffer::ContextPtr context = new Gaffer::Context( *m_context, Gaffer::Context::Borrowed );
-			context->set( ScenePlug::scenePathContextName, m_path );
-			Gaffer::Context::Scope scopedContext( context.get() );
+			Gaffer::Context::EditableScope context( m_context );
+			context.set( ScenePlug::scenePathContextName, m_path );
 
 			if( !m_f( m_scene, m_path ) )
 			{
@@ -179,6 +179,22 @@ InternedString g_camerasSetName( "__cameras" );
 InternedString g_lightsSetName( "__lights" );
 std::string g_renderSetsPrefix( "render:" );
 ConstInternedStringVectorDataPtr g_emptySetsAttribute = new InternedStringVectorData;
+InternedString g_ellipsis( "..." );
+
+bool hasWildcards( const PathMatcher &set )
+{
+	for( PathMatcher::Iterator it = set.begin(), eIt = set.end(); it != eIt; ++it )
+	{
+		for( vector<InternedString>::const_iterator nIt = it->begin(), neIt = it->end(); nIt != neIt; ++nIt )
+		{
+			if( *nIt == g_ellipsis || Gaffer::hasWildcards( nIt->c_str() ) )
+			{
+				return true;
+			}
+		}
+	}
+	return false;
+}
 
 } // namespace
 
@@ -236,6 +252,13 @@ struct RenderSets::Updater
 			const IECore::MurmurHash &hash = m_scene->setPlug()->hash();
 			if( s->hash != hash )
 			{
+				if( potentialChange == RenderSetsChanged )
+				{
+					// Keep the old set so that update() can apply
+					// just the differences to the membership index.
+					s->previousSet = s->set;
+					s->indexDirty = true;
+				}
 				s->set = m_scene->setPlug()->getValue( &hash )->readable();
 				s->hash = hash;
 				changed |= potentialChange;
@@ -294,6 +317,7 @@ unsigned RenderSets::update( const ScenePlug *scene )
 	{
 		if( std::find( setNames.begin(), setNames.end(), it->first ) == setNames.end() )
 		{
+			updateIndex( it->first, it->second.set, PathMatcher() );
 			it = m_sets.erase( it );
 			changed |= RenderSetsChanged;
 		}
@@ -308,6 +332,23 @@ unsigned RenderSets::update( const ScenePlug *scene )
 	Updater updater( scene, Context::current(), *this, changed );
 	parallel_reduce( tbb::blocked_range<size_t>( 0, m_sets.size() + 2 ), updater );
 
+	// Bring the membership index up to date with any
+	// sets that changed.
+
+	if( updater.changed & RenderSetsChanged )
+	{
+		for( Sets::iterator it = m_sets.begin(), eIt = m_sets.end(); it != eIt; ++it )
+		{
+			Set &s = it->second;
+			if( s.indexDirty )
+			{
+				updateIndex( it->first, s.previousSet, s.set );
+				s.previousSet = PathMatcher();
+				s.indexDirty = false;
+			}
+		}
+	}
+
 	return updater.changed;
 }
 
@@ -316,6 +357,8 @@ void RenderSets::clear()
 	m_sets.clear();
 	m_camerasSet = Set();
 	m_lightsSet = Set();
+	m_membershipIndex.clear();
+	m_unindexedSets.clear();
 }
 
 const PathMatcher &RenderSets::camerasSet() const
@@ -330,21 +373,131 @@ const PathMatcher &RenderSets::lightsSet() const
 
 ConstInternedStringVectorDataPtr RenderSets::setsAttribute( const std::vector<IECore::InternedString> &path ) const
 {
-	InternedStringVectorDataPtr resultData = NULL;
-	vector<InternedString> *result = NULL;
-	for( Sets::const_iterator it = m_sets.begin(), eIt = m_sets.end(); it != eIt; ++it )
+	// Gather the names of all indexed sets containing
+	// the path or one of its ancestors.
+
+	vector<InternedString> setNames;
+	vector<InternedString> prefix;
+	prefix.reserve( path.size() );
+	for( vector<InternedString>::const_iterator it = path.begin(); ; ++it )
 	{
-		if( it->second.set.match( path ) & ( Filter::ExactMatch | Filter::AncestorMatch ) )
+		MembershipIndex::const_iterator mIt = m_membershipIndex.find( prefix );
+		if( mIt != m_membershipIndex.end() )
 		{
-			if( !result )
+			setNames.insert( setNames.end(), mIt->second.begin(), mIt->second.end() );
+		}
+		if( it == path.end() )
+		{
+			break;
+		}
+		prefix.push_back( *it );
+	}
+
+	// Fall back to matching the sets we couldn't index.
+
+	for( vector<InternedString>::const_iterator it = m_unindexedSets.begin(), eIt = m_unindexedSets.end(); it != eIt; ++it )
+	{
+		Sets::const_iterator sIt = m_sets.find( *it );
+		if( sIt->second.set.match( path ) & ( Filter::ExactMatch | Filter::AncestorMatch ) )
+		{
+			setNames.push_back( *it );
+		}
+	}
+
+	if( setNames.empty() )
+	{
+		return g_emptySetsAttribute;
+	}
+
+	// Sort into the same order as m_sets, removing duplicates
+	// arising from sets which contain several ancestors of the
+	// path.
+
+	std::sort( setNames.begin(), setNames.end() );
+	setNames.erase( std::unique( setNames.begin(), setNames.end() ), setNames.end() );
+
+	InternedStringVectorDataPtr resultData = new InternedStringVectorData;
+	vector<InternedString> &result = resultData->writable();
+	result.reserve( setNames.size() );
+	for( vector<InternedString>::const_iterator it = setNames.begin(), eIt = setNames.end(); it != eIt; ++it )
+	{
+		result.push_back( m_sets.find( *it )->second.unprefixedName );
+	}
+
+	return resultData;
+}
+
+void RenderSets::updateIndex( const IECore::InternedString &setName, const PathMatcher &oldSet, const PathMatcher &newSet )
+{
+	vector<InternedString>::iterator uIt = std::find( m_unindexedSets.begin(), m_unindexedSets.end(), setName );
+	const bool wasIndexed = uIt == m_unindexedSets.end();
+	const bool indexable = !hasWildcards( newSet );
+
+	if( wasIndexed && indexable )
+	{
+		// Incremental update, touching only the locations
+		// which have been removed from or added to the set.
+		for( PathMatcher::Iterator it = oldSet.begin(), eIt = oldSet.end(); it != eIt; ++it )
+		{
+			if( !( newSet.match( *it ) & Filter::ExactMatch ) )
+			{
+				removeFromIndex( *it, setName );
+			}
+		}
+		for( PathMatcher::Iterator it = newSet.begin(), eIt = newSet.end(); it != eIt; ++it )
+		{
+			if( !( oldSet.match( *it ) & Filter::ExactMatch ) )
 			{
-				resultData = new InternedStringVectorData;
-				result = &resultData->writable();
+				addToIndex( *it, setName );
 			}
-			result->push_back( it->second.unprefixedName );
 		}
+		return;
+	}
+
+	if( wasIndexed )
+	{
+		for( PathMatcher::Iterator it = oldSet.begin(), eIt = oldSet.end(); it != eIt; ++it )
+		{
+			removeFromIndex( *it, setName );
+		}
+	}
+	else
+	{
+		m_unindexedSets.erase( uIt );
+	}
+
+	if( indexable )
+	{
+		for( PathMatcher::Iterator it = newSet.begin(), eIt = newSet.end(); it != eIt; ++it )
+		{
+			addToIndex( *it, setName );
+		}
+	}
+	else
+	{
+		m_unindexedSets.push_back( setName );
+	}
+}
+
+void RenderSets::addToIndex( const std::vector<IECore::InternedString> &path, const IECore::InternedString &setName )
+{
+	m_membershipIndex[path].push_back( setName );
+}
+
+void RenderSets::removeFromIndex( const std::vector<IECore::InternedString> &path, const IECore::InternedString &setName )
+{
+	MembershipIndex::iterator it = m_membershipIndex.find( path );
+	if( it == m_membershipIndex.end() )
+	{
+		return;
+	}
+
+	vector<InternedString> &setNames = it->second;
+	setNames.erase( std::remove( setNames.begin(), setNames.end(), setName ), setNames.end() );
+	if( setNames.empty() )
+	{
+		m_membershipIndex.erase( it );
 	}
-	return resultData ? resultData : g_emptySetsAttribute;
 }
 
 } // namespace Preview
@@ -99,6 +99,22 @@ void SceneNode::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outp
 			outputs.push_back( it->get() );
 		}
 	}
+	else if( const ScenePlug *scenePlug = input->parent<ScenePlug>() )
+	{
+		if( scenePlug->direction() == Plug::Out )
+		{
+			// The full transform and attributes are computed from
+			// the local values by hash() and compute() below.
+			if( input == scenePlug->transformPlug() && !scenePlug->fullTransformPlug()->getInput<Plug>() )
+			{
+				outputs.push_back( scenePlug->fullTransformPlug() );
+			}
+			else if( input == scenePlug->attributesPlug() && !scenePlug->fullAttributesPlug()->getInput<Plug>() )
+			{
+				outputs.push_back( scenePlug->fullAttributesPlug() );
+			}
+		}
+	}
 }
 
 void SceneNode::hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const
@@ -177,6 +193,43 @@ void SceneNode::hash( const ValuePlug *output, const Context *context, IECore::M
 			const IECore::InternedString &setName = context->get<IECore::InternedString>( ScenePlug::setNameContextName );
 			hashSet( setName, context, scenePlug, h );
 		}
+		else if( output == scenePlug->fullTransformPlug() )
+		{
+			const ScenePath &scenePath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+			if( scenePath.empty() )
+			{
+				// the root always has an identity transform.
+				h.append( IECore::M44fData::staticTypeId() );
+				h.append( Imath::M44f() );
+			}
+			else
+			{
+				// We hash in the full transform of the parent rather than
+				// the transform of every ancestor. When traversing a scene
+				// the parent hash will already be cached, so this is cheap
+				// regardless of depth.
+				scenePlug->transformPlug()->hash( h );
+				Context::EditableScope parentScope( context );
+				parentScope.set( ScenePlug::scenePathContextName, ScenePath( scenePath.begin(), scenePath.end() - 1 ) );
+				scenePlug->fullTransformPlug()->hash( h );
+			}
+		}
+		else if( output == scenePlug->fullAttributesPlug() )
+		{
+			const ScenePath &scenePath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+			if( scenePath.empty() )
+			{
+				scenePlug->fullAttributesPlug()->defaultValue()->hash( h );
+			}
+			else
+			{
+				// As above.
+				scenePlug->attributesPlug()->hash( h );
+				Context::EditableScope parentScope( context );
+				parentScope.set( ScenePlug::scenePathContextName, ScenePath( scenePath.begin(), scenePath.end() - 1 ) );
+				scenePlug->fullAttributesPlug()->hash( h );
+			}
+		}
 	}
 	else
 	{
@@ -296,9 +349,71 @@ void SceneNode::compute( ValuePlug *output, const Context *context ) const
 			else if( output == scenePlug->setPlug() )
 			{
 				const IECore::InternedString &setName = context->get<IECore::InternedString>( ScenePlug::setNameContextName );
-				static_cast<ObjectPlug *>( output )->setValue(
-					computeSet( setName, context, scenePlug )
-				);
+				ConstPathMatcherDataPtr set = computeSet( setName, context, scenePlug );
+				if( !set->readable().isCompact() )
+				{
+					// Sets may be huge, and will be held in the cache, so we
+					// store them in the compact form. Subtrees shared with
+					// input sets are typically compact already, so this only
+					// converts the parts edited by computeSet().
+					PathMatcherDataPtr compactSet = set->copy();
+					compactSet->writable().compact();
+					set = compactSet;
+				}
+				static_cast<ObjectPlug *>( output )->setValue( set );
+			}
+			else if( output == scenePlug->fullTransformPlug() )
+			{
+				const ScenePath &scenePath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+				M44f transform;
+				if( scenePath.size() ) // scene root must have identity transform
+				{
+					transform = scenePlug->transformPlug()->getValue();
+					Context::EditableScope parentScope( context );
+					parentScope.set( ScenePlug::scenePathContextName, ScenePath( scenePath.begin(), scenePath.end() - 1 ) );
+					transform = transform * scenePlug->fullTransformPlug()->getValue();
+				}
+				static_cast<M44fPlug *>( output )->setValue( transform );
+			}
+			else if( output == scenePlug->fullAttributesPlug() )
+			{
+				const ScenePath &scenePath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+				CompoundObjectPlug *fullAttributesPlug = static_cast<CompoundObjectPlug *>( output );
+				if( scenePath.size() ) // scene root must have no attributes
+				{
+					ConstCompoundObjectPtr attributes = scenePlug->attributesPlug()->getValue();
+					ConstCompoundObjectPtr parentAttributes;
+					{
+						Context::EditableScope parentScope( context );
+						parentScope.set( ScenePlug::scenePathContextName, ScenePath( scenePath.begin(), scenePath.end() - 1 ) );
+						parentAttributes = scenePlug->fullAttributesPlug()->getValue();
+					}
+
+					if( attributes->members().empty() )
+					{
+						fullAttributesPlug->setValue( parentAttributes );
+					}
+					else if( parentAttributes->members().empty() )
+					{
+						fullAttributesPlug->setValue( attributes );
+					}
+					else
+					{
+						CompoundObjectPtr result = new CompoundObject;
+						CompoundObject::ObjectMap &resultMembers = result->members();
+						resultMembers = parentAttributes->members();
+						const CompoundObject::ObjectMap &members = attributes->members();
+						for( CompoundObject::ObjectMap::const_iterator it = members.begin(), eIt = members.end(); it != eIt; ++it )
+						{
+							resultMembers[it->first] = it->second;
+						}
+						fullAttributesPlug->setValue( result );
+					}
+				}
+				else
+				{
+					fullAttributesPlug->setValue( fullAttributesPlug->defaultValue() );
+				}
 			}
 		}
 		else
@@ -60,10 +60,10 @@ namespace
 // since it'll see fewer unnecessarily different contexts, and will
 // therefore get more cache hits. We use this in our utility
 // methods for computing set names, sets and globals.
-void removeNonGlobalContextVariables( Context *context )
+void removeNonGlobalContextVariables( Context::EditableScope &scope )
 {
-	context->remove( Filter::inputSceneContextName );
-	context->remove( ScenePlug::scenePathContextName );
+	scope.remove( Filter::inputSceneContextName );
+	scope.remove( ScenePlug::scenePathContextName );
 }
 
 } // namespace
@@ -158,6 +158,24 @@ ScenePlug::ScenePlug( const std::string &name, Direction direction, unsigned fla
 		)
 	);
 
+	addChild(
+		new M44fPlug(
+			"fullTransform",
+			direction,
+			Imath::M44f(),
+			childFlags
+		)
+	);
+
+	addChild(
+		new CompoundObjectPlug(
+			"fullAttributes",
+			direction,
+			new IECore::CompoundObject(),
+			childFlags
+		)
+	);
+
 }
 
 ScenePlug::~ScenePlug()
@@ -170,7 +188,7 @@ bool ScenePlug::acceptsChild( const GraphComponent *potentialChild ) const
 	{
 		return false;
 	}
-	return children().size() != 8;
+	return children().size() != 10;
 }
 
 Gaffer::PlugPtr ScenePlug::createCounterpart( const std::string &name, Direction direction ) const
@@ -271,214 +289,233 @@ const PathMatcherDataPlug *ScenePlug::setPlug() const
 	return getChild<PathMatcherDataPlug>( 7 );
 }
 
+Gaffer::M44fPlug *ScenePlug::fullTransformPlug()
+{
+	return getChild<M44fPlug>( 8 );
+}
+
+const Gaffer::M44fPlug *ScenePlug::fullTransformPlug() const
+{
+	return getChild<M44fPlug>( 8 );
+}
+
+Gaffer::CompoundObjectPlug *ScenePlug::fullAttributesPlug()
+{
+	return getChild<CompoundObjectPlug>( 9 );
+}
+
+const Gaffer::CompoundObjectPlug *ScenePlug::fullAttributesPlug() const
+{
+	return getChild<CompoundObjectPlug>( 9 );
+}
+
 Imath::Box3f ScenePlug::bound( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return boundPlug()->getValue();
 }
 
 Imath::M44f ScenePlug::transform( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return transformPlug()->getValue();
 }
 
 Imath::M44f ScenePlug::fullTransform( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	Context::Scope scopedContext( tmpContext.get() );
-
-	Imath::M44f result;
-	ScenePath path( scenePath );
-	while( path.size() )
-	{
-		tmpContext->set( scenePathContextName, path );
-		result = result * transformPlug()->getValue();
-		path.pop_back();
-	}
-
-	return result;
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
+	return fullTransformPlug()->getValue();
 }
 
 IECore::ConstCompoundObjectPtr ScenePlug::attributes( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return attributesPlug()->getValue();
 }
 
 IECore::CompoundObjectPtr ScenePlug::fullAttributes( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
+	IECore::ConstCompoundObjectPtr attributes = fullAttributesPlug()->getValue();
 
+	// We return a shallow copy, because the value from the plug is
+	// shared with the cache and must not be modified by the caller.
 	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
-	IECore::CompoundObject::ObjectMap &resultMembers = result->members();
-	ScenePath path( scenePath );
-	while( path.size() )
-	{
-		tmpContext->set( scenePathContextName, path );
-		IECore::ConstCompoundObjectPtr a = attributesPlug()->getValue();
-		const IECore::CompoundObject::ObjectMap &aMembers = a->members();
-		for( IECore::CompoundObject::ObjectMap::const_iterator it = aMembers.begin(), eIt = aMembers.end(); it != eIt; it++ )
-		{
-			if( resultMembers.find( it->first ) == resultMembers.end() )
-			{
-				resultMembers.insert( *it );
-			}
-		}
-		path.pop_back();
-	}
-
+	result->members() = attributes->members();
 	return result;
 }
 
 IECore::ConstObjectPtr ScenePlug::object( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return objectPlug()->getValue();
 }
 
 IECore::ConstInternedStringVectorDataPtr ScenePlug::childNames( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return childNamesPlug()->getValue();
 }
 
 IECore::ConstCompoundObjectPtr ScenePlug::globals() const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	removeNonGlobalContextVariables( scope );
 	return globalsPlug()->getValue();
 }
 
 IECore::ConstInternedStringVectorDataPtr ScenePlug::setNames() const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	removeNonGlobalContextVariables( scope );
 	return setNamesPlug()->getValue();
 }
 
 ConstPathMatcherDataPtr ScenePlug::set( const IECore::InternedString &setName ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( setNameContextName, setName );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( setNameContextName, setName );
+	removeNonGlobalContextVariables( scope );
 	return setPlug()->getValue();
 }
 
 IECore::MurmurHash ScenePlug::boundHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return boundPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::transformHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return transformPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::fullTransformHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	Context::Scope scopedContext( tmpContext.get() );
-
-	IECore::MurmurHash result;
-	ScenePath path( scenePath );
-	while( path.size() )
-	{
-		tmpContext->set( scenePathContextName, path );
-		transformPlug()->hash( result );
-		path.pop_back();
-	}
-
-	return result;
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
+	return fullTransformPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::attributesHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return attributesPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::fullAttributesHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	Context::Scope scopedContext( tmpContext.get() );
-
-	IECore::MurmurHash result;
-	ScenePath path( scenePath );
-	while( path.size() )
-	{
-		tmpContext->set( scenePathContextName, path );
-		attributesPlug()->hash( result );
-		path.pop_back();
-	}
-
-	return result;
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
+	return fullAttributesPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::objectHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return objectPlug()->hash();
 
 }
 
 IECore::MurmurHash ScenePlug::childNamesHash( const ScenePath &scenePath ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( scenePathContextName, scenePath );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
 	return childNamesPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::globalsHash() const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	removeNonGlobalContextVariables( scope );
 	return globalsPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::setNamesHash() const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	removeNonGlobalContextVariables( scope );
 	return setNamesPlug()->hash();
 }
 
 IECore::MurmurHash ScenePlug::setHash( const IECore::InternedString &setName ) const
 {
-	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
-	tmpContext->set( setNameContextName, setName );
-	removeNonGlobalContextVariables( tmpContext.get() );
-	Context::Scope scopedContext( tmpContext.get() );
+	Context::EditableScope scope( Context::current() );
+	scope.set( setNameContextName, setName );
+	removeNonGlobalContextVariables( scope );
 	return setPlug()->hash();
 }
 
+void ScenePlug::location( const ScenePath &scenePath, unsigned properties, Location &result ) const
+{
+	Context::EditableScope scope( Context::current() );
+	scope.set( scenePathContextName, scenePath );
+	currentLocation( properties, result );
+}
+
+void ScenePlug::currentLocation( unsigned properties, Location &result ) const
+{
+	if( properties & BoundProperty )
+	{
+		result.bound = boundPlug()->getValue();
+	}
+	if( properties & TransformProperty )
+	{
+		result.transform = transformPlug()->getValue();
+	}
+	if( properties & AttributesProperty )
+	{
+		result.attributes = attributesPlug()->getValue();
+	}
+	if( properties & ObjectProperty )
+	{
+		result.object = objectPlug()->getValue();
+	}
+	if( properties & ChildNamesProperty )
+	{
+		result.childNames = childNamesPlug()->getValue();
+	}
+}
+
+void ScenePlug::childLocations( const ScenePath &scenePath, unsigned properties, std::vector<Location> &result, const IECore::InternedStringVectorData *childNames ) const
+{
+	Context::EditableScope scope( Context::current() );
+
+	IECore::ConstInternedStringVectorDataPtr computedChildNames;
+	if( !childNames )
+	{
+		scope.set( scenePathContextName, scenePath );
+		computedChildNames = childNamesPlug()->getValue();
+		childNames = computedChildNames.get();
+	}
+
+	const std::vector<IECore::InternedString> &names = childNames->readable();
+	result.resize( names.size() );
+
+	// Each iteration updates the path in place, so only the
+	// path needs rehashing when the context hash is computed.
+	ScenePath childPath( scenePath );
+	childPath.push_back( IECore::InternedString() ); // room for the child name
+	for( size_t i = 0, e = names.size(); i < e; ++i )
+	{
+		childPath.back() = names[i];
+		scope.set( scenePathContextName, childPath );
+		currentLocation( properties, result[i] );
+	}
+}
+
 void ScenePlug::stringToPath( const std::string &s, ScenePlug::ScenePath &path )
 {
 	path.clear();
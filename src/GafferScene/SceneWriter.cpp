@@ -34,6 +34,9 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/pipeline.h"
+#include "tbb/task_scheduler_init.h"
+
 #include "boost/filesystem.hpp"
 
 #include "IECore/SceneInterface.h"
@@ -50,6 +53,201 @@ using namespace IECore;
 using namespace Gaffer;
 using namespace GafferScene;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// A single location, passed along the pipeline used by
+// SceneWriter::executeSequence().
+struct Item : public IECore::RefCounted
+{
+	ConstContextPtr context;
+	ScenePlug::ScenePath path;
+	ScenePlug::Location location;
+	ConstCompoundObjectPtr globals;
+};
+
+IE_CORE_DECLAREPTR( Item )
+
+// First stage of the pipeline. Visits the locations of each frame in
+// turn, in depth first order, computing just the child names needed
+// to continue the traversal.
+class LocationGenerator
+{
+
+	public :
+
+		LocationGenerator( const ScenePlug *scene, const Context *context, const std::vector<float> &frames )
+			:	m_scene( scene ), m_context( context ), m_frames( frames ), m_nextFrame( 0 )
+		{
+		}
+
+		ItemPtr operator()( tbb::flow_control &flowControl ) const
+		{
+			if( m_pending.empty() )
+			{
+				if( m_nextFrame >= m_frames.size() )
+				{
+					flowControl.stop();
+					return NULL;
+				}
+				ContextPtr frameContext = new Context( *m_context, Context::Borrowed );
+				frameContext->setFrame( m_frames[m_nextFrame++] );
+				m_frameContext = frameContext;
+				m_pending.push_back( ScenePlug::ScenePath() );
+			}
+
+			ItemPtr item = new Item;
+			item->context = m_frameContext;
+			item->path.swap( m_pending.back() );
+			m_pending.pop_back();
+
+			Context::EditableScope scope( m_frameContext.get() );
+			scope.set( ScenePlug::scenePathContextName, item->path );
+			item->location.childNames = m_scene->childNamesPlug()->getValue();
+
+			// Pushed in reverse, so that the first child is visited next.
+			const vector<InternedString> &childNames = item->location.childNames->readable();
+			for( vector<InternedString>::const_reverse_iterator it = childNames.rbegin(), eIt = childNames.rend(); it != eIt; ++it )
+			{
+				m_pending.push_back( item->path );
+				m_pending.back().push_back( *it );
+			}
+
+			return item;
+		}
+
+	private :
+
+		const ScenePlug *m_scene;
+		const Context *m_context;
+		const std::vector<float> &m_frames;
+
+		// The filter is serial, so it's OK for us to modify
+		// our state from the const operator.
+		mutable size_t m_nextFrame;
+		mutable ConstContextPtr m_frameContext;
+		mutable vector<ScenePlug::ScenePath> m_pending;
+
+};
+
+// Second stage of the pipeline. Computes everything else
+// about a location, for many locations in parallel.
+class LocationComputer
+{
+
+	public :
+
+		LocationComputer( const ScenePlug *scene )
+			:	m_scene( scene )
+		{
+		}
+
+		ItemPtr operator()( ItemPtr item ) const
+		{
+			Context::EditableScope scope( item->context.get() );
+			scope.set( ScenePlug::scenePathContextName, item->path );
+
+			unsigned properties = ScenePlug::AllProperties & ~ScenePlug::ChildNamesProperty;
+			if( item->path.empty() )
+			{
+				item->globals = m_scene->globalsPlug()->getValue();
+				properties &= ~ScenePlug::TransformProperty;
+			}
+			m_scene->currentLocation( properties, item->location );
+
+			return item;
+		}
+
+	private :
+
+		const ScenePlug *m_scene;
+
+};
+
+// Final stage of the pipeline. Writes the locations in the order
+// they were generated. SceneInterface is not threadsafe, so this
+// must be serial.
+class LocationWriter
+{
+
+	public :
+
+		LocationWriter( IECore::SceneInterface *output )
+			:	m_outputs( 1, output )
+		{
+		}
+
+		void operator()( ItemPtr item ) const
+		{
+			// m_outputs holds the output for each location on the path
+			// to the previous item. Since items arrive in depth first
+			// order, the parent of this one will be among them.
+			const size_t depth = item->path.size();
+			m_outputs.resize( depth ? depth : 1 );
+			if( depth )
+			{
+				m_outputs.push_back( m_outputs.back()->child( item->path.back(), SceneInterface::CreateIfMissing ) );
+			}
+
+			writeLocation( *item, m_outputs.back().get() );
+		}
+
+	private :
+
+		void writeLocation( const Item &item, IECore::SceneInterface *output ) const
+		{
+			const ScenePlug::Location &location = item.location;
+			const double time = item.context->getTime();
+			const bool root = item.path.empty();
+
+			for( CompoundObject::ObjectMap::const_iterator it = location.attributes->members().begin(), eIt = location.attributes->members().end(); it != eIt; it++ )
+			{
+				output->writeAttribute( it->first, it->second.get(), time );
+			}
+
+			if( root )
+			{
+				output->writeAttribute( "gaffer:globals", item.globals.get(), time );
+			}
+
+			if( location.object->typeId() != IECore::NullObjectTypeId && !root )
+			{
+				output->writeObject( location.object.get(), time );
+			}
+
+			const Imath::Box3f &b = location.bound;
+			output->writeBound( Imath::Box3d( Imath::V3f( b.min ), Imath::V3f( b.max ) ), time );
+
+			if( !root )
+			{
+				const Imath::M44f &t = location.transform;
+				Imath::M44d transform(
+					t[0][0], t[0][1], t[0][2], t[0][3],
+					t[1][0], t[1][1], t[1][2], t[1][3],
+					t[2][0], t[2][1], t[2][2], t[2][3],
+					t[3][0], t[3][1], t[3][2], t[3][3]
+				);
+
+				output->writeTransform( new IECore::M44dData( transform ), time );
+			}
+		}
+
+		// The filter is serial, so it's OK for us to modify
+		// our state from the const operator.
+		mutable vector<SceneInterfacePtr> m_outputs;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// SceneWriter implementation
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( SceneWriter );
 
 size_t SceneWriter::g_firstPlugIndex = 0;
@@ -137,11 +335,18 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 	createDirectories( fileName );
 	SceneInterfacePtr output = SceneInterface::create( fileName, IndexedIO::Write );
 
-	for ( std::vector<float>::const_iterator it = frames.begin(); it != frames.end(); ++it )
-	{
-		context->setFrame( *it );
-		writeLocation( scene, ScenePlug::ScenePath(), context.get(), output.get(), context->getTime() );
-	}
+	// Locations are computed in parallel, and then written serially
+	// in their original order, because SceneInterface is not threadsafe.
+	// The number of locations in flight is limited, so that we never
+	// hold more than a small part of the scene in memory. The traversal
+	// moves straight on to the next frame, so that we don't wait for
+	// the last locations of one frame before starting on the next.
+	tbb::parallel_pipeline(
+		tbb::task_scheduler_init::default_num_threads() * 4,
+		tbb::make_filter<void, ItemPtr>( tbb::filter::serial_in_order, LocationGenerator( scene, context.get(), frames ) ) &
+		tbb::make_filter<ItemPtr, ItemPtr>( tbb::filter::parallel, LocationComputer( scene ) ) &
+		tbb::make_filter<ItemPtr, void>( tbb::filter::serial_in_order, LocationWriter( output.get() ) )
+	);
 }
 
 bool SceneWriter::requiresSequenceExecution() const
@@ -149,60 +354,6 @@ bool SceneWriter::requiresSequenceExecution() const
 	return true;
 }
 
-void SceneWriter::writeLocation( const GafferScene::ScenePlug *scene, const ScenePlug::ScenePath &scenePath, Context *context, IECore::SceneInterface *output, double time ) const
-{
-	context->set( ScenePlug::scenePathContextName, scenePath );
-
-	ConstCompoundObjectPtr attributes = scene->attributesPlug()->getValue();
-	for( CompoundObject::ObjectMap::const_iterator it = attributes->members().begin(), eIt = attributes->members().end(); it != eIt; it++ )
-	{
-		output->writeAttribute( it->first, it->second.get(), time );
-	}
-
-	if( scenePath.empty() )
-	{
-		ConstCompoundObjectPtr globals = scene->globalsPlug()->getValue();
-		output->writeAttribute( "gaffer:globals", globals.get(), time );
-	}
-
-	ConstObjectPtr object = scene->objectPlug()->getValue();
-
-	if( object->typeId() != IECore::NullObjectTypeId && scenePath.size() > 0 )
-	{
-		output->writeObject( object.get(), time );
-	}
-
-	Imath::Box3f b = scene->boundPlug()->getValue();
-
-	output->writeBound( Imath::Box3d( Imath::V3f( b.min ), Imath::V3f( b.max ) ), time );
-
-	if( scenePath.size() )
-	{
-		Imath::M44f t = scene->transformPlug()->getValue();
-		Imath::M44d transform(
-			t[0][0], t[0][1], t[0][2], t[0][3],
-			t[1][0], t[1][1], t[1][2], t[1][3],
-			t[2][0], t[2][1], t[2][2], t[2][3],
-			t[3][0], t[3][1], t[3][2], t[3][3]
-		);
-
-		output->writeTransform( new IECore::M44dData( transform ), time );
-	}
-
-	ConstInternedStringVectorDataPtr childNames = scene->childNamesPlug()->getValue();
-
-	ScenePlug::ScenePath childScenePath = scenePath;
-	childScenePath.push_back( InternedString() );
-	for( vector<InternedString>::const_iterator it=childNames->readable().begin(); it!=childNames->readable().end(); it++ )
-	{
-		childScenePath[scenePath.size()] = *it;
-
-		SceneInterfacePtr outputChild = output->child( *it, SceneInterface::CreateIfMissing );
-
-		writeLocation( scene, childScenePath, context, outputChild.get(), time );
-	}
-}
-
 void SceneWriter::createDirectories( const std::string &fileName ) const
 {
 	boost::filesystem::path filePath( fileName );
@@ -220,6 +220,7 @@ void Set::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) c
 			matchingPaths( filterPlug(), inPlug(), pathMatcher );
 		}
 
+		pathMatcher.compact();
 		static_cast<Gaffer::ObjectPlug *>( output )->setValue( pathMatcherData );
 		return;
 	}
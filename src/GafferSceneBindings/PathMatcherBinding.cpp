@@ -119,12 +119,15 @@ void bindPathMatcher()
 		.def( "addPaths", (bool (PathMatcher::*)( const PathMatcher & ))&PathMatcher::addPaths )
 		.def( "addPaths", (bool (PathMatcher::*)( const PathMatcher &, const std::vector<IECore::InternedString> & ))&PathMatcher::addPaths )
 		.def( "removePaths", &PathMatcher::removePaths )
+		.def( "intersectPaths", &PathMatcher::intersectPaths )
 		.def( "prune", (bool (PathMatcher::*)( const std::vector<IECore::InternedString> & ))&PathMatcher::prune )
 		.def( "prune", (bool (PathMatcher::*)( const std::string & ))&PathMatcher::prune )
 		.def( "subTree", (PathMatcher ( PathMatcher::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::subTree )
 		.def( "subTree", (PathMatcher ( PathMatcher::*)( const std::string & ) const)&PathMatcher::subTree )
 		.def( "clear", &PathMatcher::clear )
 		.def( "isEmpty", &PathMatcher::isEmpty )
+		.def( "compact", &PathMatcher::compact )
+		.def( "isCompact", &PathMatcher::isCompact )
 		.def( "paths", &paths )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::match )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::string & ) const)&PathMatcher::match )
@@ -35,6 +35,11 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "boost/assign/list_of.hpp"
+#include "boost/lexical_cast.hpp"
+
+#include "tbb/task_arena.h"
+
+#include "IECore/Timer.h"
 
 #include "GafferTest/Assert.h"
 
@@ -48,6 +53,52 @@ using namespace boost;
 using namespace IECore;
 using namespace GafferScene;
 
+namespace
+{
+
+// Performs union, difference and intersection of two sets,
+// in a form suitable for use with tbb::task_arena::execute().
+struct SetAlgebra
+{
+
+	SetAlgebra( const PathMatcher &a, const PathMatcher &b )
+		:	a( a ), b( b ), unionTime( 0 ), differenceTime( 0 ), intersectionTime( 0 )
+	{
+	}
+
+	void operator()()
+	{
+		IECore::Timer unionTimer;
+		unionResult = a;
+		unionResult.addPaths( b );
+		unionTime = unionTimer.stop();
+
+		IECore::Timer differenceTimer;
+		differenceResult = a;
+		differenceResult.removePaths( b );
+		differenceTime = differenceTimer.stop();
+
+		IECore::Timer intersectionTimer;
+		intersectionResult = a;
+		intersectionResult.intersectPaths( b );
+		intersectionTime = intersectionTimer.stop();
+	}
+
+	const PathMatcher &a;
+	const PathMatcher &b;
+
+	PathMatcher unionResult;
+	PathMatcher differenceResult;
+	PathMatcher intersectionResult;
+
+	double unionTime;
+	double differenceTime;
+	double intersectionTime;
+
+};
+
+} // namespace
+
 void GafferSceneTest::testPathMatcherRawIterator()
 {
 	vector<InternedString> root;
@@ -159,3 +210,79 @@ void GafferSceneTest::testPathMatcherFind()
 	GAFFERTEST_ASSERT( it == m.end() );
 
 }
+
+void GafferSceneTest::testPathMatcherSetAlgebraPerformance( size_t numGroups, size_t numChildren )
+{
+	// Build two overlapping sets of the form /group<N>/child<M>,
+	// in the compact form used for computed sets. With the default
+	// arguments each set contains 5 million paths, and their union
+	// contains 10 million.
+
+	vector<InternedString> groupNames;
+	for( size_t i = 0; i < numGroups; ++i )
+	{
+		groupNames.push_back( "group" + lexical_cast<string>( i ) );
+	}
+
+	vector<InternedString> childNames;
+	for( size_t i = 0; i < numChildren; ++i )
+	{
+		childNames.push_back( "child" + lexical_cast<string>( i ) );
+	}
+
+	PathMatcher a;
+	PathMatcher b;
+	vector<InternedString> path( 2 );
+	for( size_t i = 0; i < numGroups; ++i )
+	{
+		path[0] = groupNames[i];
+		for( size_t j = 0; j < numChildren; ++j )
+		{
+			path[1] = childNames[j];
+			if( ( i + j ) % 2 )
+			{
+				a.addPath( path );
+			}
+			if( j % 3 )
+			{
+				b.addPath( path );
+			}
+		}
+	}
+
+	a.compact();
+	b.compact();
+
+	// Compare the parallel operations with the same
+	// operations constrained to run serially.
+
+	SetAlgebra parallel( a, b );
+	parallel();
+
+	SetAlgebra serial( a, b );
+	tbb::task_arena arena( 1 );
+	arena.execute( serial );
+
+	GAFFERTEST_ASSERT( parallel.unionResult == serial.unionResult );
+	GAFFERTEST_ASSERT( parallel.differenceResult == serial.differenceResult );
+	GAFFERTEST_ASSERT( parallel.intersectionResult == serial.intersectionResult );
+
+	for( size_t i = 0; i < numGroups; ++i )
+	{
+		path[0] = groupNames[i];
+		for( size_t j = 0; j < numChildren; ++j )
+		{
+			path[1] = childNames[j];
+			const bool inA = ( i + j ) % 2;
+			const bool inB = j % 3;
+			GAFFERTEST_ASSERT( bool( parallel.unionResult.match( path ) & Filter::ExactMatch ) == ( inA || inB ) );
+			GAFFERTEST_ASSERT( bool( parallel.differenceResult.match( path ) & Filter::ExactMatch ) == ( inA && !inB ) );
+			GAFFERTEST_ASSERT( bool( parallel.intersectionResult.match( path ) & Filter::ExactMatch ) == ( inA && inB ) );
+		}
+	}
+
+	// Uncomment to get timing information.
+	//std::cerr << "UNION " << serial.unionTime << " " << parallel.unionTime << std::endl;
+	//std::cerr << "DIFFERENCE " << serial.differenceTime << " " << parallel.differenceTime << std::endl;
+	//std::cerr << "INTERSECTION " << serial.intersectionTime << " " << parallel.intersectionTime << std::endl;
+}
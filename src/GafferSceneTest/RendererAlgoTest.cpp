@@ -0,0 +1,187 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2016, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+
+#include "boost/algorithm/string/split.hpp"
+#include "boost/algorithm/string/classification.hpp"
+
+#include "IECore/VectorTypedData.h"
+
+#include "GafferTest/Assert.h"
+
+#include "GafferScene/Set.h"
+#include "GafferScene/Preview/RendererAlgo.h"
+
+#include "GafferSceneTest/RendererAlgoTest.h"
+
+using namespace std;
+using namespace IECore;
+using namespace GafferScene;
+using namespace GafferScene::Preview;
+
+namespace
+{
+
+// Asserts that the sets attribute for `path` contains exactly the
+// space separated set names in `expected`, in any order.
+void assertSetsAttribute( const RenderSets &renderSets, const string &path, const string &expected )
+{
+	ScenePlug::ScenePath scenePath;
+	ScenePlug::stringToPath( path, scenePath );
+	ConstInternedStringVectorDataPtr setsAttribute = renderSets.setsAttribute( scenePath );
+
+	vector<string> actualNames;
+	for( vector<InternedString>::const_iterator it = setsAttribute->readable().begin(), eIt = setsAttribute->readable().end(); it != eIt; ++it )
+	{
+		actualNames.push_back( it->string() );
+	}
+	std::sort( actualNames.begin(), actualNames.end() );
+
+	vector<string> expectedNames;
+	if( !expected.empty() )
+	{
+		boost::split( expectedNames, expected, boost::is_any_of( " " ) );
+	}
+	std::sort( expectedNames.begin(), expectedNames.end() );
+
+	GAFFERTEST_ASSERT( actualNames == expectedNames );
+}
+
+void setPaths( Set *set, const string &paths )
+{
+	StringVectorDataPtr pathsData = new StringVectorData;
+	boost::split( pathsData->writable(), paths, boost::is_any_of( " " ) );
+	set->pathsPlug()->setValue( pathsData );
+}
+
+} // namespace
+
+void GafferSceneTest::testRenderSetsMembershipIndex()
+{
+	SetPtr setA = new Set;
+	setA->namePlug()->setValue( "render:A" );
+	setPaths( setA.get(), "/a /a/b" );
+
+	SetPtr setB = new Set;
+	setB->inPlug()->setInput( setA->outPlug() );
+	setB->namePlug()->setValue( "render:B" );
+	setPaths( setB.get(), "/a/b/c" );
+
+	// Sets which aren't render sets must be ignored.
+
+	SetPtr setC = new Set;
+	setC->inPlug()->setInput( setB->outPlug() );
+	setC->namePlug()->setValue( "C" );
+	setPaths( setC.get(), "/a" );
+
+	const ScenePlug *scene = setC->outPlug();
+
+	RenderSets renderSets( scene );
+	assertSetsAttribute( renderSets, "/", "" );
+	assertSetsAttribute( renderSets, "/a", "A" );
+	assertSetsAttribute( renderSets, "/a/b", "A" );
+	assertSetsAttribute( renderSets, "/a/b/c", "A B" );
+	assertSetsAttribute( renderSets, "/a/b/c/d", "A B" );
+	assertSetsAttribute( renderSets, "/e", "" );
+
+	GAFFERTEST_ASSERT( renderSets.update( scene ) == RenderSets::NothingChanged );
+
+	// Add members incrementally.
+
+	setPaths( setB.get(), "/a/b/c /e" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a/b/c", "A B" );
+	assertSetsAttribute( renderSets, "/e", "B" );
+	assertSetsAttribute( renderSets, "/e/f", "B" );
+
+	// Remove members incrementally. Ancestors which are
+	// still members must continue to match.
+
+	setPaths( setA.get(), "/a" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a", "A" );
+	assertSetsAttribute( renderSets, "/a/b", "A" );
+	assertSetsAttribute( renderSets, "/a/b/c", "A B" );
+
+	setPaths( setA.get(), "/g" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a", "" );
+	assertSetsAttribute( renderSets, "/a/b/c", "B" );
+	assertSetsAttribute( renderSets, "/g", "A" );
+
+	// Sets containing wildcards can't be indexed, and
+	// must be matched directly instead.
+
+	setPaths( setB.get(), "/a/* /e" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a", "" );
+	assertSetsAttribute( renderSets, "/a/b", "B" );
+	assertSetsAttribute( renderSets, "/a/b/c", "B" );
+	assertSetsAttribute( renderSets, "/e", "B" );
+	assertSetsAttribute( renderSets, "/g", "A" );
+
+	// And must be indexed again once they no longer
+	// contain wildcards.
+
+	setPaths( setB.get(), "/e" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a/b", "" );
+	assertSetsAttribute( renderSets, "/e", "B" );
+
+	// Removing a set must remove all its members
+	// from the index.
+
+	setA->enabledPlug()->setValue( false );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/g", "" );
+	assertSetsAttribute( renderSets, "/e", "B" );
+
+	setB->enabledPlug()->setValue( false );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/e", "" );
+
+	// Including when the set contained wildcards.
+
+	setB->enabledPlug()->setValue( true );
+	setPaths( setB.get(), "/a/*" );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a/b", "B" );
+
+	setB->enabledPlug()->setValue( false );
+	GAFFERTEST_ASSERT( renderSets.update( scene ) & RenderSets::RenderSetsChanged );
+	assertSetsAttribute( renderSets, "/a/b", "" );
+}
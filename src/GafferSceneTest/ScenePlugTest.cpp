@@ -36,12 +36,59 @@
 
 #include "IECore/Timer.h"
 
+#include "GafferTest/Assert.h"
+
 #include "GafferScene/ScenePlug.h"
 
 #include "GafferSceneTest/ScenePlugTest.h"
 
+using namespace std;
+using namespace IECore;
 using namespace GafferScene;
 
+namespace
+{
+
+void assertLocationsEqual( const ScenePlug *scene, const ScenePlug::ScenePath &path, const ScenePlug::Location &location )
+{
+	GAFFERTEST_ASSERT( location.bound == scene->bound( path ) );
+	GAFFERTEST_ASSERT( location.transform == scene->transform( path ) );
+	GAFFERTEST_ASSERT( location.attributes->isEqualTo( scene->attributes( path ).get() ) );
+	GAFFERTEST_ASSERT( location.object->isEqualTo( scene->object( path ).get() ) );
+	GAFFERTEST_ASSERT( location.childNames->isEqualTo( scene->childNames( path ).get() ) );
+}
+
+void testLocationQueriesWalk( const ScenePlug *scene, const ScenePlug::ScenePath &path )
+{
+	ScenePlug::Location location;
+	scene->location( path, ScenePlug::AllProperties, location );
+	assertLocationsEqual( scene, path, location );
+
+	vector<ScenePlug::Location> children;
+	scene->childLocations( path, ScenePlug::AllProperties, children );
+	const vector<InternedString> &childNames = location.childNames->readable();
+	GAFFERTEST_ASSERT( children.size() == childNames.size() );
+
+	ScenePlug::ScenePath childPath( path );
+	childPath.push_back( InternedString() );
+	for( size_t i = 0; i < childNames.size(); ++i )
+	{
+		childPath.back() = childNames[i];
+		assertLocationsEqual( scene, childPath, children[i] );
+		testLocationQueriesWalk( scene, childPath );
+	}
+
+	// Only the requested properties should be queried.
+	ScenePlug::Location partial;
+	scene->location( path, ScenePlug::BoundProperty | ScenePlug::ChildNamesProperty, partial );
+	GAFFERTEST_ASSERT( partial.bound == location.bound );
+	GAFFERTEST_ASSERT( partial.childNames->isEqualTo( location.childNames.get() ) );
+	GAFFERTEST_ASSERT( !partial.attributes );
+	GAFFERTEST_ASSERT( !partial.object );
+}
+
+} // namespace
+
 void GafferSceneTest::testManyStringToPathCalls()
 {
 	std::string s = "/i/am/a/fairly/long/string/for/testing/string/to/path";
@@ -56,3 +103,8 @@ void GafferSceneTest::testManyStringToPathCalls()
 	// Uncomment to get timing information.
 	//std::cerr << t.stop() << std::endl;
 }
+
+void GafferSceneTest::testLocationQueries( const GafferScene::ScenePlug *scene )
+{
+	testLocationQueriesWalk( scene, ScenePlug::ScenePath() );
+}
@@ -52,10 +52,11 @@ struct SceneEvaluateFunctor
 {
 	bool operator()( const GafferScene::ScenePlug *scene, const GafferScene::ScenePlug::ScenePath &path )
 	{
-		scene->transformPlug()->getValue();
-		scene->boundPlug()->getValue();
-		scene->attributesPlug()->getValue();
-		scene->objectPlug()->getValue();
+		ScenePlug::Location location;
+		scene->currentLocation(
+			ScenePlug::TransformProperty | ScenePlug::BoundProperty | ScenePlug::AttributesProperty | ScenePlug::ObjectProperty,
+			location
+		);
 		return true;
 	}
 };
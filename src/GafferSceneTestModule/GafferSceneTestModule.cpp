@@ -47,6 +47,7 @@
 #include "GafferSceneTest/TestLight.h"
 #include "GafferSceneTest/ScenePlugTest.h"
 #include "GafferSceneTest/PathMatcherTest.h"
+#include "GafferSceneTest/RendererAlgoTest.h"
 
 using namespace boost::python;
 using namespace GafferSceneTest;
@@ -69,9 +70,13 @@ BOOST_PYTHON_MODULE( _GafferSceneTest )
 	def( "connectTraverseSceneToContextChangedSignal", &connectTraverseSceneToContextChangedSignal );
 
 	def( "testManyStringToPathCalls", &testManyStringToPathCalls );
+	def( "testLocationQueries", &testLocationQueries );
 
 	def( "testPathMatcherRawIterator", &testPathMatcherRawIterator );
 	def( "testPathMatcherIteratorPrune", &testPathMatcherIteratorPrune );
 	def( "testPathMatcherFind", &testPathMatcherFind );
+	def( "testPathMatcherSetAlgebraPerformance", &testPathMatcherSetAlgebraPerformance, ( arg( "numGroups" ) = 1000, arg( "numChildren" ) = 10000 ) );
+
+	def( "testRenderSetsMembershipIndex", &testRenderSetsMembershipIndex );
 
 }
@@ -145,3 +145,63 @@ void GafferTest::testScopingNullContext()
 		}
 	}
 }
+
+void GafferTest::testEditableScope()
+{
+	ContextPtr base = new Context();
+	base->set( "a", 1 );
+	base->set( "b", std::string( "b" ) );
+	const MurmurHash baseHash = base->hash();
+
+	IntDataPtr borrowedData = new IntData( 10 );
+
+	{
+		Context::EditableScope scope( base.get() );
+		GAFFERTEST_ASSERT( Context::current() == scope.context() );
+		GAFFERTEST_ASSERT( scope.context()->hash() == baseHash );
+
+		scope.set( "a", 2 );
+		scope.setBorrowed( "c", borrowedData.get() );
+		scope.remove( "b" );
+		scope.setFrame( 10.0f );
+
+		GAFFERTEST_ASSERT( Context::current()->get<int>( "a" ) == 2 );
+		GAFFERTEST_ASSERT( Context::current()->get<int>( "c" ) == 10 );
+		GAFFERTEST_ASSERT( Context::current()->get<std::string>( "b", "" ) == "" );
+		GAFFERTEST_ASSERT( Context::current()->getFrame() == 10.0f );
+
+		// The hash is updated from the cached hashes of the original,
+		// and must match that of an equivalent context built from scratch.
+		ContextPtr equivalent = new Context();
+		equivalent->set( "a", 2 );
+		equivalent->set( "c", 10 );
+		equivalent->setFrame( 10.0f );
+		GAFFERTEST_ASSERT( scope.context()->hash() == equivalent->hash() );
+
+		// Repeated edits must also keep the hash up to date.
+		scope.set( "a", 1 );
+		equivalent->set( "a", 1 );
+		GAFFERTEST_ASSERT( scope.context()->hash() == equivalent->hash() );
+	}
+
+	// The original must be untouched.
+	GAFFERTEST_ASSERT( base->get<int>( "a" ) == 1 );
+	GAFFERTEST_ASSERT( base->get<std::string>( "b" ) == "b" );
+	GAFFERTEST_ASSERT( base->hash() == baseHash );
+	GAFFERTEST_ASSERT( Context::current() != base.get() );
+
+	// Subsequent scopes reuse the context and values from the
+	// previous ones, and must not be affected by their state.
+	for( int i = 0; i < 3; ++i )
+	{
+		Context::EditableScope scope( base.get() );
+		GAFFERTEST_ASSERT( scope.context()->hash() == baseHash );
+		GAFFERTEST_ASSERT( scope.context()->get<int>( "a" ) == 1 );
+		GAFFERTEST_ASSERT( !scope.context()->get<Data>( "c", NULL ) );
+
+		scope.set( "d", 1 );
+		ContextPtr equivalent = new Context( *base );
+		equivalent->set( "d", 1 );
+		GAFFERTEST_ASSERT( scope.context()->hash() == equivalent->hash() );
+	}
+}
@@ -45,6 +45,9 @@ preferences["cache"] = Gaffer.CompoundPlug()
 preferences["cache"]["enabled"] = Gaffer.BoolPlug( defaultValue = True )
 preferences["cache"]["memoryLimit"] = Gaffer.IntPlug( defaultValue = Gaffer.ValuePlug.getCacheMemoryLimit() / ( 1024 * 1024 ) )
 preferences["cache"]["imageReaderMemoryLimit"] = Gaffer.IntPlug( defaultValue = GafferImage.OpenImageIOReader.getCacheMemoryLimit() )
+preferences["cache"]["diskCacheDirectory"] = Gaffer.StringPlug()
+preferences["cache"]["diskCacheSizeLimit"] = Gaffer.IntPlug( defaultValue = Gaffer.ValuePlug.getDiskCacheSizeLimit() / ( 1024 * 1024 ) )
+preferences["cache"]["hashCacheSizeLimit"] = Gaffer.IntPlug( defaultValue = Gaffer.ValuePlug.getHashCacheSizeLimit() )
 
 Gaffer.Metadata.registerPlugValue(
     preferences["cache"]["memoryLimit"],
@@ -62,6 +65,38 @@ Gaffer.Metadata.registerPlugValue(
     """
 )
 
+Gaffer.Metadata.registerPlugValue(
+    preferences["cache"]["diskCacheDirectory"],
+    "description",
+    """
+    A directory in which computed values are stored, so that they
+    can be reused in later sessions and shared with other processes.
+    Leave empty to disable the disk cache. Values are identified by
+    their hash, so the directory should be cleared if files read by
+    Gaffer are modified in place.
+    """
+)
+
+Gaffer.Metadata.registerPlugValue(
+    preferences["cache"]["diskCacheSizeLimit"],
+    "description",
+    """
+    Controls the maximum size, in megabytes, of the files stored in
+    the disk cache directory.
+    """
+)
+
+Gaffer.Metadata.registerPlugValue(
+    preferences["cache"]["hashCacheSizeLimit"],
+    "description",
+    """
+    Controls the maximum number of entries in Gaffer's cache of
+    recently computed hashes. Unlike the memory limits, this is not
+    affected by disabling the cache, because the hash cache is essential
+    for performance.
+    """
+)
+
 
 # update cache settings when they change
 
@@ -72,11 +107,16 @@ def __plugSet( plug ) :
 
 	memoryLimit = plug["memoryLimit"].getValue() * 1024 * 1024
 	imageReaderMemoryLimit = plug["imageReaderMemoryLimit"].getValue()
+	diskCacheDirectory = plug["diskCacheDirectory"].getValue()
 	if not plug["enabled"].getValue() :
 		memoryLimit = 0
 		imageReaderMemoryLimit = 0
+		diskCacheDirectory = ""
 
 	Gaffer.ValuePlug.setCacheMemoryLimit( memoryLimit )
 	GafferImage.OpenImageIOReader.setCacheMemoryLimit( imageReaderMemoryLimit )
+	Gaffer.ValuePlug.setDiskCacheSizeLimit( plug["diskCacheSizeLimit"].getValue() * 1024 * 1024 )
+	Gaffer.ValuePlug.setDiskCacheDirectory( diskCacheDirectory )
+	Gaffer.ValuePlug.setHashCacheSizeLimit( plug["hashCacheSizeLimit"].getValue() )
 
 application.__cachePlugSetConnection = preferences.plugSetSignal().connect( __plugSet )